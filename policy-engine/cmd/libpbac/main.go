@@ -50,6 +50,25 @@ func EvaluatePipelineJSON(input *C.char) *C.char {
 	return jsonResult(record)
 }
 
+type pipelineBatchRequest struct {
+	Fixtures pipeline.Fixtures `json:"fixtures"`
+	Inputs   []pipeline.Input  `json:"inputs"`
+}
+
+type pipelineBatchResponse struct {
+	Records []pipeline.EvaluationRecord `json:"records"`
+}
+
+//export EvaluatePipelineBatchJSON
+func EvaluatePipelineBatchJSON(input *C.char) *C.char {
+	var req pipelineBatchRequest
+	if err := json.Unmarshal([]byte(C.GoString(input)), &req); err != nil {
+		return jsonError(err)
+	}
+	records := pipeline.EvaluateBatch(req.Fixtures, req.Inputs)
+	return jsonResult(pipelineBatchResponse{Records: records})
+}
+
 // ── Purpose evaluation ──────────────────────────────────────────────
 
 //export EvaluatePurposeJSON
@@ -62,6 +81,27 @@ func EvaluatePurposeJSON(input *C.char) *C.char {
 	return jsonResult(result)
 }
 
+type purposeBatchRequest struct {
+	Requests []pbac.EvaluatePurposeRequest `json:"requests"`
+}
+
+type purposeBatchResponse struct {
+	Results []pbac.PurposeEvaluationResult `json:"results"`
+}
+
+//export EvaluatePurposeBatchJSON
+func EvaluatePurposeBatchJSON(input *C.char) *C.char {
+	var req purposeBatchRequest
+	if err := json.Unmarshal([]byte(C.GoString(input)), &req); err != nil {
+		return jsonError(err)
+	}
+	results := make([]pbac.PurposeEvaluationResult, 0, len(req.Requests))
+	for _, r := range req.Requests {
+		results = append(results, pbac.EvaluatePurpose(r.Consumer, r.Datasets, r.Collections))
+	}
+	return jsonResult(purposeBatchResponse{Results: results})
+}
+
 // ── Policy evaluation ───────────────────────────────────────────────
 
 //export EvaluatePoliciesJSON
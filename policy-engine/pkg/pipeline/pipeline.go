@@ -152,6 +152,20 @@ func Evaluate(f Fixtures, in Input) EvaluationRecord {
 	}
 }
 
+// EvaluateBatch runs the full PBAC pipeline for many statements against
+// the same fixture set. Records are returned in input order.
+//
+// Callers crossing an FFI or HTTP boundary should prefer this over
+// repeated Evaluate calls: the fixtures are decoded once per batch
+// rather than once per statement.
+func EvaluateBatch(f Fixtures, inputs []Input) []EvaluationRecord {
+	records := make([]EvaluationRecord, 0, len(inputs))
+	for _, in := range inputs {
+		records = append(records, Evaluate(f, in))
+	}
+	return records
+}
+
 // ── Private helpers ────────────────────────────────────────────────
 
 // resolveTables walks the input tables and produces:
@@ -1,7 +1,10 @@
 package pipeline
 
 import (
+	"encoding/json"
+	"fmt"
 	"path/filepath"
+	"reflect"
 	"testing"
 
 	"github.com/ethyca/fides/policy-engine/pkg/fixtures"
@@ -11,7 +14,7 @@ import (
 // loadFixtures loads the demo fixtures from ../../pbac/. Fails the test
 // outright if any directory is missing or malformed so callers don't
 // have to check each step.
-func loadFixtures(t *testing.T) Fixtures {
+func loadFixtures(t testing.TB) Fixtures {
 	t.Helper()
 	root := filepath.Join("..", "..", "..", "pbac")
 
@@ -192,3 +195,88 @@ func TestTableResolution_CaseInsensitive(t *testing.T) {
 		t.Errorf("expected case-insensitive table resolution, got %v", rec.DatasetKeys)
 	}
 }
+
+// ── Batch evaluation ────────────────────────────────────────────────
+
+func TestEvaluateBatch_MatchesEvaluate(t *testing.T) {
+	f := loadFixtures(t)
+	inputs := []Input{
+		aliceQuery("page_views", "q1"),
+		aliceQuery("orders", "q2"),
+		{QueryID: "q3", Identity: "carol@unknown.example", Tables: []TableRef{{Collection: "orders"}}},
+	}
+
+	records := EvaluateBatch(f, inputs)
+
+	if len(records) != len(inputs) {
+		t.Fatalf("expected %d records, got %d", len(inputs), len(records))
+	}
+	for i, in := range inputs {
+		if want := Evaluate(f, in); !reflect.DeepEqual(records[i], want) {
+			t.Errorf("record %d: batch result %+v differs from single result %+v", i, records[i], want)
+		}
+	}
+}
+
+// benchmarkInputs builds n single-table queries spread across a few
+// identities and tables, approximating a warehouse query log.
+func benchmarkInputs(n int) []Input {
+	identities := []string{"alice@demo.example", "bob@demo.example", "carol@unknown.example"}
+	tables := []string{"page_views", "orders", "customers", "unknown_table"}
+	inputs := make([]Input, n)
+	for i := range inputs {
+		table := tables[i%len(tables)]
+		inputs[i] = Input{
+			QueryID:  fmt.Sprintf("q%d", i),
+			Identity: identities[i%len(identities)],
+			Tables:   []TableRef{{Collection: table, QualifiedName: table}},
+		}
+	}
+	return inputs
+}
+
+// The JSON benchmarks mirror the libpbac boundary: every call decodes
+// its request (fixtures included) and encodes its response. Compare
+// queries/s between the two to see the per-call overhead batching saves.
+
+func BenchmarkEvaluateJSONPerQuery(b *testing.B) {
+	f := loadFixtures(b)
+	inputs := benchmarkInputs(1000)
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		for _, in := range inputs {
+			payload, _ := json.Marshal(map[string]interface{}{"fixtures": f, "input": in})
+			var req struct {
+				Fixtures Fixtures `json:"fixtures"`
+				Input    Input    `json:"input"`
+			}
+			if err := json.Unmarshal(payload, &req); err != nil {
+				b.Fatal(err)
+			}
+			if _, err := json.Marshal(Evaluate(req.Fixtures, req.Input)); err != nil {
+				b.Fatal(err)
+			}
+		}
+	}
+	b.ReportMetric(float64(b.N*len(inputs))/b.Elapsed().Seconds(), "queries/s")
+}
+
+func BenchmarkEvaluateJSONBatch(b *testing.B) {
+	f := loadFixtures(b)
+	inputs := benchmarkInputs(1000)
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		payload, _ := json.Marshal(map[string]interface{}{"fixtures": f, "inputs": inputs})
+		var req struct {
+			Fixtures Fixtures `json:"fixtures"`
+			Inputs   []Input  `json:"inputs"`
+		}
+		if err := json.Unmarshal(payload, &req); err != nil {
+			b.Fatal(err)
+		}
+		if _, err := json.Marshal(EvaluateBatch(req.Fixtures, req.Inputs)); err != nil {
+			b.Fatal(err)
+		}
+	}
+	b.ReportMetric(float64(b.N*len(inputs))/b.Elapsed().Seconds(), "queries/s")
+}
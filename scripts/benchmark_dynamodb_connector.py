@@ -0,0 +1,150 @@
+"""
+Benchmarks reading and masking DynamoDB items one request per item against the
+batched BatchGetItem and BatchWriteItem requests of the DynamoDB connector.
+
+Requests are sent to an in-memory stand-in for DynamoDB that sleeps for a fixed
+latency per request, so no AWS account or DynamoDB Local is required.
+
+Usage:
+    python scripts/benchmark_dynamodb_connector.py --items 5000 --latency-ms 10
+"""
+
+import argparse
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+from boto3.dynamodb.types import TypeSerializer
+from loguru import logger
+
+from fides.api.service.connectors.dynamodb_connector import DynamoDBConnector
+
+TABLE = "customer"
+KEY = "id"
+
+
+class LatencyDynamoDBClient:
+    """An in-memory DynamoDB table, which sleeps for `latency` seconds per request"""
+
+    def __init__(self, items: List[Dict[str, Any]], latency: float):
+        self.items = {item[KEY]["S"]: item for item in items}
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def _request(self) -> None:
+        with self._lock:
+            self.requests += 1
+        time.sleep(self.latency)
+
+    def query(self, **kwargs: Any) -> Dict[str, Any]:
+        self._request()
+        item = self.items.get(kwargs["ExpressionAttributeValues"][":value"]["S"])
+        return {"Items": [item] if item else []}
+
+    def put_item(self, TableName: str, Item: Dict[str, Any]) -> Dict[str, Any]:
+        self._request()
+        self.items[Item[KEY]["S"]] = Item
+        return {"ResponseMetadata": {"HTTPStatusCode": 200}}
+
+    def batch_get_item(self, RequestItems: Dict[str, Any]) -> Dict[str, Any]:
+        self._request()
+        keys = RequestItems[TABLE]["Keys"]
+        return {
+            "Responses": {
+                TABLE: [
+                    self.items[key[KEY]["S"]]
+                    for key in keys
+                    if key[KEY]["S"] in self.items
+                ]
+            }
+        }
+
+    def batch_write_item(self, RequestItems: Dict[str, Any]) -> Dict[str, Any]:
+        self._request()
+        for request in RequestItems[TABLE]:
+            item = request["PutRequest"]["Item"]
+            self.items[item[KEY]["S"]] = item
+        return {}
+
+
+def build_items(count: int) -> List[Dict[str, Any]]:
+    serializer = TypeSerializer()
+    return [
+        {
+            KEY: serializer.serialize(str(i)),
+            "email": serializer.serialize(f"customer-{i}@example.com"),
+            "name": serializer.serialize(f"Customer {i}"),
+        }
+        for i in range(count)
+    ]
+
+
+def per_item(client: LatencyDynamoDBClient, ids: List[str]) -> None:
+    """The connector's previous requests: a query per ID and a put per row"""
+    items = []
+    for identifier in ids:
+        items.extend(
+            client.query(
+                TableName=TABLE,
+                ExpressionAttributeValues={":value": {"S": identifier}},
+                KeyConditionExpression=f"{KEY} = :value",
+            )["Items"]
+        )
+    for item in items:
+        client.put_item(TableName=TABLE, Item={**item, "name": {"NULL": True}})
+
+
+def batched(client: LatencyDynamoDBClient, ids: List[str]) -> None:
+    items = DynamoDBConnector._batch_get_items(  # pylint: disable=protected-access
+        client, TABLE, KEY, ids
+    )
+    DynamoDBConnector._batch_write_items(  # pylint: disable=protected-access
+        client, TABLE, [{**item, "name": {"NULL": True}} for item in items], [KEY]
+    )
+
+
+def timed(
+    label: str,
+    func: Callable[[LatencyDynamoDBClient, List[str]], None],
+    items: List[Dict[str, Any]],
+    latency: float,
+) -> float:
+    client = LatencyDynamoDBClient(items, latency)
+    ids = list(client.items)
+    start = time.perf_counter()
+    func(client, ids)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<10} {elapsed:8.2f}s  {client.requests:8,} requests  "
+        f"{len(ids) / elapsed:10,.0f} items/s"
+    )
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=5_000)
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=10.0,
+        help="Simulated round trip time of each DynamoDB request",
+    )
+    args = parser.parse_args()
+    # The connector logs every batch it writes
+    logger.remove()
+
+    items = build_items(args.items)
+    latency = args.latency_ms / 1000
+    print(
+        f"Reading and masking {args.items:,} items with {args.latency_ms:g}ms "
+        "per request"
+    )
+    single = timed("per item", per_item, items, latency)
+    batch = timed("batched", batched, items, latency)
+    print(f"speedup    {single / batch:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
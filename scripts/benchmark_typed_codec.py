@@ -0,0 +1,110 @@
+"""
+Benchmarks encoding and decoding DSR access results with the CustomJSONEncoder and
+its prefixed-string decoder against the typed payload codec.
+
+The rows mimic the access results of a SQL collection: mostly strings and numbers,
+a nested address, and a configurable number of datetime, bytes and ObjectId
+columns per row.
+
+Usage:
+    python scripts/benchmark_typed_codec.py --rows 50000 --typed-columns 2
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+from bson.objectid import ObjectId
+
+from fides.api.util import typed_codec
+from fides.api.util.custom_json_encoder import CustomJSONEncoder, _custom_decoder
+
+
+def build_rows(count: int, typed_columns: int) -> List[Dict[str, Any]]:
+    typed_values: List[Callable[[int], Any]] = [
+        lambda i: datetime(2024, 1, 1) + timedelta(minutes=i),
+        lambda i: ObjectId(f"{i:024x}"),
+        lambda i: f"avatar-{i}".encode("utf-8"),
+    ]
+    rows = []
+    for i in range(count):
+        row: Dict[str, Any] = {
+            "id": i,
+            "email": f"customer-{i}@example.com",
+            "name": f"Customer {i}",
+            "phone": "+1 555 0100",
+            "score": i / 3,
+            "active": i % 2 == 0,
+            "notes": None,
+            "address": {
+                "street": f"{i} Main St",
+                "city": "Springfield",
+                "zip": "12345",
+            },
+            "tags": ["newsletter", "loyalty"],
+        }
+        for column in range(typed_columns):
+            row[f"typed_{column}"] = typed_values[column % len(typed_values)](i)
+        rows.append(row)
+    return rows
+
+
+def timed(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument(
+        "--typed-columns",
+        type=int,
+        default=2,
+        help="Datetime, ObjectId and bytes columns per row",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = build_rows(args.rows, args.typed_columns)
+    legacy = json.dumps(rows, cls=CustomJSONEncoder)
+    typed = typed_codec.dumps(rows)
+    print(
+        f"{args.rows:,} rows with {args.typed_columns} typed columns, "
+        f"best of {args.repeat}"
+    )
+    print(f"{'':<8} {'encode':>9} {'decode':>9} {'size':>12}")
+    results = {}
+    for label, encode, decode, payload in [
+        (
+            "legacy",
+            lambda: json.dumps(rows, cls=CustomJSONEncoder),
+            lambda: json.loads(legacy, object_hook=_custom_decoder),
+            legacy,
+        ),
+        (
+            "typed",
+            lambda: typed_codec.dumps(rows),
+            lambda: typed_codec.loads(typed),
+            typed,
+        ),
+    ]:
+        results[label] = (timed(encode, args.repeat), timed(decode, args.repeat))
+        print(
+            f"{label:<8} {results[label][0]:8.3f}s {results[label][1]:8.3f}s "
+            f"{len(payload):12,}"
+        )
+    print(
+        f"{'speedup':<8} {results['legacy'][0] / results['typed'][0]:8.2f}x "
+        f"{results['legacy'][1] / results['typed'][1]:8.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
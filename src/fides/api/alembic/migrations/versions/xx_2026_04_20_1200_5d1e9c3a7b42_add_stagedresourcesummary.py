@@ -0,0 +1,185 @@
+"""Add stagedresourcesummary rollup table and triggers
+
+Adds a rollup of staged resource counts by monitor, system, vendor, resource
+type, diff status, classification state and consent state, maintained by
+statement-level triggers on stagedresource, and backfills it.
+
+Revision ID: 5d1e9c3a7b42
+Revises: d71c7d274c04
+Create Date: 2026-04-20 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "5d1e9c3a7b42"
+down_revision = "d71c7d274c04"
+branch_labels = None
+depends_on = None
+
+# Intentionally hardcoded — migrations must not import application code.
+DIMENSIONS = (
+    "monitor_config_id",
+    "system_id",
+    "vendor_id",
+    "resource_type",
+    "diff_status",
+    "is_classified",
+    "consent_aggregated",
+)
+# Empty strings are counted as NULL, so that each row of the unique index, which
+# coalesces NULLs, counts a single group
+DIMENSION_EXPRESSIONS = (
+    "nullif(monitor_config_id, '')",
+    "nullif(system_id, '')",
+    "nullif(vendor_id, '')",
+    "nullif(resource_type, '')",
+    "nullif(diff_status, '')",
+    "coalesce(cardinality(classifications), 0) > 0",
+    "nullif(meta->>'consent_aggregated', '')",
+)
+CONFLICT_TARGET = (
+    "coalesce(monitor_config_id, ''), coalesce(system_id, ''), "
+    "coalesce(vendor_id, ''), coalesce(resource_type, ''), "
+    "coalesce(diff_status, ''), is_classified, coalesce(consent_aggregated, '')"
+)
+
+
+def _select_rows(transition_table: str, delta: str) -> str:
+    expressions = ", ".join(
+        f"{expression} AS {dimension}"
+        for expression, dimension in zip(DIMENSION_EXPRESSIONS, DIMENSIONS)
+    )
+    return f"SELECT {expressions}, {delta} AS delta FROM {transition_table}"
+
+
+def _apply_deltas(rows: str) -> str:
+    """
+    Upserts the summed deltas of the given rows. Rows are applied in dimension
+    order so that concurrent statements lock the summary rows in the same order.
+    """
+    dimensions = ", ".join(DIMENSIONS)
+    return f"""
+        INSERT INTO stagedresourcesummary (id, {dimensions}, resource_count)
+        SELECT 'sta_' || gen_random_uuid(), {dimensions}, sum(delta)
+        FROM ({rows}) AS changes
+        GROUP BY {dimensions}
+        HAVING sum(delta) <> 0
+        ORDER BY {dimensions}
+        ON CONFLICT ({CONFLICT_TARGET}) DO UPDATE
+        SET resource_count = stagedresourcesummary.resource_count
+            + EXCLUDED.resource_count,
+            updated_at = now();
+    """
+
+
+TRIGGER_FUNCTIONS = {
+    "INSERT": _apply_deltas(_select_rows("new_rows", "1")),
+    "UPDATE": _apply_deltas(
+        f"{_select_rows('old_rows', '-1')} UNION ALL {_select_rows('new_rows', '1')}"
+    ),
+    "DELETE": _apply_deltas(_select_rows("old_rows", "-1")),
+}
+TRANSITION_TABLES = {
+    "INSERT": "NEW TABLE AS new_rows",
+    "UPDATE": "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    "DELETE": "OLD TABLE AS old_rows",
+}
+
+
+def upgrade():
+    op.create_table(
+        "stagedresourcesummary",
+        sa.Column("id", sa.String(length=255), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column("monitor_config_id", sa.String(), nullable=True),
+        sa.Column("system_id", sa.String(), nullable=True),
+        sa.Column("vendor_id", sa.String(), nullable=True),
+        sa.Column("resource_type", sa.String(), nullable=True),
+        sa.Column("diff_status", sa.String(), nullable=True),
+        sa.Column("is_classified", sa.Boolean(), nullable=False),
+        sa.Column("consent_aggregated", sa.String(), nullable=True),
+        sa.Column(
+            "resource_count", sa.BigInteger(), server_default="0", nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_stagedresourcesummary_id"),
+        "stagedresourcesummary",
+        ["id"],
+        unique=False,
+    )
+    op.create_index(
+        "uq_stagedresourcesummary_dimensions",
+        "stagedresourcesummary",
+        [
+            sa.text("coalesce(monitor_config_id, '')"),
+            sa.text("coalesce(system_id, '')"),
+            sa.text("coalesce(vendor_id, '')"),
+            sa.text("coalesce(resource_type, '')"),
+            sa.text("coalesce(diff_status, '')"),
+            "is_classified",
+            sa.text("coalesce(consent_aggregated, '')"),
+        ],
+        unique=True,
+    )
+    op.create_index(
+        "ix_stagedresourcesummary_system_vendor",
+        "stagedresourcesummary",
+        ["system_id", "vendor_id"],
+        unique=False,
+    )
+
+    for event, body in TRIGGER_FUNCTIONS.items():
+        name = f"stagedresourcesummary_on_{event.lower()}"
+        op.execute(
+            f"""
+            CREATE OR REPLACE FUNCTION {name}() RETURNS trigger AS $$
+            BEGIN
+                {body}
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql;
+            """
+        )
+        op.execute(
+            f"""
+            CREATE TRIGGER {name}
+            AFTER {event} ON stagedresource
+            REFERENCING {TRANSITION_TABLES[event]}
+            FOR EACH STATEMENT EXECUTE FUNCTION {name}();
+            """
+        )
+
+    # Backfill from the existing staged resources
+    op.execute(_apply_deltas(_select_rows("stagedresource", "1")))
+
+
+def downgrade():
+    for event in TRIGGER_FUNCTIONS:
+        name = f"stagedresourcesummary_on_{event.lower()}"
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON stagedresource")
+        op.execute(f"DROP FUNCTION IF EXISTS {name}()")
+    op.drop_index(
+        "ix_stagedresourcesummary_system_vendor", table_name="stagedresourcesummary"
+    )
+    op.drop_index(
+        "uq_stagedresourcesummary_dimensions", table_name="stagedresourcesummary"
+    )
+    op.drop_index(
+        op.f("ix_stagedresourcesummary_id"), table_name="stagedresourcesummary"
+    )
+    op.drop_table("stagedresourcesummary")
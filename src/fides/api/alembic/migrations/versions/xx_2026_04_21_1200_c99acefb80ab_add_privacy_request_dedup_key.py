@@ -0,0 +1,62 @@
+"""add privacy request dedup key
+
+Adds the dedup_key column duplicate detection looks privacy requests up by,
+the dedup_key_version column recording which identity fields the key was built
+from, and a composite (dedup_key, policy_id, created_at) index.
+
+The index is registered for deferred creation by the post-upgrade startup task
+(post_upgrade_index_creation.py) so it can be created CONCURRENTLY on large
+privacyrequest tables. Existing requests are given a dedup key by the
+privacyrequest-dedup_key post-upgrade backfill.
+
+Revision ID: c99acefb80ab
+Revises: 5d1e9c3a7b42
+Create Date: 2026-04-21 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c99acefb80ab"
+down_revision = "5d1e9c3a7b42"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_privacyrequest_dedup_key_policy_created"
+BACKFILL_NAME = "privacyrequest-dedup_key"
+
+
+def upgrade():
+    op.add_column(
+        "privacyrequest",
+        sa.Column("dedup_key", sa.String(), nullable=True),
+    )
+    op.add_column(
+        "privacyrequest",
+        sa.Column("dedup_key_version", sa.String(), nullable=True),
+    )
+
+    # Register the index for deferred creation by the post-upgrade startup task
+    # (see post_upgrade_index_creation.py).
+    op.execute(
+        sa.text(
+            "INSERT INTO post_upgrade_background_migration_tasks (key, task_type, completed_at) "
+            "VALUES (:key, 'index', NULL) ON CONFLICT (task_type, key) DO NOTHING"
+        ).bindparams(key=INDEX_NAME)
+    )
+
+
+def downgrade():
+    # The index may not exist yet if the background task hasn't run
+    op.execute(sa.text(f"DROP INDEX IF EXISTS {INDEX_NAME}"))
+    op.execute(
+        sa.text(
+            "DELETE FROM post_upgrade_background_migration_tasks "
+            "WHERE (key = :index_key AND task_type = 'index') "
+            "OR (key = :backfill_key AND task_type = 'backfill')"
+        ).bindparams(index_key=INDEX_NAME, backfill_key=BACKFILL_NAME)
+    )
+    op.drop_column("privacyrequest", "dedup_key_version")
+    op.drop_column("privacyrequest", "dedup_key")
@@ -27,6 +27,9 @@ from fides.api.models.detection_discovery.monitor_task import (
     MonitorTask,
     MonitorTaskExecutionLog,
 )
+from fides.api.models.detection_discovery.staged_resource_summary import (
+    StagedResourceSummary,
+)
 from fides.api.models.detection_discovery.web_monitor import WebMonitorGroupJob
 from fides.api.models.digest import DigestCondition, DigestConfig
 from fides.api.models.encryption_key import EncryptionKey
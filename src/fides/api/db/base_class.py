@@ -17,8 +17,10 @@ from sqlalchemy.sql.expression import BinaryExpression, BooleanClauseList
 from sqlalchemy_utils import JSONType
 
 from fides.api.common_exceptions import KeyOrNameAlreadyExists, KeyValidationError
-from fides.api.util.custom_json_encoder import CustomJSONEncoder, _custom_decoder
+from fides.api.util import typed_codec
+from fides.api.util.custom_json_encoder import CustomJSONEncoder
 from fides.api.util.text import to_snake_case
+from fides.config import CONFIG
 
 T = TypeVar("T", bound="OrmWrappedFidesBase")
 ALLOWED_CHARS_PATTERN = r"[A-Za-z0-9\-_]"
@@ -37,13 +39,23 @@ class JSONTypeOverride(JSONType):  # pylint: disable=W0223
     '{"key": "value"}' instead of {"key": "value"}
 
     https://github.com/kvesteri/sqlalchemy-utils/issues/532
+
+    Columns created with typed_codec=True are written with the typed codec when
+    CONFIG.execution.use_typed_payload_codec is enabled. Values are read in
+    either format.
     """
 
+    def __init__(self, *args: Any, typed_codec: bool = False, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.typed_codec = typed_codec
+
     def process_bind_param(self, value: MutableDict, _: Any | None) -> str | None:
         """
         Overrides JSONType.process_bind_param to return json.dumps(value) instead of just the value.
         """
         if value is not None:
+            if self.typed_codec and CONFIG.execution.use_typed_payload_codec:
+                return typed_codec.dumps(value)
             return json.dumps(value, cls=CustomJSONEncoder)
         return value
 
@@ -52,7 +64,7 @@ class JSONTypeOverride(JSONType):  # pylint: disable=W0223
         Overrides JSONType.process_result_value to return json.loads(value) instead of just the value.
         """
         if value is not None:
-            return json.loads(value, object_hook=_custom_decoder)
+            return typed_codec.loads(value)
         return value
 
 
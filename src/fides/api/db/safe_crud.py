@@ -201,6 +201,78 @@ async def get_resource_with_custom_fields(
     return resource_dict
 
 
+async def get_resources_with_custom_fields(
+    sql_model: Type[T], fides_keys: List[str], async_session: AsyncSession
+) -> List[Dict[str, Any]]:
+    """Get many resources from the database by their FidesKeys, including their custom fields.
+
+    Resources are fetched with a single query, and their custom fields with a second one,
+    rather than two queries per resource. Keys that do not exist are silently skipped.
+
+    Returns a list of resource dictionaries, in the order of `fides_keys`.
+
+    This version does NOT manually manage transactions - transaction management
+    is left to the calling code.
+    """
+    if not fides_keys:
+        return []
+
+    with log.contextualize(
+        sql_model=sql_model.__name__, fides_key_count=len(fides_keys)
+    ):
+        try:
+            log.debug("Fetching resources with custom fields")
+            result = await async_session.execute(
+                select(sql_model).where(sql_model.fides_key.in_(fides_keys))
+            )
+            resources: List[T] = result.scalars().all()
+
+            custom_field_result = await async_session.execute(
+                select(
+                    CustomField.resource_id,
+                    CustomFieldDefinition.name,
+                    CustomField.value,
+                )
+                .join(
+                    CustomFieldDefinition,
+                    CustomField.custom_field_definition_id == CustomFieldDefinition.id,
+                )
+                .where(
+                    CustomField.resource_id.in_(fides_keys)
+                    & (  # pylint: disable=singleton-comparison
+                        CustomFieldDefinition.active == True
+                    )
+                )
+            )
+        except SQLAlchemyError as e:
+            sa_error = errors.QueryError()
+            log.exception(f"Failed to fetch resources with error: '{e}'")
+            raise sa_error
+
+        custom_fields_by_key: Dict[str, List[Any]] = defaultdict(list)
+        for field in custom_field_result.mappings().all():
+            custom_fields_by_key[field["resource_id"]].append(field)
+
+    resource_dicts: Dict[str, Dict[str, Any]] = {}
+    for resource in resources:
+        resource_dict = resource.__dict__
+        resource_dict.pop("_sa_instance_state", None)
+        for field in custom_fields_by_key.get(resource.fides_key, []):
+            if field["name"] in resource_dict:
+                resource_dict[field["name"]] = (
+                    f"{resource_dict[field['name']]}, {', '.join(field['value'])}"
+                )
+            else:
+                resource_dict[field["name"]] = ", ".join(field["value"])
+        resource_dicts[resource.fides_key] = resource_dict
+
+    return [
+        resource_dicts[key]
+        for key in dict.fromkeys(fides_keys)
+        if key in resource_dicts
+    ]
+
+
 async def list_resource(sql_model: Type[T], async_session: AsyncSession) -> List[T]:
     """
     Get a list of all of the resources of this type from the database.
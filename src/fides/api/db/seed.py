@@ -339,6 +339,7 @@ def sync_oob_saas_config_versions(session: Session) -> None:
     Called on startup so the table is bootstrapped on first deploy and
     picks up new template versions automatically on each upgrade.
     Rows are immutable once written, so this is safe to call repeatedly.
+    Only the templates whose indexed version has no row yet are loaded.
     """
 
     templates = FileConnectorTemplateLoader.get_connector_templates()
@@ -348,8 +349,11 @@ def sync_oob_saas_config_versions(session: Session) -> None:
             SaaSConfigVersion.connector_type, SaaSConfigVersion.version
         ).filter(SaaSConfigVersion.is_custom == False)  # noqa: E712
     }
-    for connector_type, template in templates.items():
+    for connector_type in templates:
+        if (connector_type, templates.get_version(connector_type)) in existing:
+            continue
         try:
+            template = templates[connector_type]
             saas_config = SaaSConfig(**load_config_from_string(template.config))
             if (connector_type, saas_config.version) in existing:
                 continue
@@ -367,6 +371,7 @@ def sync_oob_saas_config_versions(session: Session) -> None:
                 "Failed to sync SaaSConfigVersion for OOB connector '{}'",
                 connector_type,
             )
+    templates.save_index()
 
 
 def load_default_resources(session: Session) -> None:
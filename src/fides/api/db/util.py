@@ -3,6 +3,11 @@ from json import dumps, loads
 from typing import TYPE_CHECKING, Any, Dict, Type, TypeVar
 
 from sqlalchemy import Text
+
+# sqlalchemy-stubs predates SQLAlchemy 1.4 and doesn't declare ORMExecuteState
+from sqlalchemy.orm import (  # type: ignore[attr-defined]
+    ORMExecuteState as ORMExecuteState,
+)
 from sqlalchemy.types import TypeEngine
 
 from fides.api.db.encryption_utils import encrypted_type
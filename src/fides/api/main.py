@@ -29,6 +29,7 @@ from fides.api.app_setup import (
 )
 from fides.api.common_exceptions import MalisciousUrlException
 from fides.api.cryptography.identity_salt import get_identity_salt
+from fides.api.middleware import audit_log_resource_writer
 from fides.api.migrations.hash_migration_job import initiate_bcrypt_migration_task
 from fides.api.migrations.post_upgrade_backfill import (
     initiate_post_upgrade_backfill,
@@ -62,6 +63,9 @@ from fides.api.util.endpoint_utils import API_PREFIX
 from fides.api.util.rate_limit import safe_rate_limit_key
 from fides.cli.utils import FIDES_ASCII_ART
 from fides.config import CONFIG, check_required_webserver_config_values
+from fides.service.detection_discovery.staged_resource_summary_task import (
+    initiate_staged_resource_summary_reconciliation,
+)
 from fides.service.jira.polling_task import initiate_jira_ticket_polling
 
 NEXT_JS_CATCH_ALL_SEGMENTS_RE = r"^\[{1,2}\.\.\.\w+\]{1,2}"  # https://nextjs.org/docs/pages/building-your-application/routing/dynamic-routes#catch-all-segments
@@ -107,10 +111,14 @@ async def lifespan(wrapped_app: FastAPI) -> AsyncGenerator[None, None]:
     initiate_interrupted_task_requeue_poll()
     initiate_polling_task_requeue()
     initiate_jira_ticket_polling()
+    initiate_staged_resource_summary_reconciliation()
     initiate_bcrypt_migration_task()
     initiate_post_upgrade_index_creation()
     initiate_post_upgrade_backfill()
 
+    if CONFIG.security.enable_audit_log_resource_middleware:
+        audit_log_resource_writer.start()
+
     # It's just a random bunch of strings when serialized
     if not CONFIG.logging.serialization:
         logger.info(FIDES_ASCII_ART)
@@ -122,6 +130,9 @@ async def lifespan(wrapped_app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Server setup completed in {} seconds", startup_time)
     yield  # All of this happens before the webserver comes up
 
+    # Write the audit log resource records still queued before shutting down
+    await audit_log_resource_writer.stop()
+
 
 app = create_fides_app(lifespan=lifespan)  # type: ignore
 
@@ -1,15 +1,135 @@
+import asyncio
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
 
 from fastapi import Request
 from loguru import logger
+from sqlalchemy import insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from starlette.types import Message
 
 from fides.api.models.sql_models import AuditLogResource  # type: ignore[attr-defined]
 from fides.api.oauth.utils import extract_token_and_load_client
-from fides.common.session_management import get_api_session
+from fides.common.session_management import get_autoclose_db_session
+from fides.config import CONFIG
+
+# An audit log resource record, and the authorization header of its request
+AuditLogResourceRecord = Tuple[Dict[str, Any], Optional[str]]
+
+
+class AuditLogResourceWriter:
+    """
+    Writes audit log resource records in the background, so that requests don't
+    wait on a database session and commit of their own.
+
+    Records are queued in memory and written by a task on the event loop, which
+    resolves the records' users and inserts up to `batch_size` records with a
+    single multi-row insert, in a worker thread. The queue is bounded: once it
+    holds `max_queue_size` records, requests wait for room in it.
+
+    Until the writer is started, e.g. outside of the webserver's lifespan,
+    records are written one by one in a worker thread.
+    """
+
+    def __init__(self, max_queue_size: int, batch_size: int):
+        self.max_queue_size = max_queue_size
+        self.batch_size = max(batch_size, 1)
+        self._queue: Optional[asyncio.Queue[AuditLogResourceRecord]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Starts writing queued records. Must be called from the event loop."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._task = asyncio.create_task(self._run(self._queue))
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Writes the records still queued, waiting at most `timeout` seconds."""
+        queue, task = self._queue, self._task
+        if queue is None or task is None or task.done():
+            return
+        try:
+            await asyncio.wait_for(queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Dropping {} unwritten audit log resource record(s) on shutdown",
+                queue.qsize(),
+            )
+        task.cancel()
+        self._task = None
+        self._queue = None
+
+    async def put(
+        self, audit_log_resource_data: Dict[str, Any], authorization: Optional[str]
+    ) -> None:
+        record = (audit_log_resource_data, authorization)
+        if self._queue is None or not self.running:
+            await run_in_threadpool(self.write_records, [record])
+            return
+        await self._queue.put(record)
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        while True:
+            records = [await queue.get()]
+            while len(records) < self.batch_size:
+                try:
+                    records.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await run_in_threadpool(self.write_records, records)
+            except Exception as exc:
+                logger.error(
+                    "Unable to write {} audit log resource record(s): {}",
+                    len(records),
+                    exc,
+                )
+            finally:
+                for _ in records:
+                    queue.task_done()
+
+    @staticmethod
+    def write_records(records: List[AuditLogResourceRecord]) -> int:
+        """
+        Resolves the user of each record and inserts the records in a single
+        statement. Records whose user can't be resolved are skipped, as they
+        were when each request wrote its own record.
+        """
+        with get_autoclose_db_session() as db:
+            rows = []
+            for audit_log_resource_data, authorization in records:
+                row = {"id": f"aud_{uuid4()}", **audit_log_resource_data}
+                if authorization:
+                    try:
+                        row["user_id"] = get_client_user_id(db, authorization)
+                    except Exception as exc:
+                        logger.debug(exc)
+                        continue
+                rows.append(row)
+            if not rows:
+                return 0
+            try:
+                db.execute(insert(AuditLogResource.__table__).values(rows))
+                db.commit()
+            except SQLAlchemyError as err:
+                db.rollback()
+                logger.debug(err)
+                return 0
+            return len(rows)
+
+
+audit_log_resource_writer = AuditLogResourceWriter(
+    max_queue_size=CONFIG.security.audit_log_resource_queue_size,
+    batch_size=CONFIG.security.audit_log_resource_batch_size,
+)
 
 
 async def handle_audit_log_resource(request: Request) -> None:
@@ -33,13 +153,6 @@ async def handle_audit_log_resource(request: Request) -> None:
         "fides_keys": None,
         "extra_data": None,
     }
-    db: Session = get_api_session()
-
-    # get the user id associated with the request
-    token = request.headers.get("authorization")
-    if token:
-        client = await get_client_user_id(db, token)
-        audit_log_resource_data["user_id"] = client
 
     # Access request body to check for fides_keys
     await set_body(request, await request.body())
@@ -48,23 +161,14 @@ async def handle_audit_log_resource(request: Request) -> None:
     fides_keys: List = await extract_data_from_body(body)
     audit_log_resource_data["fides_keys"] = fides_keys
 
-    # write record to server
-    await write_audit_log_resource_record(db, audit_log_resource_data)
-
-
-async def write_audit_log_resource_record(
-    db: Session, audit_log_resource_data: Dict[str, Any]
-) -> None:
-    """
-    Writes a record to the audit log resource table
-    """
-    try:
-        AuditLogResource.create(db=db, data=audit_log_resource_data)
-    except SQLAlchemyError as err:
-        logger.debug(err)
+    # queue the record to be written to the server, along with the token used
+    # to get the user id associated with the request
+    await audit_log_resource_writer.put(
+        audit_log_resource_data, request.headers.get("authorization")
+    )
 
 
-async def get_client_user_id(db: Session, auth_token: str) -> str:
+def get_client_user_id(db: Session, auth_token: str) -> str:
     """
     Attempts to retrieve a client user_id
     """
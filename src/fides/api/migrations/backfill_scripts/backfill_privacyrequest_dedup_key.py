@@ -0,0 +1,98 @@
+"""Backfill script for the dedup_key column on PrivacyRequest."""
+
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from fides.api.migrations.backfill_scripts.utils import batched_backfill
+from fides.api.models.privacy_request.duplicate_group import (
+    generate_dedup_key_version,
+)
+from fides.config.config_proxy import ConfigProxy
+
+# Requests without a dedup key built from the current matched identity fields
+# which have every matched identity field, with the key generate_dedup_key would
+# build for them: the hashed values joined in field name order. Requests missing
+# an identity field are skipped, as they never get a key, so every batch only
+# selects requests it will update.
+DEDUP_KEYS_QUERY = """
+    SELECT pi.privacy_request_id,
+        string_agg(pi.hashed_value, '|' ORDER BY pi.field_name COLLATE "C") AS dedup_key
+    FROM providedidentity pi
+    JOIN privacyrequest pr ON pr.id = pi.privacy_request_id
+    WHERE pr.dedup_key_version IS DISTINCT FROM :dedup_key_version
+    AND pi.field_name = ANY(:match_identity_fields)
+    AND pi.hashed_value IS NOT NULL
+    GROUP BY pi.privacy_request_id
+    HAVING count(*) = :field_count AND count(DISTINCT pi.field_name) = :field_count
+"""
+
+
+def _get_match_identity_fields(db: Session) -> list[str]:
+    return sorted(
+        set(ConfigProxy(db).privacy_request_duplicate_detection.match_identity_fields)
+    )
+
+
+def _get_query_params(match_identity_fields: list[str]) -> dict[str, Any]:
+    return {
+        "match_identity_fields": match_identity_fields,
+        "field_count": len(match_identity_fields),
+        "dedup_key_version": generate_dedup_key_version(match_identity_fields),
+    }
+
+
+def get_pending_dedup_key_count(db: Session) -> int:
+    """Returns the count of privacy requests that still need a dedup key."""
+    match_identity_fields = _get_match_identity_fields(db)
+    if not match_identity_fields:
+        return 0
+    try:
+        result = db.execute(
+            text(f"SELECT COUNT(*) FROM ({DEDUP_KEYS_QUERY}) AS dedup_keys"),
+            _get_query_params(match_identity_fields),
+        )
+        return result.scalar() or 0
+    except SQLAlchemyError as e:
+        logger.error(
+            f"privacyrequest-dedup_key backfill: Failed to get pending count: {e}"
+        )
+        raise
+
+
+@batched_backfill(
+    name="privacyrequest-dedup_key",
+    pending_count_fn=get_pending_dedup_key_count,
+)
+def backfill_privacyrequest_dedup_key(db: Session, batch_size: int) -> int:
+    """
+    Execute one batch of dedup_key backfill.
+
+    Sets the dedup key of privacy requests created before the column was added,
+    or keyed before the matched identity fields changed, using the identity fields
+    duplicate detection currently matches on.
+    """
+    match_identity_fields = _get_match_identity_fields(db)
+    if not match_identity_fields:
+        return 0
+
+    dedup_key_query = f"""
+        WITH dedup_keys AS (
+            {DEDUP_KEYS_QUERY}
+            LIMIT :batch_size
+        )
+        UPDATE privacyrequest
+        SET dedup_key = dedup_keys.dedup_key, dedup_key_version = :dedup_key_version
+        FROM dedup_keys
+        WHERE privacyrequest.id = dedup_keys.privacy_request_id
+    """
+
+    result = db.execute(
+        text(dedup_key_query),
+        {**_get_query_params(match_identity_fields), "batch_size": batch_size},
+    )
+    db.commit()
+    return result.rowcount
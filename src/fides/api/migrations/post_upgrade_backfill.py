@@ -20,6 +20,9 @@ from redis.lock import Lock
 from sqlalchemy.orm import Session
 
 from fides.api.db.session import get_db_session
+from fides.api.migrations.backfill_scripts.backfill_privacyrequest_dedup_key import (
+    backfill_privacyrequest_dedup_key,
+)
 from fides.api.migrations.backfill_scripts.backfill_stagedresource_is_leaf import (
     backfill_stagedresource_is_leaf,
 )
@@ -88,6 +91,13 @@ def run_all_backfills(
         )
     )
 
+    # Backfill dedup_key column (added in migration c99acefb80ab)
+    results.append(
+        backfill_privacyrequest_dedup_key(
+            db, batch_size, batch_delay_seconds, lock=lock
+        )
+    )
+
     # Add future backfills here:
     # results.append(backfill_some_other_column(db, batch_size, batch_delay_seconds, lock=lock))
     #
@@ -140,6 +140,12 @@ TABLE_OBJECT_MAP: Dict[str, List[Dict[str, str]]] = {
             "type": "index",
             "migration_key": "ix_privacyrequest_policy_created",
         },
+        {
+            "name": "ix_privacyrequest_dedup_key_policy_created",
+            "statement": "CREATE INDEX CONCURRENTLY ix_privacyrequest_dedup_key_policy_created ON privacyrequest (dedup_key, policy_id, created_at)",
+            "type": "index",
+            "migration_key": "ix_privacyrequest_dedup_key_policy_created",
+        },
     ],
     "servednoticehistory": [
         {
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
+import copy
+import time
 from json import loads
 from typing import Any, Dict, Iterable, Optional
 
 from loguru import logger
 from pydantic.v1.utils import deep_update
 from pydash.objects import get
-from sqlalchemy import Boolean, CheckConstraint, Column
+from sqlalchemy import Boolean, CheckConstraint, Column, event
 from sqlalchemy.ext.mutable import MutableDict
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, object_session
 
 from fides.api.db.base_class import Base, JSONTypeOverride
 from fides.api.db.encryption_utils import encrypted_type
+from fides.api.db.util import ORMExecuteState
 from fides.config import FidesConfig
 
 
@@ -202,23 +205,233 @@ class ApplicationConfig(Base):
         """
         config_record = db.query(cls).first()
         if config_record:
-            api_prop = get(config_record.api_set, config_property)
-            config_prop = get(config_record.config_set, config_property, default_value)
-            # if no api-set property found, fall back to config-set
-            if api_prop is None:
-                return config_prop
-
-            # if we want to merge values and have a config property too
-            if merge_values and config_prop is not None:
-                # AND we have iterable api and config-set properties, then we try to merge
-                if not isinstance(api_prop, Iterable) or not isinstance(
-                    config_prop, Iterable
-                ):
-                    raise RuntimeError("Only iterable values can be merged!")
-                return {value for value in (list(api_prop) + list(config_prop))}
-
-            # otherwise, we just use the api-set property
-            return api_prop
+            return _resolve_config_property(
+                config_record.api_set,
+                config_record.config_set,
+                config_property,
+                merge_values,
+                default_value,
+            )
 
         logger.warning("No config record found!")
         return default_value
+
+
+def _resolve_config_property(
+    api_set: Dict[str, Any],
+    config_set: Dict[str, Any],
+    config_property: str,
+    merge_values: bool,
+    default_value: Any,
+) -> Optional[Any]:
+    """Resolves a config property from the api-set and config-set configs of the config record"""
+    api_prop = get(api_set, config_property)
+    config_prop = get(config_set, config_property, default_value)
+    # if no api-set property found, fall back to config-set
+    if api_prop is None:
+        return config_prop
+
+    # if we want to merge values and have a config property too
+    if merge_values and config_prop is not None:
+        # AND we have iterable api and config-set properties, then we try to merge
+        if not isinstance(api_prop, Iterable) or not isinstance(config_prop, Iterable):
+            raise RuntimeError("Only iterable values can be merged!")
+        return {value for value in (list(api_prop) + list(config_prop))}
+
+    # otherwise, we just use the api-set property
+    return api_prop
+
+
+APPLICATION_CONFIG_VERSION_KEY = "application_config_version"
+# How often a process checks the version counter for updates made by other processes
+APPLICATION_CONFIG_VERSION_CHECK_INTERVAL_SECONDS = 1
+# How long a snapshot is used for, regardless of the version counter,
+# so that missed updates (e.g. while Redis is unavailable) are eventually picked up
+APPLICATION_CONFIG_SNAPSHOT_TTL_SECONDS = 60
+
+# Set in Session.info when the session has flushed changes to the config record
+_APPLICATION_CONFIG_CHANGED = "application_config_changed"
+
+
+class ApplicationConfigSnapshot:
+    """
+    An in-memory copy of the config record, shared by the whole process.
+
+    Resolving config properties against the snapshot is a dictionary lookup
+    rather than a query. When the config record is committed, the snapshot is
+    dropped in the committing process and the version counter in Redis is
+    incremented, so that other processes reload their snapshots too.
+    """
+
+    def __init__(
+        self,
+        api_set: Optional[Dict[str, Any]],
+        config_set: Optional[Dict[str, Any]],
+        version: Optional[int],
+    ) -> None:
+        self.api_set = api_set
+        self.config_set = config_set
+        self.version = version
+        self.loaded_at = self.version_checked_at = time.monotonic()
+
+    @classmethod
+    def load(cls, db: Session, version: Optional[int]) -> ApplicationConfigSnapshot:
+        config_record = db.query(ApplicationConfig).first()
+        if not config_record:
+            return cls(None, None, version)
+        return cls(
+            copy.deepcopy(dict(config_record.api_set)),
+            copy.deepcopy(dict(config_record.config_set)),
+            version,
+        )
+
+    def get_resolved_config_property(
+        self,
+        config_property: str,
+        merge_values: bool = False,
+        default_value: Any = None,
+    ) -> Optional[Any]:
+        """See `ApplicationConfig.get_resolved_config_property`"""
+        if self.api_set is None or self.config_set is None:
+            logger.warning("No config record found!")
+            return default_value
+
+        value = _resolve_config_property(
+            self.api_set, self.config_set, config_property, merge_values, default_value
+        )
+        # Callers get their own copy of mutable values, so the snapshot can't be modified
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+        return value
+
+
+_snapshot: Optional[ApplicationConfigSnapshot] = None
+
+
+def _get_application_config_version() -> Optional[int]:
+    """Returns the version counter of the config record, or None if Redis is unavailable"""
+    try:
+        # Imported here as fides.api.util.cache depends on fides.api.tasks,
+        # which depends on the models
+        from fides.api.util.cache import get_cache
+
+        return int(get_cache().get(APPLICATION_CONFIG_VERSION_KEY) or 0)
+    except Exception as exc:
+        logger.debug("Unable to get the application config version: {}", exc)
+        return None
+
+
+def get_application_config_snapshot(
+    db: Optional[Session] = None,
+) -> ApplicationConfigSnapshot:
+    """
+    Returns the process-wide snapshot of the config record, (re)loading it if it
+    is out of date. The given db session is only used when the snapshot needs to be
+    loaded; if none is given, a session is opened for it.
+    """
+    global _snapshot  # pylint: disable=W0603
+
+    snapshot = _snapshot
+    now = time.monotonic()
+    if (
+        snapshot is not None
+        and now - snapshot.loaded_at < APPLICATION_CONFIG_SNAPSHOT_TTL_SECONDS
+    ):
+        if (
+            now - snapshot.version_checked_at
+            < APPLICATION_CONFIG_VERSION_CHECK_INTERVAL_SECONDS
+        ):
+            return snapshot
+        version = _get_application_config_version()
+        snapshot.version_checked_at = now
+        if version is None or version == snapshot.version:
+            return snapshot
+
+    # The version is read before the record, so an update committed in between
+    # is picked up at the next version check
+    version = _get_application_config_version()
+    if db is not None:
+        snapshot = ApplicationConfigSnapshot.load(db, version)
+    else:
+        # Imported here to avoid creating the API engine when the models are imported
+        from fides.common.session_management import get_autoclose_db_session
+
+        with get_autoclose_db_session() as session:
+            snapshot = ApplicationConfigSnapshot.load(session, version)
+    _snapshot = snapshot
+    return snapshot
+
+
+def get_resolved_config_property(
+    db: Optional[Session],
+    config_property: str,
+    merge_values: bool = False,
+    default_value: Any = None,
+) -> Optional[Any]:
+    """
+    Gets the 'resolved' config property from the process-wide snapshot of the config record.
+
+    If the given db session has uncommitted changes to the config record, the property
+    is resolved against the session instead, so that the changes are visible to it.
+    """
+    if db is not None and db.info.get(_APPLICATION_CONFIG_CHANGED):
+        return ApplicationConfig.get_resolved_config_property(
+            db, config_property, merge_values, default_value
+        )
+    return get_application_config_snapshot(db).get_resolved_config_property(
+        config_property, merge_values, default_value
+    )
+
+
+def invalidate_application_config_snapshot(publish: bool = True) -> None:
+    """
+    Drops this process's snapshot of the config record and, if `publish` is set,
+    increments the version counter so that other processes drop theirs.
+    """
+    global _snapshot  # pylint: disable=W0603
+    _snapshot = None
+    if not publish:
+        return
+    try:
+        from fides.api.util.cache import get_cache
+
+        get_cache().incr(APPLICATION_CONFIG_VERSION_KEY)
+    except Exception as exc:
+        logger.warning("Unable to publish the application config update: {}", exc)
+
+
+@event.listens_for(ApplicationConfig, "after_insert")
+@event.listens_for(ApplicationConfig, "after_update")
+@event.listens_for(ApplicationConfig, "after_delete")
+def _flag_application_config_change(
+    mapper: Any, connection: Any, target: ApplicationConfig
+) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info[_APPLICATION_CONFIG_CHANGED] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _flag_bulk_application_config_change(orm_execute_state: ORMExecuteState) -> None:
+    """Catches bulk updates and deletes, e.g. `db.query(ApplicationConfig).delete()`"""
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if getattr(table, "name", None) == ApplicationConfig.__table__.name:
+        orm_execute_state.session.info[_APPLICATION_CONFIG_CHANGED] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_application_config_change(session: Session) -> None:
+    if session.info.pop(_APPLICATION_CONFIG_CHANGED, False):
+        invalidate_application_config_snapshot()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_application_config_change(session: Session) -> None:
+    if session.info.pop(_APPLICATION_CONFIG_CHANGED, False):
+        invalidate_application_config_snapshot(publish=False)
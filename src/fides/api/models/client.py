@@ -4,9 +4,10 @@ import json
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-from sqlalchemy import ARRAY, Column, ForeignKey, String
+from loguru import logger
+from sqlalchemy import ARRAY, Column, ForeignKey, String, event, inspect
 from sqlalchemy.ext.declarative import declared_attr
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, object_session
 
 from fides.api.cryptography.cryptographic_util import (
     generate_salt,
@@ -25,9 +26,10 @@ from fides.api.cryptography.schemas.jwt import (
     JWE_PAYLOAD_SYSTEMS,
 )
 from fides.api.db.base_class import Base
+from fides.api.db.util import ORMExecuteState
 from fides.api.models.fides_user import FidesUser
 from fides.api.oauth.jwt import generate_jwe
-from fides.config import FidesConfig
+from fides.config import CONFIG, FidesConfig
 
 DEFAULT_SCOPES: list[str] = []
 DEFAULT_ROLES: list[str] = []
@@ -35,6 +37,9 @@ DEFAULT_SYSTEMS: list[str] = []
 DEFAULT_CONNECTIONS: list[str] = []
 DEFAULT_MONITORS: list[str] = []
 
+# Session info flag, set when a flush changed what a verified access token grants
+_VERIFIED_TOKENS_CHANGED = "verified_tokens_changed"
+
 
 def _generate_and_hash_secret(
     length_bytes: int, encoding: str = "UTF-8"
@@ -256,3 +261,60 @@ def _get_root_client_detail(
         connections=DEFAULT_CONNECTIONS,
         monitors=DEFAULT_MONITORS,
     )
+
+
+@event.listens_for(ClientDetail, "after_update")
+@event.listens_for(ClientDetail, "after_delete")
+def _flag_client_change(mapper: Any, connection: Any, target: ClientDetail) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info[_VERIFIED_TOKENS_CHANGED] = True
+
+
+@event.listens_for(FidesUser, "after_update")
+def _flag_password_reset(mapper: Any, connection: Any, target: FidesUser) -> None:
+    """Tokens issued before a password reset are no longer valid"""
+    session = object_session(target)
+    if (
+        session is not None
+        and inspect(target).attrs.password_reset_at.history.has_changes()
+    ):
+        session.info[_VERIFIED_TOKENS_CHANGED] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _flag_bulk_client_change(orm_execute_state: ORMExecuteState) -> None:
+    """Catches bulk updates and deletes of clients and users"""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if getattr(table, "name", None) in (
+        ClientDetail.__tablename__,
+        FidesUser.__tablename__,
+    ):
+        orm_execute_state.session.info[_VERIFIED_TOKENS_CHANGED] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_verified_tokens(session: Session) -> None:
+    if not session.info.pop(_VERIFIED_TOKENS_CHANGED, False):
+        return
+    try:
+        # Imported here, as the token cache depends on this module
+        from fides.api.oauth.verified_token_cache import (  # pylint: disable=cyclic-import
+            invalidate_verified_tokens,
+        )
+
+        invalidate_verified_tokens()
+    except Exception as exc:
+        logger.error(
+            "Unable to invalidate the verified access tokens of other servers, they expire from their caches within {} seconds: {}",
+            CONFIG.security.oauth_verified_token_cache_ttl_seconds,
+            exc,
+        )
+        raise
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_client_change(session: Session) -> None:
+    session.info.pop(_VERIFIED_TOKENS_CHANGED, None)
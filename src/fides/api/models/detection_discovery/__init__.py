@@ -20,6 +20,10 @@ from .monitor_task import (
     update_monitor_task_with_execution_log,
 )
 from .staged_resource_error import StagedResourceError
+from .staged_resource_summary import (
+    StagedResourceSummary,
+    reconcile_staged_resource_summaries,
+)
 
 __all__ = [
     "ClassificationBenchmark",
@@ -33,7 +37,9 @@ __all__ = [
     "StagedResource",
     "StagedResourceAncestor",
     "StagedResourceError",
+    "StagedResourceSummary",
     "fetch_staged_resources_by_type_query",
+    "reconcile_staged_resource_summaries",
     "MonitorTask",
     "MonitorTaskExecutionLog",
     "MonitorTaskType",
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum, StrEnum
 from re import match
-from typing import Any, Dict, Iterable, List, Optional, Set, Type, TypeVar
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Type, TypeVar
 
 from loguru import logger
 from sqlalchemy import (
@@ -31,6 +32,7 @@ from sqlalchemy.orm import RelationshipProperty, Session, relationship, validate
 from sqlalchemy.orm.query import Query
 
 from fides.api.db.base_class import Base, FidesBase
+from fides.api.db.bulk_copy import copy_rows
 from fides.api.models.connectionconfig import ConnectionConfig
 from fides.api.models.detection_discovery.staged_resource_error import (
     StagedResourceError,
@@ -420,6 +422,19 @@ class MonitorConfig(Base):
         return value
 
 
+STAGED_RESOURCE_ANCESTOR_STAGING_TABLE = "stagedresourceancestor_staging"
+STAGED_RESOURCE_ANCESTOR_SCOPE_TABLE = "stagedresourceancestor_scope"
+
+
+@dataclass
+class StagedResourceAncestorLinkDiff:
+    """The number of ancestor links changed by a sync of a subtree's links."""
+
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+
+
 class StagedResourceAncestor(Base):
     """
     A simple junction table that is used to store the many-to-many relationship
@@ -537,6 +552,165 @@ class StagedResourceAncestor(Base):
             )
             db.execute(stmt_text, current_batch)
 
+    @staticmethod
+    def _iter_link_rows(
+        ancestor_links: Dict[str, Set[tuple[str, int]]],
+    ) -> Iterator[tuple[str, str, int]]:
+        for descendant_urn, ancestor_urns in ancestor_links.items():
+            for ancestor_urn, distance in ancestor_urns or ():
+                yield ancestor_urn, descendant_urn, distance
+
+    @classmethod
+    def _load_staging_links(
+        cls, db: Session, ancestor_links: Dict[str, Set[tuple[str, int]]]
+    ) -> int:
+        """
+        Streams the links into a temporary staging table with COPY, returning the
+        number of links loaded. Temporary tables aren't written to the WAL, like
+        unlogged tables, and the staging table is dropped at the end of the
+        transaction.
+        """
+        db.execute(
+            text(
+                f"""
+                CREATE TEMPORARY TABLE IF NOT EXISTS {STAGED_RESOURCE_ANCESTOR_STAGING_TABLE} (
+                    ancestor_urn VARCHAR NOT NULL,
+                    descendant_urn VARCHAR NOT NULL,
+                    distance INTEGER
+                ) ON COMMIT DROP;
+                TRUNCATE {STAGED_RESOURCE_ANCESTOR_STAGING_TABLE};
+                """
+            )
+        )
+        return copy_rows(
+            db,
+            STAGED_RESOURCE_ANCESTOR_STAGING_TABLE,
+            ["ancestor_urn", "descendant_urn", "distance"],
+            cls._iter_link_rows(ancestor_links),
+        )
+
+    @classmethod
+    def bulk_load_staged_resource_ancestor_links(
+        cls,
+        db: Session,
+        ancestor_links: Dict[str, Set[tuple[str, int]]],
+    ) -> int:
+        """
+        Bulk inserts the given links, like create_all_staged_resource_ancestor_links,
+        but streams them through COPY into a staging table and merges them into the
+        StagedResourceAncestor table with a single statement, which scales to tens of
+        millions of links.
+
+        Existing links are kept as they are. The transaction is _not_ committed, so
+        the caller must commit it to persist the changes.
+
+        Returns the number of links inserted.
+        """
+        loaded = cls._load_staging_links(db, ancestor_links)
+        if not loaded:
+            return 0
+        result = db.execute(
+            text(
+                f"""
+                INSERT INTO stagedresourceancestor (id, ancestor_urn, descendant_urn, distance)
+                SELECT DISTINCT ON (ancestor_urn, descendant_urn)
+                    'srl_' || gen_random_uuid(), ancestor_urn, descendant_urn, distance
+                FROM {STAGED_RESOURCE_ANCESTOR_STAGING_TABLE}
+                ORDER BY ancestor_urn, descendant_urn, distance
+                ON CONFLICT (ancestor_urn, descendant_urn) DO NOTHING;
+                """
+            )
+        )
+        logger.debug(
+            f"Bulk loaded {loaded} staged resource ancestor links, {result.rowcount} new"
+        )
+        return result.rowcount
+
+    @classmethod
+    def sync_staged_resource_ancestor_links(
+        cls,
+        db: Session,
+        ancestor_links: Dict[str, Set[tuple[str, int]]],
+    ) -> StagedResourceAncestorLinkDiff:
+        """
+        Makes the ancestor links of the given descendants match `ancestor_links`,
+        touching only the links that changed: links to ancestors a descendant no
+        longer has are deleted, changed distances are updated and new links are
+        inserted. Descendants that aren't keys of `ancestor_links` are left as they
+        are, so a monitor execution only needs to pass the subtree that changed. A
+        descendant with an empty set of ancestors has all of its links deleted.
+
+        The transaction is _not_ committed, so the caller must commit it to persist
+        the changes.
+        """
+        if not ancestor_links:
+            return StagedResourceAncestorLinkDiff()
+        cls._load_staging_links(db, ancestor_links)
+        db.execute(
+            text(
+                f"""
+                CREATE TEMPORARY TABLE IF NOT EXISTS {STAGED_RESOURCE_ANCESTOR_SCOPE_TABLE} (
+                    descendant_urn VARCHAR PRIMARY KEY
+                ) ON COMMIT DROP;
+                TRUNCATE {STAGED_RESOURCE_ANCESTOR_SCOPE_TABLE};
+                """
+            )
+        )
+        copy_rows(
+            db,
+            STAGED_RESOURCE_ANCESTOR_SCOPE_TABLE,
+            ["descendant_urn"],
+            ((descendant_urn,) for descendant_urn in ancestor_links),
+        )
+        db.execute(text(f"ANALYZE {STAGED_RESOURCE_ANCESTOR_STAGING_TABLE}"))
+
+        deleted = db.execute(
+            text(
+                f"""
+                DELETE FROM stagedresourceancestor AS link
+                USING {STAGED_RESOURCE_ANCESTOR_SCOPE_TABLE} AS scope
+                WHERE link.descendant_urn = scope.descendant_urn
+                AND NOT EXISTS (
+                    SELECT 1 FROM {STAGED_RESOURCE_ANCESTOR_STAGING_TABLE} AS staged
+                    WHERE staged.descendant_urn = link.descendant_urn
+                    AND staged.ancestor_urn = link.ancestor_urn
+                );
+                """
+            )
+        ).rowcount
+        updated = db.execute(
+            text(
+                f"""
+                UPDATE stagedresourceancestor AS link
+                SET distance = staged.distance
+                FROM {STAGED_RESOURCE_ANCESTOR_STAGING_TABLE} AS staged
+                WHERE staged.descendant_urn = link.descendant_urn
+                AND staged.ancestor_urn = link.ancestor_urn
+                AND link.distance IS DISTINCT FROM staged.distance;
+                """
+            )
+        ).rowcount
+        inserted = db.execute(
+            text(
+                f"""
+                INSERT INTO stagedresourceancestor (id, ancestor_urn, descendant_urn, distance)
+                SELECT DISTINCT ON (ancestor_urn, descendant_urn)
+                    'srl_' || gen_random_uuid(), ancestor_urn, descendant_urn, distance
+                FROM {STAGED_RESOURCE_ANCESTOR_STAGING_TABLE}
+                ORDER BY ancestor_urn, descendant_urn, distance
+                ON CONFLICT (ancestor_urn, descendant_urn) DO NOTHING;
+                """
+            )
+        ).rowcount
+
+        diff = StagedResourceAncestorLinkDiff(
+            inserted=inserted, updated=updated, deleted=deleted
+        )
+        logger.debug(
+            f"Synced ancestor links of {len(ancestor_links)} staged resources: {diff}"
+        )
+        return diff
+
 
 _StagedResourceT = TypeVar("_StagedResourceT", bound="StagedResourceBase")
 
@@ -0,0 +1,238 @@
+"""
+Rollup of staged resource counts, used for discovery monitor and system summaries.
+
+Aggregating the `stagedresource` table at read time scans every resource of the
+monitors or systems being summarized. Instead, `stagedresourcesummary` holds the
+number of staged resources for each combination of summary dimensions, and is
+kept up to date by statement-level triggers on `stagedresource` (see the
+`add_stagedresourcesummary` migration), so that it changes in the same
+transaction as the resources it counts and summaries are small index reads.
+
+`reconcile_staged_resource_summaries` recounts the rollup from `stagedresource`
+and fixes any drift, e.g. after the triggers were disabled for a bulk load.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import BigInteger, Boolean, Column, Index, String, func, text
+from sqlalchemy.orm import Session
+
+from fides.api.db.base_class import Base
+
+# The columns a staged resource is counted by, in the order of the unique index
+SUMMARY_DIMENSIONS = (
+    "monitor_config_id",
+    "system_id",
+    "vendor_id",
+    "resource_type",
+    "diff_status",
+    "is_classified",
+    "consent_aggregated",
+)
+
+# How each summary dimension is computed from a stagedresource row, the same way as
+# the triggers do. Empty strings are counted as NULL
+STAGED_RESOURCE_SUMMARY_DIMENSION_EXPRESSIONS = {
+    "monitor_config_id": "nullif(monitor_config_id, '')",
+    "system_id": "nullif(system_id, '')",
+    "vendor_id": "nullif(vendor_id, '')",
+    "resource_type": "nullif(resource_type, '')",
+    "diff_status": "nullif(diff_status, '')",
+    "is_classified": "coalesce(cardinality(classifications), 0) > 0",
+    "consent_aggregated": "nullif(meta->>'consent_aggregated', '')",
+}
+
+
+@dataclass
+class StagedResourceSummaryReconciliation:
+    """The rollup rows fixed by a reconciliation."""
+
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+
+    @property
+    def drifted(self) -> bool:
+        return bool(self.inserted or self.updated or self.deleted)
+
+
+class StagedResourceSummary(Base):
+    """
+    The number of staged resources with a given monitor, system, vendor, resource
+    type, diff status, classification state and consent state.
+
+    Rows are maintained by triggers on `stagedresource`, never by the ORM. Rows
+    whose count dropped to zero are kept until the next reconciliation, so reads
+    should filter on `resource_count > 0`.
+    """
+
+    monitor_config_id = Column(String, nullable=True)
+    system_id = Column(String, nullable=True)
+    vendor_id = Column(String, nullable=True)
+    resource_type = Column(String, nullable=True)
+    diff_status = Column(String, nullable=True)
+    is_classified = Column(Boolean, nullable=False)
+    consent_aggregated = Column(String, nullable=True)
+    resource_count = Column(BigInteger, nullable=False, server_default="0")
+
+    __table_args__ = (
+        # The conflict target of the trigger upserts. NULLs are coalesced so that
+        # resources without e.g. a system are counted in a single row
+        Index(
+            "uq_stagedresourcesummary_dimensions",
+            text("coalesce(monitor_config_id, '')"),
+            text("coalesce(system_id, '')"),
+            text("coalesce(vendor_id, '')"),
+            text("coalesce(resource_type, '')"),
+            text("coalesce(diff_status, '')"),
+            "is_classified",
+            text("coalesce(consent_aggregated, '')"),
+            unique=True,
+        ),
+        Index(
+            "ix_stagedresourcesummary_system_vendor",
+            "system_id",
+            "vendor_id",
+        ),
+    )
+
+    @classmethod
+    def get_monitor_summaries(
+        cls,
+        db: Session,
+        monitor_config_ids: Optional[List[str]] = None,
+    ) -> List[StagedResourceSummary]:
+        """Returns the non-empty rollup rows of the given monitors, or all monitors."""
+        query = db.query(cls).filter(cls.resource_count > 0)
+        if monitor_config_ids is not None:
+            query = query.filter(cls.monitor_config_id.in_(monitor_config_ids))
+        return query.all()
+
+    @classmethod
+    def get_system_summaries(
+        cls,
+        db: Session,
+        system_ids: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[str], Optional[str], Optional[str], int]]:
+        """
+        Returns the number of staged resources by system, vendor and consent state,
+        for the given systems or all systems.
+        """
+        query = (
+            db.query(
+                cls.system_id,
+                cls.vendor_id,
+                cls.consent_aggregated,
+                func.sum(cls.resource_count),
+            )
+            .filter(cls.resource_count > 0)
+            .group_by(cls.system_id, cls.vendor_id, cls.consent_aggregated)
+        )
+        if system_ids is not None:
+            query = query.filter(cls.system_id.in_(system_ids))
+        return [
+            (system_id, vendor_id, consent_aggregated, int(count))
+            for system_id, vendor_id, consent_aggregated, count in query.all()
+        ]
+
+    @classmethod
+    def get_counts(cls, db: Session, **filters: Any) -> Dict[Tuple[Any, ...], int]:
+        """
+        Returns the number of staged resources for each combination of the summary
+        dimensions, keyed by the dimensions in `SUMMARY_DIMENSIONS` order, optionally
+        filtered by dimension values.
+        """
+        query = db.query(cls).filter(cls.resource_count > 0)
+        for dimension, value in filters.items():
+            if dimension not in SUMMARY_DIMENSIONS:
+                raise ValueError(
+                    f"Unknown staged resource summary dimension: {dimension}"
+                )
+            query = query.filter(getattr(cls, dimension).is_not_distinct_from(value))
+        return {
+            tuple(getattr(row, dimension) for dimension in SUMMARY_DIMENSIONS): (
+                row.resource_count
+            )
+            for row in query.all()
+        }
+
+
+def reconcile_staged_resource_summaries(
+    db: Session,
+) -> StagedResourceSummaryReconciliation:
+    """
+    Recounts the staged resources and fixes the rollup rows that drifted, removing
+    the rows that no longer count any resources.
+
+    The rollup table is locked against the triggers while it's recounted, so writes
+    to `stagedresource` wait for the reconciliation rather than being lost or
+    counted twice. Commits the transaction.
+    """
+    dimensions = ", ".join(SUMMARY_DIMENSIONS)
+    expressions = ", ".join(
+        f"{STAGED_RESOURCE_SUMMARY_DIMENSION_EXPRESSIONS[dimension]} AS {dimension}"
+        for dimension in SUMMARY_DIMENSIONS
+    )
+    matches = " AND ".join(
+        f"summary.{dimension} IS NOT DISTINCT FROM actual.{dimension}"
+        for dimension in SUMMARY_DIMENSIONS
+    )
+
+    db.execute(text("LOCK TABLE stagedresourcesummary IN SHARE ROW EXCLUSIVE MODE"))
+    db.execute(
+        text(
+            f"""
+            CREATE TEMPORARY TABLE stagedresourcesummary_actual ON COMMIT DROP AS
+            SELECT {expressions}, count(*) AS resource_count
+            FROM stagedresource
+            GROUP BY {", ".join(str(i + 1) for i in range(len(SUMMARY_DIMENSIONS)))}
+            """
+        )
+    )
+
+    deleted = db.execute(
+        text(
+            f"""
+            DELETE FROM stagedresourcesummary AS summary
+            WHERE NOT EXISTS (
+                SELECT 1 FROM stagedresourcesummary_actual AS actual WHERE {matches}
+            )
+            """
+        )
+    ).rowcount
+    updated = db.execute(
+        text(
+            f"""
+            UPDATE stagedresourcesummary AS summary
+            SET resource_count = actual.resource_count, updated_at = now()
+            FROM stagedresourcesummary_actual AS actual
+            WHERE {matches} AND summary.resource_count <> actual.resource_count
+            """
+        )
+    ).rowcount
+    inserted = db.execute(
+        text(
+            f"""
+            INSERT INTO stagedresourcesummary (id, {dimensions}, resource_count)
+            SELECT 'sta_' || gen_random_uuid(), {dimensions}, resource_count
+            FROM stagedresourcesummary_actual AS actual
+            WHERE NOT EXISTS (
+                SELECT 1 FROM stagedresourcesummary AS summary WHERE {matches}
+            )
+            """
+        )
+    ).rowcount
+    db.commit()
+
+    result = StagedResourceSummaryReconciliation(
+        inserted=inserted, updated=updated, deleted=deleted
+    )
+    if result.drifted:
+        logger.warning(f"Reconciled drifted staged resource summaries: {result}")
+    else:
+        logger.info("Staged resource summaries are up to date")
+    return result
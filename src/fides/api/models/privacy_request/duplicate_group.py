@@ -31,6 +31,41 @@ def generate_deterministic_uuid(rule_version: str, dedup_key: str) -> uuid.UUID:
     return uuid.UUID(hashlib.md5(hash_input).hexdigest())
 
 
+def generate_dedup_key(
+    hashed_identities: dict[str, str], match_identity_fields: list[str]
+) -> str:
+    """Generate the dedup key for a request from its hashed identity values.
+
+    The key joins the hashed values of the matched identity fields, ordered by
+    field name, so requests with the same matched identities share a key.
+
+    Raises:
+        ValueError: If the request is missing any of the matched identity fields
+    """
+    matched_identities = {
+        field_name: hashed_value
+        for field_name, hashed_value in hashed_identities.items()
+        if field_name in match_identity_fields
+    }
+    if len(matched_identities) != len(match_identity_fields):
+        raise ValueError(
+            "This request does not contain the required identity fields for duplicate detection."
+        )
+    return "|".join(
+        [matched_identities[field] for field in sorted(match_identity_fields)]
+    )
+
+
+def generate_dedup_key_version(match_identity_fields: list[str]) -> str:
+    """Generate a stable short hash for the identity fields dedup keys are built from.
+
+    It's stored alongside each dedup key, so keys built from other identity fields
+    aren't compared to keys built from the current ones.
+    """
+    normalized = json.dumps(sorted(set(match_identity_fields)))
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:8]
+
+
 def generate_rule_version(config: DuplicateDetectionSettings) -> str:
     """Generate a stable short hash for the dedup rule config."""
     normalized = json.dumps(config.model_dump(), sort_keys=True)
@@ -83,7 +83,11 @@ from fides.api.models.pre_approval_webhook import (
     PreApprovalWebhook,
     PreApprovalWebhookReply,
 )
-from fides.api.models.privacy_request.duplicate_group import DuplicateGroup
+from fides.api.models.privacy_request.duplicate_group import (
+    DuplicateGroup,
+    generate_dedup_key,
+    generate_dedup_key_version,
+)
 from fides.api.models.privacy_request.execution_log import (
     COMPLETED_EXECUTION_LOG_STATUSES,
     EXITED_EXECUTION_LOG_STATUSES,
@@ -126,6 +130,7 @@ from fides.api.util.identity_verification import IdentityVerificationMixin
 from fides.api.util.logger import Pii
 from fides.api.util.logger_context_utils import Contextualizable, LoggerContextKeys
 from fides.config import CONFIG
+from fides.config.config_proxy import ConfigProxy
 from fides.service.attachment_service import AttachmentService
 
 if TYPE_CHECKING:
@@ -152,6 +157,14 @@ class PrivacyRequest(
             "policy_id",
             "created_at",
         ),
+        # Duplicate detection looks requests up by their dedup key, within a
+        # policy and a created_at time window
+        Index(
+            "ix_privacyrequest_dedup_key_policy_created",
+            "dedup_key",
+            "policy_id",
+            "created_at",
+        ),
     )
 
     external_id = Column(String, index=True)
@@ -256,6 +269,11 @@ class PrivacyRequest(
         back_populates="privacy_requests",
         uselist=False,
     )
+    # The hashed values of the identities duplicate detection matches on, as of
+    # when they were persisted, and the version of the matched identity fields the
+    # key was built from. See generate_dedup_key and generate_dedup_key_version.
+    dedup_key = Column(String, nullable=True)
+    dedup_key_version = Column(String, nullable=True)
 
     # A PrivacyRequest can be soft deleted, so we store when it was deleted
     deleted_at = Column(DateTime(timezone=True), nullable=True)
@@ -612,6 +630,11 @@ class PrivacyRequest(
                     data=provided_identity_data,
                 )
 
+        self.update_dedup_key(
+            db,
+            ConfigProxy(db).privacy_request_duplicate_detection.match_identity_fields,
+        )
+
         # Simultaneously add identities to automaton for fuzzy search
         if CONFIG.execution.fuzzy_search_enabled:
             try:
@@ -620,6 +643,34 @@ class PrivacyRequest(
                 # This should never affect the ability to create privacy requests
                 logger.error(f"Could not add identities to Automaton: {Pii(str(exc))}")
 
+    def update_dedup_key(self, db: Session, match_identity_fields: List[str]) -> None:
+        """
+        Stores the key duplicate detection looks this request up by, or None if the
+        request doesn't have all of the identity fields duplicates are matched on,
+        along with the version of the matched identity fields.
+        """
+        dedup_key = None
+        if match_identity_fields:
+            hashed_identities = dict(
+                db.query(ProvidedIdentity.field_name, ProvidedIdentity.hashed_value)
+                .filter(
+                    ProvidedIdentity.privacy_request_id == self.id,
+                    ProvidedIdentity.field_name.in_(match_identity_fields),
+                    ProvidedIdentity.hashed_value.isnot(None),
+                )
+                .all()
+            )
+            try:
+                dedup_key = generate_dedup_key(hashed_identities, match_identity_fields)
+            except ValueError:
+                pass
+
+        dedup_key_version = generate_dedup_key_version(match_identity_fields)
+        if (dedup_key, dedup_key_version) != (self.dedup_key, self.dedup_key_version):
+            self.dedup_key = dedup_key  # type: ignore[assignment]
+            self.dedup_key_version = dedup_key_version  # type: ignore[assignment]
+            self.save(db)
+
     def persist_custom_privacy_request_fields(
         self,
         db: Session,
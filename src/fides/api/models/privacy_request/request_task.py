@@ -124,14 +124,14 @@ class RequestTask(WorkerTask, Base):
     # by data category for the end user.
     _access_data = Column(  # An encrypted JSON String - saved as a list of Rows
         "access_data",
-        encrypted_type(type_in=JSONTypeOverride),
+        encrypted_type(type_in=JSONTypeOverride(typed_codec=True)),
     )
 
     # This is the raw access data saved in erasure format (with placeholders preserved) to perform a masking request.
     # First saved on the access node, and then copied to the corresponding erasure node.
     _data_for_erasures = Column(  # An encrypted JSON String - saved as a list of rows
         "data_for_erasures",
-        encrypted_type(type_in=JSONTypeOverride),
+        encrypted_type(type_in=JSONTypeOverride(typed_codec=True)),
     )
 
     # Use descriptors for automatic external storage handling
@@ -416,7 +416,7 @@ class RequestTaskSubRequest(Base):
     # by data category for the end user.
     _access_data = Column(  # An encrypted JSON String - saved as a list of Rows
         "access_data",
-        encrypted_type(type_in=JSONTypeOverride),
+        encrypted_type(type_in=JSONTypeOverride(typed_codec=True)),
     )
 
     # Use descriptors for automatic external storage handling
@@ -38,6 +38,12 @@ from fides.api.models.pre_approval_webhook import PreApprovalWebhook
 from fides.api.models.privacy_request import RequestTask
 from fides.api.oauth.jwt import decrypt_jwe
 from fides.api.oauth.roles import ROLES_TO_SCOPES_MAPPING, get_scopes_from_roles
+from fides.api.oauth.verified_token_cache import (
+    VerifiedToken,
+    VerifiedTokenStore,
+    get_token_digest,
+    get_verified_token_store,
+)
 from fides.api.request_context import set_user_id
 from fides.api.schemas.external_https import (
     DownloadTokenJWE,
@@ -619,21 +625,47 @@ def extract_token_and_load_client(
     *,
     token_duration_override: Optional[int] = None,
 ) -> Tuple[Dict, ClientDetail]:
-    """Extract the token, verify it's valid, and likewise load the client as part of authorization"""
+    """Extract the token, verify it's valid, and likewise load the client as part of authorization
+
+    Tokens which were verified before are served from the verified token cache,
+    without decrypting the token or querying the client, see `verified_token_cache`.
+    """
     if authorization is None:
         logger.debug("No authorization supplied.")
         raise AuthenticationError(detail="Authentication Failure")
 
+    token_duration = (
+        token_duration_override or CONFIG.security.oauth_access_token_expire_minutes
+    )
+    token_store: Optional[VerifiedTokenStore] = None
+    digest = ""
+    if (
+        CONFIG.security.oauth_verified_token_cache_size > 0
+        and CONFIG.security.oauth_verified_token_cache_ttl_seconds > 0
+    ):
+        token_store = get_verified_token_store()
+        digest = get_token_digest(authorization)
+        verified_token = token_store.get(digest)
+        if verified_token is not None:
+            if is_token_expired_by_payload(verified_token.token_data, token_duration):
+                token_store.discard(digest)
+                logger.debug("Auth token expired.")
+                raise AuthorizationError(detail="Not Authorized for this action")
+            cached_client = verified_token.load_client(db)
+            if cached_client is None:
+                token_store.discard(digest)
+                logger.debug("Auth token belongs to an invalid client_id.")
+                raise AuthorizationError(detail="Not Authorized for this action")
+            _set_client_user_id(cached_client)
+            return verified_token.token_data, cached_client
+
     try:
         token_data = json.loads(extract_payload(authorization, get_encryption_key()))
     except (JoseError, ValueError) as exc:
         logger.debug("Unable to parse auth token.")
         raise AuthorizationError(detail="Not Authorized for this action") from exc
 
-    if is_token_expired_by_payload(
-        token_data,
-        token_duration_override or CONFIG.security.oauth_access_token_expire_minutes,
-    ):
+    if is_token_expired_by_payload(token_data, token_duration):
         logger.debug("Auth token expired.")
         raise AuthorizationError(detail="Not Authorized for this action")
 
@@ -664,9 +696,20 @@ def extract_token_and_load_client(
     # Invalidate tokens issued prior to the user's most recent password reset.
     check_token_invalidation(issued_at_dt, token_data, client)
 
-    # Populate request-scoped context with the authenticated user identifier.
-    # Prefer the linked user_id; fall back to the client id when this is the
-    # special root client (which has no associated FidesUser row).
+    if token_store is not None:
+        token_store.put(digest, VerifiedToken.from_client(token_data, client))
+
+    _set_client_user_id(client)
+
+    return token_data, client
+
+
+def _set_client_user_id(client: ClientDetail) -> None:
+    """
+    Populate request-scoped context with the authenticated user identifier.
+    Prefer the linked user_id; fall back to the client id when this is the
+    special root client (which has no associated FidesUser row).
+    """
     ctx_user_id = client.user_id
     if not ctx_user_id and client.id == CONFIG.security.oauth_root_client_id:
         ctx_user_id = CONFIG.security.oauth_root_client_id
@@ -674,8 +717,6 @@ def extract_token_and_load_client(
     if ctx_user_id:
         set_user_id(ctx_user_id)
 
-    return token_data, client
-
 
 async def extract_token_and_load_client_async(
     authorization: str = Security(oauth2_scheme),
@@ -743,15 +784,7 @@ async def extract_token_and_load_client_async(
     # Invalidate tokens issued prior to the user's most recent password reset.
     check_token_invalidation(issued_at_dt, token_data, client)
 
-    # Populate request-scoped context with the authenticated user identifier.
-    # Prefer the linked user_id; fall back to the client id when this is the
-    # special root client (which has no associated FidesUser row).
-    ctx_user_id = client.user_id
-    if not ctx_user_id and client.id == CONFIG.security.oauth_root_client_id:
-        ctx_user_id = CONFIG.security.oauth_root_client_id
-
-    if ctx_user_id:
-        set_user_id(ctx_user_id)
+    _set_client_user_id(client)
 
     return token_data, client
 
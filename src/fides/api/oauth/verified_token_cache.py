@@ -0,0 +1,166 @@
+"""
+In-process cache of verified OAuth access tokens.
+
+Authenticating a request decrypts its JWE and loads the token's client from the
+database. Both are deterministic for a given token until the client or its user
+changes, so the result of a successful verification is cached, keyed by a digest
+of the token, and reused by later requests with the same token:
+
+* the decoded payload, which is re-checked for expiry on every use, and
+* a snapshot of the client's columns (scopes, roles, systems, ...), which is
+  merged into the request's session without querying the database.
+
+The cache is held by a ``@redis_version_cached`` function, so that bumping its
+Redis version counter drops every process's cache on their next request. The
+version is bumped after a commit which updated or deleted a client, or reset a
+user's password (see the listeners in ``fides.api.models.client``).
+
+Revocation must not fail open, so:
+
+* while the version can't be read from Redis, the cache is bypassed and every
+  token is fully verified,
+* a failure to bump the version is logged and re-raised from the commit that
+  changed the client or user, rather than ignored, and
+* each entry expires after ``security.oauth_verified_token_cache_ttl_seconds``,
+  which bounds how long a token stays usable if an invalidation is still lost.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from fides.api.models.client import ClientDetail
+from fides.api.util.redis_version_cache import redis_version_cached
+from fides.config import CONFIG
+
+VERIFIED_TOKENS_VERSION_KEY = "oauth_verified_tokens:version"
+
+
+@dataclass(frozen=True)
+class VerifiedToken:
+    """A token which was decrypted and whose client was loaded and verified."""
+
+    token_data: Dict[str, Any]
+    client_id: str
+    # The client's column values, None for the in-memory root client
+    client_state: Optional[Dict[str, Any]]
+
+    @classmethod
+    def from_client(
+        cls, token_data: Dict[str, Any], client: ClientDetail
+    ) -> VerifiedToken:
+        client_state = None
+        if client.id != CONFIG.security.oauth_root_client_id:
+            client_state = {
+                attr.key: getattr(client, attr.key)
+                for attr in inspect(ClientDetail).column_attrs
+            }
+        return cls(
+            token_data=token_data, client_id=client.id, client_state=client_state
+        )
+
+    def load_client(self, db: Session) -> Optional[ClientDetail]:
+        """
+        Returns the client, attached to the given session without querying it.
+        Relationships, e.g. the client's user, are still loaded on access.
+
+        Returns None if the token is for the root client and it no longer exists.
+        """
+        if self.client_state is None:
+            return ClientDetail.get(
+                db,
+                object_id=self.client_id,
+                config=CONFIG,
+                scopes=CONFIG.security.root_user_scopes,
+                roles=CONFIG.security.root_user_roles,
+            )
+
+        # Copy list values, so changes to the request's client aren't cached
+        client = ClientDetail(
+            **{
+                key: list(value) if isinstance(value, list) else value
+                for key, value in self.client_state.items()
+            }
+        )
+        make_transient_to_detached(client)
+        return db.merge(client, load=False)
+
+
+class VerifiedTokenStore:
+    """
+    A bounded, least recently used map of token digests to verified tokens,
+    each of which expires `ttl_seconds` after it was verified.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # Verified tokens with the monotonic time they expire at
+        self._tokens: OrderedDict[str, Tuple[VerifiedToken, float]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def get(self, digest: str) -> Optional[VerifiedToken]:
+        with self._lock:
+            entry = self._tokens.get(digest)
+            if entry is None:
+                return None
+            token, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._tokens[digest]
+                return None
+            self._tokens.move_to_end(digest)
+            return token
+
+    def put(self, digest: str, token: VerifiedToken) -> None:
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._tokens[digest] = (token, time.monotonic() + self.ttl_seconds)
+            self._tokens.move_to_end(digest)
+            while len(self._tokens) > self.max_size:
+                self._tokens.popitem(last=False)
+
+    def discard(self, digest: str) -> None:
+        with self._lock:
+            self._tokens.pop(digest, None)
+
+
+@redis_version_cached(
+    redis_key=VERIFIED_TOKENS_VERSION_KEY,
+    cache_key="oauth_verified_tokens",
+    serve_stale=False,
+)
+def get_verified_token_store() -> VerifiedTokenStore:
+    """
+    Returns this process's verified tokens. A new, empty store is returned once
+    the tokens were invalidated by any process, and on every call while Redis
+    can't confirm that they weren't.
+    """
+    return VerifiedTokenStore(
+        CONFIG.security.oauth_verified_token_cache_size,
+        CONFIG.security.oauth_verified_token_cache_ttl_seconds,
+    )
+
+
+def invalidate_verified_tokens() -> None:
+    """
+    Drops the verified tokens of every process. Raises if their Redis version
+    can't be bumped, in which case other processes keep serving their tokens
+    until the tokens expire from their cache.
+    """
+    get_verified_token_store.bump_version()  # type: ignore[attr-defined]
+
+
+def get_token_digest(authorization: str) -> str:
+    return hashlib.sha256(authorization.encode("utf-8")).hexdigest()
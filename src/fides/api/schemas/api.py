@@ -1,6 +1,6 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class BulkResponse(BaseModel):
@@ -35,3 +35,23 @@ class BulkUpdateFailed(BaseModel):
 
     message: str
     data: Dict[str, Any]
+
+
+class BatchResourceRequest(BaseModel):
+    """
+    Schema for requesting many resources of a single type by their fides_keys.
+
+    `etags` optionally maps a fides_key to the ETag of the copy the caller already
+    holds; matching resources are reported as `not_modified` instead of being returned.
+    """
+
+    fides_keys: List[str] = Field(max_length=1000)
+    etags: Dict[str, str] = Field(default_factory=dict)
+
+
+class BatchResourceResponse(BaseModel):
+    """Schema for the response of a batch resource retrieval."""
+
+    resources: List[Dict[str, Any]]
+    etags: Dict[str, str]
+    not_modified: List[str]
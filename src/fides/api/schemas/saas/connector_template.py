@@ -12,6 +12,21 @@ from fides.api.schemas.saas.saas_config import SaaSConfig
 from fides.api.util.saas_util import load_config_from_string, load_dataset_from_string
 
 
+class ConnectorTemplateHeader(BaseModel):
+    """
+    The fields of a connector template that are derived from its SaaS config,
+    which can be cached without the template's config, dataset and icon.
+    """
+
+    human_readable: str
+    authorization_required: bool
+    user_guide: Optional[str] = None
+    supported_actions: List[ActionType]
+    category: Optional[ConnectionCategory] = None
+    tags: Optional[List[str]] = None
+    enabled_features: Optional[List[IntegrationFeature]] = None
+
+
 class ConnectorTemplate(BaseModel):
     """
     A collection of artifacts that make up a complete
@@ -1,9 +1,15 @@
 import re
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union
 
 from fideslang.models import FidesCollectionKey, FidesDatasetReference
 from fideslang.validation import FidesKey
-from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
 from pydantic import Field as PydanticField
 
 from fides.api.common_exceptions import ValidationError
@@ -31,6 +37,11 @@ from fides.api.util.domain_util import (
 from fides.config import CONFIG
 from fides.config.security_settings import DomainValidationMode
 
+if TYPE_CHECKING:
+    from fides.api.service.processors.post_processor_strategy.post_processor_pipeline import (
+        PostProcessorPipeline,
+    )
+
 
 class ParamValue(BaseModel):
     """
@@ -130,6 +141,21 @@ class SaaSRequest(BaseModel):
     model_config = ConfigDict(
         from_attributes=True, use_enum_values=True, extra="forbid"
     )
+    _postprocessor_pipeline: Optional[Any] = PrivateAttr(default=None)
+
+    def get_postprocessor_pipeline(self) -> "PostProcessorPipeline":
+        """
+        Returns the request's postprocessors compiled into a pipeline, which is
+        built once and reused for every response of the request.
+        """
+        # delay import to avoid cyclic-dependency error
+        from fides.api.service.processors.post_processor_strategy.post_processor_pipeline import (  # pylint: disable=R0401
+            PostProcessorPipeline,
+        )
+
+        if self._postprocessor_pipeline is None:
+            self._postprocessor_pipeline = PostProcessorPipeline(self.postprocessors)
+        return self._postprocessor_pipeline
 
     @model_validator(mode="after")
     def validate_request_for_pagination(self) -> "SaaSRequest":
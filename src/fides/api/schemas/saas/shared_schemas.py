@@ -69,3 +69,5 @@ class PollingStatusResult(BaseModel):
 
     is_complete: bool
     skip_result_request: bool = False  # True when status indicates no data to fetch
+    # How long the vendor asked us to wait before checking again, if it said
+    retry_after_seconds: Optional[float] = None
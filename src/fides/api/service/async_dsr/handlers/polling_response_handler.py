@@ -7,7 +7,9 @@ and response parsing with no business logic dependencies.
 
 import mimetypes
 import os
+from datetime import datetime, timezone
 from email.message import Message
+from email.utils import parsedate_to_datetime
 from typing import Any, List, Optional
 from urllib.parse import urlparse
 
@@ -124,6 +126,28 @@ class PollingResponseProcessor:
         # Otherwise, check truthiness
         return bool(status_value)
 
+    @staticmethod
+    def get_retry_after(response: Response) -> Optional[float]:
+        """
+        Return the number of seconds the Retry-After header asks us to wait,
+        given either as a number of seconds or as an HTTP date.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if not retry_after:
+            return None
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            logger.debug(f"Ignoring invalid Retry-After header: {retry_after}")
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
     @staticmethod
     def _infer_data_type(request_path: str, response: Response) -> SupportedDataType:
         """Infer data type from response characteristics."""
@@ -0,0 +1,422 @@
+"""
+Dispatcher for async polling tasks.
+
+Rather than requeueing every polling RequestTask as a full access or erasure
+node task on each tick, the dispatcher checks the status of the pending
+sub-requests itself, and only queues a task once all of its sub-requests are
+ready to have their results fetched.
+
+- Status checks are only sent for sub-requests that are due (see polling_schedule).
+  Each check that isn't ready backs off the next one exponentially, or by the
+  delay the vendor asks for.
+- The statuses of the due sub-requests are checked concurrently, with at most
+  `CONFIG.execution.async_polling_connector_concurrency` checks in flight per
+  connection. Each concurrent sequence of checks has a database session and
+  client of its own, as a client may refresh and store its connection's OAuth2
+  token while it checks a status.
+- Tasks whose sub-requests errored or timed out, and tasks without pending
+  sub-requests, are queued right away, so that the node task handles them as it
+  always has. Tasks the dispatcher can't check itself are queued once every
+  `CONFIG.execution.async_polling_interval_hours`, as before.
+- Tasks that are still queued or running from an earlier run, according to the
+  task liveness registry, aren't queued again.
+"""
+
+import asyncio
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from loguru import logger
+from sqlalchemy.orm import Session, defer, undefer
+
+from fides.api.models.connectionconfig import ConnectionConfig, ConnectionType
+from fides.api.models.privacy_request.request_task import (
+    AsyncTaskType,
+    RequestTask,
+    RequestTaskSubRequest,
+)
+from fides.api.models.worker_task import ExecutionLogStatus
+from fides.api.schemas.policy import ActionType
+from fides.api.schemas.saas.saas_config import SaaSConfig, SaaSRequest
+from fides.api.schemas.saas.shared_schemas import PollingStatusResult
+from fides.api.service.async_dsr.polling_schedule import (
+    get_ready_sub_request_ids,
+    get_waiting_sub_request_ids,
+    prune_schedule,
+    save_ready_status,
+    schedule_legacy_check,
+    schedule_next_check,
+)
+from fides.api.service.async_dsr.strategies.async_dsr_strategy_factory import (
+    get_strategy,
+)
+from fides.api.service.async_dsr.strategies.async_dsr_strategy_polling import (
+    AsyncPollingStrategy,
+)
+from fides.api.service.connectors.saas_connector import SaaSConnector
+from fides.api.util.task_heartbeat import TaskLiveness, TaskLivenessSnapshot
+from fides.common.session_management import get_autoclose_db_session
+from fides.config import CONFIG
+
+
+@dataclass
+class PollingTarget:
+    """The connection and strategy used to check the status of a task's sub-requests."""
+
+    connection_key: str
+    strategy_name: str
+    strategy_configuration: Dict[str, Any]
+
+
+@dataclass
+class StatusCheck:
+    """A status check of a single due sub-request."""
+
+    request_task_id: str
+    sub_request_id: str
+    param_values: Dict[str, Any]
+    target: PollingTarget
+    result: Optional[Union[PollingStatusResult, Exception]] = None
+
+
+@dataclass
+class PollingDispatchResult:
+    """Metrics for a single run of the dispatcher."""
+
+    tasks: int = 0
+    checked: int = 0
+    ready: int = 0
+    queued_task_ids: List[str] = field(default_factory=list)
+
+
+def _get_async_request(
+    saas_config: SaaSConfig, collection_name: str, action_type: ActionType
+) -> Optional[SaaSRequest]:
+    """
+    Return the request with the async config for the collection, chosen the same
+    way as SaaSQueryConfig chooses the read and masking requests.
+    """
+    endpoint = saas_config.top_level_endpoint_dict.get(collection_name)
+    if not endpoint:
+        return None
+    requests: List[Optional[SaaSRequest]] = []
+    if action_type == ActionType.access:
+        read = endpoint.requests.read
+        requests.extend(read if isinstance(read, list) else [read])
+    elif action_type == ActionType.erasure:
+        requests.append(
+            endpoint.requests.update
+            or saas_config.data_protection_request
+            or endpoint.requests.delete
+        )
+    return next(
+        (request for request in requests if request and request.async_config), None
+    )
+
+
+class AsyncPollingDispatcher:
+    """Checks the status of due sub-requests and queues the tasks that are ready."""
+
+    def __init__(self, db: Session, redis: Any) -> None:
+        self.db = db
+        self.redis = redis
+        self._connection_configs: Dict[str, Optional[ConnectionConfig]] = {}
+        self._targets: Dict[Tuple[str, str, str], Optional[PollingTarget]] = {}
+
+    def run(self, now: Optional[float] = None) -> PollingDispatchResult:
+        now = now if now is not None else time.time()
+        result = PollingDispatchResult()
+
+        base_query = (
+            self.db.query(RequestTask)
+            .filter(RequestTask.status == ExecutionLogStatus.polling)
+            .filter(RequestTask.async_type == AsyncTaskType.polling)
+        )
+        # The connection key is kept on the (otherwise deferred) traversal details
+        polling_tasks = (
+            RequestTask.query_with_deferred_data(base_query)
+            .options(undefer(RequestTask.traversal_details))
+            .all()
+        )
+        result.tasks = len(polling_tasks)
+        if not polling_tasks:
+            prune_schedule(self.redis, [])
+            return result
+
+        pending_by_task: Dict[str, List[RequestTaskSubRequest]] = defaultdict(list)
+        for sub_request in (
+            self.db.query(RequestTaskSubRequest)
+            .filter(
+                RequestTaskSubRequest.request_task_id.in_(
+                    [task.id for task in polling_tasks]
+                ),
+                RequestTaskSubRequest.status == ExecutionLogStatus.pending.value,
+            )
+            .options(defer(RequestTaskSubRequest._access_data))
+        ):
+            pending_by_task[sub_request.request_task_id].append(sub_request)
+
+        pending_ids = {
+            sub_request.id
+            for sub_requests in pending_by_task.values()
+            for sub_request in sub_requests
+        }
+        prune_schedule(self.redis, pending_ids | {task.id for task in polling_tasks})
+        waiting_ids = get_waiting_sub_request_ids(self.redis, now)
+        ready_ids = get_ready_sub_request_ids(self.redis, pending_ids)
+
+        timeout_seconds = CONFIG.execution.async_polling_request_timeout_days * 86400
+        to_queue: Set[str] = set()
+        checks: List[StatusCheck] = []
+        for task in polling_tasks:
+            pending = pending_by_task.get(task.id, [])
+            if not pending or any(
+                sub_request.created_at
+                and now - sub_request.created_at.timestamp() > timeout_seconds
+                for sub_request in pending
+            ):
+                # Let the node task complete the task, or fail it with a timeout
+                to_queue.add(task.id)
+                continue
+
+            due = [
+                sub_request
+                for sub_request in pending
+                if sub_request.id not in waiting_ids and sub_request.id not in ready_ids
+            ]
+            if not due:
+                if all(sub_request.id in ready_ids for sub_request in pending):
+                    to_queue.add(task.id)
+                continue
+
+            target = self._get_polling_target(task)
+            if not target:
+                # Fall back to having the node task check, at the legacy interval
+                if task.id not in waiting_ids:
+                    schedule_legacy_check(self.redis, task.id, now)
+                    to_queue.add(task.id)
+                continue
+            checks.extend(
+                StatusCheck(
+                    request_task_id=task.id,
+                    sub_request_id=sub_request.id,
+                    param_values=sub_request.param_values,
+                    target=target,
+                )
+                for sub_request in due
+            )
+
+        if checks:
+            asyncio.run(self._check_statuses(checks))
+        result.checked = len(checks)
+
+        not_ready_task_ids: Set[str] = set()
+        for check in checks:
+            if isinstance(check.result, Exception):
+                # The node task checks the status again and records the error
+                logger.warning(
+                    "Status check of sub-request {} failed: {}",
+                    check.sub_request_id,
+                    check.result,
+                )
+                to_queue.add(check.request_task_id)
+            elif check.result and check.result.is_complete:
+                save_ready_status(self.redis, check.sub_request_id, check.result)
+                ready_ids.add(check.sub_request_id)
+                result.ready += 1
+            else:
+                schedule_next_check(
+                    self.redis,
+                    check.sub_request_id,
+                    now,
+                    check.result.retry_after_seconds if check.result else None,
+                )
+                not_ready_task_ids.add(check.request_task_id)
+
+        for task_id in {check.request_task_id for check in checks}:
+            if task_id not in not_ready_task_ids and all(
+                sub_request.id in ready_ids for sub_request in pending_by_task[task_id]
+            ):
+                to_queue.add(task_id)
+
+        # Avoiding cyclic imports
+        from fides.api.task.execute_request_tasks import queue_request_task
+
+        liveness = TaskLivenessSnapshot(self.redis) if to_queue else None
+        for task in polling_tasks:
+            if task.id not in to_queue:
+                continue
+            if liveness and self._is_task_active(task, liveness):
+                logger.debug(f"Polling task {task.id} is already queued, skipping")
+                continue
+            logger.info(f"Requeuing polling task {task.id} for processing")
+            queue_request_task(task, privacy_request_proceed=True)
+            result.queued_task_ids.append(task.id)
+
+        logger.info(
+            "Async polling dispatcher checked {} sub-requests of {} polling tasks, "
+            "{} ready, {} tasks queued",
+            result.checked,
+            result.tasks,
+            result.ready,
+            len(result.queued_task_ids),
+        )
+        return result
+
+    async def _check_statuses(self, checks: List[StatusCheck]) -> None:
+        """
+        Check the status of the given sub-requests concurrently, bounded per
+        connection. The checks of each connection are split into at most
+        `async_polling_connector_concurrency` lanes, each run in a thread.
+        """
+        lanes_per_connection = max(
+            CONFIG.execution.async_polling_connector_concurrency, 1
+        )
+        checks_by_connection: Dict[str, List[StatusCheck]] = defaultdict(list)
+        for check in checks:
+            checks_by_connection[check.target.connection_key].append(check)
+
+        lanes = [
+            (connection_key, connection_checks[lane::lanes_per_connection])
+            for connection_key, connection_checks in checks_by_connection.items()
+            for lane in range(min(lanes_per_connection, len(connection_checks)))
+        ]
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(self._run_status_checks, connection_key, lane_checks)
+                for connection_key, lane_checks in lanes
+            )
+        )
+
+    @staticmethod
+    def _run_status_checks(connection_key: str, checks: List[StatusCheck]) -> None:
+        """
+        Check the status of the given sub-requests of a connection one after the other.
+
+        The checks get a database session, connection config and client of their
+        own, so that concurrent lanes never share a session or client, e.g. when
+        the client refreshes and stores an OAuth2 token.
+        """
+        try:
+            with get_autoclose_db_session() as db:
+                connection_config = ConnectionConfig.get_by(
+                    db, field="key", value=connection_key
+                )
+                if not connection_config:
+                    raise ValueError(f"Connection config {connection_key} not found")
+                client = SaaSConnector(connection_config).create_client()
+                for check in checks:
+                    try:
+                        strategy: AsyncPollingStrategy = get_strategy(  # type: ignore[assignment]
+                            check.target.strategy_name,
+                            db,
+                            check.target.strategy_configuration,
+                        )
+                        check.result = strategy.check_sub_request_status(
+                            client, check.param_values
+                        )
+                    except Exception as exc:
+                        check.result = exc
+        except Exception as exc:
+            for check in checks:
+                if check.result is None:
+                    check.result = exc
+
+    @staticmethod
+    def _is_task_active(
+        request_task: RequestTask, liveness: TaskLivenessSnapshot
+    ) -> bool:
+        """
+        Whether the task was already queued by an earlier run and hasn't finished,
+        so that a backed up DSR queue doesn't get the same task on every run.
+        """
+        try:
+            celery_task_id = request_task.get_cached_task_id()
+        except Exception as exc:
+            logger.warning(
+                "Failed to get the cached task ID of polling task {}: {}",
+                request_task.id,
+                exc,
+            )
+            return False
+        if not celery_task_id:
+            logger.debug(
+                "Polling task {} has no cached task ID, so it isn't queued",
+                request_task.id,
+            )
+            return False
+        return liveness.get_liveness(celery_task_id) in (
+            TaskLiveness.queued,
+            TaskLiveness.running,
+        )
+
+    def _get_connection_config(self, connection_key: str) -> Optional[ConnectionConfig]:
+        if connection_key not in self._connection_configs:
+            self._connection_configs[connection_key] = ConnectionConfig.get_by(
+                self.db, field="key", value=connection_key
+            )
+        return self._connection_configs[connection_key]
+
+    def _get_polling_target(self, request_task: RequestTask) -> Optional[PollingTarget]:
+        """
+        Find (once per connection, collection and action) the strategy used by the
+        node task to check the status of the task's sub-requests.
+        """
+        connection_key = (request_task.traversal_details or {}).get(
+            "dataset_connection_key"
+        )
+        if not connection_key:
+            return None
+        target_key = (
+            connection_key,
+            request_task.collection_name,
+            str(request_task.action_type),
+        )
+        if target_key in self._targets:
+            return self._targets[target_key]
+
+        target: Optional[PollingTarget] = None
+        try:
+            connection_config = self._get_connection_config(connection_key)
+            saas_config = (
+                connection_config.get_saas_config()
+                if connection_config
+                and connection_config.connection_type == ConnectionType.saas
+                else None
+            )
+            async_request = (
+                _get_async_request(
+                    saas_config,
+                    request_task.collection_name,
+                    ActionType(request_task.action_type),
+                )
+                if saas_config
+                else None
+            )
+            if (
+                connection_config
+                and async_request
+                and async_request.async_config
+                and async_request.async_config.strategy == AsyncTaskType.polling.value
+            ):
+                # Validates the configuration before any status is checked with it
+                get_strategy(
+                    async_request.async_config.strategy,
+                    self.db,
+                    async_request.async_config.configuration,
+                )
+                target = PollingTarget(
+                    connection_key=connection_key,
+                    strategy_name=async_request.async_config.strategy,
+                    strategy_configuration=async_request.async_config.configuration,
+                )
+        except Exception as exc:
+            logger.warning(
+                "Unable to check the status of polling task {} directly: {}",
+                request_task.id,
+                exc,
+            )
+        self._targets[target_key] = target
+        return target
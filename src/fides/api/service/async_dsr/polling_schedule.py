@@ -0,0 +1,174 @@
+"""
+Redis-backed polling schedule for async polling sub-requests.
+
+The async polling dispatcher records per sub-request:
+
+- `async_polling_next_check`: sub-request IDs scored by the time their status
+  should next be checked, so finding the sub-requests that are due is a single
+  range query. Tasks whose sub-requests can only be checked by their node task
+  are scheduled here by task ID.
+- `async_polling_attempts`: the number of status checks that weren't ready yet,
+  which drives the exponential backoff between checks.
+- `async_polling_ready:<sub_request_id>`: the status result of a sub-request that
+  is ready, so that the task which fetches its results doesn't check it again.
+"""
+
+from typing import Any, Collection, Optional, Set
+
+from loguru import logger
+
+from fides.api.schemas.saas.shared_schemas import PollingStatusResult
+from fides.config import CONFIG
+
+ASYNC_POLLING_NEXT_CHECK_KEY = "async_polling_next_check"
+ASYNC_POLLING_ATTEMPTS_KEY = "async_polling_attempts"
+ASYNC_POLLING_READY_KEY_PREFIX = "async_polling_ready"
+
+
+def _get_redis() -> Any:
+    # Imported here as fides.api.util.cache depends on fides.api.tasks
+    from fides.api.util.cache import get_cache
+
+    return get_cache()
+
+
+def _decode(value: Any) -> str:
+    if isinstance(value, bytes):
+        return value.decode(CONFIG.security.encoding)
+    return value
+
+
+def get_ready_key(sub_request_id: str) -> str:
+    return f"{ASYNC_POLLING_READY_KEY_PREFIX}:{sub_request_id}"
+
+
+def get_max_check_interval() -> float:
+    return CONFIG.execution.async_polling_interval_hours * 3600
+
+
+def get_backoff_delay(attempts: int, retry_after: Optional[float] = None) -> float:
+    """
+    Return how long to wait before the next status check of a sub-request that
+    has been checked `attempts` times without being ready.
+
+    The wait doubles with every attempt, starting from the minimum check interval.
+    A delay requested by the vendor takes precedence. Either way, sub-requests are
+    checked at least as often as the legacy polling interval.
+    """
+    if retry_after is not None:
+        delay = retry_after
+    else:
+        delay = CONFIG.execution.async_polling_min_check_interval_seconds * 2 ** max(
+            attempts - 1, 0
+        )
+    return max(min(delay, get_max_check_interval()), 0.0)
+
+
+def get_waiting_sub_request_ids(redis: Any, now: float) -> Set[str]:
+    """
+    Return the IDs of the sub-requests whose next status check is still in the
+    future. Every other pending sub-request is due.
+    """
+    return {
+        _decode(sub_request_id)
+        for sub_request_id in redis.zrangebyscore(
+            ASYNC_POLLING_NEXT_CHECK_KEY, f"({now}", "+inf"
+        )
+    }
+
+
+def get_ready_sub_request_ids(redis: Any, sub_request_ids: Collection[str]) -> Set[str]:
+    """Return the IDs of the sub-requests with a stored ready status."""
+    sub_request_ids = list(sub_request_ids)
+    if not sub_request_ids:
+        return set()
+    pipe = redis.pipeline(transaction=False)
+    for sub_request_id in sub_request_ids:
+        pipe.exists(get_ready_key(sub_request_id))
+    return {
+        sub_request_id
+        for sub_request_id, exists in zip(sub_request_ids, pipe.execute())
+        if exists
+    }
+
+
+def schedule_next_check(
+    redis: Any,
+    sub_request_id: str,
+    now: float,
+    retry_after: Optional[float] = None,
+) -> float:
+    """Back off the next status check of a sub-request that isn't ready yet."""
+    attempts = redis.hincrby(ASYNC_POLLING_ATTEMPTS_KEY, sub_request_id, 1)
+    next_check = now + get_backoff_delay(int(attempts), retry_after)
+    redis.zadd(ASYNC_POLLING_NEXT_CHECK_KEY, {sub_request_id: next_check})
+    return next_check
+
+
+def schedule_legacy_check(redis: Any, request_task_id: str, now: float) -> float:
+    """
+    Schedule the next check of a task whose sub-requests are checked by its node
+    task, rather than by the dispatcher, at the legacy polling interval.
+    """
+    next_check = now + get_max_check_interval()
+    redis.zadd(ASYNC_POLLING_NEXT_CHECK_KEY, {request_task_id: next_check})
+    return next_check
+
+
+def save_ready_status(
+    redis: Any, sub_request_id: str, status_result: PollingStatusResult
+) -> None:
+    """Store the status of a ready sub-request until its results are fetched."""
+    pipe = redis.pipeline(transaction=False)
+    pipe.set(
+        get_ready_key(sub_request_id),
+        status_result.model_dump_json(),
+        ex=CONFIG.execution.async_polling_request_timeout_days * 24 * 60 * 60,
+    )
+    pipe.zrem(ASYNC_POLLING_NEXT_CHECK_KEY, sub_request_id)
+    pipe.hdel(ASYNC_POLLING_ATTEMPTS_KEY, sub_request_id)
+    pipe.execute()
+
+
+def pop_ready_status(sub_request_id: str) -> Optional[PollingStatusResult]:
+    """
+    Return and remove the stored status of a ready sub-request, if there is one.
+
+    A missing status, or a failure to read it, just means the status gets
+    checked again.
+    """
+    try:
+        pipe = _get_redis().pipeline(transaction=False)
+        pipe.get(get_ready_key(sub_request_id))
+        pipe.delete(get_ready_key(sub_request_id))
+        raw, _ = pipe.execute()
+    except Exception as exc:
+        logger.warning(
+            "Failed to load the polling status of sub-request {}: {}",
+            sub_request_id,
+            exc,
+        )
+        return None
+    if not raw:
+        return None
+    return PollingStatusResult.model_validate_json(_decode(raw))
+
+
+def prune_schedule(redis: Any, pending_ids: Collection[str]) -> None:
+    """Remove the schedule of sub-requests and tasks that are no longer pending."""
+    pending = set(pending_ids)
+    scheduled = {
+        _decode(sub_request_id)
+        for sub_request_id in redis.zrange(ASYNC_POLLING_NEXT_CHECK_KEY, 0, -1)
+    }
+    scheduled.update(
+        _decode(sub_request_id)
+        for sub_request_id in redis.hkeys(ASYNC_POLLING_ATTEMPTS_KEY)
+    )
+    stale = scheduled - pending
+    if not stale:
+        return
+    pipe = redis.pipeline(transaction=False)
+    pipe.zrem(ASYNC_POLLING_NEXT_CHECK_KEY, *stale)
+    pipe.hdel(ASYNC_POLLING_ATTEMPTS_KEY, *stale)
+    pipe.execute()
@@ -38,6 +38,7 @@ from fides.api.service.async_dsr.handlers.polling_response_handler import (
 from fides.api.service.async_dsr.handlers.polling_sub_request_handler import (
     PollingSubRequestHandler,
 )
+from fides.api.service.async_dsr.polling_schedule import pop_ready_status
 from fides.api.service.async_dsr.strategies.async_dsr_strategy import AsyncDSRStrategy
 from fides.api.service.async_dsr.utils import AsyncPhase, get_async_phase
 from fides.api.service.connectors.saas.authenticated_client import AuthenticatedClient
@@ -443,6 +444,12 @@ class AsyncPollingStrategy(AsyncDSRStrategy):
             f"Unsupported action type: {polling_task.action_type}"
         )
 
+    def check_sub_request_status(
+        self, client: AuthenticatedClient, param_values: Dict[str, Any]
+    ) -> PollingStatusResult:
+        """Check the status of a sub-request, e.g. from the async polling dispatcher."""
+        return self._check_sub_request_status(client, param_values)
+
     def _check_sub_request_status(
         self, client: AuthenticatedClient, param_values: Dict[str, Any]
     ) -> PollingStatusResult:
@@ -507,7 +514,11 @@ class AsyncPollingStrategy(AsyncDSRStrategy):
             status_path,
             self.status_request.status_completed_value,
         )
-        return PollingStatusResult(is_complete=is_complete, skip_result_request=False)
+        return PollingStatusResult(
+            is_complete=is_complete,
+            skip_result_request=False,
+            retry_after_seconds=PollingResponseProcessor.get_retry_after(response),
+        )
 
     def _process_completed_sub_request(
         self,
@@ -614,7 +625,10 @@ class AsyncPollingStrategy(AsyncDSRStrategy):
             polling_task: The parent polling task
         """
         param_values = sub_request.param_values
-        status_result = self._check_sub_request_status(client, param_values)
+        # Reuse the status the polling dispatcher found, if it queued this task
+        status_result = pop_ready_status(
+            sub_request.id
+        ) or self._check_sub_request_status(client, param_values)
 
         if status_result.is_complete:
             if status_result.skip_result_request:
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, Optional
+from typing import Any, Dict, Generic, Iterable, List, Optional
 
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Session
 
 from fides.api.common_exceptions import MessageDispatchException
 from fides.api.models.connectionconfig import ConnectionConfig, ConnectionTestStatus
@@ -38,11 +38,29 @@ class BaseEmailConnector(Generic[DB_CONNECTOR_TYPE], ABC):
         """
 
     @abstractmethod
-    def batch_email_send(self, privacy_requests: Query, batch_id: str) -> None:
+    def batch_email_send(
+        self,
+        privacy_requests: Iterable[PrivacyRequest],
+        batch_id: str,
+        identities: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> None:
         """
         Aggregates the identities provided by multiple privacy requests and sends them in a single batch email.
+
+        `identities` holds the already decrypted identity data of the privacy requests,
+        by privacy request ID, so that it isn't decrypted again for every connector.
         """
 
+    @staticmethod
+    def get_identity_data(
+        privacy_request: PrivacyRequest,
+        identities: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """Returns the identity data of the privacy request, preferring `identities`."""
+        if identities is not None and privacy_request.id in identities:
+            return identities[privacy_request.id]
+        return privacy_request.get_cached_identity_data()
+
     @abstractmethod
     def add_skipped_log(self, db: Session, privacy_request: PrivacyRequest) -> None:
         """Add skipped log for the email connector to a privacy request"""
@@ -1,6 +1,6 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Session
 
 from fides.api.models.connectionconfig import ConnectionConfig, ConnectionType
 from fides.api.models.policy import Rule
@@ -117,7 +117,10 @@ class BaseErasureEmailConnector(BaseEmailConnector):
         privacy_request.save(db)
 
     def error_all_privacy_requests(
-        self, db: Session, privacy_requests: Query, failure_reason: str
+        self,
+        db: Session,
+        privacy_requests: Iterable[PrivacyRequest],
+        failure_reason: str,
     ) -> None:
         """
         Creates an ExecutionLog with status error for each privacy request in the batch, and sets the
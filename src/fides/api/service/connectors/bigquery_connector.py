@@ -206,10 +206,13 @@ class BigQueryConnector(SQLConnector):
                     client,
                 )
             else:
-                for row in rows:
+                value_maps = query_config.update_value_maps(
+                    rows, policy, privacy_request
+                )
+                for row, value_map in zip(rows, value_maps):
                     update_or_delete_stmts: List[Executable] = (
                         query_config.generate_update(
-                            row, policy, privacy_request, client
+                            row, policy, privacy_request, client, value_map=value_map
                         )
                     )
                     logger.debug(
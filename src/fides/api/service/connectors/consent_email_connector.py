@@ -1,7 +1,7 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from loguru import logger
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Session
 
 from fides.api.common_exceptions import MessageDispatchException
 from fides.api.models.connectionconfig import (
@@ -214,14 +214,23 @@ class GenericConsentEmailConnector(BaseEmailConnector):
             db, privacy_request, self.configuration
         )
 
-    def batch_email_send(self, privacy_requests: Query, batch_id: str) -> None:
+    def batch_email_send(
+        self,
+        privacy_requests: Iterable[PrivacyRequest],
+        batch_id: str,
+        identities: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> None:
         db = Session.object_session(self.configuration)
+        # Loaded once, rather than re-running the query on every pass below
+        privacy_requests = list(privacy_requests)
 
         skipped_privacy_requests: List[str] = []
         batched_consent_preferences: List[ConsentPreferencesByUser] = []
 
         for privacy_request in privacy_requests:
-            user_identities: Dict[str, Any] = privacy_request.get_cached_identity_data()
+            user_identities: Dict[str, Any] = self.get_identity_data(
+                privacy_request, identities
+            )
             filtered_user_identities: Dict[str, Any] = (
                 filter_user_identities_for_connector(self.config, user_identities)
             )
@@ -1,11 +1,11 @@
 import json
-from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 from fideslang.models import FidesDatasetReference
 from loguru import logger
 from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy.exc import InternalError, OperationalError
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Session
 
 from fides.api.common_exceptions import MessageDispatchException
 from fides.api.graph.config import CollectionAddress, GraphDataset
@@ -73,7 +73,12 @@ class DynamicErasureEmailConnector(BaseErasureEmailConnector):
                 f"is incorrectly configured: {exc}"
             ) from exc
 
-    def batch_email_send(self, privacy_requests: Query, batch_id: str) -> None:
+    def batch_email_send(
+        self,
+        privacy_requests: Iterable[PrivacyRequest],
+        batch_id: str,
+        identities: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> None:
         logger.debug(
             "Starting batch erasure email {} for connector: {} ...",
             batch_id,
@@ -81,6 +86,8 @@ class DynamicErasureEmailConnector(BaseErasureEmailConnector):
         )
 
         db: Session = Session.object_session(self.configuration)
+        # Loaded once, rather than re-running the query on every pass below
+        privacy_requests = list(privacy_requests)
         processed_config = self.process_connector_config(db, privacy_requests)
 
         skipped_privacy_requests: List[str] = []
@@ -109,8 +116,8 @@ class DynamicErasureEmailConnector(BaseErasureEmailConnector):
                 if not custom_field_data:
                     continue
 
-                user_identities: Dict[str, Any] = (
-                    privacy_request.get_cached_identity_data()
+                user_identities: Dict[str, Any] = self.get_identity_data(
+                    privacy_request, identities
                 )
                 filtered_user_identities: Dict[str, Any] = (
                     filter_user_identities_for_connector(self.config, user_identities)
@@ -174,9 +181,7 @@ class DynamicErasureEmailConnector(BaseErasureEmailConnector):
                 excluded_ids = set(skipped_privacy_requests) | already_sent_ids
                 self.error_all_privacy_requests(
                     db,
-                    privacy_requests.filter(
-                        PrivacyRequest.id.notin_(list(excluded_ids))
-                    ),
+                    [pr for pr in privacy_requests if pr.id not in excluded_ids],
                     message,
                 )
                 raise exc
@@ -203,7 +208,7 @@ class DynamicErasureEmailConnector(BaseErasureEmailConnector):
     def get_collection_and_field_from_reference(
         self,
         db: Session,
-        privacy_requests: Query,
+        privacy_requests: Iterable[PrivacyRequest],
         dataset_reference: FidesDatasetReference,
     ) -> Tuple[str, str]:
         dataset_key = dataset_reference.dataset  # pylint: disable=no-member
@@ -231,7 +236,7 @@ class DynamicErasureEmailConnector(BaseErasureEmailConnector):
         return collection_name, field_name
 
     def process_connector_config(
-        self, db: Session, privacy_requests: Query
+        self, db: Session, privacy_requests: Iterable[PrivacyRequest]
     ) -> ProcessedConfig:
         """
         Validates and processes the connector config. Returns a ProcessedConfig that has the graph_dataset
@@ -1,14 +1,18 @@
 import itertools
-from typing import Any, Dict, Generator, List, Optional
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Generator, Hashable, List, Optional, Set, Tuple
 
 from boto3 import Session
-from boto3.dynamodb.types import TypeDeserializer
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
 from botocore.exceptions import ClientError
 from loguru import logger
 
 from fides.api.common_exceptions import ConnectionException
+from fides.api.graph.config import CollectionAddress
 from fides.api.graph.execution import ExecutionNode
-from fides.api.models.connectionconfig import ConnectionTestStatus
+from fides.api.models.connectionconfig import ConnectionConfig, ConnectionTestStatus
 from fides.api.models.policy import Policy
 from fides.api.models.privacy_request import PrivacyRequest, RequestTask
 from fides.api.schemas.connection_configuration.connection_secrets_dynamodb import (
@@ -18,7 +22,6 @@ from fides.api.service.connectors.base_connector import BaseConnector
 from fides.api.service.connectors.query_configs.dynamodb_query_config import (
     DynamoDBQueryConfig,
 )
-from fides.api.service.connectors.query_configs.query_config import QueryConfig
 from fides.api.util.aws_util import get_aws_session
 from fides.api.util.collection_util import Row
 from fides.api.util.logger import Pii
@@ -27,10 +30,26 @@ from fides.connectors.models import (
     ConnectorFailureException,
 )
 
+# The most keys a single BatchGetItem request may read
+BATCH_GET_ITEM_LIMIT = 100
+# The most items a single BatchWriteItem request may write
+BATCH_WRITE_ITEM_LIMIT = 25
+# How many times unprocessed keys and items are retried, backing off in between
+BATCH_MAX_RETRIES = 5
+BATCH_RETRY_BASE_DELAY_SECONDS = 0.05
+# The most queries of a single table run concurrently
+QUERY_CONCURRENCY = 8
+
 
 class DynamoDBConnector(BaseConnector[Any]):  # type: ignore
     """AWS DynamoDB Connector"""
 
+    def __init__(self, configuration: ConnectionConfig):
+        super().__init__(configuration)
+        # Table descriptions are looked up once per connector, rather than on every
+        # retrieval and masking request of the task
+        self._query_configs: Dict[CollectionAddress, DynamoDBQueryConfig] = {}
+
     def build_uri(self) -> None:
         """Not used for this type"""
 
@@ -51,8 +70,11 @@ class DynamoDBConnector(BaseConnector[Any]):  # type: ignore
         except ValueError:
             raise ConnectionException("Value Error connecting to AWS DynamoDB.")
 
-    def query_config(self, node: ExecutionNode) -> QueryConfig[Any]:
+    def query_config(self, node: ExecutionNode) -> DynamoDBQueryConfig:
         """Query wrapper corresponding to the input traversal_node."""
+        if node.address in self._query_configs:
+            return self._query_configs[node.address]
+
         client = self.client()
         try:
             describe_table = client.describe_table(TableName=node.address.collection)
@@ -67,7 +89,11 @@ class DynamoDBConnector(BaseConnector[Any]):  # type: ignore
         except ClientError as error:
             raise ConnectorFailureException(error.response["Error"]["Message"])
 
-        return DynamoDBQueryConfig(node, attribute_definitions)
+        query_config = DynamoDBQueryConfig(
+            node, attribute_definitions, describe_table["Table"]["KeySchema"]
+        )
+        self._query_configs[node.address] = query_config
+        return query_config
 
     def test_connection(self) -> Optional[ConnectionTestStatus]:
         """
@@ -97,8 +123,10 @@ class DynamoDBConnector(BaseConnector[Any]):  # type: ignore
     ) -> List[Row]:
         """
         Retrieve DynamoDB data.
-        In the case of complex objects, returns multiple rows
-        as the product of options to query against.
+
+        Tables keyed by their partition key alone are read with BatchGetItem, up to
+        100 identifiers per request. Tables with a sort key are queried once per
+        identifier, concurrently, following each query's pagination.
         """
         deserializer = TypeDeserializer()
         collection_name = node.address.collection
@@ -106,29 +134,31 @@ class DynamoDBConnector(BaseConnector[Any]):  # type: ignore
         try:
             results = []
             query_config = self.query_config(node)
-            for attribute_definition in query_config.attribute_definitions:  # type: ignore
+            for attribute_definition in query_config.attribute_definitions:
                 attribute_name = attribute_definition["AttributeName"]
-                for identifier in input_data.get(attribute_name, []):
-                    selected_input_data = input_data
-                    selected_input_data[attribute_name] = [identifier]
-                    query_param = query_config.generate_query(
-                        selected_input_data, policy
-                    )
-                    if query_param is None:
-                        return []
-                    items = client.query(
-                        TableName=collection_name,
-                        ExpressionAttributeValues=query_param[
-                            "ExpressionAttributeValues"
-                        ],
-                        KeyConditionExpression=query_param["KeyConditionExpression"],
+                identifiers = _unique(input_data.get(attribute_name, []))
+                if not identifiers:
+                    continue
+                if not query_config.has_range_key:
+                    items = self._batch_get_items(
+                        client, collection_name, attribute_name, identifiers
                     )
-                    for item in items.get("Items"):
-                        result = {}
-                        for key, value in item.items():
-                            deserialized_value = deserializer.deserialize(value)
-                            result[key] = deserialized_value
-                        results.append(result)
+                else:
+                    query_params = []
+                    for identifier in identifiers:
+                        query_param = query_config.generate_query(
+                            {attribute_name: [identifier]}, policy
+                        )
+                        if query_param is None:
+                            return []
+                        query_params.append(query_param)
+                    items = self._query_items(client, collection_name, query_params)
+                for item in items:
+                    result = {}
+                    for key, value in item.items():
+                        deserialized_value = deserializer.deserialize(value)
+                        result[key] = deserialized_value
+                    results.append(result)
             return results
         except ClientError as error:
             raise ConnectorFailureException(error.response["Error"]["Message"])
@@ -142,32 +172,176 @@ class DynamoDBConnector(BaseConnector[Any]):  # type: ignore
         rows: List[Row],
         input_data: Optional[Dict[str, List[Any]]] = None,
     ) -> int:
-        """Execute a masking request for DynamoDB"""
+        """Execute a masking request for DynamoDB, writing up to 25 rows per request"""
 
         query_config = self.query_config(node)
         collection_name = node.address.collection
-        update_ct = 0
-        for row in rows:
-            update_items = query_config.generate_update_stmt(
-                row, policy, privacy_request
+        value_maps = query_config.update_value_maps(rows, policy, privacy_request)
+        update_items = []
+        for row, value_map in zip(rows, value_maps):
+            update_item = query_config.generate_update_stmt(
+                row, policy, privacy_request, value_map=value_map
             )
-            if update_items is not None:
-                client = self.client()
-                update_result = client.put_item(
-                    TableName=collection_name,
-                    Item=update_items,
-                )
-                if update_result["ResponseMetadata"]["HTTPStatusCode"] == 200:
-                    update_ct += 1
-                logger.info(
-                    "client.put_item({}, {})",
-                    collection_name,
-                    Pii(update_items),
+            if update_item is not None:
+                update_items.append(update_item)
+
+        if not update_items:
+            return 0
+        try:
+            return self._batch_write_items(
+                self.client(), collection_name, update_items, query_config.key_names
+            )
+        except ClientError as error:
+            raise ConnectorFailureException(error.response["Error"]["Message"])
+
+    @staticmethod
+    def _batch_get_items(
+        client: Any,
+        collection_name: str,
+        attribute_name: str,
+        identifiers: List[Any],
+    ) -> List[Dict[str, Any]]:
+        """Reads the items with the given partition keys with BatchGetItem"""
+        serializer = TypeSerializer()
+        items: List[Dict[str, Any]] = []
+        for start in range(0, len(identifiers), BATCH_GET_ITEM_LIMIT):
+            request_items: Dict[str, Any] = {
+                collection_name: {
+                    "Keys": [
+                        {attribute_name: serializer.serialize(identifier)}
+                        for identifier in identifiers[
+                            start : start + BATCH_GET_ITEM_LIMIT
+                        ]
+                    ]
+                }
+            }
+            for attempt in range(BATCH_MAX_RETRIES + 1):
+                if attempt:
+                    _backoff(attempt)
+                response = client.batch_get_item(RequestItems=request_items)
+                items.extend(response.get("Responses", {}).get(collection_name, []))
+                request_items = response.get("UnprocessedKeys") or {}
+                if not request_items:
+                    break
+            else:
+                raise ConnectorFailureException(
+                    f"Unable to read all items from DynamoDB table '{collection_name}' "
+                    f"after {BATCH_MAX_RETRIES} retries"
                 )
+        return items
+
+    @staticmethod
+    def _query_items(
+        client: Any, collection_name: str, query_params: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Runs the given queries concurrently, reading every page of each query"""
+
+        def query(query_param: Dict[str, Any]) -> List[Dict[str, Any]]:
+            items: List[Dict[str, Any]] = []
+            kwargs: Dict[str, Any] = {
+                "TableName": collection_name,
+                "ExpressionAttributeValues": query_param["ExpressionAttributeValues"],
+                "KeyConditionExpression": query_param["KeyConditionExpression"],
+            }
+            while True:
+                response = client.query(**kwargs)
+                items.extend(response.get("Items", []))
+                if not response.get("LastEvaluatedKey"):
+                    return items
+                kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+        if len(query_params) == 1:
+            return query(query_params[0])
+        # boto3 clients are thread safe, so the queries share the task's client
+        with ThreadPoolExecutor(
+            max_workers=min(len(query_params), QUERY_CONCURRENCY)
+        ) as executor:
+            return [
+                item for items in executor.map(query, query_params) for item in items
+            ]
 
+    @staticmethod
+    def _batch_write_items(
+        client: Any,
+        collection_name: str,
+        update_items: List[Dict[str, Any]],
+        key_names: List[str],
+    ) -> int:
+        """
+        Puts the given items with BatchWriteItem, retrying unprocessed items.
+        Returns the number of items written.
+        """
+        update_ct = 0
+        for batch in _write_batches(update_items, key_names):
+            request_items: Dict[str, Any] = {
+                collection_name: [{"PutRequest": {"Item": item}} for item in batch]
+            }
+            for attempt in range(BATCH_MAX_RETRIES + 1):
+                if attempt:
+                    _backoff(attempt)
+                response = client.batch_write_item(RequestItems=request_items)
+                request_items = response.get("UnprocessedItems") or {}
+                if not request_items:
+                    break
+            else:
+                raise ConnectorFailureException(
+                    f"Unable to write all items to DynamoDB table '{collection_name}' "
+                    f"after {BATCH_MAX_RETRIES} retries"
+                )
+            update_ct += len(batch)
+            logger.info(
+                "client.batch_write_item({}, {})",
+                collection_name,
+                Pii(batch),
+            )
         return update_ct
 
 
+def _unique(values: List[Any]) -> List[Any]:
+    """The given values without duplicates, in order"""
+    unique: List[Any] = []
+    seen = set()
+    for value in values:
+        key = _value_key(value)
+        if key not in seen:
+            seen.add(key)
+            unique.append(value)
+    return unique
+
+
+def _value_key(value: Any) -> Hashable:
+    if isinstance(value, Hashable):
+        return value
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _write_batches(
+    items: List[Dict[str, Any]], key_names: List[str]
+) -> Generator[List[Dict[str, Any]], None, None]:
+    """
+    Splits the items into BatchWriteItem requests. A request may not write the
+    same item twice, so an item whose key is already in the current request starts
+    the next one.
+    """
+    batch: List[Dict[str, Any]] = []
+    batch_keys: Set[Tuple[Hashable, ...]] = set()
+    for item in items:
+        key: Tuple[Hashable, ...] = tuple(
+            _value_key(item.get(key_name)) for key_name in key_names
+        )
+        if len(batch) >= BATCH_WRITE_ITEM_LIMIT or (key_names and key in batch_keys):
+            yield batch
+            batch, batch_keys = [], set()
+        batch.append(item)
+        batch_keys.add(key)
+    if batch:
+        yield batch
+
+
+def _backoff(attempt: int) -> None:
+    time.sleep(BATCH_RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1))
+
+
 def product_dict(**kwargs: List) -> Generator:
     """
     Takes a dictionary of lists, returning the product
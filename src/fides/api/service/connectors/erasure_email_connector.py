@@ -1,7 +1,7 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from loguru import logger
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Session
 
 from fides.api.common_exceptions import MessageDispatchException
 from fides.api.models.connectionconfig import (
@@ -67,17 +67,26 @@ class GenericErasureEmailConnector(BaseErasureEmailConnector):
             return ConnectionTestStatus.failed
         return ConnectionTestStatus.succeeded
 
-    def batch_email_send(self, privacy_requests: Query, batch_id: str) -> None:
+    def batch_email_send(
+        self,
+        privacy_requests: Iterable[PrivacyRequest],
+        batch_id: str,
+        identities: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> None:
         skipped_privacy_requests: List[str] = []
         batched_identities: List[str] = []
         db = Session.object_session(self.configuration)
+        # Loaded once, rather than re-running the query on every pass below
+        privacy_requests = list(privacy_requests)
         all_pr_ids = [pr.id for pr in privacy_requests]
         already_sent_ids = self.get_already_sent_privacy_request_ids(db, all_pr_ids)
 
         for privacy_request in privacy_requests:
             if privacy_request.id in already_sent_ids:
                 continue
-            user_identities: Dict[str, Any] = privacy_request.get_cached_identity_data()
+            user_identities: Dict[str, Any] = self.get_identity_data(
+                privacy_request, identities
+            )
             filtered_user_identities: Dict[str, Any] = (
                 filter_user_identities_for_connector(self.config, user_identities)
             )
@@ -116,7 +125,7 @@ class GenericErasureEmailConnector(BaseErasureEmailConnector):
             excluded_ids = set(skipped_privacy_requests) | already_sent_ids
             self.error_all_privacy_requests(
                 db,
-                privacy_requests.filter(PrivacyRequest.id.notin_(list(excluded_ids))),
+                [pr for pr in privacy_requests if pr.id not in excluded_ids],
                 message,
             )
             raise
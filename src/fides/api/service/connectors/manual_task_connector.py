@@ -32,7 +32,12 @@ class ManualTaskQueryConfig(QueryConfig):
         return "Manual task: no query needed"
 
     def generate_update_stmt(
-        self, row: Row, policy: Policy, request: PrivacyRequest
+        self,
+        row: Row,
+        policy: Policy,
+        request: PrivacyRequest,
+        *,
+        value_map: Optional[Dict[str, Any]] = None,
     ) -> Any:
         """Generate update statement - not used for manual tasks"""
         return None
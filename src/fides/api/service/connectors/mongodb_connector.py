@@ -2,8 +2,12 @@ from typing import Any, Dict, List, Optional
 from urllib.parse import quote_plus
 
 from loguru import logger
-from pymongo import MongoClient
-from pymongo.errors import OperationFailure, ServerSelectionTimeoutError
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import (
+    BulkWriteError,
+    OperationFailure,
+    ServerSelectionTimeoutError,
+)
 
 from fides.api.common_exceptions import ConnectionException
 from fides.api.graph.execution import ExecutionNode
@@ -20,6 +24,7 @@ from fides.api.service.connectors.query_configs.mongodb_query_config import (
 from fides.api.service.connectors.query_configs.query_config import QueryConfig
 from fides.api.util.collection_util import Row
 from fides.api.util.logger import Pii
+from fides.config import CONFIG
 
 
 class MongoDBConnector(BaseConnector[MongoClient]):
@@ -163,7 +168,12 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         request_task: RequestTask,
         input_data: Dict[str, List[Any]],
     ) -> List[Row]:
-        """Retrieve mongo data"""
+        """
+        Retrieve mongo data with a single query, matching all of the input values of
+        each field with `$in`. The documents are fetched from the cursor in batches of
+        `CONFIG.execution.mongodb_cursor_batch_size` and appended to the returned rows
+        as each batch arrives, and the cursor is closed as soon as it is exhausted.
+        """
         query_config = self.query_config(node)
         client = self.client()
 
@@ -177,10 +187,13 @@ class MongoDBConnector(BaseConnector[MongoClient]):
 
         db = client[db_name]
         collection = db[collection_name]
-        rows = []
         logger.info("Starting data retrieval for {}", node.address)
-        for row in collection.find(query_data, fields):
-            rows.append(row)
+        rows: List[Row] = []
+        with collection.find(query_data, fields).batch_size(
+            CONFIG.execution.mongodb_cursor_batch_size
+        ) as cursor:
+            for document in cursor:
+                rows.append(document)
         logger.info("Found {} rows on {}", len(rows), node.address)
         return rows
 
@@ -193,29 +206,50 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         rows: List[Row],
         input_data: Optional[Dict[str, List[Any]]] = None,
     ) -> int:
-        """Execute a masking request"""
+        """
+        Execute a masking request, updating every document with a single unordered
+        bulk write. Returns the number of documents modified.
+        """
         query_config = self.query_config(node)
         collection_name = node.address.collection
-        client = self.client()
-        update_ct = 0
-        for row in rows:
+        value_maps = query_config.update_value_maps(rows, policy, privacy_request)
+        operations = []
+        for row, value_map in zip(rows, value_maps):
             update_stmt = query_config.generate_update_stmt(
-                row, policy, privacy_request
+                row, policy, privacy_request, value_map=value_map
             )
             if update_stmt is not None:
                 query, update = update_stmt
-                db = client[node.address.dataset]
-                collection = db[collection_name]
-                update_result = collection.update_one(query, update, upsert=False)
-                update_ct += update_result.modified_count
+                operations.append(UpdateOne(query, update, upsert=False))
                 logger.info(
-                    "db.{}.update_one({}, {}, upsert=False)",
-                    collection_name,
+                    "Adding UpdateOne({}, {}, upsert=False) to the bulk write on db.{}",
                     Pii(query),
                     Pii(update),
+                    collection_name,
                 )
 
-        return update_ct
+        if not operations:
+            return 0
+        collection = self.client()[node.address.dataset][collection_name]
+        try:
+            # Unordered, so that one failed update doesn't stop the others
+            result = collection.bulk_write(operations, ordered=False)
+        except BulkWriteError as exc:
+            logger.error(
+                "Masked {} of {} documents in {}, {} update(s) failed",
+                exc.details.get("nModified", 0),
+                len(operations),
+                node.address,
+                len(exc.details.get("writeErrors", [])),
+            )
+            raise
+        logger.info(
+            "Masked {} of {} documents in {}",
+            result.modified_count,
+            len(operations),
+            node.address,
+        )
+        return result.modified_count
 
     def close(self) -> None:
         """Close any held resources"""
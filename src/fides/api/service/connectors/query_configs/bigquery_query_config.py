@@ -142,7 +142,13 @@ class BigQueryQueryConfig(QueryStringWithoutTuplesOverrideQueryConfig):
         return self.generate_update(row, policy, request, client)
 
     def generate_update(
-        self, row: Row, policy: Policy, request: PrivacyRequest, client: Engine
+        self,
+        row: Row,
+        policy: Policy,
+        request: PrivacyRequest,
+        client: Engine,
+        *,
+        value_map: Optional[Dict[str, Any]] = None,
     ) -> List[Update]:
         """
         Using TextClause to insert 'None' values into BigQuery throws an exception, so we use update clause instead.
@@ -158,7 +164,11 @@ class BigQueryQueryConfig(QueryStringWithoutTuplesOverrideQueryConfig):
         """
 
         # 1. Take update_value_map as-is (already flattened)
-        update_value_map: Dict[str, Any] = self.update_value_map(row, policy, request)
+        update_value_map: Dict[str, Any] = (
+            value_map
+            if value_map is not None
+            else self.update_value_map(row, policy, request)
+        )
 
         # 2. Flatten the row
         flattened_row = flatten_dict(row)
@@ -32,10 +32,24 @@ DynamoDBStatement = Dict[str, Any]
 
 class DynamoDBQueryConfig(QueryConfig[DynamoDBStatement]):
     def __init__(
-        self, node: ExecutionNode, attribute_definitions: List[Dict[str, Any]]
+        self,
+        node: ExecutionNode,
+        attribute_definitions: List[Dict[str, Any]],
+        key_schema: Optional[List[Dict[str, Any]]] = None,
     ):
         super().__init__(node)
         self.attribute_definitions = attribute_definitions
+        self.key_schema = key_schema or []
+
+    @property
+    def key_names(self) -> List[str]:
+        """The attributes of the table's primary key"""
+        return [key["AttributeName"] for key in self.key_schema]
+
+    @property
+    def has_range_key(self) -> bool:
+        """Whether the table's primary key includes a sort key"""
+        return any(key["KeyType"] == "RANGE" for key in self.key_schema)
 
     def generate_query(
         self,
@@ -56,13 +70,22 @@ class DynamoDBQueryConfig(QueryConfig[DynamoDBStatement]):
         return query_param
 
     def generate_update_stmt(
-        self, row: Row, policy: Policy, request: PrivacyRequest
+        self,
+        row: Row,
+        policy: Policy,
+        request: PrivacyRequest,
+        *,
+        value_map: Optional[Dict[str, Any]] = None,
     ) -> Optional[DynamoDBStatement]:
         """
         Generate a Dictionary that contains necessary items to
         run a PUT operation against DynamoDB
         """
-        update_clauses = self.update_value_map(row, policy, request)
+        update_clauses = (
+            value_map
+            if value_map is not None
+            else self.update_value_map(row, policy, request)
+        )
 
         if update_clauses:
             serializer = TypeSerializer()
@@ -61,7 +61,12 @@ class ManualQueryConfig(QueryConfig[Executable]):
         return manual_query
 
     def generate_update_stmt(
-        self, row: Row, policy: Policy, request: PrivacyRequest
+        self,
+        row: Row,
+        policy: Policy,
+        request: PrivacyRequest,
+        *,
+        value_map: Optional[Dict[str, Any]] = None,
     ) -> Optional[ManualAction]:
         """Describe the details needed to manually mask data in the
         current collection.
@@ -85,7 +90,11 @@ class ManualQueryConfig(QueryConfig[Executable]):
                 for field_path, field in self.primary_key_field_paths.items()
             }
         )
-        update_stmt: Dict[str, Any] = self.update_value_map(row, policy, request)
+        update_stmt: Dict[str, Any] = (
+            value_map
+            if value_map is not None
+            else self.update_value_map(row, policy, request)
+        )
 
         if update_stmt and locators:
             return ManualAction(locators=locators, get=None, update=update_stmt)
@@ -21,6 +21,21 @@ MongoStatement = Tuple[Dict[str, Any], Dict[str, Any]]
   """
 
 
+def _unique(values: List[Any]) -> List[Any]:
+    """
+    The given values without duplicates, in order, so `$in` matches each once.
+    Values are compared with their type, as Mongo doesn't match `1` and `True`
+    (or `1` and `"1"`) to each other the way Python considers `1 == True`.
+    """
+    unique: Dict[Tuple[type, Any], Any] = {}
+    try:
+        for value in values:
+            unique.setdefault((type(value), value), value)
+    except TypeError:  # unhashable values, e.g. embedded documents
+        return values
+    return list(unique.values())
+
+
 class MongoQueryConfig(QueryConfig[MongoStatement]):
     """Query config that translates parameters into mongo statements"""
 
@@ -41,6 +56,7 @@ class MongoQueryConfig(QueryConfig[MongoStatement]):
             if filtered_data:
                 query_pairs = {}
                 for string_field_path, data in filtered_data.items():
+                    data = _unique(data)
                     if len(data) == 1:
                         query_pairs[string_field_path] = data[0]
 
@@ -64,10 +80,19 @@ class MongoQueryConfig(QueryConfig[MongoStatement]):
         return None
 
     def generate_update_stmt(
-        self, row: Row, policy: Policy, request: PrivacyRequest
+        self,
+        row: Row,
+        policy: Policy,
+        request: PrivacyRequest,
+        *,
+        value_map: Optional[Dict[str, Any]] = None,
     ) -> Optional[MongoStatement]:
         """Generate a SQL update statement in the form of Mongo update statement components"""
-        update_clauses = self.update_value_map(row, policy, request)
+        update_clauses = (
+            value_map
+            if value_map is not None
+            else self.update_value_map(row, policy, request)
+        )
 
         pk_clauses: Dict[str, Any] = filter_nonempty_values(
             {
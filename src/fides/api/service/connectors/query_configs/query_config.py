@@ -1,6 +1,7 @@
 # pylint: disable=too-many-lines
 import re
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Any, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union
 
 import pydash
@@ -39,6 +40,17 @@ from fides.api.util.querytoken import QueryToken
 T = TypeVar("T")
 
 
+@dataclass
+class MaskingPlanEntry:
+    """A field to mask on a collection, and how to mask it"""
+
+    field_path: FieldPath
+    field: Optional[Field]
+    strategy: MaskingStrategy
+    null_masking: bool
+    truncation: MaskingTruncation
+
+
 class QueryConfig(Generic[T], ABC):
     """A wrapper around a resource-type dependent query object that can generate runnable queries
     and string representations."""
@@ -243,54 +255,37 @@ class QueryConfig(Generic[T], ABC):
         # Return true if it's either an object or an array of objects and has data categories
         return is_object or is_array_of_objects
 
-    def update_value_map(  # pylint: disable=R0914
-        self, row: Row, policy: Policy, request: PrivacyRequest
-    ) -> Dict[str, Any]:
-        """Map the relevant field (as strings) to be updated on the row with their masked values from Policy Rules
-
-        Example return:  {'name': None, 'ccn': None, 'code': None, 'workplace_info.employer': None, 'children.0': None}
-
-        In this example, a Null Masking Strategy was used to determine that the name/ccn/code fields, nested
-        workplace_info.employer field, and the first element in 'children' for a given customer_id will be replaced
-        with null values.
+    def build_masking_plan(self, policy: Policy) -> List[MaskingPlanEntry]:
         """
-        rule_to_collection_field_paths: Dict[Rule, List[FieldPath]] = (
-            self.build_rule_target_field_paths(policy)
-        )
+        Compile the Policy's erasure rules into the fields to mask on this collection,
+        each with the masking strategy and truncation to apply.
 
-        value_map: Dict[str, Any] = {}
-        # Track which parent paths have been masked as whole objects/arrays
-        masked_parent_paths: List[str] = []
+        The plan doesn't depend on any row data, so it is built once for all of the
+        rows being masked rather than once per row.
+        """
+        masking_plan: List[MaskingPlanEntry] = []
+        field_map = self.field_map()
 
-        for rule, field_paths in rule_to_collection_field_paths.items():
+        for rule, field_paths in self.build_rule_target_field_paths(policy).items():
             strategy_config = rule.masking_strategy
             if not strategy_config:
                 continue
 
+            rule_strategy: MaskingStrategy = MaskingStrategy.get_strategy(
+                strategy_config["strategy"], strategy_config["configuration"]
+            )
+
             for rule_field_path in field_paths:
                 # Check if field is read-only before processing
-                field = self.field_map().get(rule_field_path)
+                field = field_map.get(rule_field_path)
                 if field and field.read_only:
                     logger.debug(
                         f"Skipping read-only field: {rule_field_path.string_path}"
                     )
                     continue
 
-                # Skip if this field is a child of an already masked parent object
-                if self._is_child_of_masked_parent(
-                    rule_field_path.string_path, masked_parent_paths
-                ):
-                    logger.debug(
-                        f"Skipping field {rule_field_path.string_path} because its parent object has already been masked"
-                    )
-                    continue
-
-                # Determine masking strategy
-                strategy: MaskingStrategy = MaskingStrategy.get_strategy(
-                    strategy_config["strategy"], strategy_config["configuration"]
-                )
-
                 # Apply field-level masking strategy override if present
+                strategy = rule_strategy
                 if field and field.masking_strategy_override:
                     masking_strategy_override = field.masking_strategy_override
                     strategy = MaskingStrategy.get_strategy(
@@ -302,11 +297,10 @@ class QueryConfig(Generic[T], ABC):
                     )
 
                 null_masking: bool = strategy.name == NullMaskingStrategy.name
-                truncation: MaskingTruncation = [
-                    MaskingTruncation(field.data_type_converter, field.length)
-                    for field_path, field in self.field_map().items()
-                    if field_path == rule_field_path
-                ][0]
+                truncation = MaskingTruncation(
+                    field.data_type_converter if field else None,
+                    field.length if field else None,
+                )
 
                 if not self._supported_data_type(truncation, null_masking, strategy):
                     logger.warning(
@@ -317,56 +311,124 @@ class QueryConfig(Generic[T], ABC):
                     )
                     continue
 
+                masking_plan.append(
+                    MaskingPlanEntry(
+                        field_path=rule_field_path,
+                        field=field,
+                        strategy=strategy,
+                        null_masking=null_masking,
+                        truncation=truncation,
+                    )
+                )
+
+        return masking_plan
+
+    def update_value_map(
+        self, row: Row, policy: Policy, request: PrivacyRequest
+    ) -> Dict[str, Any]:
+        """Map the relevant field (as strings) to be updated on the row with their masked values from Policy Rules
+
+        Example return:  {'name': None, 'ccn': None, 'code': None, 'workplace_info.employer': None, 'children.0': None}
+
+        In this example, a Null Masking Strategy was used to determine that the name/ccn/code fields, nested
+        workplace_info.employer field, and the first element in 'children' for a given customer_id will be replaced
+        with null values.
+        """
+        return self.update_value_maps([row], policy, request)[0]
+
+    def update_value_maps(  # pylint: disable=R0914
+        self, rows: List[Row], policy: Policy, request: PrivacyRequest
+    ) -> List[Dict[str, Any]]:
+        """Return the update value map (see `update_value_map`) of each given row.
+
+        The masking plan is built once, and each field is masked as a whole column,
+        across all of the rows, with a single call to its masking strategy.
+        Deterministic strategies only mask each distinct value in the column once.
+        """
+        masking_plan = self.build_masking_plan(policy)
+        value_maps: List[Dict[str, Any]] = [{} for _ in rows]
+        # The (row index, path, value) to mask for each entry of the masking plan
+        columns: List[List[Tuple[int, str, Any]]] = [[] for _ in masking_plan]
+
+        for row_index, row in enumerate(rows):
+            value_map = value_maps[row_index]
+            # Track which parent paths have been masked as whole objects/arrays
+            masked_parent_paths: List[str] = []
+
+            for entry, column in zip(masking_plan, columns):
+                rule_field_path = entry.field_path
+
+                # Skip if this field is a child of an already masked parent object
+                if self._is_child_of_masked_parent(
+                    rule_field_path.string_path, masked_parent_paths
+                ):
+                    logger.debug(
+                        f"Skipping field {rule_field_path.string_path} because its parent object has already been masked"
+                    )
+                    continue
+
                 # Get the actual field value to determine its type
                 field_val = pydash.objects.get(row, rule_field_path.string_path)
 
                 # Handle objects and arrays with data categories - mask as whole entities
-                if self._is_object_or_array_with_data_category(field_val, field):
+                if self._is_object_or_array_with_data_category(field_val, entry.field):
                     logger.info(
                         f"Field {rule_field_path.string_path} is an object or array of objects with data category. Masking entire field."
                     )
                     if field_val is not None:
-                        value_map[rule_field_path.string_path] = (
-                            self._generate_masked_value(
-                                request_id=request.id,
-                                strategy=strategy,
-                                val=field_val,
-                                masking_truncation=truncation,
-                                null_masking=null_masking,
-                                str_field_path=rule_field_path.string_path,
-                            )
+                        column.append(
+                            (row_index, rule_field_path.string_path, field_val)
                         )
+                        # Reserve the key so the value map keeps the order fields were masked in
+                        value_map.setdefault(rule_field_path.string_path, None)
                         # Add this path to masked parent paths to skip its children later
                         masked_parent_paths.append(rule_field_path.string_path)
-                else:
-                    # Standard approach: build refined target paths for individual fields
-                    paths_to_mask = [
-                        join_detailed_path(path)
-                        for path in build_refined_target_paths(
-                            row, query_paths={rule_field_path: None}
+                    continue
+
+                # Standard approach: build refined target paths for individual fields
+                paths_to_mask = [
+                    join_detailed_path(path)
+                    for path in build_refined_target_paths(
+                        row, query_paths={rule_field_path: None}
+                    )
+                ]
+
+                # Process each detailed path, skipping those that are children of masked parents
+                for detailed_path in paths_to_mask:
+                    if self._is_child_of_masked_parent(
+                        detailed_path, masked_parent_paths
+                    ):
+                        logger.debug(
+                            f"Skipping detailed path {detailed_path} because its parent object has already been masked"
                         )
-                    ]
-
-                    # Process each detailed path, skipping those that are children of masked parents
-                    for detailed_path in paths_to_mask:
-                        if self._is_child_of_masked_parent(
-                            detailed_path, masked_parent_paths
-                        ):
-                            logger.debug(
-                                f"Skipping detailed path {detailed_path} because its parent object has already been masked"
-                            )
-                            continue
-
-                        value_map[detailed_path] = self._generate_masked_value(
-                            request_id=request.id,
-                            strategy=strategy,
-                            val=pydash.objects.get(row, detailed_path),
-                            masking_truncation=truncation,
-                            null_masking=null_masking,
-                            str_field_path=detailed_path,
+                        continue
+
+                    column.append(
+                        (
+                            row_index,
+                            detailed_path,
+                            pydash.objects.get(row, detailed_path),
                         )
+                    )
+                    value_map.setdefault(detailed_path, None)
 
-        return value_map
+        # Entries are applied in plan order so that, as before, a later rule
+        # targeting the same path takes precedence.
+        for entry, column in zip(masking_plan, columns):
+            if not column:
+                continue
+            masked_values = self._generate_masked_values(
+                request_id=request.id,
+                strategy=entry.strategy,
+                values=[val for _, _, val in column],
+                masking_truncation=entry.truncation,
+                null_masking=entry.null_masking,
+                str_field_path=entry.field_path.string_path,
+            )
+            for (row_index, path, _), masked_val in zip(column, masked_values):
+                value_maps[row_index][path] = masked_val
+
+        return value_maps
 
     @staticmethod
     def _supported_data_type(
@@ -386,26 +448,25 @@ class QueryConfig(Generic[T], ABC):
         return True
 
     @staticmethod
-    def _generate_masked_value(  # pylint: disable=R0913
+    def _generate_masked_values(  # pylint: disable=R0913
         request_id: str,
         strategy: MaskingStrategy,
-        val: Any,
+        values: List[Any],
         masking_truncation: MaskingTruncation,
         null_masking: bool,
         str_field_path: str,
-    ) -> T:
-        # masking API takes and returns lists, but here we are only leveraging single elements
-        masked_val = strategy.mask([val], request_id)[0]  # type: ignore
+    ) -> List[Any]:
+        masked_values = strategy.mask_batch(values, request_id)
 
         logger.debug(
-            "Generated the following masked val for field {}: {}",
+            "Generated {} masked vals for field {}",
+            len(masked_values),
             str_field_path,
-            masked_val,
         )
 
         # special case for null masking
         if null_masking:
-            return masked_val
+            return masked_values
 
         if masking_truncation.length:
             logger.warning(
@@ -413,10 +474,13 @@ class QueryConfig(Generic[T], ABC):
                 str_field_path,
             )
             #  for strategies other than null masking we assume that masked data type is the same as specified data type
-            masked_val = masking_truncation.data_type_converter.truncate(  # type: ignore
-                masking_truncation.length, masked_val
-            )
-        return masked_val
+            masked_values = [
+                masking_truncation.data_type_converter.truncate(  # type: ignore
+                    masking_truncation.length, masked_val
+                )
+                for masked_val in masked_values
+            ]
+        return masked_values
 
     @abstractmethod
     def generate_query(
@@ -436,11 +500,20 @@ class QueryConfig(Generic[T], ABC):
 
     @abstractmethod
     def generate_update_stmt(
-        self, row: Row, policy: Policy, request: PrivacyRequest
+        self,
+        row: Row,
+        policy: Policy,
+        request: PrivacyRequest,
+        *,
+        value_map: Optional[Dict[str, Any]] = None,
     ) -> Optional[T]:
         """Generate an update statement. If there is no data to be updated
         (for example, if the policy identifies no fields to be updated)
-        returns None"""
+        returns None
+
+        `value_map` is the row's update value map, when it was already computed for
+        all of the rows with `update_value_maps`; otherwise the row is masked on its own.
+        """
 
 
 class SQLLikeQueryConfig(QueryConfig[T], ABC):
@@ -600,10 +673,19 @@ class SQLLikeQueryConfig(QueryConfig[T], ABC):
         """Adds the appropriate formatting for update statements in this datastore."""
 
     def generate_update_stmt(
-        self, row: Row, policy: Policy, request: PrivacyRequest
+        self,
+        row: Row,
+        policy: Policy,
+        request: PrivacyRequest,
+        *,
+        value_map: Optional[Dict[str, Any]] = None,
     ) -> Optional[T]:
         """Returns an update statement in generic SQL-ish dialect."""
-        update_value_map: Dict[str, Any] = self.update_value_map(row, policy, request)
+        update_value_map: Dict[str, Any] = (
+            value_map
+            if value_map is not None
+            else self.update_value_map(row, policy, request)
+        )
 
         non_empty_primary_key_fields: Dict[str, Field] = filter_nonempty_values(
             {
@@ -482,6 +482,8 @@ class SaaSQueryConfig(QueryConfig[SaaSRequestParams]):
         policy: Policy,
         request: PrivacyRequest,
         input_data: Optional[Dict[str, List[Any]]] = None,
+        *,
+        value_map: Optional[Dict[str, Any]] = None,
     ) -> SaaSRequestParams:
         """
         This returns the method, path, header, query, and body params needed to make an API call.
@@ -493,10 +495,11 @@ class SaaSQueryConfig(QueryConfig[SaaSRequestParams]):
             policy: The privacy policy being applied
             request: The privacy request being processed
             input_data: Optional upstream data from other collections for cross-collection references
+            value_map: The row's update value map, if it was already computed
         """
         current_request: SaaSRequest = self.get_masking_request()  # type: ignore
         param_values: Dict[str, Any] = self.generate_update_param_values(
-            row, policy, request, current_request, input_data
+            row, policy, request, current_request, input_data, value_map=value_map
         )
 
         return self.generate_update_request_params(param_values, current_request)
@@ -526,6 +529,8 @@ class SaaSQueryConfig(QueryConfig[SaaSRequestParams]):
         privacy_request: PrivacyRequest,
         saas_request: SaaSRequest,
         input_data: Optional[Dict[str, List[Any]]] = None,
+        *,
+        value_map: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         A utility that generates the update request param values
@@ -543,6 +548,7 @@ class SaaSQueryConfig(QueryConfig[SaaSRequestParams]):
             privacy_request: The privacy request being processed
             saas_request: The SaaS request configuration
             input_data: Optional upstream data from other collections for cross-collection references
+            value_map: The row's update value map, if it was already computed
         """
 
         collection_values: Dict[str, Row] = {self.collection_name: row}
@@ -573,8 +579,10 @@ class SaaSQueryConfig(QueryConfig[SaaSRequestParams]):
                     pydash.unset(row, detailed_path)
 
         # mask row values
-        update_value_map: Dict[str, Any] = self.update_value_map(
-            row, policy, privacy_request
+        update_value_map: Dict[str, Any] = (
+            value_map
+            if value_map is not None
+            else self.update_value_map(row, policy, privacy_request)
         )
         masked_object: Dict[str, Any] = unflatten_dict(update_value_map)
 
@@ -1,13 +1,32 @@
 # pylint: disable=protected-access
+import hashlib
+import hmac
+import json
 import os
+import re
+import tempfile
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Type
+from collections import ChainMap
+from dataclasses import dataclass
+from threading import RLock
+from typing import (
+    Any,
+    Dict,
+    ItemsView,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Type,
+    ValuesView,
+)
 from zipfile import ZipFile
 
 from fideslang.models import Dataset
 from loguru import logger
 from sqlalchemy.orm import Session
 
+import fides
 from fides.api.common_exceptions import ValidationError
 from fides.api.cryptography.cryptographic_util import str_to_b64_str
 from fides.api.models.connectionconfig import ConnectionConfig
@@ -16,6 +35,7 @@ from fides.api.models.saas_config_version import SaaSConfigVersion
 from fides.api.models.saas_template_dataset import SaasTemplateDataset
 from fides.api.schemas.saas.connector_template import (
     ConnectorTemplate,
+    ConnectorTemplateHeader,
     ConnectorTemplateListResponse,
 )
 from fides.api.schemas.saas.saas_config import SaaSConfig
@@ -34,6 +54,7 @@ from fides.api.util.saas_util import (
 )
 from fides.api.util.unsafe_file_util import verify_svg, verify_zip
 from fides.common.session_management import get_api_session
+from fides.config import CONFIG
 
 
 class ConnectorTemplateLoader(ABC):
@@ -47,7 +68,7 @@ class ConnectorTemplateLoader(ABC):
         return cls._instance
 
     @classmethod
-    def get_connector_templates(cls) -> Dict[str, ConnectorTemplate]:
+    def get_connector_templates(cls) -> Mapping[str, ConnectorTemplate]:
         """Returns a map of connection templates."""
         return cls()._instance._templates  # type: ignore[attr-defined, union-attr]
 
@@ -56,55 +77,337 @@ class ConnectorTemplateLoader(ABC):
         """Load connector templates into the _templates dictionary"""
 
 
-class FileConnectorTemplateLoader(ConnectorTemplateLoader):
-    """
-    Loads SaaS connector templates from the data/saas directory.
+# The indentation of the first key of a SaaS config
+_SAAS_CONFIG_INDENT_PATTERN = re.compile(
+    r"^saas_config:[ \t]*\n(?:[ \t]*(?:#.*)?\n)*( +)\S", re.MULTILINE
+)
+
+
+def _scan_connector_type(config: str) -> Optional[str]:
+    """Reads the connector type of a SaaS config without parsing its YAML."""
+    indent = _SAAS_CONFIG_INDENT_PATTERN.search(config)
+    if indent is None:
+        return None
+    connector_type = re.search(
+        rf"""^{indent.group(1)}type:[ \t]*['"]?([\w.-]+)['"]?[ \t]*$""",
+        config,
+        re.MULTILINE,
+    )
+    return connector_type.group(1) if connector_type else None
+
+
+def _content_hash(contents: str) -> str:
+    return hashlib.sha256(contents.encode("utf-8")).hexdigest()
+
+
+def _get_index_path() -> str:
+    """The path of the on-disk index of the file connector templates."""
+    return os.path.expanduser(CONFIG.execution.saas_connector_template_index_path)
+
+
+def _sign_index(index: Dict[str, Any]) -> str:
+    """The HMAC of the index, keyed by the app encryption key."""
+    contents = json.dumps(index, sort_keys=True, separators=(",", ":"))
+    return hmac.new(
+        CONFIG.security.app_encryption_key.encode("utf-8"),
+        contents.encode("utf-8"),
+        hashlib.sha256,
+    ).hexdigest()
+
+
+def _get_template_header(config: SaaSConfig) -> ConnectorTemplateHeader:
+    authentication = config.client_config.authentication
+    authorization_required = (
+        authentication is not None
+        and authentication.strategy
+        == OAuth2AuthorizationCodeAuthenticationStrategy.name
+    )
+    return ConnectorTemplateHeader(
+        human_readable=config.name,
+        authorization_required=authorization_required,
+        user_guide=config.user_guide,
+        supported_actions=config.supported_actions,
+        **extract_display_info_from_config(config),
+    )
+
+
+def _get_template_icon(connector_type: str) -> str:
+    try:
+        return encode_file_contents(f"data/saas/icon/{connector_type}.svg")
+    except FileNotFoundError:
+        logger.debug(
+            f"Could not find the expected {connector_type}.svg in the data/saas/icon/ directory, using default icon"
+        )
+        return encode_file_contents("data/saas/icon/default.svg")
+
+
+@dataclass
+class FileConnectorTemplateEntry:
+    """A file connector template in the index, and what is known about it."""
+
+    config_path: str
+    config_hash: str
+    header: Optional[ConnectorTemplateHeader] = None
+    version: Optional[str] = None
+
+
+class LoadedTemplatesItemsView(ItemsView[str, ConnectorTemplate]):
+    """The items of a map of connector templates, skipping templates which fail to load."""
+
+    _mapping: Mapping[str, ConnectorTemplate]
+
+    def __iter__(self) -> Iterator[tuple[str, ConnectorTemplate]]:
+        for connector_type in list(self._mapping):
+            try:
+                yield connector_type, self._mapping[connector_type]
+            except KeyError:
+                continue
+
+
+class LoadedTemplatesValuesView(ValuesView[ConnectorTemplate]):
+    """The values of a map of connector templates, skipping templates which fail to load."""
+
+    _mapping: Mapping[str, ConnectorTemplate]
+
+    def __iter__(self) -> Iterator[ConnectorTemplate]:
+        for _, template in LoadedTemplatesItemsView(self._mapping):
+            yield template
+
+
+class FileConnectorTemplates(Mapping[str, ConnectorTemplate]):
     """
+    The file connector templates, keyed by connector type.
 
-    def _load_connector_templates(self) -> None:
-        logger.info("Loading connectors templates from the data/saas directory")
-        for file in os.listdir("data/saas/config"):
-            if file.endswith(".yml"):
-                config_path = os.path.join("data/saas/config", file)
-                config = SaaSConfig(**load_config(config_path))
-
-                connector_type = config.type
-
-                authentication = config.client_config.authentication
-                authorization_required = (
-                    authentication is not None
-                    and authentication.strategy
-                    == OAuth2AuthorizationCodeAuthenticationStrategy.name
-                )
+    The index of connector types is built from the on-disk index, which caches
+    each template's header and version by the hash of its config, and otherwise
+    from a scan of each config for its type. A `ConnectorTemplate` is only read,
+    validated and encoded when it's first accessed.
 
-                display_info = extract_display_info_from_config(config)
+    The on-disk index is kept at the configured
+    `saas_connector_template_index_path`, readable only by its owner, and signed
+    with the app encryption key. An index that fails the signature check is
+    ignored. Headers indexed since the index was read are written back by
+    `save_index`, once at the end of a pass over the templates.
 
-                try:
-                    icon = encode_file_contents(f"data/saas/icon/{connector_type}.svg")
-                except FileNotFoundError:
-                    logger.debug(
-                        f"Could not find the expected {connector_type}.svg in the data/saas/icon/ directory, using default icon"
-                    )
-                    icon = encode_file_contents("data/saas/icon/default.svg")
+    Templates which fail to load are logged and removed from the index, and
+    are skipped when iterating over the items or values.
+    """
 
-                # store connector template for retrieval
+    def __init__(
+        self, entries: Dict[str, FileConnectorTemplateEntry], dirty: bool = False
+    ):
+        self._entries = entries
+        self._templates: Dict[str, ConnectorTemplate] = {}
+        self._lock = RLock()
+        self._dirty = dirty
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, connector_type: object) -> bool:
+        return connector_type in self._entries
+
+    def items(self) -> ItemsView[str, ConnectorTemplate]:
+        return LoadedTemplatesItemsView(self)
+
+    def values(self) -> ValuesView[ConnectorTemplate]:
+        return LoadedTemplatesValuesView(self)
+
+    def __getitem__(self, connector_type: str) -> ConnectorTemplate:
+        template = self._templates.get(connector_type)
+        if template is not None:
+            return template
+        with self._lock:
+            if connector_type in self._templates:
+                return self._templates[connector_type]
+            entry = self._entries[connector_type]
+            try:
+                template = self._load_template(connector_type, entry)
+            except Exception:
+                logger.exception("Unable to load {} connector", connector_type)
+                self._entries.pop(connector_type, None)
+                raise KeyError(connector_type) from None
+            self._templates[connector_type] = template
+            return template
+
+    def get_header(self, connector_type: str) -> Optional[ConnectorTemplateHeader]:
+        """
+        Returns the header of the template, without loading the template's dataset
+        and icon if its config was indexed before.
+        """
+        entry = self._get_indexed_entry(connector_type)
+        return entry.header if entry else None
+
+    def get_version(self, connector_type: str) -> Optional[str]:
+        """
+        Returns the version of the template's SaaS config, without loading the
+        template's dataset and icon if its config was indexed before.
+        """
+        entry = self._get_indexed_entry(connector_type)
+        return entry.version if entry else None
+
+    def _get_indexed_entry(
+        self, connector_type: str
+    ) -> Optional[FileConnectorTemplateEntry]:
+        entry = self._entries.get(connector_type)
+        if entry is None:
+            return None
+        if entry.header is None or entry.version is None:
+            with self._lock:
                 try:
-                    FileConnectorTemplateLoader.get_connector_templates()[
-                        connector_type
-                    ] = ConnectorTemplate(
-                        config=load_yaml_as_string(config_path),
-                        dataset=load_yaml_as_string(
-                            f"data/saas/dataset/{connector_type}_dataset.yml"
-                        ),
-                        icon=icon,
-                        human_readable=config.name,
-                        authorization_required=authorization_required,
-                        user_guide=config.user_guide,
-                        supported_actions=config.supported_actions,
-                        **display_info,
-                    )
+                    config = SaaSConfig(**load_config(entry.config_path))
                 except Exception:
                     logger.exception("Unable to load {} connector", connector_type)
+                    self._entries.pop(connector_type, None)
+                    return None
+                entry.header = _get_template_header(config)
+                entry.version = config.version
+                self._dirty = True
+        return entry
+
+    def _load_template(
+        self, connector_type: str, entry: FileConnectorTemplateEntry
+    ) -> ConnectorTemplate:
+        config = load_yaml_as_string(entry.config_path)
+        dataset = load_yaml_as_string(f"data/saas/dataset/{connector_type}_dataset.yml")
+        icon = _get_template_icon(connector_type)
+
+        saas_config = SaaSConfig(**load_config_from_string(config))
+        if saas_config.type != connector_type:
+            raise ValidationError(
+                f"Expected a config of type '{connector_type}' in {entry.config_path}"
+            )
+        header = _get_template_header(saas_config)
+        template = ConnectorTemplate(
+            config=config, dataset=dataset, icon=icon, **header.model_dump()
+        )
+        config_hash = _content_hash(config)
+        if (
+            entry.config_hash != config_hash
+            or entry.header != header
+            or entry.version != saas_config.version
+        ):
+            entry.config_hash = config_hash
+            entry.header = header
+            entry.version = saas_config.version
+            self._dirty = True
+        return template
+
+    @classmethod
+    def load(cls, config_dir: str = "data/saas/config") -> "FileConnectorTemplates":
+        """Indexes the connector templates of the config directory."""
+        cached = cls._read_index()
+        entries: Dict[str, FileConnectorTemplateEntry] = {}
+        dirty = False
+        for file in os.listdir(config_dir):
+            if not file.endswith(".yml"):
+                continue
+            config_path = os.path.join(config_dir, file)
+            config = load_yaml_as_string(config_path)
+            config_hash = _content_hash(config)
+            entry = FileConnectorTemplateEntry(
+                config_path=config_path, config_hash=config_hash
+            )
+
+            cached_entry = cached.get(config_hash)
+            if cached_entry is not None:
+                connector_type = cached_entry["connector_type"]
+                entry.header = ConnectorTemplateHeader.model_validate(
+                    cached_entry["header"]
+                )
+                entry.version = cached_entry.get("version")
+            else:
+                scanned_type = _scan_connector_type(config)
+                if scanned_type is not None:
+                    connector_type = scanned_type
+                else:
+                    saas_config = SaaSConfig(**load_config_from_string(config))
+                    connector_type = saas_config.type
+                    entry.header = _get_template_header(saas_config)
+                    entry.version = saas_config.version
+                    dirty = True
+            entries[connector_type] = entry
+        return cls(entries, dirty=dirty)
+
+    @staticmethod
+    def _read_index() -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the cached entries of the on-disk index, keyed by config hash,
+        if the index was signed with this app's encryption key.
+        """
+        index_path = _get_index_path()
+        try:
+            with open(index_path, "r", encoding="utf-8") as file:
+                signed_index = json.load(file)
+            index = signed_index["index"]
+            signature = signed_index["signature"]
+        except (OSError, ValueError, TypeError, KeyError):
+            return {}
+        if not isinstance(signature, str) or not hmac.compare_digest(
+            signature, _sign_index(index)
+        ):
+            logger.warning(
+                "Ignoring the connector template index at {}, its signature is invalid",
+                index_path,
+            )
+            return {}
+        if index.get("version") != fides.__version__:
+            return {}
+        return index.get("templates", {})
+
+    def save_index(self) -> None:
+        """
+        Writes the signed headers of the indexed templates to the on-disk index,
+        if any were indexed since it was read or last written. The index is
+        replaced atomically, as processes may write it concurrently.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            templates = {
+                entry.config_hash: {
+                    "connector_type": connector_type,
+                    "header": entry.header.model_dump(mode="json"),
+                    "version": entry.version,
+                }
+                for connector_type, entry in list(self._entries.items())
+                if entry.header is not None and entry.version is not None
+            }
+        index = {"version": fides.__version__, "templates": templates}
+        index_path = _get_index_path()
+        index_dir = os.path.dirname(index_path)
+        try:
+            os.makedirs(index_dir, mode=0o700, exist_ok=True)
+            # NamedTemporaryFile creates the file readable by its owner only
+            with tempfile.NamedTemporaryFile(
+                "w", dir=index_dir, suffix=".tmp", delete=False, encoding="utf-8"
+            ) as file:
+                json.dump({"index": index, "signature": _sign_index(index)}, file)
+            os.replace(file.name, index_path)
+        except OSError as exc:
+            logger.debug("Unable to write the connector template index: {}", exc)
+
+
+class FileConnectorTemplateLoader(ConnectorTemplateLoader):
+    """
+    Loads SaaS connector templates from the data/saas directory.
+
+    Templates are indexed at startup and loaded on first access, see
+    `FileConnectorTemplates`.
+    """
+
+    @classmethod
+    def get_connector_templates(cls) -> FileConnectorTemplates:
+        """Returns the index of file connector templates."""
+        return cls()._instance._templates  # type: ignore[attr-defined, union-attr]
+
+    def _load_connector_templates(self) -> None:
+        logger.info("Indexing connectors templates from the data/saas directory")
+        self._templates = FileConnectorTemplates.load()  # type: ignore[attr-defined]
 
 
 class CustomConnectorTemplateLoader(ConnectorTemplateLoader):
@@ -186,8 +489,8 @@ class CustomConnectorTemplateLoader(ConnectorTemplateLoader):
         display_info = extract_display_info_from_config(config)
 
         # Check if a file-based connector template exists for this connector type
-        file_connector_template = (
-            FileConnectorTemplateLoader.get_connector_templates().get(template.key)
+        file_connector_template_available = (
+            template.key in FileConnectorTemplateLoader.get_connector_templates()
         )
 
         connector_template = ConnectorTemplate(
@@ -199,7 +502,7 @@ class CustomConnectorTemplateLoader(ConnectorTemplateLoader):
             user_guide=config.user_guide,
             supported_actions=config.supported_actions,
             custom=True,
-            default_connector_available=file_connector_template is not None,
+            default_connector_available=file_connector_template_available,
             **display_info,
         )
 
@@ -347,14 +650,30 @@ class CustomConnectorTemplateLoader(ConnectorTemplateLoader):
         return connector_type
 
 
+class CombinedConnectorTemplates(ChainMap):
+    """A ChainMap of connector templates, which skips templates that fail to load."""
+
+    def get(self, key: str, default: Any = None) -> Any:  # type: ignore[override]
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def items(self) -> ItemsView[str, ConnectorTemplate]:
+        return LoadedTemplatesItemsView(self)
+
+    def values(self) -> ValuesView[ConnectorTemplate]:
+        return LoadedTemplatesValuesView(self)
+
+
 class ConnectorRegistry:
     @classmethod
-    def get_combined_templates(cls) -> dict[str, ConnectorTemplate]:
+    def get_combined_templates(cls) -> Mapping[str, ConnectorTemplate]:
         """Returns a combined map of connector templates from all registered loaders.
 
         The resulting map is an aggregation of templates from the file loader
         and the custom loader, with custom loader templates taking precedence
-        in case of conflicts.
+        in case of conflicts. File templates are only loaded when they're accessed.
 
         The custom loader's ``get_connector_templates()`` is backed by the
         ``@redis_version_cached`` decorator, so it only reloads from the
@@ -364,10 +683,10 @@ class ConnectorRegistry:
         and loop over the result rather than calling get_connector_template()
         per type, which would trigger repeated Redis version checks.
         """
-        return {
-            **FileConnectorTemplateLoader.get_connector_templates(),  # type: ignore
-            **CustomConnectorTemplateLoader.get_connector_templates(),  # type: ignore
-        }
+        return CombinedConnectorTemplates(
+            CustomConnectorTemplateLoader.get_connector_templates(),  # type: ignore
+            FileConnectorTemplateLoader.get_connector_templates(),  # type: ignore
+        )
 
     @classmethod
     def connector_types(cls) -> List[str]:
@@ -388,19 +707,56 @@ class ConnectorRegistry:
         Includes connector_type, name, supported_actions, category, whether it's custom,
         and whether a default connector is available.
         """
-        combined_templates = cls.get_combined_templates()
+        file_templates = FileConnectorTemplateLoader.get_connector_templates()
+        custom_templates = CustomConnectorTemplateLoader.get_connector_templates()
 
         summaries: List[ConnectorTemplateListResponse] = []
-        for connector_type, template in combined_templates.items():
+        for connector_type in cls.get_combined_templates():
+            template: Optional[Any] = custom_templates.get(connector_type)
+            if template is None:
+                # The header of a file template has the fields of its summary
+                template = file_templates.get_header(connector_type)
+                if template is None:
+                    continue
             summaries.append(
                 ConnectorTemplateListResponse(
                     type=connector_type,
                     name=template.human_readable,
                     supported_actions=template.supported_actions,
                     category=template.category,
-                    custom=template.custom,
-                    default_connector_available=template.default_connector_available,
+                    custom=getattr(template, "custom", False),
+                    default_connector_available=getattr(
+                        template, "default_connector_available", False
+                    ),
                 )
             )
+        file_templates.save_index()
 
         return summaries
+
+    @classmethod
+    def get_template_versions(cls) -> Dict[str, str]:
+        """
+        Returns the SaaS config version of every connector template, with custom
+        templates taking precedence, without loading the file templates whose
+        configs were indexed before.
+
+        Callers that go on to load templates should save the file template index
+        once they're done, see `FileConnectorTemplates.save_index`.
+        """
+        file_templates = FileConnectorTemplateLoader.get_connector_templates()
+        custom_templates = CustomConnectorTemplateLoader.get_connector_templates()
+
+        versions: Dict[str, str] = {}
+        for connector_type in file_templates:
+            version = file_templates.get_version(connector_type)
+            if version is not None:
+                versions[connector_type] = version
+        for connector_type, template in custom_templates.items():
+            try:
+                versions[connector_type] = SaaSConfig(
+                    **load_config_from_string(template.config)
+                ).version
+            except Exception:
+                logger.exception("Unable to load {} connector", connector_type)
+        return versions
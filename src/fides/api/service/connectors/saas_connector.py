@@ -47,6 +47,9 @@ from fides.api.service.connectors.base_connector import BaseConnector
 from fides.api.service.connectors.query_configs.saas_query_config import SaaSQueryConfig
 from fides.api.service.connectors.saas.authenticated_client import AuthenticatedClient
 from fides.api.service.pagination.pagination_strategy import PaginationStrategy
+from fides.api.service.processors.post_processor_strategy.post_processor_pipeline import (
+    PostProcessorPipeline,
+)
 from fides.api.service.processors.post_processor_strategy.post_processor_strategy import (
     PostProcessorStrategy,
 )
@@ -440,7 +443,7 @@ class SaaSConnector(BaseConnector[AuthenticatedClient], Contextualizable):
         rows = self.process_response_data(
             response_data,
             identity_data,
-            cast(Optional[List[PostProcessorStrategy]], saas_request.postprocessors),
+            saas_request.get_postprocessor_pipeline(),
             response,
         )
 
@@ -474,42 +477,30 @@ class SaaSConnector(BaseConnector[AuthenticatedClient], Contextualizable):
         self,
         response_data: Union[List[Dict[str, Any]], Dict[str, Any]],
         identity_data: Dict[str, Any],
-        postprocessors: Optional[List[PostProcessorStrategy]],
+        postprocessors: Union[
+            PostProcessorPipeline, Optional[List[PostProcessorStrategy]]
+        ],
         response: Optional[Response] = None,
     ) -> List[Row]:
         """
         Runs the raw response through all available postprocessors for the request,
         forwarding the output of one postprocessor into the input of the next.
 
+        Postprocessors are preferably given as the request's compiled pipeline,
+        see `SaaSRequest.get_postprocessor_pipeline`.
+
         The final result is returned as a list of processed objects.
         """
         rows: List[Row] = []
-        processed_data = response_data
-        privacy_request = self.current_privacy_request
-
-        for postprocessor in postprocessors or []:
-            strategy: PostProcessorStrategy = PostProcessorStrategy.get_strategy(
-                postprocessor.strategy,  # type: ignore[attr-defined]
-                postprocessor.configuration,  # type: ignore
-            )
-            logger.info(
-                "Starting postprocessing of '{}' collection with '{}' strategy.",
-                self.current_collection_name,
-                postprocessor.strategy,  # type: ignore
-            )
-            try:
-                processed_data = strategy.process(
-                    processed_data,
-                    identity_data,
-                    privacy_request,
-                    response,
-                )
-
-            except Exception as exc:
-                raise PostProcessingException(
-                    f"Exception occurred during the '{postprocessor.strategy}' postprocessor "  # type: ignore
-                    f"on the '{self.current_collection_name}' collection: {exc}"
-                )
+        if not isinstance(postprocessors, PostProcessorPipeline):
+            postprocessors = PostProcessorPipeline(postprocessors)
+        processed_data = postprocessors.process(
+            response_data,
+            self.current_collection_name,
+            identity_data,
+            self.current_privacy_request,
+            response,
+        )
         if not processed_data:
             return rows
         if isinstance(processed_data, list):
@@ -595,7 +586,7 @@ class SaaSConnector(BaseConnector[AuthenticatedClient], Contextualizable):
         rows = self.process_response_data(
             rows,
             privacy_request.get_cached_identity_data(),
-            cast(Optional[List[PostProcessorStrategy]], masking_request.postprocessors),
+            masking_request.get_postprocessor_pipeline(),
             None,
         )
 
@@ -637,10 +628,7 @@ class SaaSConnector(BaseConnector[AuthenticatedClient], Contextualizable):
                     self.process_response_data(
                         response_data,
                         privacy_request.get_cached_identity_data(),
-                        cast(
-                            Optional[List[PostProcessorStrategy]],
-                            masking_request.postprocessors,
-                        ),
+                        masking_request.get_postprocessor_pipeline(),
                         handled_response,
                     )
             except (
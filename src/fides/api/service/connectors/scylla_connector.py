@@ -156,9 +156,10 @@ class ScyllaConnector(BaseConnector[Cluster]):
         query_config = self.query_config(node)
         update_ct = 0
         client = self.client()
-        for row in rows:
+        value_maps = query_config.update_value_maps(rows, policy, privacy_request)
+        for row, value_map in zip(rows, value_maps):
             generated_update_stmt = query_config.generate_update_stmt(
-                row, policy, privacy_request
+                row, policy, privacy_request, value_map=value_map
             )
             if generated_update_stmt is not None:
                 statement, params = generated_update_stmt
@@ -241,9 +241,10 @@ class SQLConnector(BaseConnector[Engine]):
         update_ct = 0
         client = self.client_for_node(node)
 
-        for row in rows:
+        value_maps = query_config.update_value_maps(rows, policy, privacy_request)
+        for row, value_map in zip(rows, value_maps):
             update_stmt: Optional[TextClause] = query_config.generate_update_stmt(
-                row, policy, privacy_request
+                row, policy, privacy_request, value_map=value_map
             )
             if update_stmt is not None:
                 if self.should_dry_run(SqlDryRunMode.erasure):
@@ -5,8 +5,9 @@ This service provides a generic interface for storing large data that would
 otherwise exceed database column size limits or impact performance.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 from sqlalchemy.orm import Session
@@ -227,3 +228,69 @@ class ExternalDataStorageService:
             logger.warning(
                 f"Failed to delete external storage file at {metadata.file_key}: {str(e)}"
             )
+
+    @staticmethod
+    def delete_data_batch(
+        db: Session,
+        metadata_list: List[ExternalStorageMetadata],
+        max_workers: int = 8,
+    ) -> int:
+        """
+        Delete many files from external storage concurrently.
+
+        Storage configurations and providers are resolved once per storage key
+        on the calling thread, and only the provider deletes run in parallel.
+
+        Args:
+            db: Database session
+            metadata_list: Storage metadata of the files to delete
+            max_workers: Maximum number of concurrent deletes
+
+        Returns:
+            The number of files that were deleted
+
+        Note:
+            Like delete_data, this is best-effort and logs warnings on failure.
+        """
+        if not metadata_list:
+            return 0
+
+        providers: Dict[Optional[str], Optional[Tuple[Any, str]]] = {}
+        deletes: List[Tuple[Any, str, str]] = []
+        for metadata in metadata_list:
+            if metadata.storage_key not in providers:
+                try:
+                    storage_config = ExternalDataStorageService._get_storage_config(
+                        db, metadata.storage_key
+                    )
+                    providers[metadata.storage_key] = (
+                        StorageProviderFactory.create(storage_config),
+                        StorageProviderFactory.get_bucket_from_config(storage_config),
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to resolve storage '{metadata.storage_key}' for external file cleanup: {str(e)}"
+                    )
+                    providers[metadata.storage_key] = None
+
+            resolved = providers[metadata.storage_key]
+            if resolved is not None:
+                provider, bucket = resolved
+                deletes.append((provider, bucket, metadata.file_key))
+
+        def _delete(delete: Tuple[Any, str, str]) -> bool:
+            provider, bucket, file_key = delete
+            try:
+                provider.delete(bucket, file_key)
+                return True
+            except Exception as e:
+                logger.warning(
+                    f"Failed to delete external storage file at {file_key}: {str(e)}"
+                )
+                return False
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            deleted = sum(executor.map(_delete, deletes))
+
+        logger.info(f"Deleted {deleted} of {len(metadata_list)} external storage files")
+        return deleted
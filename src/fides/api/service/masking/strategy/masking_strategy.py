@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import Any, List, Optional, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from fides.api.schemas.masking.masking_secrets import MaskingSecretCache
 from fides.api.schemas.masking.masking_strategy_description import (
@@ -14,12 +14,46 @@ from fides.api.service.strategy import Strategy
 class MaskingStrategy(Strategy):
     """Abstract base class for masking strategies"""
 
+    # Whether masking a value always returns the same masked value for the same
+    # privacy request. Repeated values only need to be masked once if so.
+    deterministic: bool = False
+
     @abstractmethod
     def mask(
         self, values: Optional[List[str]], request_id: Optional[str]
     ) -> Optional[List[Any]]:
         """Used to mask the provided values"""
 
+    def mask_batch(self, values: List[Any], request_id: Optional[str]) -> List[Any]:
+        """
+        Masks a whole column of values with a single call to `mask`.
+
+        If the strategy is deterministic, each distinct value is only masked once
+        and its masked value is reused for every occurrence.
+        """
+        if not self.deterministic:
+            return self.mask(values, request_id) or []
+
+        unique_values: List[Any] = []
+        positions: List[int] = []
+        seen: Dict[Tuple[type, Any], int] = {}
+        for value in values:
+            key: Optional[Tuple[type, Any]] = (type(value), value)
+            try:
+                position = seen.get(key)  # type: ignore[arg-type]
+            except TypeError:
+                # Unhashable values, such as whole objects, are masked individually
+                key, position = None, None
+            if position is None:
+                position = len(unique_values)
+                unique_values.append(value)
+                if key is not None:
+                    seen[key] = position
+            positions.append(position)
+
+        masked_values = self.mask(unique_values, request_id) or []
+        return [masked_values[position] for position in positions]
+
     @abstractmethod
     def secrets_required(self) -> bool:
         """Determines whether secrets are needed for specific masking strategy"""
@@ -25,6 +25,7 @@ from fides.api.util.encryption.secrets_util import SecretsUtil
 class AesEncryptionMaskingStrategy(MaskingStrategy):
     name = "aes_encrypt"
     configuration_model = AesEncryptionMaskingConfiguration
+    deterministic = True
 
     def __init__(self, configuration: AesEncryptionMaskingConfiguration):
         self.mode = configuration.mode
@@ -48,11 +49,21 @@ class AesEncryptionMaskingStrategy(MaskingStrategy):
                 SecretType.key_hmac,
                 masking_meta[SecretType.key_hmac],
             )
+            salt_hmac: str | None = SecretsUtil.get_or_generate_secret(
+                request_id,
+                SecretType.salt_hmac,
+                masking_meta[SecretType.salt_hmac],
+            )
 
             # The nonce is generated deterministically such that the same input val will result in same nonce
             # and therefore the same masked val through the aes strategy. This is called convergent encryption, with this
             # implementation loosely based on https://www.vaultproject.io/docs/secrets/transit#convergent-encryption
 
+            formatter: Optional[FormatPreservation] = (
+                FormatPreservation(self.format_preservation)
+                if self.format_preservation is not None
+                else None
+            )
             masked_values: List[Optional[str]] = []
             for value in values:
                 if value is None:
@@ -62,12 +73,10 @@ class AesEncryptionMaskingStrategy(MaskingStrategy):
                 nonce: bytes | None = self._generate_nonce(
                     str(value),
                     key_hmac,  # type: ignore[arg-type]
-                    request_id,
-                    masking_meta,  # type: ignore
+                    salt_hmac,  # type: ignore[arg-type]
                 )
                 masked: str = encrypt(str(value), key, nonce)  # type: ignore
-                if self.format_preservation is not None:
-                    formatter = FormatPreservation(self.format_preservation)
+                if formatter is not None:
                     masked = formatter.format(masked)
                 masked_values.append(masked)
             return masked_values
@@ -112,18 +121,14 @@ class AesEncryptionMaskingStrategy(MaskingStrategy):
     def _generate_nonce(
         value: str,
         key: str,
-        privacy_request_id: Optional[str],
-        masking_meta: Dict[SecretType, MaskingSecretMeta],
+        salt: str,
     ) -> bytes:
-        salt = SecretsUtil.get_or_generate_secret(
-            privacy_request_id, SecretType.salt_hmac, masking_meta[SecretType.salt_hmac]
-        )
         # Trim to 12 bytes, which is recommended length from aes gcm lib:
         # https://cryptography.io/en/latest/hazmat/primitives/aead/#cryptography.hazmat.primitives.ciphers.aead.AESGCM.encrypt
         return hmac_encrypt_return_bytes(
             value,
             key,
-            salt,  # type: ignore[arg-type]
+            salt,
             HmacMaskingConfiguration.Algorithm.sha_256,  # type: ignore
         )[:12]
 
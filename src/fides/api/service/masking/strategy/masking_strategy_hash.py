@@ -24,6 +24,7 @@ class HashMaskingStrategy(MaskingStrategy):
 
     name = "hash"
     configuration_model = HashMaskingConfiguration
+    deterministic = True
 
     def __init__(
         self,
@@ -53,6 +54,11 @@ class HashMaskingStrategy(MaskingStrategy):
             masking_meta[SecretType.salt],
         )
 
+        formatter: Optional[FormatPreservation] = (
+            FormatPreservation(self.format_preservation)
+            if self.format_preservation is not None
+            else None
+        )
         masked_values: List[Optional[str]] = []
         for value in values:
             if value is None:
@@ -60,8 +66,7 @@ class HashMaskingStrategy(MaskingStrategy):
                 continue
 
             masked: str = self.algorithm_function(str(value), salt)  # type: ignore
-            if self.format_preservation is not None:
-                formatter = FormatPreservation(self.format_preservation)
+            if formatter is not None:
                 masked = formatter.format(masked)
             masked_values.append(masked)
         return masked_values
@@ -25,6 +25,7 @@ class HmacMaskingStrategy(MaskingStrategy):
 
     name = "hmac"
     configuration_model = HmacMaskingConfiguration
+    deterministic = True
 
     def __init__(
         self,
@@ -53,14 +54,18 @@ class HmacMaskingStrategy(MaskingStrategy):
             request_id, SecretType.salt, masking_meta[SecretType.salt]
         )
 
+        formatter: Optional[FormatPreservation] = (
+            FormatPreservation(self.format_preservation)
+            if self.format_preservation is not None
+            else None
+        )
         masked_values: List[Optional[str]] = []
         for value in values:
             if value is None:
                 masked_values.append(None)
                 continue
             masked: str = hmac_encrypt_return_str(str(value), key, salt, self.algorithm)  # type: ignore
-            if self.format_preservation is not None:
-                formatter = FormatPreservation(self.format_preservation)
+            if formatter is not None:
                 masked = formatter.format(masked)
             masked_values.append(masked)
         return masked_values
@@ -12,6 +12,7 @@ class NullMaskingStrategy(MaskingStrategy):
 
     name = "null_rewrite"
     configuration_model = NullMaskingConfiguration
+    deterministic = True
 
     def __init__(
         self,
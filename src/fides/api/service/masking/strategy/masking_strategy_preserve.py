@@ -12,6 +12,7 @@ class PreserveMaskingStrategy(MaskingStrategy):
 
     name = "preserve"
     configuration_model = PreserveMaskingConfiguration
+    deterministic = True
 
     def __init__(
         self,
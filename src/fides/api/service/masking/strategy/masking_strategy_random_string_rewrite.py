@@ -33,6 +33,11 @@ class RandomStringRewriteMaskingStrategy(MaskingStrategy):
         if values is None:
             return None
 
+        formatter: Optional[FormatPreservation] = (
+            FormatPreservation(self.format_preservation)
+            if self.format_preservation is not None
+            else None
+        )
         masked_values: List[str] = []
         for _ in range(len(values)):
             masked: str = "".join(
@@ -41,8 +46,7 @@ class RandomStringRewriteMaskingStrategy(MaskingStrategy):
                     for _ in range(self.length)
                 ]
             )
-            if self.format_preservation is not None:
-                formatter = FormatPreservation(self.format_preservation)
+            if formatter is not None:
                 masked = formatter.format(masked)
             masked_values.append(masked)
         return masked_values
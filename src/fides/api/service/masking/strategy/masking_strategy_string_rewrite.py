@@ -16,6 +16,7 @@ class StringRewriteMaskingStrategy(MaskingStrategy):
 
     name = "string_rewrite"
     configuration_model = StringRewriteMaskingConfiguration
+    deterministic = True
 
     def __init__(
         self,
@@ -31,14 +32,10 @@ class StringRewriteMaskingStrategy(MaskingStrategy):
         None"""
         if values is None:
             return None
-        masked_values: List[str] = []
-        for _ in range(len(values)):
-            if self.format_preservation is not None:
-                formatter = FormatPreservation(self.format_preservation)
-                masked_values.append(formatter.format(self.rewrite_value))
-            else:
-                masked_values.append(self.rewrite_value)
-        return masked_values
+        masked: str = self.rewrite_value
+        if self.format_preservation is not None:
+            masked = FormatPreservation(self.format_preservation).format(masked)
+        return [masked] * len(values)
 
     def secrets_required(self) -> bool:
         return False
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Callable, Dict, List, Optional, Union
+import re
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import requests
 import sendgrid
@@ -46,7 +51,10 @@ from fides.api.service.messaging.messaging_crud_service import (
     get_basic_messaging_template_by_type_or_default,
     get_enabled_messaging_template_by_type_and_property,
 )
-from fides.api.tasks import DatabaseTask, celery_app
+from fides.api.service.messaging.messaging_throughput import (
+    record_messaging_throughput,
+)
+from fides.api.tasks import MESSAGING_QUEUE_NAME, DatabaseTask, celery_app
 from fides.config import CONFIG
 from fides.config.config_proxy import ConfigProxy
 from fides.service.messaging.aws_ses_service import AWS_SES_Service
@@ -96,6 +104,59 @@ def dispatch_message_task(
         )
 
 
+@celery_app.task(base=DatabaseTask, bind=True)
+def dispatch_message_batch_task(
+    self: DatabaseTask,
+    messages: List[Dict[str, Any]],
+    service_type: Optional[str],
+    property_id: Optional[str],
+) -> None:
+    """
+    Dispatches a batch of messages of the same action type, each a dict of the
+    `message_meta` and `to_identity` that `dispatch_message_task` takes.
+
+    The messages that fail to send are queued again one by one, so that they are
+    retried by `dispatch_message_task` the same way as single messages.
+    """
+    schemas = [
+        FidesopsMessage.model_validate(message["message_meta"]) for message in messages
+    ]
+    if not schemas:
+        return
+    with self.get_new_session() as db:
+        result = dispatch_message_batch(
+            db=db,
+            action_type=schemas[0].action_type,
+            messages=[
+                BatchMessage(
+                    to_identity=Identity.model_validate(message["to_identity"]),
+                    body_params=schema.body_params,
+                )
+                for message, schema in zip(messages, schemas)
+            ],
+            service_type=service_type,
+            property_id=property_id,
+        )
+    logger.info(
+        "Dispatched batch of {} {} messages: {} sent, {} skipped, {} failed",
+        len(messages),
+        schemas[0].action_type,
+        result.sent,
+        result.skipped,
+        len(result.failed),
+    )
+    for index in result.failed:
+        dispatch_message_task.apply_async(
+            queue=MESSAGING_QUEUE_NAME,
+            kwargs={
+                "message_meta": messages[index]["message_meta"],
+                "service_type": service_type,
+                "to_identity": messages[index]["to_identity"],
+                "property_id": property_id,
+            },
+        )
+
+
 def _property_specific_messaging_eligible(db: Session) -> bool:
     """
     Helper method to determine whether property specific messaging is eligible at all. To be eligible:
@@ -181,39 +242,51 @@ def message_send_enabled(
     return False
 
 
-def dispatch_message(
+MessageBodyParams = Union[
+    AccessRequestCompleteBodyParams,
+    ConsentEmailFulfillmentBodyParams,
+    SubjectIdentityVerificationBodyParams,
+    RequestReceiptBodyParams,
+    RequestReviewDenyBodyParams,
+    ErasureRequestBodyParams,
+    UserInviteBodyParams,
+    PasswordResetBodyParams,
+    ErrorNotificationBodyParams,
+    ExternalUserWelcomeBodyParams,
+    ManualTaskDigestBodyParams,
+]
+
+
+@dataclass
+class MessageDispatchContext:
+    """
+    Everything needed to build and send messages of one action type, which is the
+    same for every recipient.
+    """
+
+    messaging_config: MessagingConfig
+    messaging_method: MessagingMethod
+    messaging_template: Optional[MessagingTemplate]
+    config_proxy: ConfigProxy
+
+
+def _get_message_dispatch_context(
     db: Session,
     action_type: MessagingActionType,
-    *,
-    to_identity: Optional[Identity],
-    service_type: Optional[str],
-    message_body_params: Optional[
-        Union[
-            AccessRequestCompleteBodyParams,
-            ConsentEmailFulfillmentBodyParams,
-            SubjectIdentityVerificationBodyParams,
-            RequestReceiptBodyParams,
-            RequestReviewDenyBodyParams,
-            ErasureRequestBodyParams,
-            UserInviteBodyParams,
-            PasswordResetBodyParams,
-            ErrorNotificationBodyParams,
-            ExternalUserWelcomeBodyParams,
-            ManualTaskDigestBodyParams,
-        ]
-    ] = None,
-    subject_override: Optional[str] = None,
-    property_id: Optional[str] = None,
-) -> None:
+    service_type: str,
+    property_id: Optional[str],
+) -> Optional[MessageDispatchContext]:
     """
-    Sends a message to `to_identity` with content supplied in `message_body_params`
+    Looks up the messaging config and template for the action type. Returns None if
+    no message should be sent, because property-specific messaging is enabled and
+    there is no enabled template for the action type.
     """
-    if not to_identity:
-        logger.error("Message failed to send. No identity supplied.")
-        raise MessageDispatchException("No identity supplied.")
-    if not service_type:
-        logger.error("Message failed to send. No notification service type configured.")
-        raise MessageDispatchException("No notification service type configured.")
+    messaging_method = get_messaging_method(service_type)
+    if not messaging_method:
+        logger.error("Notification service type is not valid: {}", service_type)
+        raise MessageDispatchException(
+            f"Notification service type is not valid: {service_type}"
+        )
 
     logger.info("Retrieving message config")
     messaging_config: MessagingConfig = MessagingConfig.get_configuration(
@@ -222,14 +295,13 @@ def dispatch_message(
     logger.info(
         "Building appropriate message template for action type: {}", action_type
     )
-    messaging_method = get_messaging_method(service_type)
-    message: Optional[Union[EmailForActionType, str]] = None
+    config_proxy = ConfigProxy(db=db)
     messaging_template: Optional[MessagingTemplate] = None
 
     # If property-specific messaging is enabled and message type is one of the configurable templates,
     # we switch over to this mode, regardless of other ENV vars
     if (
-        ConfigProxy(db).notifications.enable_property_specific_messaging
+        config_proxy.notifications.enable_property_specific_messaging
         and action_type in CONFIGURABLE_MESSAGING_ACTION_TYPES
     ):
         property_specific_messaging_template = get_property_specific_messaging_template(
@@ -240,7 +312,7 @@ def dispatch_message(
                 "Skipping sending property-specific email as no enabled template was found for action type: {}",
                 action_type,
             )
-            return
+            return None
         messaging_template = property_specific_messaging_template
     else:
         logger.info(
@@ -250,28 +322,91 @@ def dispatch_message(
             db=db, template_type=action_type.value
         )
 
-    config_proxy = ConfigProxy(db=db)
+    return MessageDispatchContext(
+        messaging_config=messaging_config,
+        messaging_method=messaging_method,
+        messaging_template=messaging_template,
+        config_proxy=config_proxy,
+    )
 
-    if messaging_method == MessagingMethod.EMAIL:
+
+def _build_message(
+    context: MessageDispatchContext,
+    action_type: MessagingActionType,
+    body_params: Optional[MessageBodyParams],
+    subject_override: Optional[str] = None,
+) -> Union[EmailForActionType, str]:
+    message: Union[EmailForActionType, str]
+    if context.messaging_method == MessagingMethod.EMAIL:
         message = _build_email(
-            config_proxy=config_proxy,
+            config_proxy=context.config_proxy,
             action_type=action_type,
-            body_params=message_body_params,
-            messaging_template=messaging_template,
+            body_params=body_params,
+            messaging_template=context.messaging_template,
         )
-    elif messaging_method == MessagingMethod.SMS:
+    elif context.messaging_method == MessagingMethod.SMS:
         message = _build_sms(
             action_type=action_type,
-            body_params=message_body_params,
+            body_params=body_params,
         )
     else:  # pragma: no cover
         # This is here as a fail safe, but it should be impossible to reach because
         # is controlled by a database enum field.
-        logger.error("Notification service type is not valid: {}", service_type)
+        logger.error(
+            "Notification service type is not valid: {}",
+            context.messaging_config.service_type,
+        )
         raise MessageDispatchException(
-            f"Notification service type is not valid: {service_type}"
+            f"Notification service type is not valid: {context.messaging_config.service_type}"
         )
-    messaging_service: MessagingServiceType = messaging_config.service_type  # type: ignore
+
+    if subject_override and isinstance(message, EmailForActionType):
+        message.subject = subject_override
+    return message
+
+
+def _get_recipient(
+    messaging_method: MessagingMethod, to_identity: Identity
+) -> Optional[str]:
+    return (
+        to_identity.email
+        if messaging_method == MessagingMethod.EMAIL
+        else to_identity.phone_number
+    )
+
+
+def _missing_recipient_message(messaging_method: MessagingMethod) -> str:
+    return f"No {'email' if messaging_method == MessagingMethod.EMAIL else 'phone'} identity supplied."
+
+
+def dispatch_message(
+    db: Session,
+    action_type: MessagingActionType,
+    *,
+    to_identity: Optional[Identity],
+    service_type: Optional[str],
+    message_body_params: Optional[MessageBodyParams] = None,
+    subject_override: Optional[str] = None,
+    property_id: Optional[str] = None,
+) -> None:
+    """
+    Sends a message to `to_identity` with content supplied in `message_body_params`
+    """
+    if not to_identity:
+        logger.error("Message failed to send. No identity supplied.")
+        raise MessageDispatchException("No identity supplied.")
+    if not service_type:
+        logger.error("Message failed to send. No notification service type configured.")
+        raise MessageDispatchException("No notification service type configured.")
+
+    context = _get_message_dispatch_context(db, action_type, service_type, property_id)
+    if not context:
+        return
+
+    message = _build_message(
+        context, action_type, message_body_params, subject_override
+    )
+    messaging_service: MessagingServiceType = context.messaging_config.service_type  # type: ignore
     logger.info(
         "Retrieving appropriate dispatcher for email service: {}", messaging_service
     )
@@ -291,27 +426,130 @@ def dispatch_message(
         action_type,
     )
 
-    if subject_override and isinstance(message, EmailForActionType):
-        message.subject = subject_override
-
-    to = (
-        to_identity.email
-        if messaging_method == MessagingMethod.EMAIL
-        else to_identity.phone_number
-    )
+    to = _get_recipient(context.messaging_method, to_identity)
 
     if not to:
-        error_message = f"No {'email' if messaging_method == MessagingMethod.EMAIL else 'phone'} identity supplied."
+        error_message = _missing_recipient_message(context.messaging_method)
         logger.error(f"Message failed to send. {error_message}")
         raise MessageDispatchException(error_message)
 
-    dispatcher(
-        messaging_config,
-        message,
-        to,
+    start = time.perf_counter()
+    try:
+        dispatcher(
+            context.messaging_config,
+            message,
+            to,
+        )
+    except Exception:
+        record_messaging_throughput(
+            messaging_service, failed=1, seconds=time.perf_counter() - start
+        )
+        raise
+    record_messaging_throughput(
+        messaging_service, sent=1, seconds=time.perf_counter() - start
     )
 
 
+@dataclass
+class BatchMessage:
+    """A single recipient of a batch of messages, with its own body params."""
+
+    to_identity: Identity
+    body_params: Optional[MessageBodyParams] = None
+
+
+@dataclass
+class MessageBatchResult:
+    """
+    The outcome of dispatching a batch of messages. Failures are keyed by the index
+    of the message in the batch.
+    """
+
+    sent: int = 0
+    skipped: int = 0
+    failed: Dict[int, str] = field(default_factory=dict)
+
+
+def dispatch_message_batch(
+    db: Session,
+    action_type: MessagingActionType,
+    *,
+    messages: List[BatchMessage],
+    service_type: Optional[str],
+    subject_override: Optional[str] = None,
+    property_id: Optional[str] = None,
+) -> MessageBatchResult:
+    """
+    Sends a message of the same action type to every recipient in `messages`.
+
+    The messaging config, template and provider client are looked up once for the
+    whole batch, and messages with identical content are sent with the provider's
+    batch sending API where there is one. A message that can't be built or sent is
+    reported in the result rather than failing the rest of the batch.
+    """
+    result = MessageBatchResult()
+    if not messages:
+        return result
+    if not service_type:
+        logger.error(
+            "Messages failed to send. No notification service type configured."
+        )
+        raise MessageDispatchException("No notification service type configured.")
+
+    context = _get_message_dispatch_context(db, action_type, service_type, property_id)
+    if not context:
+        result.skipped = len(messages)
+        return result
+
+    messaging_service: MessagingServiceType = context.messaging_config.service_type  # type: ignore
+    batch_dispatcher: Optional[Callable] = _get_batch_dispatcher_from_config_type(
+        message_service_type=messaging_service
+    )
+    if not batch_dispatcher:
+        raise MessageDispatchException(
+            f"Dispatcher has not been implemented for message service type: {messaging_service}"
+        )
+
+    # Indexes into `messages` of each message built for dispatch
+    indexes: List[int] = []
+    built: List[Tuple[Union[EmailForActionType, str], str]] = []
+    for index, batch_message in enumerate(messages):
+        to = _get_recipient(context.messaging_method, batch_message.to_identity)
+        if not to:
+            result.failed[index] = _missing_recipient_message(context.messaging_method)
+            continue
+        try:
+            message = _build_message(
+                context, action_type, batch_message.body_params, subject_override
+            )
+        except Exception as exc:
+            result.failed[index] = str(exc)
+            continue
+        indexes.append(index)
+        built.append((message, to))
+
+    logger.info(
+        "Starting batch dispatch of {} messages for messaging service with action type: {}",
+        len(built),
+        action_type,
+    )
+    start = time.perf_counter()
+    failed: Dict[int, str] = (
+        batch_dispatcher(context.messaging_config, built) if built else {}
+    )
+    for built_index, error in failed.items():
+        result.failed[indexes[built_index]] = error
+    result.sent = len(built) - len(failed)
+    record_messaging_throughput(
+        messaging_service,
+        sent=result.sent,
+        failed=len(result.failed),
+        seconds=time.perf_counter() - start,
+        batches=1,
+    )
+    return result
+
+
 def _build_sms(  # pylint: disable=too-many-return-statements
     action_type: MessagingActionType,
     body_params: Any,
@@ -366,15 +604,41 @@ def _build_sms(  # pylint: disable=too-many-return-statements
     )
 
 
-def _render(template_str: str, variables: Optional[Dict] = None) -> str:
-    """Helper function to render a template string with the provided variables."""
-    if variables is None:
-        variables = {}
+@lru_cache(maxsize=512)
+def _compile_template(template_str: str, keys: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Splits a template string into its literal text and the placeholders of the
+    given (uppercased) variable keys, alternating: even indexes are literal text and
+    odd indexes are placeholder keys.
 
-    for key, value in variables.items():
-        template_str = template_str.replace(f"__{key.upper()}__", str(value))
+    Compiled templates are cached by their content, so an edited template is just
+    compiled again.
+    """
+    pattern = re.compile(
+        "|".join(re.escape(f"__{key}__") for key in sorted(keys, key=len, reverse=True))
+    )
+    parts: List[str] = []
+    position = 0
+    for match in pattern.finditer(template_str):
+        parts.append(template_str[position : match.start()])
+        parts.append(match.group()[2:-2])
+        position = match.end()
+    parts.append(template_str[position:])
+    return tuple(parts)
 
-    return template_str
+
+def _render(template_str: str, variables: Optional[Dict] = None) -> str:
+    """Helper function to render a template string with the provided variables."""
+    if not variables:
+        return template_str
+
+    values = {key.upper(): str(value) for key, value in variables.items()}
+    parts = _compile_template(template_str, tuple(sorted(values)))
+    if len(parts) == 1:
+        return template_str
+    return "".join(
+        values[part] if index % 2 else part for index, part in enumerate(parts)
+    )
 
 
 def _build_email(  # pylint: disable=too-many-return-statements, too-many-branches, too-many-statements
@@ -819,8 +1083,9 @@ def _twilio_sms_dispatcher(
     messaging_config: MessagingConfig,
     message: str,
     to: str,
+    client: Optional[Client] = None,
 ) -> None:
-    """Dispatches SMS using Twilio"""
+    """Dispatches SMS using Twilio, with the given client if there is one"""
     validate_config(messaging_config, "Twilio SMS", validate_details=False)
 
     account_sid = messaging_config.secrets[
@@ -836,7 +1101,7 @@ def _twilio_sms_dispatcher(
         MessagingServiceSecrets.TWILIO_SENDER_PHONE_NUMBER.value
     )
 
-    client = Client(account_sid, auth_token)
+    client = client or Client(account_sid, auth_token)
     try:
         if messaging_service_id:
             client.messages.create(
@@ -874,6 +1139,312 @@ def _aws_ses_dispatcher(
         )
 
 
+def _get_batch_dispatcher_from_config_type(
+    message_service_type: MessagingServiceType,
+) -> Optional[Callable]:
+    """Determines which batch dispatcher to use based on message service type"""
+    handler = {
+        MessagingServiceType.mailgun: _mailgun_batch_dispatcher,
+        MessagingServiceType.mailchimp_transactional: _mailchimp_transactional_batch_dispatcher,
+        MessagingServiceType.twilio_text: _twilio_sms_batch_dispatcher,
+        MessagingServiceType.twilio_email: _twilio_email_batch_dispatcher,
+        MessagingServiceType.aws_ses: _aws_ses_batch_dispatcher,
+    }
+    return handler.get(message_service_type)  # type: ignore
+
+
+BatchMessages = List[Tuple[Any, str]]
+
+# Recipients per request to the providers' batch sending APIs
+MAILGUN_BATCH_SIZE = 1000
+MAILCHIMP_TRANSACTIONAL_BATCH_SIZE = 1000
+TWILIO_EMAIL_BATCH_SIZE = 1000
+
+
+def _group_identical_emails(messages: BatchMessages) -> List[List[int]]:
+    """
+    Groups the indexes of the emails with the same content, so that each group can
+    be sent to all of its recipients at once.
+    """
+    groups: Dict[Tuple[str, str, str], List[int]] = defaultdict(list)
+    for index, (message, _) in enumerate(messages):
+        key = (
+            message.subject,
+            message.body,
+            json.dumps(message.template_variables or {}, sort_keys=True, default=str),
+        )
+        groups[key].append(index)
+    return list(groups.values())
+
+
+def _chunks(indexes: List[int], size: int) -> List[List[int]]:
+    return [indexes[i : i + size] for i in range(0, len(indexes), size)]
+
+
+def _mailgun_batch_dispatcher(
+    messaging_config: MessagingConfig, messages: BatchMessages
+) -> Dict[int, str]:
+    """
+    Dispatches emails using Mailgun batch sending, with one request per group of up
+    to 1000 recipients of the same email. Returns the errors of the emails that
+    failed to send, by index.
+    """
+    validate_config(messaging_config, "Mailgun")
+
+    base_url = (
+        "https://api.mailgun.net"
+        if messaging_config.details[MessagingServiceDetails.IS_EU_DOMAIN.value] is False
+        else "https://api.eu.mailgun.net"
+    )
+    domain = messaging_config.details[MessagingServiceDetails.DOMAIN.value]
+    api_url = f"{base_url}/{messaging_config.details[MessagingServiceDetails.API_VERSION.value]}/{domain}"
+
+    failed: Dict[int, str] = {}
+    with requests.Session() as session:
+        session.auth = (
+            "api",
+            messaging_config.secrets[MessagingServiceSecrets.MAILGUN_API_KEY.value],
+        )
+        try:
+            # Check if a fides template exists, once for the whole batch
+            template_test = session.get(
+                f"{api_url}/templates/{EMAIL_TEMPLATE_NAME}", timeout=10
+            )
+        except RequestException as exc:
+            logger.error("Emails failed to send: {}", str(exc))
+            error = f"Email failed to send due to: {str(exc)}"
+            return {index: error for index in range(len(messages))}
+
+        for group in _group_identical_emails(messages):
+            message: EmailForActionType = messages[group[0]][0]
+            for chunk in _chunks(group, MAILGUN_BATCH_SIZE):
+                recipients = [messages[index][1].strip() for index in chunk]
+                data: Dict[str, Any] = {
+                    "from": f"<mailgun@{domain}>",
+                    "to": recipients,
+                    "subject": message.subject,
+                    # Recipient variables make Mailgun send a separate email to each
+                    # recipient, instead of one email with every recipient on it
+                    "recipient-variables": json.dumps(
+                        {recipient: {} for recipient in recipients}
+                    ),
+                }
+                if template_test.status_code == 200:
+                    data["template"] = EMAIL_TEMPLATE_NAME
+                    data["h:X-Mailgun-Variables"] = json.dumps(
+                        {
+                            "fides_email_body": message.body,
+                            **(message.template_variables or {}),
+                        }
+                    )
+                else:
+                    data["html"] = message.body
+
+                chunk_error: Optional[str] = None
+                try:
+                    response = session.post(
+                        f"{api_url}/messages", data=data, timeout=30
+                    )
+                    if not response.ok:
+                        chunk_error = f"Email failed to send with status code {response.status_code}"
+                except RequestException as exc:
+                    chunk_error = f"Email failed to send due to: {str(exc)}"
+                if chunk_error:
+                    logger.error(
+                        "Batch of {} emails failed to send: {}", len(chunk), chunk_error
+                    )
+                    failed.update({index: chunk_error for index in chunk})
+    return failed
+
+
+def _mailchimp_transactional_batch_dispatcher(
+    messaging_config: MessagingConfig, messages: BatchMessages
+) -> Dict[int, str]:
+    """
+    Dispatches emails using Mailchimp Transactional, with one request per group of
+    recipients of the same email. Returns the errors of the emails that failed to
+    send or were rejected, by index.
+    """
+    validate_config(messaging_config, "Mailchimp Transactional")
+
+    from_email = messaging_config.details[MessagingServiceDetails.EMAIL_FROM.value]
+    api_key = messaging_config.secrets[
+        MessagingServiceSecrets.MAILCHIMP_TRANSACTIONAL_API_KEY.value
+    ]
+    failed: Dict[int, str] = {}
+    with requests.Session() as session:
+        for group in _group_identical_emails(messages):
+            message: EmailForActionType = messages[group[0]][0]
+            for chunk in _chunks(group, MAILCHIMP_TRANSACTIONAL_BATCH_SIZE):
+                indexes_by_email: Dict[str, List[int]] = defaultdict(list)
+                for index in chunk:
+                    indexes_by_email[messages[index][1].strip().lower()].append(index)
+                data = json.dumps(
+                    {
+                        "key": api_key,
+                        "message": {
+                            "from_email": from_email,
+                            "subject": message.subject,
+                            "html": message.body,
+                            "to": [
+                                {"email": messages[index][1].strip(), "type": "to"}
+                                for index in chunk
+                            ],
+                            # Each recipient gets their own email, without the others
+                            "preserve_recipients": False,
+                        },
+                    }
+                )
+                try:
+                    response = session.post(
+                        "https://mandrillapp.com/api/1.0/messages/send",
+                        headers={"Content-Type": "application/json"},
+                        data=data,
+                        timeout=30,
+                    )
+                except RequestException as exc:
+                    error = f"Email failed to send due to: {str(exc)}"
+                    logger.error(
+                        "Batch of {} emails failed to send: {}", len(chunk), error
+                    )
+                    failed.update({index: error for index in chunk})
+                    continue
+                if not response.ok:
+                    error = (
+                        f"Email failed to send with status code {response.status_code}"
+                    )
+                    logger.error(
+                        "Batch of {} emails failed to send: {}", len(chunk), error
+                    )
+                    failed.update({index: error for index in chunk})
+                    continue
+
+                for send_data in response.json():
+                    if send_data.get("status", "rejected") != "rejected":
+                        continue
+                    reason = send_data.get("reject_reason", "Fides Error")
+                    for index in indexes_by_email.get(
+                        str(send_data.get("email", "")).lower(), []
+                    ):
+                        failed[index] = f"Email unable to send due to reason: {reason}."
+    return failed
+
+
+def _twilio_email_batch_dispatcher(
+    messaging_config: MessagingConfig, messages: BatchMessages
+) -> Dict[int, str]:
+    """
+    Dispatches emails using Twilio SendGrid, with one personalization per recipient
+    and one request per group of up to 1000 recipients of the same email. Returns
+    the errors of the emails that failed to send, by index.
+    """
+    validate_config(messaging_config, "Twilio email")
+
+    try:
+        sg = sendgrid.SendGridAPIClient(
+            api_key=messaging_config.secrets[
+                MessagingServiceSecrets.TWILIO_API_KEY.value
+            ]
+        )
+        response = sg.client.templates.get(
+            query_params={"generations": "dynamic", "page_size": 200}
+        )
+        template_id = _get_template_id_if_exists(
+            json.loads(response.body), EMAIL_TEMPLATE_NAME
+        )
+    except Exception as exc:
+        logger.error("Emails failed to send: {}", str(exc))
+        error = f"Email failed to send due to: {str(exc)}"
+        return {index: error for index in range(len(messages))}
+
+    from_email = Email(
+        messaging_config.details[MessagingServiceDetails.TWILIO_EMAIL_FROM.value]
+    )
+    failed: Dict[int, str] = {}
+    for group in _group_identical_emails(messages):
+        message: EmailForActionType = messages[group[0]][0]
+        for chunk in _chunks(group, TWILIO_EMAIL_BATCH_SIZE):
+            mail = Mail(from_email=from_email, subject=message.subject)
+            if template_id:
+                mail.template_id = TemplateId(template_id)
+            else:
+                mail.add_content(Content("text/html", message.body))
+            for index in chunk:
+                personalization = Personalization()
+                personalization.add_email(To(messages[index][1].strip()))
+                if template_id:
+                    personalization.dynamic_template_data = {
+                        "fides_email_body": message.body
+                    }
+                mail.add_personalization(personalization)
+
+            chunk_error: Optional[str] = None
+            try:
+                response = sg.client.mail.send.post(request_body=mail.get())
+                if response.status_code >= 400:
+                    chunk_error = f"Email failed to send: {response.status_code}, {str(response.body)}"
+            except Exception as exc:
+                chunk_error = f"Email failed to send due to: {str(exc)}"
+            if chunk_error:
+                logger.error(
+                    "Batch of {} emails failed to send: {}", len(chunk), chunk_error
+                )
+                failed.update({index: chunk_error for index in chunk})
+    return failed
+
+
+def _aws_ses_batch_dispatcher(
+    messaging_config: MessagingConfig, messages: BatchMessages
+) -> Dict[int, str]:
+    """
+    Dispatches emails using AWS SES, with one client and a single verification of
+    the sending identity for the whole batch. Returns the errors of the emails that
+    failed to send, by index.
+    """
+    validate_config(messaging_config, "AWS SES")
+
+    aws_ses_service = AWS_SES_Service(messaging_config)
+    try:
+        aws_ses_service.validate_email_and_domain_status()
+    except Exception as exc:
+        logger.error("Emails failed to send: {}", str(exc))
+        error = f"AWS SES email failed to send due to: {str(exc)}"
+        return {index: error for index in range(len(messages))}
+
+    failed: Dict[int, str] = {}
+    for index, (message, to) in enumerate(messages):
+        try:
+            aws_ses_service.send_email(
+                to, message.subject, message.body, validate=False
+            )
+        except Exception as exc:
+            logger.error("Email failed to send: {}", str(exc))
+            failed[index] = f"AWS SES email failed to send due to: {str(exc)}"
+    return failed
+
+
+def _twilio_sms_batch_dispatcher(
+    messaging_config: MessagingConfig, messages: BatchMessages
+) -> Dict[int, str]:
+    """
+    Dispatches SMS using Twilio, with one client for the whole batch. Returns the
+    errors of the messages that failed to send, by index.
+    """
+    validate_config(messaging_config, "Twilio SMS", validate_details=False)
+
+    client = Client(
+        messaging_config.secrets[MessagingServiceSecrets.TWILIO_ACCOUNT_SID.value],
+        messaging_config.secrets[MessagingServiceSecrets.TWILIO_AUTH_TOKEN.value],
+    )
+    failed: Dict[int, str] = {}
+    for index, (message, to) in enumerate(messages):
+        try:
+            _twilio_sms_dispatcher(messaging_config, message, to, client=client)
+        except Exception as exc:
+            failed[index] = str(exc)
+    return failed
+
+
 def _get_template_id_if_exists(
     templates_response: Dict[str, List], template_name: str
 ) -> Optional[str]:
@@ -0,0 +1,92 @@
+"""
+In-process throughput metrics for messages sent through each messaging provider.
+
+The counters are per worker process, and are logged periodically so they can be
+compared across providers and between single and batch sends.
+"""
+
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+LOG_INTERVAL_SECONDS = 60
+
+
+@dataclass
+class MessagingThroughput:
+    """Messages sent and failed through a single messaging provider."""
+
+    sent: int = 0
+    failed: int = 0
+    requests: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+    @property
+    def messages_per_second(self) -> float:
+        if not self.seconds:
+            return 0.0
+        return (self.sent + self.failed) / self.seconds
+
+
+_throughput: Dict[str, MessagingThroughput] = {}
+_throughput_lock = threading.Lock()
+_last_logged: Optional[float] = None
+
+
+def record_messaging_throughput(
+    service_type: Any,
+    *,
+    sent: int = 0,
+    failed: int = 0,
+    seconds: float = 0.0,
+    batches: int = 0,
+) -> None:
+    """Adds a single or batch send through the given provider to its metrics."""
+    global _last_logged  # pylint: disable=global-statement
+
+    with _throughput_lock:
+        throughput = _throughput.setdefault(
+            getattr(service_type, "value", service_type), MessagingThroughput()
+        )
+        throughput.sent += sent
+        throughput.failed += failed
+        throughput.requests += 1
+        throughput.batches += batches
+        throughput.seconds += seconds
+
+        now = time.monotonic()
+        if _last_logged is not None and now - _last_logged < LOG_INTERVAL_SECONDS:
+            return
+        _last_logged = now
+        snapshot = {key: asdict(value) for key, value in _throughput.items()}
+        rates = {
+            key: round(value.messages_per_second, 2)
+            for key, value in _throughput.items()
+        }
+
+    logger.info(
+        "Messaging throughput by provider: {} (messages per second: {})",
+        snapshot,
+        rates,
+    )
+
+
+def get_messaging_throughput() -> Dict[str, MessagingThroughput]:
+    """Returns a copy of the throughput metrics of each messaging provider."""
+    with _throughput_lock:
+        return {
+            key: MessagingThroughput(**asdict(value))
+            for key, value in _throughput.items()
+        }
+
+
+def reset_messaging_throughput() -> None:
+    global _last_logged  # pylint: disable=global-statement
+
+    with _throughput_lock:
+        _throughput.clear()
+        _last_logged = None
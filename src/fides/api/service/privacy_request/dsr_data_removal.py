@@ -0,0 +1,274 @@
+"""
+Batched removal of saved DSR data that is past its retention period.
+
+Expired request tasks are deleted, and the saved results of completed privacy
+requests are cleared, in batches keyed by primary key. Each batch is committed
+on its own and followed by a configurable sleep, so the job never holds locks
+on large parts of either table. Any files the rows reference in external
+storage (see EncryptedLargeDataDescriptor) are deleted alongside them.
+
+Progress is checkpointed to Redis after every batch. If the job is interrupted,
+the next run resumes from the checkpoint with the original cutoffs.
+"""
+
+import json
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Any, List, Optional
+
+from loguru import logger
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+
+from fides.api.models.privacy_request import PrivacyRequest, RequestTask
+from fides.api.models.privacy_request.request_task import RequestTaskSubRequest
+from fides.api.schemas.external_storage import ExternalStorageMetadata
+from fides.api.schemas.privacy_request import PrivacyRequestStatus
+from fides.api.service.external_data_storage import ExternalDataStorageService
+from fides.api.util.cache import FidesopsRedis
+from fides.config import CONFIG
+
+DSR_DATA_REMOVAL_PROGRESS = "dsr_data_removal_progress"
+DSR_DATA_REMOVAL_PROGRESS_TTL = 7 * 24 * 60 * 60
+
+# Encrypted external storage metadata is a few hundred characters long, so
+# larger values must be inline data and don't need to be decrypted to check.
+EXTERNAL_METADATA_MAX_ENCRYPTED_LENGTH = 4096
+
+
+@dataclass
+class DSRDataRemovalProgress:
+    """Checkpoint and metrics for a single run of the DSR data removal job."""
+
+    started_at: datetime
+    request_task_cutoff: datetime
+    privacy_request_cutoff: datetime
+    last_request_task_id: Optional[str] = None
+    last_privacy_request_id: Optional[str] = None
+    request_tasks_done: bool = False
+    request_tasks_deleted: int = 0
+    privacy_requests_cleared: int = 0
+    external_files_deleted: int = 0
+    batches: int = 0
+    completed_at: Optional[datetime] = None
+
+    @classmethod
+    def start(cls) -> "DSRDataRemovalProgress":
+        now = datetime.now()
+        return cls(
+            started_at=now,
+            request_task_cutoff=now
+            - timedelta(seconds=CONFIG.execution.request_task_ttl),
+            # Using Redis Default TTL Seconds by default
+            privacy_request_cutoff=now
+            - timedelta(seconds=CONFIG.redis.default_ttl_seconds),
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), default=datetime.isoformat)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "DSRDataRemovalProgress":
+        data = json.loads(raw)
+        for field_name in (
+            "started_at",
+            "request_task_cutoff",
+            "privacy_request_cutoff",
+            "completed_at",
+        ):
+            if data.get(field_name):
+                data[field_name] = datetime.fromisoformat(data[field_name])
+        return cls(**data)
+
+    def log(self, message: str) -> None:
+        elapsed = max((datetime.now() - self.started_at).total_seconds(), 1e-6)
+        logger.info(
+            "{}: {} request tasks deleted, {} privacy requests cleared, "
+            "{} external files deleted in {} batches ({:.1f} rows/s)",
+            message,
+            self.request_tasks_deleted,
+            self.privacy_requests_cleared,
+            self.external_files_deleted,
+            self.batches,
+            (self.request_tasks_deleted + self.privacy_requests_cleared) / elapsed,
+        )
+
+
+def load_progress(redis: FidesopsRedis) -> DSRDataRemovalProgress:
+    """Resume an interrupted run from its checkpoint, or start a new one."""
+    try:
+        raw = redis.get(DSR_DATA_REMOVAL_PROGRESS)
+        if raw:
+            progress = DSRDataRemovalProgress.from_json(raw)
+            if progress.completed_at is None:
+                progress.log("Resuming interrupted DSR data removal")
+                return progress
+    except Exception as exc:
+        logger.warning(f"Failed to load DSR data removal checkpoint: {exc}")
+    return DSRDataRemovalProgress.start()
+
+
+def save_progress(redis: FidesopsRedis, progress: DSRDataRemovalProgress) -> None:
+    try:
+        redis.set_with_autoexpire(
+            DSR_DATA_REMOVAL_PROGRESS,
+            progress.to_json(),
+            DSR_DATA_REMOVAL_PROGRESS_TTL,
+        )
+    except Exception as exc:
+        logger.warning(f"Failed to save DSR data removal checkpoint: {exc}")
+
+
+def _find_external_storage_metadata(
+    db: Session, columns: List[Any], *filters: Any
+) -> List[ExternalStorageMetadata]:
+    """Return the external storage metadata held in the given encrypted columns."""
+    found: List[ExternalStorageMetadata] = []
+    for column in columns:
+        values = db.query(column).filter(
+            *filters,
+            column.isnot(None),
+            func.length(column) < EXTERNAL_METADATA_MAX_ENCRYPTED_LENGTH,
+        )
+        for (raw_data,) in values:
+            if isinstance(raw_data, dict) and "storage_type" in raw_data:
+                found.append(ExternalStorageMetadata.model_validate(raw_data))
+    return found
+
+
+def _delete_external_files(db: Session, metadata: List[ExternalStorageMetadata]) -> int:
+    return ExternalDataStorageService.delete_data_batch(
+        db, metadata, max_workers=CONFIG.execution.dsr_data_removal_storage_workers
+    )
+
+
+def delete_expired_request_tasks_batch(
+    db: Session, progress: DSRDataRemovalProgress, batch_size: int
+) -> int:
+    """
+    Delete the next batch of expired request tasks of completed privacy requests,
+    along with their external storage files. Returns the number of rows deleted.
+    """
+    query = (
+        db.query(RequestTask.id)
+        .join(PrivacyRequest, RequestTask.privacy_request_id == PrivacyRequest.id)
+        .filter(
+            RequestTask.created_at < progress.request_task_cutoff,
+            PrivacyRequest.status == PrivacyRequestStatus.complete,
+        )
+    )
+    if progress.last_request_task_id:
+        query = query.filter(RequestTask.id > progress.last_request_task_id)
+    request_task_ids = [
+        request_task_id
+        for (request_task_id,) in query.order_by(RequestTask.id).limit(batch_size)
+    ]
+    if not request_task_ids:
+        return 0
+
+    external_files = _find_external_storage_metadata(
+        db,
+        [RequestTask._access_data, RequestTask._data_for_erasures],
+        RequestTask.id.in_(request_task_ids),
+    ) + _find_external_storage_metadata(
+        db,
+        [RequestTaskSubRequest._access_data],
+        RequestTaskSubRequest.request_task_id.in_(request_task_ids),
+    )
+    progress.external_files_deleted += _delete_external_files(db, external_files)
+
+    # Sub-requests are removed by the database via ON DELETE CASCADE
+    db.query(RequestTask).filter(RequestTask.id.in_(request_task_ids)).delete(
+        synchronize_session=False
+    )
+    db.commit()
+
+    progress.last_request_task_id = request_task_ids[-1]
+    progress.request_tasks_deleted += len(request_task_ids)
+    return len(request_task_ids)
+
+
+def clear_expired_privacy_request_data_batch(
+    db: Session, progress: DSRDataRemovalProgress, batch_size: int
+) -> int:
+    """
+    Clear the saved results of the next batch of expired, completed privacy requests,
+    along with their external storage files. Returns the number of rows updated.
+    """
+    query = db.query(PrivacyRequest.id).filter(
+        PrivacyRequest.updated_at < progress.privacy_request_cutoff,
+        PrivacyRequest.status == PrivacyRequestStatus.complete,
+        or_(
+            PrivacyRequest._filtered_final_upload.isnot(None),
+            PrivacyRequest.access_result_urls.isnot(None),
+        ),
+    )
+    if progress.last_privacy_request_id:
+        query = query.filter(PrivacyRequest.id > progress.last_privacy_request_id)
+    privacy_request_ids = [
+        privacy_request_id
+        for (privacy_request_id,) in query.order_by(PrivacyRequest.id).limit(batch_size)
+    ]
+    if not privacy_request_ids:
+        return 0
+
+    external_files = _find_external_storage_metadata(
+        db,
+        [PrivacyRequest._filtered_final_upload],
+        PrivacyRequest.id.in_(privacy_request_ids),
+    )
+    progress.external_files_deleted += _delete_external_files(db, external_files)
+
+    db.query(PrivacyRequest).filter(PrivacyRequest.id.in_(privacy_request_ids)).update(
+        {
+            PrivacyRequest._filtered_final_upload: None,
+            PrivacyRequest.access_result_urls: None,
+            # Keep updated_at as is, this is not a change to the request itself
+            PrivacyRequest.updated_at: PrivacyRequest.updated_at,
+        },
+        synchronize_session=False,
+    )
+    db.commit()
+
+    progress.last_privacy_request_id = privacy_request_ids[-1]
+    progress.privacy_requests_cleared += len(privacy_request_ids)
+    return len(privacy_request_ids)
+
+
+def run_dsr_data_removal(db: Session, redis: FidesopsRedis) -> DSRDataRemovalProgress:
+    """
+    Remove saved customer data that is no longer needed, one batch at a time.
+
+    Request tasks, which potentially contain encrypted PII, are deleted first.
+    Then the columns of privacy requests that potentially contain encrypted PII
+    or URLs that contain encrypted PII are cleared.
+    """
+    batch_size = CONFIG.execution.dsr_data_removal_batch_size
+    batch_delay = CONFIG.execution.dsr_data_removal_batch_delay
+    progress = load_progress(redis)
+
+    def run_batches(run_batch: Any) -> None:
+        while True:
+            processed = run_batch(db, progress, batch_size)
+            if not processed:
+                return
+            progress.batches += 1
+            save_progress(redis, progress)
+            progress.log("DSR data removal in progress")
+            if processed < batch_size:
+                return
+            if batch_delay:
+                time.sleep(batch_delay)
+
+    if not progress.request_tasks_done:
+        run_batches(delete_expired_request_tasks_batch)
+        progress.request_tasks_done = True
+        save_progress(redis, progress)
+
+    run_batches(clear_expired_privacy_request_data_batch)
+
+    progress.completed_at = datetime.now()
+    save_progress(redis, progress)
+    progress.log("DSR data removal complete")
+    return progress
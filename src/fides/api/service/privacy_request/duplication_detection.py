@@ -1,27 +1,20 @@
 from datetime import datetime, timedelta, timezone
-from typing import Optional
 from uuid import UUID
 
 from loguru import logger
-from sqlalchemy.orm import Session, defer
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Query, Session, defer
 
 from fides.api.models.privacy_request.duplicate_group import (
     DuplicateGroup,
+    generate_dedup_key,
+    generate_dedup_key_version,
     generate_rule_version,
 )
 from fides.api.models.privacy_request.privacy_request import PrivacyRequest
+from fides.api.models.privacy_request.provided_identity import ProvidedIdentity
 from fides.api.schemas.policy import ActionType
 from fides.api.schemas.privacy_request import PrivacyRequestStatus
-from fides.api.task.conditional_dependencies.schemas import (
-    Condition,
-    ConditionGroup,
-    ConditionLeaf,
-    GroupOperator,
-    Operator,
-)
-from fides.api.task.conditional_dependencies.sql_translator import (
-    SQLConditionTranslator,
-)
 from fides.config.config_proxy import ConfigProxy
 from fides.config.duplicate_detection_settings import DuplicateDetectionSettings
 
@@ -45,98 +38,6 @@ class DuplicateDetectionService:
     def is_enabled(self) -> bool:
         return self._config.enabled
 
-    def _create_identity_conditions(
-        self, current_request: PrivacyRequest
-    ) -> list[Condition]:
-        """Creates conditions for matching identity fields.
-
-        For identity field matching using the EAV pattern in ProvidedIdentity, we need to match both field_name
-        and hashed_value. This function creates the required nested conditions for each identity field.
-        Also adds a condition for the policy_id to ensure that we are only matching requests for the same policy.
-        """
-        conditions: list[Condition] = []
-        current_identities: dict[str, str] = {
-            pi.field_name: pi.hashed_value
-            for pi in current_request.provided_identities  # type: ignore [attr-defined]
-            if pi.field_name in self._config.match_identity_fields
-        }
-        if len(current_identities) != len(self._config.match_identity_fields):
-            missing_fields = [
-                field
-                for field in self._config.match_identity_fields
-                if field not in current_identities.keys()
-            ]
-            logger.debug(
-                f"Some identity fields were not found in the current request: {missing_fields}"
-            )
-            return []
-
-        for field_name, hashed_value in current_identities.items():
-            identity_condition = ConditionGroup(
-                logical_operator=GroupOperator.and_,
-                conditions=[
-                    ConditionLeaf(
-                        field_address="privacyrequest.provided_identities.field_name",
-                        operator=Operator.eq,
-                        value=field_name,
-                    ),
-                    ConditionLeaf(
-                        field_address="privacyrequest.provided_identities.hashed_value",
-                        operator=Operator.eq,
-                        value=hashed_value,
-                    ),
-                ],
-            )
-            conditions.append(identity_condition)
-        policy_condition = ConditionLeaf(
-            field_address="privacyrequest.policy_id",
-            operator=Operator.eq,
-            value=current_request.policy_id,
-        )
-        conditions.append(policy_condition)
-        return conditions
-
-    def _create_time_window_condition(self, time_window_days: int) -> Condition:
-        """Creates a condition for matching requests within a time window."""
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=time_window_days)
-        condition = ConditionLeaf(
-            field_address="privacyrequest.created_at",
-            operator=Operator.gte,
-            value=cutoff_date.isoformat(),
-        )
-        return condition
-
-    def create_duplicate_detection_conditions(
-        self,
-        current_request: PrivacyRequest,
-    ) -> Optional[ConditionGroup]:
-        """
-        Create conditions for duplicate detection based on configuration.
-
-        Args:
-            current_request: The current privacy request to find duplicates for
-            config: Duplicate detection configuration settings
-
-        Returns:
-            A ConditionGroup with AND operator, or None if no conditions can be created
-        """
-        if len(self._config.match_identity_fields) == 0:
-            return None
-
-        identity_conditions = self._create_identity_conditions(current_request)
-        if not identity_conditions:
-            return None  # Only proceed if we have identity conditions
-
-        time_window_condition = self._create_time_window_condition(
-            self._config.time_window_days
-        )
-
-        # Combine all conditions with AND operator
-        all_conditions: list[Condition] = [*identity_conditions, time_window_condition]
-        return ConditionGroup(
-            logical_operator=GroupOperator.and_, conditions=all_conditions
-        )
-
     def find_duplicate_privacy_requests(
         self,
         current_request: PrivacyRequest,
@@ -144,56 +45,126 @@ class DuplicateDetectionService:
         """
         Find potential duplicate privacy requests based on duplicate detection configuration.
 
-        Uses the SQLConditionTranslator to build queries from conditions, which handles
-        the ProvidedIdentity relationship using SQLAlchemy's .any() method.
+        Requests are matched on their dedup key, policy and creation time, which the
+        ix_privacyrequest_dedup_key_policy_created index covers, so this doesn't need
+        to join the ProvidedIdentity table once per matched identity field.
+
+        Requests without a key built from the current matched identity fields, i.e.
+        not keyed yet or keyed before the fields changed, are matched on their
+        identities instead, and are given the current key.
 
         Args:
             current_request: The privacy request to check for duplicates
-            config: Duplicate detection configuration settings
 
         Returns:
             List of PrivacyRequest objects that match the duplicate criteria,
             does not include the current request
         """
-        condition = self.create_duplicate_detection_conditions(current_request)
+        if len(self._config.match_identity_fields) == 0:
+            return []
 
-        if condition is None:
+        try:
+            dedup_key = self.generate_dedup_key(current_request)
+        except ValueError as e:
+            logger.debug(
+                f"Not checking request {current_request.id} for duplicates: {e}"
+            )
             return []
 
-        translator = SQLConditionTranslator(self.db)
-        query = translator.generate_query_from_condition(condition)
+        dedup_key_version = generate_dedup_key_version(
+            self._config.match_identity_fields
+        )
+        keyed_duplicates = (
+            self._candidate_requests_query(current_request)
+            .filter(
+                PrivacyRequest.dedup_key == dedup_key,
+                PrivacyRequest.dedup_key_version == dedup_key_version,
+            )
+            .all()
+        )
+        unkeyed_duplicates = (
+            self._candidate_requests_query(current_request)
+            .filter(
+                or_(
+                    PrivacyRequest.dedup_key_version.is_(None),
+                    PrivacyRequest.dedup_key_version != dedup_key_version,
+                ),
+                PrivacyRequest.id.in_(self._identity_matches_query(current_request)),
+            )
+            .all()
+        )
+        for duplicate in unkeyed_duplicates:
+            duplicate.dedup_key = dedup_key  # type: ignore[assignment]
+            duplicate.dedup_key_version = dedup_key_version  # type: ignore[assignment]
+        return keyed_duplicates + unkeyed_duplicates
 
-        query = query.filter(PrivacyRequest.id != current_request.id).filter(
-            PrivacyRequest.deleted_at.is_(None)
+    def _candidate_requests_query(self, current_request: PrivacyRequest) -> Query:
+        """
+        Returns the query of the other requests of the same policy created within
+        the time window, which the ix_privacyrequest_policy_created index covers.
+        """
+        cutoff_date = datetime.now(timezone.utc) - timedelta(
+            days=self._config.time_window_days
+        )
+        query = self.db.query(PrivacyRequest).filter(
+            PrivacyRequest.policy_id == current_request.policy_id,
+            PrivacyRequest.created_at >= cutoff_date,
+            PrivacyRequest.id != current_request.id,
+            PrivacyRequest.deleted_at.is_(None),
         )
         # Apply defer options to prevent loading large columns when checking for duplicates
         # pylint: disable=protected-access
-        query = query.options(
+        return query.options(
             defer(PrivacyRequest._filtered_final_upload),
             defer(PrivacyRequest.access_result_urls),
         )
-        return query.all()
+
+    def _identity_matches_query(self, current_request: PrivacyRequest) -> Query:
+        """
+        Returns the query of the ids of the requests with the same hashed values as
+        the current request for every matched identity field.
+        """
+        match_identity_fields = set(self._config.match_identity_fields)
+        identity_conditions = [
+            and_(
+                ProvidedIdentity.field_name == pi.field_name,
+                ProvidedIdentity.hashed_value == pi.hashed_value,
+            )
+            for pi in current_request.provided_identities  # type: ignore [attr-defined]
+            if pi.field_name in match_identity_fields
+        ]
+        return (
+            self.db.query(ProvidedIdentity.privacy_request_id)
+            .filter(or_(*identity_conditions))
+            .group_by(ProvidedIdentity.privacy_request_id)
+            .having(
+                func.count(func.distinct(ProvidedIdentity.field_name))
+                == len(match_identity_fields)
+            )
+        )
 
     def generate_dedup_key(self, request: PrivacyRequest) -> str:
         """
         Generate a dedup key for a request based on the duplicate detection settings.
         """
-        current_identities: dict[str, str] = {
-            pi.field_name: pi.hashed_value
-            for pi in request.provided_identities  # type: ignore [attr-defined]
-            if pi.field_name in self._config.match_identity_fields
-        }
-        if len(current_identities) != len(self._config.match_identity_fields):
-            raise ValueError(
-                "This request does not contain the required identity fields for duplicate detection."
-            )
-        return "|".join(
-            [
-                current_identities[field]
-                for field in sorted(self._config.match_identity_fields)
-            ]
+        return generate_dedup_key(
+            {
+                pi.field_name: pi.hashed_value
+                for pi in request.provided_identities  # type: ignore [attr-defined]
+            },
+            self._config.match_identity_fields,
         )
 
+    def update_dedup_key(self, request: PrivacyRequest) -> None:
+        """
+        Store the request's dedup key under the current duplicate detection settings.
+
+        Dedup keys are stored as identities are persisted, so requests persisted
+        before the matched identity fields changed keep their previous key and key
+        version until they're found by find_duplicate_privacy_requests.
+        """
+        request.update_dedup_key(self.db, self._config.match_identity_fields)
+
     def update_duplicate_group_ids(
         self,
         request: PrivacyRequest,
@@ -357,6 +328,11 @@ class DuplicateDetectionService:
             logger.warning(message)
             self.add_success_execution_log(request, message)
             return False
+        # Duplicates of this request are found by the key under the current settings
+        request.dedup_key = dedup_key  # type: ignore[assignment]
+        request.dedup_key_version = generate_dedup_key_version(  # type: ignore[assignment]
+            self._config.match_identity_fields
+        )
 
         _, duplicate_group = DuplicateGroup.get_or_create(
             db=self.db, data={"rule_version": rule_version, "dedup_key": dedup_key}
@@ -1,10 +1,18 @@
+import json
 import uuid
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
 from enum import Enum
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from loguru import logger
-from sqlalchemy.orm import Query, Session
+from sqlalchemy import literal, tuple_
+from sqlalchemy.orm import Session
 
 from fides.api.common_exceptions import MessageDispatchException
+from fides.api.models.connectionconfig import ConnectionConfig
 from fides.api.models.policy import Policy, Rule
 from fides.api.models.privacy_request import PrivacyRequest
 from fides.api.schemas.policy import ActionType, CurrentStep
@@ -19,6 +27,7 @@ from fides.api.service.privacy_request.request_runner_service import (
 )
 from fides.api.tasks import DatabaseTask, celery_app
 from fides.api.tasks.scheduled.scheduler import create_cron_trigger, scheduler
+from fides.api.util.cache import FidesopsRedis, get_cache
 from fides.api.util.lock import redis_lock
 from fides.config import get_config
 from fides.service.privacy_request.privacy_request_service import queue_privacy_request
@@ -27,6 +36,8 @@ CONFIG = get_config()
 BATCH_EMAIL_SEND = "batch_email_send"
 BATCH_EMAIL_SEND_LOCK = "batch_email_send_lock"
 BATCH_EMAIL_SEND_LOCK_TIMEOUT = 600
+BATCH_EMAIL_SEND_PROGRESS = "batch_email_send_progress"
+BATCH_EMAIL_SEND_PROGRESS_TTL = 7 * 24 * 60 * 60
 
 
 class EmailExitState(Enum):
@@ -41,107 +52,285 @@ class EmailExitState(Enum):
     email_send_already_running = "email_send_already_running"
 
 
+@dataclass
+class BatchEmailSendProgress:
+    """
+    Checkpoint and metrics for a run of the batch email send.
+
+    `sent` holds the IDs of the privacy requests each connector has already emailed,
+    for the requests that haven't been requeued yet. A failed run keeps this, so the
+    next run only sends the emails that are still missing.
+    """
+
+    batch_id: str
+    started_at: datetime
+    chunks: int = 0
+    privacy_requests_requeued: int = 0
+    sent: Dict[str, List[str]] = field(default_factory=dict)
+    completed_at: Optional[datetime] = None
+
+    @classmethod
+    def start(cls) -> "BatchEmailSendProgress":
+        return cls(batch_id=str(uuid.uuid4()), started_at=datetime.now())
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), default=datetime.isoformat)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "BatchEmailSendProgress":
+        data = json.loads(raw)
+        for field_name in ("started_at", "completed_at"):
+            if data.get(field_name):
+                data[field_name] = datetime.fromisoformat(data[field_name])
+        return cls(**data)
+
+    def mark_sent(self, connection_key: str, privacy_request_ids: List[str]) -> None:
+        sent = set(self.sent.get(connection_key, []))
+        sent.update(privacy_request_ids)
+        self.sent[connection_key] = sorted(sent)
+
+    def forget(self, privacy_request_ids: Set[str]) -> None:
+        """Drop the sent records of privacy requests that are done with."""
+        self.sent = {
+            connection_key: [pr_id for pr_id in ids if pr_id not in privacy_request_ids]
+            for connection_key, ids in self.sent.items()
+        }
+
+
+def load_progress(redis: FidesopsRedis) -> BatchEmailSendProgress:
+    """Resume a failed or interrupted run from its checkpoint, or start a new one."""
+    try:
+        raw = redis.get(BATCH_EMAIL_SEND_PROGRESS)
+        if raw:
+            progress = BatchEmailSendProgress.from_json(raw)
+            if progress.completed_at is None:
+                logger.info(
+                    "Resuming batch email send {} after {} chunks",
+                    progress.batch_id,
+                    progress.chunks,
+                )
+                return progress
+    except Exception as exc:
+        logger.warning(f"Failed to load batch email send checkpoint: {exc}")
+    return BatchEmailSendProgress.start()
+
+
+def save_progress(redis: FidesopsRedis, progress: BatchEmailSendProgress) -> None:
+    try:
+        redis.set_with_autoexpire(
+            BATCH_EMAIL_SEND_PROGRESS,
+            progress.to_json(),
+            BATCH_EMAIL_SEND_PROGRESS_TTL,
+        )
+    except Exception as exc:
+        logger.warning(f"Failed to save batch email send checkpoint: {exc}")
+
+
+def get_awaiting_email_send_chunks(session: Session) -> Iterator[List[PrivacyRequest]]:
+    """
+    Pages through the privacy requests awaiting email send, oldest first, in chunks
+    of `CONFIG.execution.email_send_batch_size`.
+
+    Pages are keyed on (created_at, id), so requests that leave the awaiting status
+    as their chunk is processed don't shift the following pages.
+    """
+    chunk_size = max(CONFIG.execution.email_send_batch_size, 1)
+    last: Optional[Tuple[datetime, str]] = None
+    while True:
+        # Use query_without_large_columns to prevent OOM errors when processing many privacy requests
+        query = (
+            PrivacyRequest.query_without_large_columns(session)
+            .filter(PrivacyRequest.status == PrivacyRequestStatus.awaiting_email_send)
+            .filter(PrivacyRequest.deleted_at.is_(None))
+        )
+        if last:
+            last_created_at, last_id = last
+            query = query.filter(
+                tuple_(PrivacyRequest.created_at, PrivacyRequest.id)
+                > tuple_(literal(last_created_at), literal(last_id))
+            )
+        chunk: List[PrivacyRequest] = (
+            query.order_by(PrivacyRequest.created_at.asc(), PrivacyRequest.id.asc())
+            .limit(chunk_size)
+            .all()
+        )
+        if not chunk:
+            return
+        yield chunk
+        if len(chunk) < chunk_size:
+            return
+        last_request = chunk[-1]
+        # created_at is set by the database on insert, so it is never None here
+        assert last_request.created_at is not None, (
+            f"Privacy request {last_request.id} has no created_at"
+        )
+        last = (last_request.created_at, last_request.id)
+
+
+def get_action_types_by_privacy_request(
+    session: Session, privacy_request_ids: List[str]
+) -> Dict[str, Set[ActionType]]:
+    """Returns the erasure and consent action types of each privacy request's policy."""
+    action_types: Dict[str, Set[ActionType]] = defaultdict(set)
+    for privacy_request_id, action_type in (
+        session.query(PrivacyRequest.id, Rule.action_type)
+        .join(Policy, PrivacyRequest.policy_id == Policy.id)
+        .join(Rule, Policy.id == Rule.policy_id)
+        .filter(
+            PrivacyRequest.id.in_(privacy_request_ids),
+            Rule.action_type.in_([ActionType.erasure, ActionType.consent]),
+        )
+        .distinct()
+    ):
+        action_types[privacy_request_id].add(ActionType(action_type))
+    return action_types
+
+
+def send_email_chunk(
+    chunk: List[PrivacyRequest],
+    connectors: List[Tuple[ConnectionConfig, ActionType]],
+    progress: BatchEmailSendProgress,
+    redis: FidesopsRedis,
+) -> bool:
+    """
+    Sends the batch emails of every connector for a chunk of privacy requests. The
+    identities of each request are decrypted once and shared by all connectors.
+
+    Returns whether every connector sent its emails.
+    """
+    session = Session.object_session(chunk[0])
+    action_types = get_action_types_by_privacy_request(
+        session, [privacy_request.id for privacy_request in chunk]
+    )
+    identities: Dict[str, Dict[str, Any]] = {
+        privacy_request.id: privacy_request.get_cached_identity_data()
+        for privacy_request in chunk
+    }
+
+    succeeded = True
+    for connection_config, action_type in connectors:
+        already_sent = set(progress.sent.get(connection_config.key, []))
+        privacy_requests = [
+            privacy_request
+            for privacy_request in chunk
+            if action_type in action_types.get(privacy_request.id, set())
+            and privacy_request.id not in already_sent
+        ]
+        if not privacy_requests:
+            continue
+        try:
+            get_connector(connection_config).batch_email_send(  # type: ignore
+                privacy_requests, progress.batch_id, identities=identities
+            )
+        except (
+            MessageDispatchException,
+            DynamicErasureEmailConnectorException,
+        ) as exc:
+            logger.error(
+                "Batch {} email send for connector '{}' failed with exception: '{}'",
+                action_type.value,
+                connection_config.key,
+                exc,
+            )
+            succeeded = False
+            continue
+        progress.mark_sent(
+            connection_config.key,
+            [privacy_request.id for privacy_request in privacy_requests],
+        )
+        save_progress(redis, progress)
+    return succeeded
+
+
 @celery_app.task(base=DatabaseTask, bind=True)
 def send_email_batch(self: DatabaseTask) -> EmailExitState:
-    """Sends emails for each relevant connector with applicable user details batched together."""
+    """
+    Sends emails for each relevant connector with applicable user details batched together.
+
+    The privacy requests awaiting email send are paged through once, in chunks. Each
+    chunk is sent by every connector and then requeued, and progress is checkpointed
+    after every connector, so that a failed run resumes where it left off.
+    """
     with redis_lock(
         lock_key=BATCH_EMAIL_SEND_LOCK, timeout=BATCH_EMAIL_SEND_LOCK_TIMEOUT
     ) as lock:
         if not lock:
             return EmailExitState.email_send_already_running
 
-        batch_id = str(uuid.uuid4())
-        logger.info("Starting batch email send {}...", batch_id)
+        redis = get_cache()
+        progress = load_progress(redis)
+        logger.info("Starting batch email send {}...", progress.batch_id)
         with self.get_new_session() as session:
-            # Use query_without_large_columns to prevent OOM errors when processing many privacy requests
-            privacy_requests: Query = (
-                PrivacyRequest.query_without_large_columns(session)
-                .filter(
-                    PrivacyRequest.status == PrivacyRequestStatus.awaiting_email_send
-                )
-                .filter(PrivacyRequest.deleted_at.is_(None))
-                .order_by(PrivacyRequest.created_at.asc())  # oldest first
-            )
-            if not privacy_requests.first():
+            chunks = get_awaiting_email_send_chunks(session)
+            first_chunk = next(chunks, None)
+            if not first_chunk:
                 logger.info(
                     "Skipping batch email send with status: {}",
                     EmailExitState.no_applicable_privacy_requests.value,
                 )
                 return EmailExitState.no_applicable_privacy_requests
 
-            consent_configs: Query = get_consent_email_connection_configs(session)
-            erasure_configs: Query = get_erasure_email_connection_configs(session)
-            combined_configs = consent_configs.union_all(erasure_configs)
-            if not combined_configs.first():
-                requeue_privacy_requests_after_email_send(privacy_requests, session)
+            connectors: List[Tuple[ConnectionConfig, ActionType]] = [
+                (connection_config, ActionType.erasure)
+                for connection_config in get_erasure_email_connection_configs(session)
+            ] + [
+                (connection_config, ActionType.consent)
+                for connection_config in get_consent_email_connection_configs(session)
+            ]
+            if not connectors:
+                for chunk in chain([first_chunk], chunks):
+                    requeue_privacy_requests_after_email_send(chunk, session)
                 logger.info(
                     "Skipping batch email send with status: {}",
                     EmailExitState.no_applicable_connectors.value,
                 )
                 return EmailExitState.no_applicable_connectors
 
-            has_failure = False
-
-            # erasure
-            for connection_config in erasure_configs:
-                try:
-                    get_connector(connection_config).batch_email_send(  # type: ignore
-                        filter_privacy_requests_by_action_type(
-                            privacy_requests, ActionType.erasure
-                        ),
-                        batch_id,
-                    )
-                except (
-                    MessageDispatchException,
-                    DynamicErasureEmailConnectorException,
-                ) as exc:
-                    logger.error(
-                        "Batch erasure email send for connector '{}' failed with exception: '{}'",
-                        connection_config.key,
-                        exc,
-                    )
-                    has_failure = True
-
-            # consent
-            for connection_config in consent_configs:
-                try:
-                    get_connector(connection_config).batch_email_send(  # type: ignore
-                        filter_privacy_requests_by_action_type(
-                            privacy_requests, ActionType.consent
-                        ),
-                        batch_id,
-                    )
-                except (
-                    MessageDispatchException,
-                    DynamicErasureEmailConnectorException,
-                ) as exc:
-                    logger.error(
-                        "Batch consent email send for connector '{}' failed with exception: '{}'",
-                        connection_config.key,
-                        exc,
-                    )
-                    has_failure = True
-
-            if has_failure:
+            # Requests of chunks that failed in this run, which stay awaiting email send
+            pending_ids: Set[str] = set()
+            for chunk in chain([first_chunk], chunks):
+                chunk_ids = {privacy_request.id for privacy_request in chunk}
+                if send_email_chunk(chunk, connectors, progress, redis):
+                    # Connectors error the requests they can't send an email for
+                    awaiting = [
+                        privacy_request
+                        for privacy_request in chunk
+                        if privacy_request.status
+                        == PrivacyRequestStatus.awaiting_email_send
+                    ]
+                    requeue_privacy_requests_after_email_send(awaiting, session)
+                    progress.privacy_requests_requeued += len(awaiting)
+                    progress.forget(chunk_ids)
+                else:
+                    pending_ids.update(chunk_ids)
+                progress.chunks += 1
+                save_progress(redis, progress)
+                lock.extend(BATCH_EMAIL_SEND_LOCK_TIMEOUT, replace_ttl=True)
+
+            logger.info(
+                "Batch email send {} processed {} chunks, {} privacy requests "
+                "requeued, {} awaiting a retry",
+                progress.batch_id,
+                progress.chunks,
+                progress.privacy_requests_requeued,
+                len(pending_ids),
+            )
+            if pending_ids:
+                # Only the requests that are still awaiting email send can resume
+                progress.sent = {
+                    connection_key: [pr_id for pr_id in ids if pr_id in pending_ids]
+                    for connection_key, ids in progress.sent.items()
+                }
+                save_progress(redis, progress)
                 return EmailExitState.email_send_failed
 
-            requeue_privacy_requests_after_email_send(privacy_requests, session)
+            progress.completed_at = datetime.now()
+            save_progress(redis, progress)
             return EmailExitState.complete
 
 
-def filter_privacy_requests_by_action_type(
-    privacy_requests: Query, action_type: ActionType
-) -> Query:
-    """Applies a filter for the specific Rule.action_type to the passed in privacy_requests."""
-    return (
-        privacy_requests.join(Policy, PrivacyRequest.policy_id == Policy.id)
-        .join(Rule, Policy.id == Rule.policy_id)
-        .filter(Rule.action_type == action_type)
-    )
-
-
 def requeue_privacy_requests_after_email_send(
-    privacy_requests: Query, db: Session
+    privacy_requests: Iterable[PrivacyRequest], db: Session
 ) -> None:
     """After batch consent email send, requeue privacy requests from the post webhooks step
     to wrap up processing and transition to a "complete" state.
@@ -2,15 +2,26 @@ from __future__ import annotations
 
 import json
 from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import Any, DefaultDict, Dict, Generator, List, Optional, Set, Union
+from datetime import datetime
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Generator,
+    List,
+    Optional,
+    Set,
+    Union,
+)
 
 import sqlalchemy
 from httpx import AsyncClient
 from loguru import logger
-from sqlalchemy import cast, null, text
+from sqlalchemy import cast, null
 from sqlalchemy.orm import Query, Session
-from sqlalchemy.sql.elements import TextClause
 
 from fides.api.common_exceptions import PrivacyRequestError
 from fides.api.graph.config import ROOT_COLLECTION_ADDRESS, TERMINATOR_ADDRESS
@@ -28,6 +39,7 @@ from fides.api.schemas.drp_privacy_request import DrpPrivacyRequestCreate
 from fides.api.schemas.policy import ActionType
 from fides.api.schemas.privacy_request import PrivacyRequestStatus
 from fides.api.schemas.redis_cache import Identity
+from fides.api.service.privacy_request.dsr_data_removal import run_dsr_data_removal
 from fides.api.tasks import DSR_QUEUE_NAME, DatabaseTask, celery_app
 from fides.api.tasks.scheduled.scheduler import scheduler
 from fides.api.util.cache import (
@@ -40,6 +52,7 @@ from fides.api.util.cache import (
     reset_privacy_request_retry_count,
 )
 from fides.api.util.lock import redis_lock
+from fides.api.util.task_heartbeat import TaskLiveness, TaskLivenessSnapshot
 from fides.config import CONFIG
 
 PRIVACY_REQUEST_STATUS_CHANGE_POLL = "privacy_request_status_change_poll"
@@ -237,57 +250,18 @@ def initiate_scheduled_dsr_data_removal() -> None:
 def remove_saved_dsr_data(self: DatabaseTask) -> None:
     """
     Remove saved customer data that is no longer needed to facilitate running the access or erasure request.
+
+    Runs in throttled batches and resumes where it left off if interrupted,
+    see `run_dsr_data_removal`.
     """
     with self.get_new_session() as db:
         logger.info("Running DSR Data Removal Task to cleanup obsolete user data")
 
-        # Remove old request tasks which potentially contain encrypted PII
-        remove_dsr_data: TextClause = text(
-            """
-            DELETE FROM requesttask
-            USING privacyrequest
-            WHERE requesttask.privacy_request_id = privacyrequest.id
-            AND requesttask.created_at < :ttl
-            AND privacyrequest.status = 'complete';
-            """
-        )
-
-        result = db.execute(
-            remove_dsr_data,
-            {
-                "ttl": (
-                    datetime.now()
-                    - timedelta(seconds=CONFIG.execution.request_task_ttl)
-                ),
-            },
-        )
-        affected_rows = result.rowcount
+        progress = run_dsr_data_removal(db, get_cache())
         logger.info(
-            f"Deleted {affected_rows} expired request tasks via DSR Data Removal Task."
+            f"Deleted {progress.request_tasks_deleted} expired request tasks via DSR Data Removal Task."
         )
 
-        # Remove columns from old privacyrequests that potentially contain encrypted PII
-        # or URL's that contain encrypted PII.
-        remove_data_from_privacy_request: TextClause = text(
-            """
-            UPDATE privacyrequest
-            SET filtered_final_upload = null, access_result_urls = null
-            WHERE privacyrequest.updated_at < :ttl
-            AND privacyrequest.status = 'complete';
-            """
-        )
-
-        db.execute(
-            remove_data_from_privacy_request,
-            {
-                "ttl": (  # Using Redis Default TTL Seconds by default
-                    datetime.now() - timedelta(seconds=CONFIG.redis.default_ttl_seconds)
-                ),
-            },
-        )
-
-        db.commit()
-
 
 def initiate_interrupted_task_requeue_poll() -> None:
     """Initiates scheduler to check for and requeue interrupted tasks"""
@@ -328,7 +302,7 @@ def initiate_polling_task_requeue() -> None:
         id=ASYNC_TASKS_STATUS_POLLING,
         coalesce=True,
         replace_existing=True,
-        seconds=CONFIG.execution.async_polling_interval_hours * 3600,
+        seconds=CONFIG.execution.async_polling_dispatch_interval_seconds,
     )
 
 
@@ -382,6 +356,32 @@ def _get_task_ids_from_dsr_queue(
     return queued_tasks_ids
 
 
+def _is_task_active(
+    task_id: str,
+    liveness: TaskLivenessSnapshot,
+    get_queued_task_ids: Callable[[], Optional[FrozenSet[str]]],
+) -> bool:
+    """
+    Returns True if the given Celery task is still queued or running.
+
+    Tasks with a live heartbeat, or registered as queued and still within the queue,
+    are resolved from the liveness registry alone. A stale heartbeat or queued entry is
+    confirmed with the workers before the task is treated as interrupted. Only tasks
+    the registry doesn't know about at all fall back to the DSR queue and the workers.
+    """
+    task_liveness = liveness.get_liveness(task_id)
+    if task_liveness in (TaskLiveness.running, TaskLiveness.queued):
+        return True
+
+    if task_liveness == TaskLiveness.unknown:
+        queued_task_ids = get_queued_task_ids()
+        # If the queue can't be read, assume the task is still in it
+        if queued_task_ids is None or task_id in queued_task_ids:
+            return True
+
+    return celery_tasks_in_flight([task_id])
+
+
 def _cancel_interrupted_tasks_and_error_privacy_request(
     db: Session, privacy_request: PrivacyRequest, error_message: Optional[str] = None
 ) -> None:
@@ -553,10 +553,13 @@ def requeue_interrupted_tasks(self: DatabaseTask) -> None:
     privacy request is requeued to ensure its completion.
 
     The function performs the following steps:
-    1. Retrieves all task IDs currently in the queue.
-    2. Fetches all in-progress privacy requests from the database.
+    1. Fetches all in-progress privacy requests from the database.
+    2. Reads the running and stale task heartbeats from the liveness registry.
     3. Checks each privacy request to determine if its tasks are still active.
     4. Requeues the privacy request if any of its tasks are found to be interrupted.
+
+    The DSR queue itself is only scanned, once per pass, if a task is missing
+    from the liveness registry (e.g. it was queued before the registry existed).
     """
     redis_conn: FidesopsRedis = get_cache()
 
@@ -584,23 +587,36 @@ def requeue_interrupted_tasks(self: DatabaseTask) -> None:
                 .order_by(PrivacyRequest.created_at)
             )
 
-            if not in_progress_requests.count():
+            in_progress_count = in_progress_requests.count()
+            if not in_progress_count:
                 logger.debug("No in-progress privacy requests to check")
                 return
 
-            logger.debug(
-                f"Found {in_progress_requests.count()} privacy requests to check"
-            )
+            logger.debug(f"Found {in_progress_count} privacy requests to check")
 
-            # Get task IDs from the queue in a memory-efficient way
             try:
-                queued_tasks_ids = _get_task_ids_from_dsr_queue(redis_conn)
-            except Exception as queue_exc:
+                liveness = TaskLivenessSnapshot(redis_conn)
+            except Exception as registry_exc:
                 logger.warning(
-                    f"Failed to get task IDs from queue, skipping queue state checks: {queue_exc}"
+                    f"Failed to read the task liveness registry, skipping queue state checks: {registry_exc}"
                 )
                 return
 
+            logger.debug(
+                f"Found {len(liveness.running)} running and {len(liveness.stale)} stale DSR task heartbeats"
+            )
+
+            @lru_cache(maxsize=None)
+            def get_queued_task_ids() -> Optional[FrozenSet[str]]:
+                """Scan the DSR queue, at most once per pass, for tasks the registry doesn't know about."""
+                try:
+                    return frozenset(_get_task_ids_from_dsr_queue(redis_conn))
+                except Exception as queue_exc:
+                    logger.warning(
+                        f"Failed to get task IDs from queue, skipping queue state checks: {queue_exc}"
+                    )
+                    return None
+
             # Check each privacy request
             for privacy_request in in_progress_requests:
                 should_requeue = False
@@ -630,9 +646,7 @@ def requeue_interrupted_tasks(self: DatabaseTask) -> None:
                     continue
 
                 # Check if the main privacy request task is active
-                if task_id not in queued_tasks_ids and not celery_tasks_in_flight(
-                    [task_id]
-                ):
+                if not _is_task_active(task_id, liveness, get_queued_task_ids):
                     request_tasks_count = (
                         db.query(RequestTask)
                         .filter(RequestTask.privacy_request_id == privacy_request.id)
@@ -753,9 +767,8 @@ def requeue_interrupted_tasks(self: DatabaseTask) -> None:
                             should_requeue = True
                             break
 
-                        if (
-                            subtask_id not in queued_tasks_ids
-                            and not celery_tasks_in_flight([subtask_id])
+                        if not _is_task_active(
+                            subtask_id, liveness, get_queued_task_ids
                         ):
                             logger.warning(
                                 f"Request task {request_task_id} is not in the queue or running, requeueing privacy request"
@@ -771,7 +784,8 @@ def requeue_interrupted_tasks(self: DatabaseTask) -> None:
 @celery_app.task(base=DatabaseTask, bind=True)
 def requeue_polling_tasks(self: DatabaseTask) -> None:
     """
-    Poll the status of async tasks that are awaiting processing.
+    Check the status of the async polling tasks whose sub-requests are due, and
+    queue the tasks whose results are ready.
     """
     with redis_lock(
         ASYNC_TASKS_STATUS_POLLING_LOCK,
@@ -783,25 +797,12 @@ def requeue_polling_tasks(self: DatabaseTask) -> None:
         with self.get_new_session() as db:
             logger.debug("Polling for async tasks status")
 
-            # Get all tasks that are polling and are from polling async tasks
-            # Defer large columns since we only need metadata to queue tasks
-            base_query = (
-                db.query(RequestTask)
-                .filter(RequestTask.status == ExecutionLogStatus.polling)
-                .filter(RequestTask.async_type == AsyncTaskType.polling)
+            # Avoiding cyclic imports
+            from fides.api.service.async_dsr.polling_dispatcher import (
+                AsyncPollingDispatcher,
             )
-            async_tasks = RequestTask.query_with_deferred_data(base_query).all()
-            logger.info(f"Found {len(async_tasks)} async polling tasks")
 
-            if async_tasks:
-                # Avoiding cyclic imports
-                from fides.api.task.execute_request_tasks import queue_request_task
-
-                for async_task in async_tasks:
-                    logger.info(
-                        f"Requeuing polling task {async_task.id} for processing"
-                    )
-                    queue_request_task(async_task, privacy_request_proceed=True)
+            AsyncPollingDispatcher(db, get_cache()).run()
 
 
 EMBEDDED_EXECUTION_LOG_LIMIT = 1000
@@ -0,0 +1,74 @@
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from loguru import logger
+from requests import Response
+
+from fides.api.common_exceptions import PostProcessingException
+from fides.api.models.privacy_request import PrivacyRequest
+from fides.api.service.processors.post_processor_strategy.post_processor_strategy import (
+    PostProcessorStrategy,
+)
+
+
+class PostProcessorPipeline:
+    """
+    The postprocessors of a SaaS request, compiled into their strategies.
+
+    Looking up a strategy and validating its configuration is done once, when the
+    strategy is first run, rather than for every response the request returns.
+    Strategies also parse their paths and values when they're built, so running
+    the pipeline only does the per-item work.
+    """
+
+    def __init__(self, postprocessors: Optional[Sequence[Any]]):
+        self.postprocessors = list(postprocessors or [])
+        self._strategies: List[Optional[PostProcessorStrategy]] = [None] * len(
+            self.postprocessors
+        )
+
+    def __len__(self) -> int:
+        return len(self.postprocessors)
+
+    def _get_strategy(self, index: int) -> PostProcessorStrategy:
+        strategy = self._strategies[index]
+        if strategy is None:
+            postprocessor = self.postprocessors[index]
+            strategy = PostProcessorStrategy.get_strategy(
+                postprocessor.strategy, postprocessor.configuration
+            )
+            self._strategies[index] = strategy
+        return strategy
+
+    def process(
+        self,
+        data: Union[List[Dict[str, Any]], Dict[str, Any]],
+        collection_name: Optional[str],
+        identity_data: Optional[Dict[str, Any]] = None,
+        privacy_request: Optional[PrivacyRequest] = None,
+        response: Optional[Response] = None,
+    ) -> Any:
+        """
+        Runs the data through each postprocessor, forwarding the output of one
+        postprocessor into the input of the next.
+        """
+        processed_data: Any = data
+        for index, postprocessor in enumerate(self.postprocessors):
+            strategy = self._get_strategy(index)
+            logger.info(
+                "Starting postprocessing of '{}' collection with '{}' strategy.",
+                collection_name,
+                postprocessor.strategy,
+            )
+            try:
+                processed_data = strategy.process(
+                    processed_data,
+                    identity_data,
+                    privacy_request,
+                    response,
+                )
+            except Exception as exc:
+                raise PostProcessingException(
+                    f"Exception occurred during the '{postprocessor.strategy}' postprocessor "
+                    f"on the '{collection_name}' collection: {exc}"
+                )
+        return processed_data
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 import pydash
 from loguru import logger
@@ -49,6 +49,8 @@ class FilterPostProcessorStrategy(PostProcessorStrategy):
         self.value = configuration.value
         self.exact = configuration.exact
         self.case_sensitive = configuration.case_sensitive
+        # The field path, split once rather than for every filtered item
+        self._field_components = self.field.split(".")
 
     def process(
         self,
@@ -99,28 +101,15 @@ class FilterPostProcessorStrategy(PostProcessorStrategy):
             )
 
         try:
+            matches = self._build_predicate(filter_value)
             if isinstance(data, list):
                 return [
                     item
                     for item in data
-                    if self._matches(
-                        self.exact,
-                        self.case_sensitive,
-                        filter_value
-                        if isinstance(filter_value, list)
-                        else [filter_value],  # type: ignore
-                        self._get_nested_values(item, self.field),
-                    )
+                    if matches(self._get_values(item, self._field_components))
                 ]
             return (
-                data
-                if self._matches(
-                    self.exact,
-                    self.case_sensitive,
-                    filter_value if isinstance(filter_value, list) else [filter_value],  # type: ignore
-                    self._get_nested_values(data, self.field),
-                )
-                else []
+                data if matches(self._get_values(data, self._field_components)) else []
             )
         except KeyError:
             logger.warning(
@@ -144,63 +133,103 @@ class FilterPostProcessorStrategy(PostProcessorStrategy):
         - exact: filter_value and target must be the same length (no extra characters)
         - case_sensitive: cases must match between filter_value and target
         """
+        return self._build_predicate(filter_value, exact, case_sensitive)(target)
 
-        # does not match if we don't have anything to compare to
-        if target is None:
-            return False
+    def _build_predicate(
+        self,
+        filter_value: Any,
+        exact: Optional[bool] = None,
+        case_sensitive: Optional[bool] = None,
+    ) -> Callable[[Any], bool]:
+        """
+        Returns the match of a target against the filter value, see `_matches`.
 
-        # validate inputs
-        if not isinstance(target, (str, list, int)):
-            raise FidesopsException(
-                f"Field value '{self.field}' for filter postprocessor must be a string, list of strings, integer or list of integers, found '{type(target).__name__}'"
-            )
+        The filter value is validated, casefolded and indexed once, rather than for
+        every item being filtered. Errors are raised for the same targets, in the
+        same order, as when matching each target on its own.
+        """
+        if exact is None:
+            exact = self.exact
+        if case_sensitive is None:
+            case_sensitive = self.case_sensitive
+        values = filter_value if isinstance(filter_value, list) else [filter_value]
+        values_valid = all(isinstance(value, str) for value in values) or all(
+            isinstance(value, int) for value in values
+        )
+        if values_valid:
+            str_values = [value for value in values if isinstance(value, str)]
+            if not case_sensitive:
+                str_values = [value.casefold() for value in str_values]
+            value_set = set(values)
+            str_value_set = set(str_values)
 
-        # validate list contents
-        if isinstance(target, list):
-            if not all(isinstance(item, str) for item in target) and not all(
-                isinstance(item, int) for item in target
-            ):
+        def matches(target: Any) -> bool:
+            # does not match if we don't have anything to compare to
+            if target is None:
+                return False
+
+            # validate inputs
+            if not isinstance(target, (str, list, int)):
                 raise FidesopsException(
-                    f"The field '{self.field}' list must contain either all strings or all integers."
+                    f"Field value '{self.field}' for filter postprocessor must be a string, list of strings, integer or list of integers, found '{type(target).__name__}'"
                 )
-        # validate filter contents
-        if not all(isinstance(value, str) for value in filter_value) and not all(
-            isinstance(value, int) for value in filter_value
-        ):
-            raise FidesopsException(
-                f"The filter_value '{filter_value}' list must contain either all strings or all integers."
-            )
 
-        if isinstance(target, int):
-            return any(value == target for value in filter_value)
+            # validate list contents
+            if isinstance(target, list):
+                if not all(isinstance(item, str) for item in target) and not all(
+                    isinstance(item, int) for item in target
+                ):
+                    raise FidesopsException(
+                        f"The field '{self.field}' list must contain either all strings or all integers."
+                    )
+            # validate filter contents
+            if not values_valid:
+                raise FidesopsException(
+                    f"The filter_value '{values}' list must contain either all strings or all integers."
+                )
+
+            if isinstance(target, int):
+                return target in value_set
+
+            if isinstance(target, list) and isinstance(target[0], int):
+                return any(value in target for value in values)
 
-        if isinstance(target, list) and isinstance(target[0], int):
-            return any(value in target for value in filter_value)
+            # prep inputs by converting them to lowercase
+            if not case_sensitive:
+                if isinstance(target, list) and isinstance(target[0], str):
+                    target = [
+                        item.casefold() for item in target if isinstance(item, str)
+                    ]
+                elif isinstance(target, str):
+                    target = target.casefold()
 
-        # prep inputs by converting them to lowercase
-        if not case_sensitive and isinstance(target, (list, str)):
-            filter_value = [
-                value.casefold() for value in filter_value if isinstance(value, str)
-            ]
+            # compare filter_values to a target list
             if isinstance(target, list) and isinstance(target[0], str):
-                target = [item.casefold() for item in target if isinstance(item, str)]
-            elif isinstance(target, str):
-                target = target.casefold()
-
-        # compare filter_values to a target list
-        if isinstance(target, list) and isinstance(target[0], str):
-            return any(
-                value == item if exact else value in item
-                for value in filter_value
-                if isinstance(value, str)
-                for item in target
-                if isinstance(item, str)
-            )
+                if exact:
+                    return any(
+                        item in str_value_set
+                        for item in target
+                        if isinstance(item, str)
+                    )
+                return any(
+                    value in item
+                    for value in str_values
+                    for item in target
+                    if isinstance(item, str)
+                )
 
-        # base case, compare filter_value to a single string
-        return any(
-            value == target if exact else value in target for value in filter_value
-        )
+            # base case, compare filter_value to a single string
+            if case_sensitive:
+                return (
+                    target in value_set
+                    if exact
+                    else any(value in target for value in values)
+                )
+            if exact:
+                return target in str_value_set
+            return any(value in target for value in str_values)
+
+        return matches
 
     def _get_nested_values(self, data: Dict[str, Any], path: str) -> Any:
         """
@@ -225,16 +254,18 @@ class FilterPostProcessorStrategy(PostProcessorStrategy):
         For a dictionary {"a": {"b": [{"c": 1}, {"c": 2}]}} and path "a.b.c", the function
         returns [1, 2].
         """
-        components = path.split(".")
-        value = data[components[0]]
-        if len(components) > 1:
+        return self._get_values(data, path.split("."))
+
+    def _get_values(
+        self, data: Dict[str, Any], components: Sequence[str], start: int = 0
+    ) -> Any:
+        """`_get_nested_values` with the path already split into its components"""
+        value = data[components[start]]
+        if len(components) - start > 1:
             if isinstance(value, dict):
-                return self._get_nested_values(value, ".".join(components[1:]))
+                return self._get_values(value, components, start + 1)
             if isinstance(value, list):
                 return pydash.flatten(
-                    [
-                        self._get_nested_values(item, ".".join(components[1:]))
-                        for item in value
-                    ]
+                    [self._get_values(item, components, start + 1) for item in value]
                 )
         return value
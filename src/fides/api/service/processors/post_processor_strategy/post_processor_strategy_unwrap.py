@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pydash
 from loguru import logger
@@ -39,6 +39,32 @@ class UnwrapPostProcessorStrategy(PostProcessorStrategy):
 
     def __init__(self, configuration: UnwrapPostProcessorConfiguration):
         self.data_path = configuration.data_path
+        self._path_keys = self._parse_path(self.data_path)
+
+    @staticmethod
+    def _parse_path(data_path: str) -> Optional[Tuple[str, ...]]:
+        """
+        Splits a plain dotted path into its keys, so items can be unwrapped with
+        dict lookups rather than parsing the path for every item. Returns None for
+        paths which need pydash's parsing, i.e. with list indices or escapes.
+        """
+        if not data_path or any(char in data_path for char in "[]\\"):
+            return None
+        keys = tuple(data_path.split("."))
+        if any(not key or key.lstrip("-").isdigit() for key in keys):
+            return None
+        return keys
+
+    def _unwrap(self, item: Any) -> Any:
+        """Equivalent to `pydash.get(item, self.data_path)`"""
+        if self._path_keys is None or not isinstance(item, dict):
+            return pydash.get(item, self.data_path)
+        value = item
+        for key in self._path_keys:
+            if not isinstance(value, dict) or key not in value:
+                return pydash.get(item, self.data_path)
+            value = value[key]
+        return value
 
     def process(
         self,
@@ -55,7 +81,7 @@ class UnwrapPostProcessorStrategy(PostProcessorStrategy):
 
         result = []
         if isinstance(data, dict):
-            unwrapped = pydash.get(data, self.data_path)
+            unwrapped = self._unwrap(data)
             if unwrapped is None:
                 logger.warning(
                     "{} could not be found for the following post processing strategy: {}",
@@ -66,7 +92,7 @@ class UnwrapPostProcessorStrategy(PostProcessorStrategy):
                 result = unwrapped
         elif isinstance(data, list):
             for item in data:
-                unwrapped = pydash.get(item, self.data_path)
+                unwrapped = self._unwrap(item)
                 if unwrapped is None:
                     logger.warning(
                         "{} could not be found for the following post processing strategy: {}",
@@ -1,4 +1,4 @@
-from typing import Any, Optional, Union
+from typing import Any, Callable, Optional, Union
 
 from loguru import logger
 from sqlalchemy.orm import Session
@@ -15,14 +15,120 @@ from fides.api.task.conditional_dependencies.schemas import (
     ConditionLeaf,
     EvaluationResult,
     GroupEvaluationResult,
+    GroupOperator,
     Operator,
 )
 
+# A condition compiled by compile_condition, returns the condition's result for data
+CompiledCondition = Callable[[Any], bool]
+
 
 class ConditionEvaluationError(Exception):
     """Error raised when a condition evaluation fails"""
 
 
+def _split_field_address(field_address: str) -> list[str]:
+    # Handle both colon-separated and dot-separated field addresses
+    if ":" in field_address:
+        # Full field address like "dataset:collection:field" - split on colons
+        return field_address.split(":")
+    # Relative field path like "field.subfield" - split on dots
+    return field_address.split(".")
+
+
+def _get_nested_value_from_dict(data: Any, keys: list[str]) -> Optional[Any]:
+    current: Any = data
+    for key in keys:
+        if not isinstance(current, dict):
+            return None
+        current = current.get(key)
+        if current is None:
+            return None
+    return current
+
+
+def _compile_leaf_condition(condition: ConditionLeaf) -> CompiledCondition:
+    keys = _split_field_address(condition.field_address)
+    field_path = FieldPath(*keys) if len(keys) > 1 else FieldPath(keys[0])
+    operator_method = OPERATOR_METHODS.get(condition.operator)
+    expected_value = condition.value
+
+    def evaluate(data: Any) -> bool:
+        # Same lookup as ConditionEvaluator._get_nested_value
+        if hasattr(data, "get_field_value"):
+            try:
+                data_value = data.get_field_value(field_path)
+            except (AttributeError, ValueError):
+                data_value = _get_nested_value_from_dict(data, keys)
+        else:
+            data_value = _get_nested_value_from_dict(data, keys)
+
+        if operator_method is None:
+            logger.error(f"Unknown operator: {condition.operator}")
+            raise ConditionEvaluationError(f"Unknown operator: {condition.operator}")
+        try:
+            return operator_method(data_value, expected_value)
+        except Exception as e:
+            logger.error(f"Unexpected error in operator {condition.operator}: {e}")
+            raise ConditionEvaluationError(
+                f"Unexpected error evaluating condition: {e}"
+            ) from e
+
+    return evaluate
+
+
+def _compile_group_condition(group: ConditionGroup) -> CompiledCondition:
+    conditions = [compile_condition(condition) for condition in group.conditions]
+
+    if group.logical_operator == GroupOperator.and_:
+
+        def evaluate_and(data: Any) -> bool:
+            for condition in conditions:
+                if not condition(data):
+                    return False
+            return True
+
+        return evaluate_and
+
+    if group.logical_operator == GroupOperator.or_:
+
+        def evaluate_or(data: Any) -> bool:
+            for condition in conditions:
+                if condition(data):
+                    return True
+            return False
+
+        return evaluate_or
+
+    raise ConditionEvaluationError(
+        f"Unknown logical operator: {group.logical_operator}"
+    )
+
+
+def compile_condition(rule: Condition) -> CompiledCondition:
+    """Compile a condition tree into a function which evaluates it against data
+
+    Field addresses are split and operators are looked up once, rather than on every
+    evaluation, and groups stop evaluating their conditions, in order, as soon as
+    their result is known. The function returns the same result as
+    ConditionEvaluator.evaluate_rule, without building the detailed report, so it
+    suits conditions which are evaluated many times. As conditions after the one
+    deciding a group's result aren't evaluated, errors they would raise aren't.
+
+    Args:
+        rule: The condition tree to compile
+
+    Returns:
+        A function returning the condition's result for the data it's given
+
+    Raises:
+        ConditionEvaluationError: If a group has an unknown logical operator
+    """
+    if isinstance(rule, ConditionLeaf):
+        return _compile_leaf_condition(rule)
+    return _compile_group_condition(rule)
+
+
 class ConditionEvaluator:
     """Evaluates nested conditions and returns a boolean result and a detailed evaluation report"""
 
@@ -69,14 +175,7 @@ class ConditionEvaluator:
         Raises:
             ConditionEvaluationError: If there is an issue applying the operator or if an unexpected error occurs.
         """
-        # Handle both colon-separated and dot-separated field addresses
-        if ":" in condition.field_address:
-            # Full field address like "dataset:collection:field" - split on colons
-            keys = condition.field_address.split(":")
-        else:
-            # Relative field path like "field.subfield" - split on dots
-            keys = condition.field_address.split(".")
-
+        keys = _split_field_address(condition.field_address)
         data_value = self._get_nested_value(data, keys)
 
         # Apply operator and get result
@@ -177,14 +276,7 @@ class ConditionEvaluator:
         Raises:
             KeyError: If the keys are not valid for the dictionary
         """
-        current: Any = data
-        for key in keys:
-            if not isinstance(current, dict):
-                return None
-            current = current.get(key)
-            if current is None:
-                return None
-        return current
+        return _get_nested_value_from_dict(data, keys)
 
     def _get_nested_value(self, data: Union[dict, Any], keys: list[str]) -> Any:
         """Get nested value from data using dot notation or colon notation
@@ -1,4 +1,7 @@
-from typing import Optional
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional
 
 from loguru import logger
 from sqlalchemy.orm import Session, contains_eager
@@ -15,7 +18,11 @@ from fides.api.models.conditional_dependency.conditional_dependency_base import
 from fides.api.models.policy import Policy, Rule
 from fides.api.models.policy.conditional_dependency import PolicyCondition
 from fides.api.schemas.policy import ActionType
-from fides.api.task.conditional_dependencies.evaluator import ConditionEvaluator
+from fides.api.task.conditional_dependencies.evaluator import (
+    CompiledCondition,
+    ConditionEvaluator,
+    compile_condition,
+)
 from fides.api.task.conditional_dependencies.privacy_request.privacy_request_data import (
     EvaluablePrivacyRequest,
     PrivacyRequestDataTransformer,
@@ -25,6 +32,7 @@ from fides.api.task.conditional_dependencies.privacy_request.schemas import (
     PrivacyRequestFields,
 )
 from fides.api.task.conditional_dependencies.schemas import (
+    Condition,
     PolicyEvaluationResult,
     PolicyEvaluationSpecificity,
 )
@@ -89,6 +97,43 @@ class PolicyEvaluationError(Exception):
     """Error raised when policy evaluation fails"""
 
 
+@dataclass(frozen=True)
+class CompiledPolicyCondition:
+    """A validated policy condition tree, with everything derived from it"""
+
+    condition_tree: Condition
+    field_addresses: set[str]
+    specificity: PolicyEvaluationSpecificity
+    evaluate: CompiledCondition
+
+
+@lru_cache(maxsize=1024)
+def _compile_policy_condition(condition_tree_json: str) -> CompiledPolicyCondition:
+    condition_tree = ConditionTypeAdapter.validate_python(
+        json.loads(condition_tree_json)
+    )
+    field_addresses = extract_field_addresses(condition_tree)
+    return CompiledPolicyCondition(
+        condition_tree=condition_tree,
+        field_addresses=field_addresses,
+        specificity=calculate_specificity(field_addresses),
+        evaluate=compile_condition(condition_tree),
+    )
+
+
+def get_compiled_policy_condition(condition_tree: Any) -> CompiledPolicyCondition:
+    """Validate and compile a policy's condition tree, reusing earlier compilations
+
+    Compilations are cached by the tree's content, so a condition which is changed
+    is compiled again, and the condition trees of every policy are only validated
+    once per process rather than for every privacy request.
+
+    Raises:
+        ValidationError: If the condition tree is malformed
+    """
+    return _compile_policy_condition(json.dumps(condition_tree, sort_keys=True))
+
+
 class PolicyEvaluator:
     """Evaluates privacy requests against policies with conditions.
 
@@ -230,22 +275,19 @@ class PolicyEvaluator:
         Raises:
             PolicyEvaluationError: If condition tree is malformed or evaluation fails unexpectedly
         """
-        condition_tree = ConditionTypeAdapter.validate_python(
-            policy_condition.condition_tree
-        )
+        compiled = get_compiled_policy_condition(policy_condition.condition_tree)
+        evaluation_data = data_transformer.to_evaluation_data(compiled.field_addresses)
 
-        field_addresses = extract_field_addresses(condition_tree)
-        evaluation_result = self.condition_evaluator.evaluate_rule(
-            condition_tree, data_transformer.to_evaluation_data(field_addresses)
-        )
-
-        if not evaluation_result.result:
+        if not compiled.evaluate(evaluation_data):
             return None
 
-        specificity = calculate_specificity(field_addresses)
+        # Only matching policies need the detailed report
+        evaluation_result = self.condition_evaluator.evaluate_rule(
+            compiled.condition_tree, evaluation_data
+        )
 
         return (
-            specificity,
+            compiled.specificity,
             PolicyEvaluationResult(
                 policy=policy_condition.policy,
                 evaluation_result=evaluation_result,
@@ -1,5 +1,6 @@
 from collections import deque
-from typing import Any, Optional
+from threading import Lock
+from typing import Any, NamedTuple, Optional
 
 from loguru import logger
 from sqlalchemy import and_, not_, or_
@@ -22,11 +23,41 @@ from fides.api.task.conditional_dependencies.sql_schemas import (
 )
 
 
+class JoinStep(NamedTuple):
+    """A relationship to join, and whether it points back to the primary model"""
+
+    relationship_attr: Any
+    reverse: bool
+
+
+class JoinPlan(NamedTuple):
+    """The models and joins needed to query the tables referenced by a condition
+
+    Join plans only depend on the models, so they are shared by every condition
+    which references the same tables, and only the filter is built per condition.
+    """
+
+    primary_model: type
+    model_classes: dict[str, type]
+    join_steps: list[JoinStep]
+
+
+# Join plans keyed by the (table name, model) pairs a condition references, in
+# order, so the first pair is the primary model
+JoinPlanKey = tuple[tuple[str, type], ...]
+
+
 class SQLConditionTranslator:
     """Translates conditional dependencies into SQLAlchemy queries using relationship traversal"""
 
     MAX_RELATIONSHIP_DEPTH = 15
     DEFAULT_PRIMARY_KEY = "id"
+    MAX_JOIN_PLANS = 256
+
+    # Shared by all translators, as a translator is created per session, and so
+    # by all threads, which only access it holding the lock
+    _join_plans: dict[JoinPlanKey, JoinPlan] = {}
+    _join_plans_lock = Lock()
 
     def __init__(self, db: Session, orm_registry: Optional[Base] = None):
         """
@@ -96,6 +127,44 @@ class SQLConditionTranslator:
         """
         # Analyze which tables/models are needed
         tables_to_fields = self.map_tables_to_fields(condition)
+        join_plan = self.get_join_plan(tables_to_fields)
+
+        # Build base query - select from primary model (equivalent to SELECT *)
+        query: Query = self.db.query(join_plan.primary_model)
+
+        # Add JOINs using relationships
+        query = self._apply_join_steps(
+            query, join_plan.join_steps, join_plan.primary_model
+        )
+
+        # Add WHERE conditions
+        filter_expression = self._build_filter_expression(
+            condition, join_plan.model_classes
+        )
+        if filter_expression is not None:
+            query = query.filter(filter_expression)
+
+        return query
+
+    def get_join_plan(
+        self, tables_to_fields: dict[str, list[FieldAddress]]
+    ) -> JoinPlan:
+        """Returns the models and joins needed to query the given tables
+
+        Finding the relationship paths between models means introspecting their
+        mappers and searching the relationship graph, so plans are cached by the
+        tables and models they are built from.
+
+        Args:
+            tables_to_fields: Dictionary of the referenced table names to lists of
+                field addresses
+
+        Returns:
+            The JoinPlan for the tables
+
+        Raises:
+            SQLTranslationError: If no models are found for the tables
+        """
         model_classes: dict[str, type] = {
             table_name: model_class
             for table_name in tables_to_fields
@@ -107,6 +176,36 @@ class SQLConditionTranslator:
                 "No valid SQLAlchemy models found for the specified tables"
             )
 
+        key: JoinPlanKey = tuple(model_classes.items())
+        with self._join_plans_lock:
+            join_plan = self._join_plans.get(key)
+        if join_plan is None:
+            # Built outside of the lock, a concurrent build of the same plan is harmless
+            join_plan = self._build_join_plan(model_classes, tables_to_fields)
+            with self._join_plans_lock:
+                if len(self._join_plans) >= self.MAX_JOIN_PLANS:
+                    # Evict the oldest plan
+                    self._join_plans.pop(next(iter(self._join_plans)), None)
+                self._join_plans[key] = join_plan
+        return join_plan
+
+    def _build_join_plan(
+        self,
+        model_classes: dict[str, type],
+        tables_to_fields: dict[str, list[FieldAddress]],
+    ) -> JoinPlan:
+        """Builds the JoinPlan for the referenced tables' models
+
+        Args:
+            model_classes: Dictionary of the referenced table names to model classes
+            tables_to_fields: Dictionary of table names to lists of field addresses
+
+        Returns:
+            The JoinPlan for the models
+        """
+        model_classes = dict(model_classes)
+        tables_to_fields = dict(tables_to_fields)
+
         # Determine primary model - first table in the model_classes dictionary (first condition)
         # This makes the query intent clear and predictable for users
         primary_table, primary_model = next(iter(model_classes.items()))
@@ -123,20 +222,10 @@ class SQLConditionTranslator:
                     model_classes[table_name] = model_class
                     tables_to_fields[table_name] = []
 
-        # Build base query - select from primary model (equivalent to SELECT *)
-        query: Query = self.db.query(primary_model)
-
-        # Add JOINs using relationships
-        query = self._add_relationship_joins(
-            query, primary_model, model_classes, primary_table, tables_to_fields
+        join_steps = self._plan_relationship_joins(
+            primary_model, model_classes, primary_table, tables_to_fields
         )
-
-        # Add WHERE conditions
-        filter_expression = self._build_filter_expression(condition, model_classes)
-        if filter_expression is not None:
-            query = query.filter(filter_expression)
-
-        return query
+        return JoinPlan(primary_model, model_classes, join_steps)
 
     def map_tables_to_fields(
         self, condition: Condition
@@ -416,6 +505,30 @@ class SQLConditionTranslator:
         Returns:
             The SQLAlchemy query with the JOINs added or the original query if no join paths found
         """
+        join_steps = self._plan_relationship_joins(
+            primary_model, model_classes, primary_table, tables_to_fields
+        )
+        return self._apply_join_steps(query, join_steps, primary_model)
+
+    def _plan_relationship_joins(
+        self,
+        primary_model: type,
+        model_classes: dict[str, type],
+        primary_table: str,
+        tables_to_fields: dict[str, list],
+    ) -> list[JoinStep]:
+        """Finds the relationships to join to reach the referenced tables
+
+        Args:
+            primary_model: The primary model class
+            model_classes: Dictionary of table names to model classes
+            primary_table: The primary table name
+            tables_to_fields: Dictionary of table names to lists of field addresses
+
+        Returns:
+            The JoinSteps in the order they should be joined
+        """
+        join_steps: list[JoinStep] = []
         for table_name, model_class in model_classes.items():
             if table_name == primary_table:
                 continue
@@ -430,19 +543,36 @@ class SQLConditionTranslator:
                 table_name,
                 primary_table,
             )
-            if join_path:
-                for relationship_attr in join_path:
-                    # Check if this is a reverse relationship (target model has relationship to primary model)
-                    if (
-                        hasattr(relationship_attr, "property")
-                        and hasattr(relationship_attr.property, "mapper")
-                        and relationship_attr.property.mapper.class_ == primary_model
-                    ):
-                        query = self._apply_reverse_join(
-                            query, relationship_attr, primary_model
-                        )
-                    else:
-                        query = query.join(relationship_attr)
+            for relationship_attr in join_path:
+                # Check if this is a reverse relationship (target model has relationship to primary model)
+                reverse = (
+                    hasattr(relationship_attr, "property")
+                    and hasattr(relationship_attr.property, "mapper")
+                    and relationship_attr.property.mapper.class_ == primary_model
+                )
+                join_steps.append(JoinStep(relationship_attr, reverse))
+        return join_steps
+
+    def _apply_join_steps(
+        self, query: Query, join_steps: list[JoinStep], primary_model: type
+    ) -> Query:
+        """Adds the planned JOINs to the query
+
+        Args:
+            query: The SQLAlchemy query to add the JOINs to
+            join_steps: The JoinSteps to apply
+            primary_model: The primary model class
+
+        Returns:
+            The SQLAlchemy query with the JOINs added
+        """
+        for relationship_attr, reverse in join_steps:
+            if reverse:
+                query = self._apply_reverse_join(
+                    query, relationship_attr, primary_model
+                )
+            else:
+                query = query.join(relationship_attr)
         return query
 
     def _apply_reverse_join(
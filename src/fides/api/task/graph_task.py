@@ -2,6 +2,7 @@
 import copy
 import traceback
 from abc import ABC
+from datetime import datetime, timedelta, timezone
 from functools import wraps
 from time import sleep
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
@@ -60,6 +61,7 @@ from fides.api.util.collection_util import (
 from fides.api.util.consent_util import (
     add_errored_system_status_for_consent_reporting_on_preferences,
 )
+from fides.api.util.encryption.secrets_util import masking_secret_vault
 from fides.api.util.logger_context_utils import LoggerContextKeys
 from fides.api.util.memory_watchdog import MemoryLimitExceeded
 from fides.api.util.saas_util import FIDESOPS_GROUPED_INPUTS
@@ -71,6 +73,13 @@ COLLECTION_FIELD_PATH_MAP = Dict[CollectionAddress, List[Tuple[FieldPath, FieldP
 EMPTY_REQUEST = PrivacyRequest()
 EMPTY_REQUEST_TASK = RequestTask()
 
+# Transitions whose execution logs are held back, when execution logs are coalesced,
+# until the node's next status transition outside this set
+BUFFERED_EXECUTION_LOG_STATUSES = {
+    ExecutionLogStatus.in_processing,
+    ExecutionLogStatus.retrying,
+}
+
 
 def _is_memory_limit_exceeded(exception: BaseException) -> bool:
     """Check if the exception or any exception in its chain is a MemoryLimitExceeded."""
@@ -97,8 +106,7 @@ def retry(
 
     # pylint: disable=too-many-return-statements
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def result(*args: Any, **kwargs: Any) -> Any:
+        def run_with_retries(*args: Any, **kwargs: Any) -> Any:
             func_delay = CONFIG.execution.task_retry_delay
             method_name = func.__name__
             self = args[0]
@@ -210,6 +218,14 @@ def retry(
             self.add_error_status_for_consent_reporting()
             return default_return
 
+        @wraps(func)
+        def result(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return run_with_retries(*args, **kwargs)
+            finally:
+                # Nothing is left buffered once the node has stopped running
+                args[0].flush_execution_logs()
+
         return result
 
     return decorator
@@ -267,6 +283,12 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
             saas_config_dict.get("version") if saas_config_dict else None
         )
 
+        # Execution logs held back until the next checkpoint, when execution logs
+        # are coalesced, and the time the last of them was stamped with. See
+        # update_status.
+        self.pending_execution_logs: List[Dict[str, Any]] = []
+        self.last_execution_log_at: Optional[datetime] = None
+
         self.execution_log_id = None
         # a local copy of the execution log record written to. If we write multiple status
         # updates, we will use this id to ensure that we're updating rather than creating
@@ -420,32 +442,75 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
         """Update status activities - create an execution log (which stores historical logs)
         and update the Request Task's current status.
         """
-        with get_db() as db:
-            ExecutionLog.create(
-                db=db,
-                data={
-                    "connection_key": self.execution_node.connection_key,
-                    "dataset_name": self.execution_node.address.dataset,
-                    "collection_name": self.execution_node.address.collection,
-                    "fields_affected": fields_affected,
-                    "action_type": action_type,
-                    "status": status,
-                    "privacy_request_id": self.resources.request.id,
-                    "message": msg,
-                    "saas_version": self._saas_version,
-                },
-            )
+        execution_log_data = {
+            "connection_key": self.execution_node.connection_key,
+            "dataset_name": self.execution_node.address.dataset,
+            "collection_name": self.execution_node.address.collection,
+            "fields_affected": fields_affected,
+            "action_type": action_type,
+            "status": status,
+            "privacy_request_id": self.resources.request.id,
+            "message": msg,
+            "saas_version": self._saas_version,
+        }
+        if not CONFIG.execution.coalesce_execution_logs:
+            with get_db() as db:
+                ExecutionLog.create(db=db, data=execution_log_data)
+                self._update_request_task_status(db, status)
+            return
 
+        # Stamp the time of the transition rather than of the flush, without a
+        # round trip to the database. The node's stamps only ever increase, so its
+        # logs keep their order even if the worker's clock steps back.
+        created_at = datetime.now(timezone.utc)
+        if self.last_execution_log_at and created_at <= self.last_execution_log_at:
+            created_at = self.last_execution_log_at + timedelta(microseconds=1)
+        self.last_execution_log_at = created_at
+        execution_log_data["created_at"] = created_at
+        self.pending_execution_logs.append(execution_log_data)
+        if status in BUFFERED_EXECUTION_LOG_STATUSES:
+            # Neither the log nor the request task's status is written: the
+            # worker's heartbeat is what tells that the task is running
+            return
+
+        with get_db() as db:
+            # Terminal and pausing transitions are written right away, in the same
+            # commit as the logs buffered before them
+            self._add_pending_execution_logs(db)
             if self.request_task.id:
-                # Merge the request_task into the current session to make it
-                # persistent, then refresh its `async_type` to load the latest
-                # state from the database. This is crucial for async tasks where
-                # `async_type` might be updated by another process, and avoids
-                # overwriting local data like `access_data`.
-                request_task = db.merge(self.request_task)
-                db.refresh(request_task, attribute_names=["async_type"])
-                request_task.update_status(db, status)
-                self.request_task = request_task
+                self._update_request_task_status(db, status)
+            else:
+                db.commit()
+
+    def flush_execution_logs(self) -> None:
+        """Write any buffered execution logs in a single batched insert."""
+        if not self.pending_execution_logs:
+            return
+        with get_db() as db:
+            self._add_pending_execution_logs(db)
+            db.commit()
+
+    def _add_pending_execution_logs(self, db: Session) -> None:
+        """Add the buffered execution logs to the session, in the order logged."""
+        db.add_all(
+            ExecutionLog(**execution_log_data)
+            for execution_log_data in self.pending_execution_logs
+        )
+        self.pending_execution_logs = []
+
+    def _update_request_task_status(
+        self, db: Session, status: ExecutionLogStatus
+    ) -> None:
+        if self.request_task.id:
+            # Merge the request_task into the current session to make it
+            # persistent, then refresh its `async_type` to load the latest
+            # state from the database. This is crucial for async tasks where
+            # `async_type` might be updated by another process, and avoids
+            # overwriting local data like `access_data`.
+            request_task = db.merge(self.request_task)
+            db.refresh(request_task, attribute_names=["async_type"])
+            request_task.update_status(db, status)
+            self.request_task = request_task
 
     def log_start(self, action_type: ActionType) -> None:
         """Task start activities"""
@@ -841,8 +906,12 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
             *inputs, group_dependent_fields=True
         )
 
-        # Use execution context to capture postprocessor messages
-        with collect_execution_log_messages() as messages:
+        # Use execution context to capture postprocessor messages, and load the
+        # masking secrets once for all of the values masked on this node
+        with (
+            collect_execution_log_messages() as messages,
+            masking_secret_vault(self.resources.session, self.resources.request.id),
+        ):
             output = self.connector.mask_data(
                 self.execution_node,
                 self.resources.policy,
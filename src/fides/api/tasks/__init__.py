@@ -2,7 +2,12 @@ from typing import Any, ContextManager, Dict, List, Optional
 
 import celery_redis_cluster_backend  # type: ignore[import-untyped]  # noqa: F401 - registers redis+cluster/rediss+cluster backends
 from celery import Celery, Task
-from celery.signals import before_task_publish, task_postrun, task_prerun
+from celery.signals import (
+    after_task_publish,
+    before_task_publish,
+    task_postrun,
+    task_prerun,
+)
 from celery.signals import setup_logging as celery_setup_logging
 from loguru import logger
 from sqlalchemy.exc import OperationalError
@@ -18,6 +23,7 @@ from tenacity import (
 from fides.api.db.session import get_db_engine, get_db_session
 from fides.api.request_context import get_request_id, set_request_id
 from fides.api.tasks import celery_healthcheck
+from fides.api.util import task_heartbeat
 from fides.api.util.logger import setup as setup_logging
 from fides.config import CONFIG, FidesConfig
 
@@ -222,6 +228,34 @@ def _clear_request_id(**kwargs: Any) -> None:
     set_request_id(None)
 
 
+def _is_dsr_task(task: Task) -> bool:
+    delivery_info = getattr(task.request, "delivery_info", None) or {}
+    return delivery_info.get("routing_key") == DSR_QUEUE_NAME
+
+
+@after_task_publish.connect
+def _register_queued_dsr_task(
+    headers: Dict[str, Any], routing_key: Optional[str] = None, **kwargs: Any
+) -> None:
+    """Add newly published DSR tasks to the liveness registry."""
+    if routing_key == DSR_QUEUE_NAME and headers.get("id"):
+        task_heartbeat.mark_task_queued(headers["id"])
+
+
+@task_prerun.connect
+def _start_dsr_task_heartbeat(task_id: str, task: Task, **kwargs: Any) -> None:
+    """Start sending heartbeats for a DSR task while it runs on this worker."""
+    if _is_dsr_task(task):
+        task_heartbeat.mark_task_started(task_id)
+
+
+@task_postrun.connect
+def _stop_dsr_task_heartbeat(task_id: str, task: Task, **kwargs: Any) -> None:
+    """Remove a finished DSR task from the liveness registry."""
+    if _is_dsr_task(task):
+        task_heartbeat.mark_task_finished(task_id)
+
+
 def get_worker_ids() -> List[Optional[str]]:
     """
     Returns a list of the connected healthy worker UUIDs.
@@ -28,6 +28,7 @@ from fides.api.tasks import (
     PRIVACY_PREFERENCES_QUEUE_NAME,
     celery_app,
 )
+from fides.api.util import typed_codec
 from fides.api.util.custom_json_encoder import CustomJSONEncoder, _custom_decoder
 from fides.common.cache.dsr_store import DSRCacheStore
 from fides.common.cache.manager import RedisCacheManager
@@ -131,7 +132,12 @@ class FidesopsRedis:
     def set_encoded_object(self, key: str, obj: Any) -> Optional[bool]:
         """Set an object in redis in an encoded form. This object should be retrieved via
         get_objects_by_prefix or processed with decode_obj."""
-        return self.set_with_autoexpire(f"EN_{key}", FidesopsRedis.encode_obj(obj))
+        return self.set_with_autoexpire(
+            f"EN_{key}",
+            FidesopsRedis.encode_obj(
+                obj, typed=CONFIG.execution.use_typed_payload_codec
+            ),
+        )
 
     def get_encoded_by_key(self, key: str) -> Optional[Any]:
         """Returns cached obj decoded from base64"""
@@ -165,8 +171,13 @@ class FidesopsRedis:
         return decoded_items
 
     @staticmethod
-    def encode_obj(obj: Any) -> bytes:
-        """Encode an object to a JSON string that can be stored in Redis"""
+    def encode_obj(obj: Any, typed: bool = False) -> bytes:
+        """Encode an object to a JSON string that can be stored in Redis.
+
+        If typed, the object is encoded as a typed codec frame instead, which must
+        be read with decode_obj."""
+        if typed:
+            return typed_codec.dumps(obj)  # type: ignore
         return json.dumps(obj, cls=CustomJSONEncoder)  # type: ignore
 
     @staticmethod
@@ -176,6 +187,8 @@ class FidesopsRedis:
         Since Redis may not contain a value
         for a given key it's possible we may try to decode an empty object."""
         if bs:
+            if typed_codec.is_typed_frame(bs):
+                return typed_codec.loads(bs)
             try:
                 result = json.loads(bs, object_hook=_custom_decoder)
             except json.decoder.JSONDecodeError:
@@ -206,7 +219,9 @@ class FidesopsRedis:
         Returns:
             The length of the list after the push operation
         """
-        encoded_entry = self.encode_obj(obj)
+        encoded_entry = self.encode_obj(
+            obj, typed=CONFIG.execution.use_typed_payload_codec
+        )
         list_length = self._client.rpush(key, encoded_entry)
         self._client.expire(key, expire_time)
         return list_length
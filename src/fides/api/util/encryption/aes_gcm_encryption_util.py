@@ -18,8 +18,9 @@ from loguru import logger
 from sqlalchemy_utils.types.encrypted.encrypted_type import AesGcmEngine
 
 from fides.api.db.encryption_utils import get_encryption_key
+from fides.api.util import typed_codec
 from fides.api.util.collection_util import Row
-from fides.api.util.custom_json_encoder import CustomJSONEncoder, _custom_decoder
+from fides.api.util.custom_json_encoder import CustomJSONEncoder
 from fides.config import CONFIG
 
 
@@ -27,6 +28,16 @@ class EncryptionError(Exception):
     """Raised when encryption/decryption operations fail"""
 
 
+def _serialize(data: Any) -> str:
+    """
+    Serializes data with the typed codec if it's enabled, or the CustomJSONEncoder.
+    The decrypt functions read either format.
+    """
+    if CONFIG.execution.use_typed_payload_codec:
+        return typed_codec.dumps(data)
+    return json.dumps(data, cls=CustomJSONEncoder, separators=(",", ":"))
+
+
 # SQLAlchemy-Utils Implementation (for compatibility with existing database encryption)
 def encrypt_with_sqlalchemy_utils(data: List[Row]) -> bytes:
     """
@@ -44,8 +55,8 @@ def encrypt_with_sqlalchemy_utils(data: List[Row]) -> bytes:
         EncryptionError: If serialization or encryption fails
     """
     try:
-        # Serialize using CustomJSONEncoder for consistent ObjectId handling
-        serialized_data = json.dumps(data, cls=CustomJSONEncoder, separators=(",", ":"))
+        # Serialize with the typed codec or CustomJSONEncoder for ObjectId handling
+        serialized_data = _serialize(data)
         data_bytes = serialized_data.encode("utf-8")
 
         # Encrypt using SQLAlchemy-Utils AesGcmEngine
@@ -70,7 +81,7 @@ def encrypt_with_sqlalchemy_utils(data: List[Row]) -> bytes:
 
 def decrypt_with_sqlalchemy_utils(encrypted_bytes: bytes) -> List[Row]:
     """
-    Decrypt and deserialize data using SQLAlchemy-Utils AesGcmEngine and _custom_decoder.
+    Decrypt and deserialize data using SQLAlchemy-Utils AesGcmEngine and the typed codec.
 
     Args:
         encrypted_bytes: Encrypted data bytes to decrypt
@@ -91,8 +102,8 @@ def decrypt_with_sqlalchemy_utils(encrypted_bytes: bytes) -> List[Row]:
         encrypted_str = encrypted_bytes.decode("utf-8")
         decrypted_data = engine.decrypt(encrypted_str)
 
-        # Deserialize using _custom_decoder for consistent ObjectId handling
-        data = json.loads(decrypted_data, object_hook=_custom_decoder)
+        # Deserialize either format for consistent ObjectId handling
+        data = typed_codec.loads(decrypted_data)
 
         logger.debug(
             f"SQLAlchemy-Utils: Decrypted {len(encrypted_bytes)} bytes to {len(data)} records"
@@ -128,8 +139,8 @@ def encrypt_with_cryptography(
         if chunk_size is None:
             chunk_size = 4 * 1024 * 1024  # 4MB chunks
 
-        # Serialize using CustomJSONEncoder for consistent handling
-        serialized_data = json.dumps(data, cls=CustomJSONEncoder, separators=(",", ":"))
+        # Serialize with the typed codec or CustomJSONEncoder for consistent handling
+        serialized_data = _serialize(data)
         plaintext = serialized_data.encode("utf-8")
 
         data_size_mb = len(plaintext) / (1024 * 1024)
@@ -254,7 +265,7 @@ def decrypt_with_cryptography(
         # Combine and deserialize
         plaintext = b"".join(plaintext_chunks)
         decrypted_json = plaintext.decode("utf-8")
-        data = json.loads(decrypted_json, object_hook=_custom_decoder)
+        data = typed_codec.loads(decrypted_json)
 
         record_count = len(data) if isinstance(data, list) else "N/A"
         logger.info(f"Cryptography: Successfully decrypted {record_count} records")
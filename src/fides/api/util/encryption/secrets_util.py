@@ -1,9 +1,11 @@
 import secrets
-from typing import Any, Dict, List, Optional, TypeVar
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Generator, List, Optional, Tuple, TypeVar
 
 from loguru import logger
+from sqlalchemy.orm import Session
 
-from fides.api.db.session import get_db_session
 from fides.api.models.masking_secret import MaskingSecret
 from fides.api.schemas.masking.masking_secrets import (
     MaskingSecretCache,
@@ -11,11 +13,83 @@ from fides.api.schemas.masking.masking_secrets import (
     SecretType,
 )
 from fides.api.util.cache import get_cache, get_masking_secret_cache_key
-from fides.config import CONFIG
+from fides.common.session_management import get_autoclose_db_session
 
 T = TypeVar("T")
 
 
+class MaskingSecretVault:
+    """
+    An in-memory store of the masking secrets of a single privacy request.
+
+    Masking strategies look up their secrets for every batch of values they mask,
+    which can be once per row of an erasure. The vault loads all of the privacy
+    request's persisted secrets with a single query, so these lookups don't need
+    any I/O. Secrets that aren't in the database (e.g. those of older requests,
+    which were only cached in Redis) are looked up once and then kept as well.
+    """
+
+    def __init__(
+        self,
+        privacy_request_id: str,
+        masking_secrets: Dict[Tuple[str, str], Any],
+    ) -> None:
+        self.privacy_request_id = privacy_request_id
+        self._secrets = masking_secrets
+
+    @classmethod
+    def load(cls, db: Session, privacy_request_id: str) -> "MaskingSecretVault":
+        """Load all of the masking secrets persisted for the privacy request."""
+        masking_secrets = (
+            db.query(MaskingSecret)
+            .filter(MaskingSecret.privacy_request_id == privacy_request_id)
+            .all()
+        )
+        return cls(
+            privacy_request_id,
+            {
+                (
+                    masking_secret.masking_strategy,
+                    masking_secret.secret_type,
+                ): masking_secret.get_secret()
+                for masking_secret in masking_secrets
+            },
+        )
+
+    def get(self, masking_strategy: str, secret_type: SecretType) -> Optional[Any]:
+        key = (masking_strategy, secret_type.value)
+        if key not in self._secrets:
+            self._secrets[key] = SecretsUtil.lookup_masking_secret(
+                self.privacy_request_id, masking_strategy, secret_type
+            )
+        return self._secrets[key]
+
+
+_masking_secret_vault: ContextVar[Optional[MaskingSecretVault]] = ContextVar(
+    "masking_secret_vault", default=None
+)
+
+
+@contextmanager
+def masking_secret_vault(
+    db: Session, privacy_request_id: str
+) -> Generator[MaskingSecretVault, None, None]:
+    """
+    Serve the privacy request's masking secrets from a MaskingSecretVault
+    for the duration of the context.
+
+    Usage:
+        with masking_secret_vault(db, privacy_request.id):
+            # ... mask values for the privacy request
+    """
+    vault = MaskingSecretVault.load(db, privacy_request_id)
+    token = _masking_secret_vault.set(vault)
+    try:
+        yield vault
+    finally:
+        _masking_secret_vault.reset(token)
+
+
 class SecretsUtil:
     @staticmethod
     def get_or_generate_secret(
@@ -72,6 +146,24 @@ class SecretsUtil:
         privacy_request_id: str,
         masking_strategy: str,
         secret_type: SecretType,
+    ) -> Optional[Any]:
+        """
+        Retrieves the masking secret from the active MaskingSecretVault for the
+        privacy request if there is one, otherwise looks it up directly.
+        """
+        vault = _masking_secret_vault.get()
+        if vault is not None and vault.privacy_request_id == privacy_request_id:
+            return vault.get(masking_strategy, secret_type)
+
+        return SecretsUtil.lookup_masking_secret(
+            privacy_request_id, masking_strategy, secret_type
+        )
+
+    @staticmethod
+    def lookup_masking_secret(
+        privacy_request_id: str,
+        masking_strategy: str,
+        secret_type: SecretType,
     ) -> Optional[Any]:
         """
         Attempts to retrieve masking secret from cache first, then falls back to DB.
@@ -89,9 +181,8 @@ class SecretsUtil:
             return secret
 
         # Cache miss - try database
-        session_local = get_db_session(CONFIG)
-        with session_local() as session:
-            masking_secret: MaskingSecret = (
+        with get_autoclose_db_session() as session:
+            masking_secret: Optional[MaskingSecret] = (
                 session.query(MaskingSecret)
                 .filter(
                     MaskingSecret.privacy_request_id == privacy_request_id,
@@ -101,7 +192,7 @@ class SecretsUtil:
                 .first()
             )
 
-            if not masking_secret:
+            if masking_secret is None:
                 return None
 
             return masking_secret.get_secret()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
@@ -162,3 +164,42 @@ def human_friendly_list(item_list: List[Any]) -> str:
     if length == 2:
         return " and ".join(stringified_list)
     return ", ".join(stringified_list[0:-1]) + f", and {stringified_list[-1]}"
+
+
+def resource_etag(resource: Dict[str, Any]) -> str:
+    """
+    Compute a strong ETag for a JSON-serializable resource.
+
+    Keys are sorted so that the value only changes when the content does.
+    """
+    serialized = json.dumps(resource, sort_keys=True, separators=(",", ":"))
+    return f'"{hashlib.sha256(serialized.encode("utf-8")).hexdigest()}"'
+
+
+def build_batch_resource_response(
+    fides_model: FidesModelType,
+    resource_dicts: List[Dict[str, Any]],
+    known_etags: Dict[str, str],
+) -> Dict[str, Any]:
+    """
+    Serialize a batch of resources, omitting those whose ETag matches the one the caller sent.
+
+    Returns a payload matching `BatchResourceResponse`.
+    """
+    resources: List[Dict[str, Any]] = []
+    etags: Dict[str, str] = {}
+    not_modified: List[str] = []
+    for resource_dict in resource_dicts:
+        # Relationships loaded on the resource are ORM objects, as for response models
+        resource = fides_model.model_validate(
+            resource_dict, from_attributes=True
+        ).model_dump(mode="json")
+        fides_key = resource["fides_key"]
+        etag = resource_etag(resource)
+        etags[fides_key] = etag
+        if known_etags.get(fides_key) == etag:
+            not_modified.append(fides_key)
+        else:
+            resources.append(resource)
+
+    return {"resources": resources, "etags": etags, "not_modified": not_modified}
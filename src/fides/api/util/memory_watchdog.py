@@ -37,14 +37,13 @@ def get_memory_watchdog_enabled() -> bool:
         bool: True if memory_watchdog_enabled is enabled, False otherwise (defaults to False)
     """
     try:
-        from fides.common.session_management import get_autoclose_db_session as get_db
         from fides.config.config_proxy import ConfigProxy
 
-        with get_db() as db:
-            config_proxy = ConfigProxy(db)
-            # ConfigProxy returns None when no config record exists, so we must handle None explicitly
-            value = getattr(config_proxy.execution, "memory_watchdog_enabled")
-            return value if value is not None else False
+        # Resolved from the config snapshot, which only opens a db session when it's out of date
+        config_proxy = ConfigProxy()
+        # ConfigProxy returns None when no config record exists, so we must handle None explicitly
+        value = getattr(config_proxy.execution, "memory_watchdog_enabled")
+        return value if value is not None else False
     except Exception:  # pragma: no cover
         # default to disabled for backward compatibility
         return False
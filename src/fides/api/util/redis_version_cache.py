@@ -109,6 +109,7 @@ def _bump_redis_version(redis_key: str) -> None:
 def redis_version_cached(
     redis_key: str,
     cache_key: str,
+    serve_stale: bool = True,
 ) -> Callable[[Callable[..., R]], Callable[..., R]]:
     """Caching decorator that invalidates via a Redis version counter.
 
@@ -130,9 +131,15 @@ def redis_version_cached(
     value is returned.  If no cached value exists (e.g. cold start with
     Redis down), the underlying function is called directly.
 
+    With ``serve_stale=False`` a value that can't be verified is never
+    served: while Redis is unreachable the local entry is dropped and every
+    call returns a fresh, uncached result of the underlying function, and
+    ``bump_version()`` raises if the counter can't be incremented.
+
     Args:
         redis_key: The Redis key that holds the version counter.
         cache_key: A unique string identifying this local cache entry.
+        serve_stale: Whether to serve the cached value while Redis is unreachable.
     """
 
     def decorator(func: Callable[..., R]) -> Callable[..., R]:
@@ -142,6 +149,15 @@ def redis_version_cached(
             try:
                 current_version = _get_redis_version(redis_key)
             except Exception as e:
+                if not serve_stale:
+                    logger.warning(
+                        "redis_version_cache '{}': Redis unavailable, bypassing the cache. Exception: {}",
+                        cache_key,
+                        e,
+                    )
+                    cache_clear()
+                    return func(*args, **kwargs)
+
                 # Redis is down – prefer stale data over a DB round-trip
                 with _cache_lock:
                     cached = _cache_store.get(cache_key)
@@ -202,6 +218,9 @@ def redis_version_cached(
             try:
                 _bump_redis_version(redis_key)
             except Exception:
+                if not serve_stale:
+                    cache_clear()
+                    raise
                 logger.warning(
                     "redis_version_cache '{}': unable to bump Redis version for key '{}'",
                     cache_key,
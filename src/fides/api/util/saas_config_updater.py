@@ -1,8 +1,8 @@
 import copy
-from typing import Iterable
+from typing import Dict, Iterable
 
 from loguru import logger
-from packaging.version import Version
+from packaging.version import InvalidVersion, Version
 from packaging.version import parse as parse_version
 from sqlalchemy import func as sa_func
 from sqlalchemy.orm import Session
@@ -13,6 +13,7 @@ from fides.api.schemas.saas.connector_template import ConnectorTemplate
 from fides.api.schemas.saas.saas_config import SaaSConfig
 from fides.api.service.connectors.saas.connector_registry_service import (
     ConnectorRegistry,
+    FileConnectorTemplateLoader,
 )
 from fides.api.util.saas_util import load_config_from_string, load_dataset_from_string
 from fides.service.connection.connection_service import ConnectionService
@@ -26,11 +27,30 @@ def update_saas_configs(db: Session) -> None:
 
     Effectively an "update script" for SaaS config instances,
     to be run on server bootstrap.
+
+    A template is only loaded if its template dataset hasn't been stored yet,
+    or if an instance of its type has a lower version than the template's
+    indexed version.
     """
     event_audit_service = EventAuditService(db)
     saas_connection_service = ConnectionService(db, event_audit_service)
     all_templates = ConnectorRegistry.get_combined_templates()
-    for connector_type, template in all_templates.items():
+    template_versions = ConnectorRegistry.get_template_versions()
+    stored_dataset_types = {
+        connection_type
+        for (connection_type,) in db.query(SaasTemplateDataset.connection_type)
+    }
+    lowest_instance_versions = _get_lowest_instance_versions(db)
+    for connector_type, version in template_versions.items():
+        lowest_instance_version = lowest_instance_versions.get(connector_type.lower())
+        if connector_type in stored_dataset_types and (
+            lowest_instance_version is None
+            or lowest_instance_version >= parse_version(version)
+        ):
+            continue
+        template = all_templates.get(connector_type)
+        if template is None:
+            continue
         logger.debug(
             "Determining if any updates are needed for connectors of type {} based on templates...",
             connector_type,
@@ -88,3 +108,21 @@ def update_saas_configs(db: Session) -> None:
                         "Encountered error attempting to update SaaS config instance {}",
                         saas_config_instance.fides_key,
                     )
+    FileConnectorTemplateLoader.get_connector_templates().save_index()
+
+
+def _get_lowest_instance_versions(db: Session) -> Dict[str, Version]:
+    """Returns the lowest version of the SaaS config instances of each type."""
+    lowest_versions: Dict[str, Version] = {}
+    for saas_config in db.query(ConnectionConfig.saas_config).filter(
+        ConnectionConfig.saas_config.isnot(None)
+    ):
+        try:
+            connector_type = str(saas_config[0]["type"]).lower()
+            version = parse_version(str(saas_config[0]["version"]))
+        except (KeyError, TypeError, InvalidVersion):
+            continue
+        lowest_version = lowest_versions.get(connector_type)
+        if lowest_version is None or version < lowest_version:
+            lowest_versions[connector_type] = version
+    return lowest_versions
@@ -0,0 +1,185 @@
+"""
+A Redis-backed liveness registry for DSR Celery tasks.
+
+Rather than scanning the whole DSR queue to find out whether a task is still
+queued or running, the interrupted task watchdog consults two sorted sets:
+
+- `dsr_tasks_queued`: task IDs scored by the time they were published. Entries
+  are removed as soon as a worker starts the task.
+- `dsr_task_heartbeats`: task IDs scored by the last time a worker reported them
+  as running. Each worker process refreshes its running tasks from a background
+  thread every `CONFIG.execution.dsr_task_heartbeat_interval` seconds, and removes
+  them once they finish.
+
+A running task whose heartbeat is older than `CONFIG.execution.dsr_task_heartbeat_timeout`
+is considered interrupted, which is a single range query on the heartbeat set.
+
+A queued entry is trusted for `CONFIG.execution.dsr_task_queued_timeout` seconds,
+and after that for as long as the DSR queue is backed up far enough to still hold
+it: tasks are consumed in the order they were published, so the tasks still waiting
+are the `queue length` most recently published ones. A queued entry outside both
+windows is reported as stale, since the broker may have lost or purged its message,
+and callers confirm it with the workers.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from enum import Enum
+from typing import Any, Optional, Set
+
+from loguru import logger
+
+from fides.config import CONFIG
+
+TASK_HEARTBEATS_KEY = "dsr_task_heartbeats"
+QUEUED_TASKS_KEY = "dsr_tasks_queued"
+
+_running_task_ids: Set[str] = set()
+_running_task_ids_lock = threading.Lock()
+_heartbeat_thread: Optional[threading.Thread] = None
+
+
+class TaskLiveness(Enum):
+    """What the registry knows about a Celery task."""
+
+    queued = "queued"
+    running = "running"
+    stale = "stale"
+    unknown = "unknown"
+
+
+def _get_redis() -> Any:
+    # Imported here as fides.api.util.cache depends on fides.api.tasks,
+    # which registers the Celery signal handlers that call into this module.
+    from fides.api.util.cache import get_cache
+
+    return get_cache()
+
+
+def _decode(value: Any) -> str:
+    if isinstance(value, bytes):
+        return value.decode(CONFIG.security.encoding)
+    return value
+
+
+def mark_task_queued(task_id: str) -> None:
+    """Record that a DSR task has been published to the queue."""
+    try:
+        _get_redis().zadd(QUEUED_TASKS_KEY, {task_id: time.time()})
+    except Exception as exc:
+        logger.warning("Failed to register queued task {}: {}", task_id, exc)
+
+
+def mark_task_started(task_id: str) -> None:
+    """Move a task from the queued set to the heartbeat set and start refreshing it."""
+    with _running_task_ids_lock:
+        _running_task_ids.add(task_id)
+    _ensure_heartbeat_thread()
+    try:
+        pipe = _get_redis().pipeline(transaction=False)
+        pipe.zrem(QUEUED_TASKS_KEY, task_id)
+        pipe.zadd(TASK_HEARTBEATS_KEY, {task_id: time.time()})
+        pipe.execute()
+    except Exception as exc:
+        logger.warning("Failed to register heartbeat for task {}: {}", task_id, exc)
+
+
+def mark_task_finished(task_id: str) -> None:
+    """Stop refreshing a task's heartbeat and remove it from the registry."""
+    with _running_task_ids_lock:
+        _running_task_ids.discard(task_id)
+    try:
+        _get_redis().zrem(TASK_HEARTBEATS_KEY, task_id)
+    except Exception as exc:
+        logger.warning("Failed to clear heartbeat for task {}: {}", task_id, exc)
+
+
+def send_heartbeats() -> None:
+    """Refresh the heartbeat of every task running in this process."""
+    with _running_task_ids_lock:
+        task_ids = list(_running_task_ids)
+    if not task_ids:
+        return
+    now = time.time()
+    try:
+        _get_redis().zadd(TASK_HEARTBEATS_KEY, {task_id: now for task_id in task_ids})
+    except Exception as exc:
+        logger.warning("Failed to send task heartbeats: {}", exc)
+
+
+def _heartbeat_loop() -> None:
+    while True:
+        time.sleep(CONFIG.execution.dsr_task_heartbeat_interval)
+        send_heartbeats()
+
+
+def _ensure_heartbeat_thread() -> None:
+    """
+    Start the heartbeat thread for this process if it isn't running yet.
+
+    The thread is started lazily, from within the task, so that each forked
+    worker process gets its own.
+    """
+    global _heartbeat_thread  # pylint: disable=W0603
+    with _running_task_ids_lock:
+        if _heartbeat_thread is not None and _heartbeat_thread.is_alive():
+            return
+        _heartbeat_thread = threading.Thread(
+            target=_heartbeat_loop, name="dsr-task-heartbeat", daemon=True
+        )
+        _heartbeat_thread.start()
+
+
+class TaskLivenessSnapshot:
+    """
+    The state of the registry as of a single watchdog pass.
+
+    Live and stale heartbeats are each fetched with one range query. The
+    queued set can be large when the DSR queue backs up, so it is only
+    checked per task ID, and only for tasks without a heartbeat.
+    """
+
+    def __init__(self, redis: Any, now: Optional[float] = None) -> None:
+        # Imported here for the same reason as in _get_redis
+        from fides.api.tasks import DSR_QUEUE_NAME
+
+        self._redis = redis
+        now = now if now is not None else time.time()
+        cutoff = now - CONFIG.execution.dsr_task_heartbeat_timeout
+        self._queued_cutoff = now - CONFIG.execution.dsr_task_queued_timeout
+
+        # Entries left behind by tasks that were never picked up again
+        expiry = now - CONFIG.execution.request_task_ttl
+        pipe = redis.pipeline(transaction=False)
+        pipe.zremrangebyscore(TASK_HEARTBEATS_KEY, "-inf", expiry)
+        pipe.zremrangebyscore(QUEUED_TASKS_KEY, "-inf", expiry)
+        pipe.zrangebyscore(TASK_HEARTBEATS_KEY, cutoff, "+inf")
+        pipe.zrangebyscore(TASK_HEARTBEATS_KEY, "-inf", f"({cutoff}")
+        pipe.llen(DSR_QUEUE_NAME)
+        _, _, live, stale, queue_length = pipe.execute()
+
+        self.running: Set[str] = {_decode(task_id) for task_id in live}
+        self.stale: Set[str] = {_decode(task_id) for task_id in stale}
+        self.queue_length: int = queue_length or 0
+
+    def get_liveness(self, task_id: str) -> TaskLiveness:
+        """Return what the registry knows about the given task."""
+        if task_id in self.running:
+            return TaskLiveness.running
+        if task_id in self.stale:
+            return TaskLiveness.stale
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.zscore(QUEUED_TASKS_KEY, task_id)
+            pipe.zrevrank(QUEUED_TASKS_KEY, task_id)
+            queued_at, newer_queued_count = pipe.execute()
+        except Exception as exc:
+            logger.warning("Failed to look up queued task {}: {}", task_id, exc)
+            return TaskLiveness.unknown
+        if queued_at is None:
+            return TaskLiveness.unknown
+        if queued_at >= self._queued_cutoff or newer_queued_count < self.queue_length:
+            return TaskLiveness.queued
+        return TaskLiveness.stale
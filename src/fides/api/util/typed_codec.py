@@ -0,0 +1,271 @@
+"""
+A typed codec for the DSR payloads fides caches in Redis and stores encrypted in
+the database.
+
+The ``CustomJSONEncoder`` encodes bytes, dates and ObjectIds as prefixed strings,
+so decoding its output has to run an object hook that checks every string value
+of every decoded object for those prefixes. This codec records where the typed
+values are instead. A frame is UTF-8 text, so it can be stored wherever the JSON
+was:
+
+    \\x00ftc<version>\\x00<tags>\\x00<body>
+
+* ``body`` is the JSON document, with bytes as base64, dates and datetimes in ISO
+  8601 format and ObjectIds as their hex string,
+* ``tags`` mirrors the body down to its typed values: a tag for a typed value,
+  an object of the members holding typed values, or for a list, ``[tags,
+  indexes]`` groups, so list items with typed values in the same places share
+  one entry. ``indexes`` is null if the group covers every item, and ``tags`` is
+  null if there are no typed values.
+
+Decoding parses the body with the C JSON parser and no object hook, and then only
+converts the tagged values, to the same Python types the ``_custom_decoder`` hook
+gives for the ``CustomJSONEncoder`` output of the same payload, so enabling the
+codec doesn't change what readers get:
+
+* dates, like datetimes, are decoded as datetimes, and
+* typed values which aren't object members (list items and a top-level value)
+  are decoded as the prefixed strings the object hook leaves them as.
+
+Strings which happen to start with a prefix are left alone. A JSON document
+can't start with a NUL, so ``loads`` reads the existing prefixed-string payloads
+as well.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import quote
+
+from bson.objectid import ObjectId
+
+from fides.api.util.custom_json_encoder import (
+    ENCODED_BYTES_PREFIX,
+    ENCODED_DATE_PREFIX,
+    ENCODED_MONGO_OBJECT_ID_PREFIX,
+    _custom_decoder,
+)
+
+FRAME_PREFIX = "\x00ftc"
+FRAME_SEPARATOR = "\x00"
+VERSION = 1
+
+TAG_BYTES = "b"
+TAG_DATE = "d"
+TAG_DATETIME = "dt"
+TAG_OBJECT_ID = "oid"
+
+# Decoders of the typed values which are object members
+_DECODERS: Dict[str, Callable[[Any], Any]] = {
+    TAG_BYTES: base64.b64decode,
+    TAG_DATE: datetime.fromisoformat,
+    TAG_DATETIME: datetime.fromisoformat,
+    TAG_OBJECT_ID: ObjectId,
+}
+
+# Decoders of the other typed values, to the CustomJSONEncoder's prefixed strings
+_PREFIXED_STRING_DECODERS: Dict[str, Callable[[Any], Any]] = {
+    TAG_BYTES: lambda value: f"{ENCODED_BYTES_PREFIX}{quote(base64.b64decode(value))}",
+    TAG_DATE: lambda value: f"{ENCODED_DATE_PREFIX}{value}",
+    TAG_DATETIME: lambda value: f"{ENCODED_DATE_PREFIX}{value}",
+    TAG_OBJECT_ID: lambda value: f"{ENCODED_MONGO_OBJECT_ID_PREFIX}{value}",
+}
+
+# Values json.dumps writes without calling _default. Subclasses are visited, and
+# skipped by the isinstance checks in _build_node.
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+_OBJECT_NODE = "o"
+_ARRAY_NODE = "a"
+
+# A tag, an object node of (key, node) members, or an array node of (node, indexes)
+# groups, where indexes is None if the node applies to every item
+Node = Union[str, Tuple[str, Tuple[Tuple[Any, Any], ...]]]
+
+
+def _default(o: Any) -> Any:
+    """Mirrors CustomJSONEncoder.default, with bytes as base64"""
+    if isinstance(o, Enum):
+        return o.value
+    if isinstance(o, bytes):
+        return base64.b64encode(o).decode("ascii")
+    if isinstance(o, (datetime, date)):
+        return o.isoformat()
+    if isinstance(o, ObjectId):
+        return str(o)
+    if hasattr(o, "__dict__"):
+        return o.__dict__
+    return str(o)
+
+
+_ENCODER = json.JSONEncoder(default=_default, separators=(",", ":"))
+
+
+def _get_tag(o: Any) -> Union[str, None]:
+    if isinstance(o, bytes):
+        return TAG_BYTES
+    if isinstance(o, datetime):
+        return TAG_DATETIME
+    if isinstance(o, date):
+        return TAG_DATE
+    if isinstance(o, ObjectId):
+        return TAG_OBJECT_ID
+    return None
+
+
+def _json_key(key: Any) -> Any:
+    """Returns a dict key as json.dumps writes it"""
+    if isinstance(key, str):
+        return str.__str__(key)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        return float.__repr__(key)
+    # json.dumps rejects any other key
+    return key
+
+
+def _build_node(obj: Any) -> Optional[Node]:
+    """
+    Returns the node locating the typed values in obj, or None if it has none,
+    visiting values in the same way json.dumps does with the _default function.
+    Nodes are hashable, so that list items with the same node are grouped.
+    """
+    if isinstance(obj, (str, int, float)) or obj is None:
+        return None
+    if isinstance(obj, dict):
+        members = []
+        for key, value in obj.items():
+            if type(value) not in _SCALAR_TYPES:
+                node = _build_node(value)
+                if node is not None:
+                    members.append((_json_key(key), node))
+        return (_OBJECT_NODE, tuple(members)) if members else None
+    if isinstance(obj, (list, tuple)):
+        groups: Dict[Node, List[int]] = {}
+        for index, value in enumerate(obj):
+            if type(value) not in _SCALAR_TYPES:
+                node = _build_node(value)
+                if node is not None:
+                    groups.setdefault(node, []).append(index)
+        if not groups:
+            return None
+        return (
+            _ARRAY_NODE,
+            tuple(
+                (node, None if len(indexes) == len(obj) else tuple(indexes))
+                for node, indexes in groups.items()
+            ),
+        )
+    if isinstance(obj, Enum):
+        return _build_node(obj.value)
+    tag = _get_tag(obj)
+    if tag:
+        return tag
+    return _build_node(_default(obj))
+
+
+def _node_to_json(node: Node) -> Any:
+    if isinstance(node, str):
+        return node
+    kind, children = node
+    if kind == _OBJECT_NODE:
+        return {key: _node_to_json(child) for key, child in children}
+    return [[_node_to_json(child), indexes] for child, indexes in children]
+
+
+def _restore(tags: Any, value: Any, is_member: bool = False) -> Any:
+    """
+    Decodes the typed values of a value parsed from the body. is_member is True
+    if the value is a member of an object.
+    """
+    if isinstance(tags, str):
+        decoder = (_DECODERS if is_member else _PREFIXED_STRING_DECODERS).get(tags)
+        if decoder is None:
+            raise ValueError(f"Unknown typed codec tag '{tags}'")
+        return decoder(value)
+    if isinstance(tags, dict):
+        for key, child in tags.items():
+            value[key] = _restore(child, value[key], is_member=True)
+        return value
+    for child, indexes in tags:
+        for index in range(len(value)) if indexes is None else indexes:
+            value[index] = _restore(child, value[index])
+    return value
+
+
+def _encode_header(obj: Any) -> str:
+    node = _build_node(obj)
+    tags = None if node is None else _node_to_json(node)
+    return (
+        f"{FRAME_PREFIX}{VERSION}{FRAME_SEPARATOR}"
+        f"{json.dumps(tags, separators=(',', ':'))}{FRAME_SEPARATOR}"
+    )
+
+
+def is_typed_frame(data: Union[str, bytes]) -> bool:
+    if isinstance(data, (bytes, bytearray)):
+        return data.startswith(FRAME_PREFIX.encode("ascii"))
+    return data.startswith(FRAME_PREFIX)
+
+
+def dumps(obj: Any) -> str:
+    """Encodes obj into a typed frame"""
+    return _encode_header(obj) + _ENCODER.encode(obj)
+
+
+def iter_dumps(obj: Any) -> Iterator[str]:
+    """
+    Encodes obj into a typed frame chunk by chunk, so large payloads can be written
+    out without building the whole frame in memory.
+    """
+    yield _encode_header(obj)
+    yield from _ENCODER.iterencode(obj)
+
+
+def dump(obj: Any, fp: IO[str]) -> None:
+    """Writes obj to the text file as a typed frame"""
+    for chunk in iter_dumps(obj):
+        fp.write(chunk)
+
+
+def _decode_frame(header: str, body: str) -> Any:
+    version, tags = header.split(FRAME_SEPARATOR, 1)
+    if int(version) > VERSION:
+        raise ValueError(f"Unsupported typed codec version {version}")
+
+    obj = json.loads(body)
+    tags_tree = json.loads(tags)
+    if tags_tree is None:
+        return obj
+    return _restore(tags_tree, obj)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Decodes a typed frame, or a JSON document encoded with the CustomJSONEncoder.
+    """
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8")
+    if not data.startswith(FRAME_PREFIX):
+        return json.loads(data, object_hook=_custom_decoder)
+
+    # Neither the tags nor the body can contain a NUL, JSON escapes it
+    header, body = data[len(FRAME_PREFIX) :].rsplit(FRAME_SEPARATOR, 1)
+    return _decode_frame(header, body)
+
+
+def load(fp: IO[str]) -> Any:
+    """
+    Reads a typed frame, or a JSON document encoded with the CustomJSONEncoder,
+    from the text file.
+    """
+    return loads(fp.read())
@@ -7,6 +7,9 @@ from sqlalchemy.orm import Session
 
 from fides.api.db.database import configure_db, migrate_db, reset_db
 from fides.api.deps import get_db
+from fides.api.migrations.backfill_scripts.backfill_privacyrequest_dedup_key import (
+    get_pending_dedup_key_count,
+)
 from fides.api.migrations.backfill_scripts.backfill_stagedresource_is_leaf import (
     get_pending_is_leaf_count,
 )
@@ -219,5 +222,6 @@ def get_backfill_status(
         pending_count={
             "stagedresource-is_leaf": get_pending_is_leaf_count(db),
             "stagedresourceancestor-distance": get_pending_distance_count(db),
+            "privacyrequest-dedup_key": get_pending_dedup_key_count(db),
         },
     )
@@ -20,13 +20,16 @@ from fides.api.db.crud import (
     upsert_resources,
 )
 from fides.api.db.ctl_session import get_async_db
+from fides.api.db.safe_crud import get_resources_with_custom_fields
 from fides.api.models.sql_models import ModelWithDefaultField, sql_model_map
 from fides.api.oauth.utils import verify_oauth_client_prod
+from fides.api.schemas.api import BatchResourceRequest, BatchResourceResponse
 from fides.api.util import errors
 from fides.api.util.api_router import APIRouter
 from fides.api.util.endpoint_utils import (
     API_PREFIX,
     CLI_SCOPE_PREFIX_MAPPING,
+    build_batch_resource_response,
     forbid_if_default,
     forbid_if_editing_any_is_default,
     forbid_if_editing_is_default,
@@ -46,6 +49,9 @@ def generic_router_factory(fides_model: FidesModelType, model_type: str) -> APIR
     )
     list_router = list_router_factory(fides_model=fides_model, model_type=model_type)
     get_router = get_router_factory(fides_model=fides_model, model_type=model_type)
+    batch_get_router = batch_get_router_factory(
+        fides_model=fides_model, model_type=model_type
+    )
     delete_router = delete_router_factory(
         fides_model=fides_model, model_type=model_type
     )
@@ -59,6 +65,7 @@ def generic_router_factory(fides_model: FidesModelType, model_type: str) -> APIR
     object_router.include_router(create_router)
     object_router.include_router(list_router)
     object_router.include_router(get_router)
+    object_router.include_router(batch_get_router)
     object_router.include_router(delete_router)
     object_router.include_router(update_router)
     object_router.include_router(upsert_router)
@@ -171,6 +178,44 @@ def get_router_factory(fides_model: FidesModelType, model_type: str) -> APIRoute
     return router
 
 
+def batch_get_router_factory(fides_model: FidesModelType, model_type: str) -> APIRouter:
+    """Return a configured version of a generic 'Batch Get' endpoint."""
+
+    router = APIRouter(prefix=f"{API_PREFIX}/{model_type}", tags=[fides_model.__name__])
+
+    @router.post(
+        path="/batch",
+        dependencies=[
+            Security(
+                verify_oauth_client_prod,
+                scopes=[f"{CLI_SCOPE_PREFIX_MAPPING[model_type]}:{READ}"],
+            )
+        ],
+        response_model=BatchResourceResponse,
+        name="Batch Get",
+    )
+    async def batch_get(
+        batch_request: BatchResourceRequest,
+        db: AsyncSession = Depends(get_async_db),
+    ) -> Dict:
+        """
+        Get many resources by their fides_keys in a single request.
+
+        Keys that do not exist are omitted from the response. Resources whose
+        ETag matches the one provided in `etags` are listed under `not_modified`
+        instead of being returned.
+        """
+        sql_model = sql_model_map[model_type]
+        resource_dicts = await get_resources_with_custom_fields(
+            sql_model, batch_request.fides_keys, db
+        )
+        return build_batch_resource_response(
+            fides_model, resource_dicts, batch_request.etags
+        )
+
+    return router
+
+
 def update_router_factory(fides_model: FidesModelType, model_type: str) -> APIRouter:
     """Return a configured version of a generic 'Update' route."""
 
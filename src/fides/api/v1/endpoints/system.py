@@ -22,6 +22,7 @@ from starlette.status import (
 from fides.api import deps
 from fides.api.db.crud import get_resource, get_resource_with_custom_fields
 from fides.api.db.ctl_session import get_async_db
+from fides.api.db.safe_crud import get_resources_with_custom_fields
 from fides.api.db.system import (
     create_system,
     get_system,
@@ -39,6 +40,7 @@ from fides.api.oauth.system_manager_oauth_util import (
     verify_oauth_client_for_system_from_request_body_cli,
 )
 from fides.api.oauth.utils import get_current_user, verify_oauth_client_prod
+from fides.api.schemas.api import BatchResourceRequest, BatchResourceResponse
 from fides.api.schemas.connection_configuration import connection_secrets_schemas
 from fides.api.schemas.connection_configuration.connection_config import (
     BulkPutConnectionConfiguration,
@@ -63,6 +65,7 @@ from fides.api.util.connection_util import (
     patch_connection_configs,
     update_connection_secrets,
 )
+from fides.api.util.endpoint_utils import build_batch_resource_response
 from fides.api.v1.endpoints.saas_config_endpoints import instantiate_connection
 from fides.common.scope_registry import (
     CONNECTION_CREATE_OR_UPDATE,
@@ -588,6 +591,37 @@ async def get(
     return await get_resource_with_custom_fields(System, fides_key, db)
 
 
+@SYSTEM_ROUTER.post(
+    "/batch",
+    dependencies=[
+        Security(
+            verify_oauth_client_prod,
+            scopes=[SYSTEM_READ],
+        )
+    ],
+    response_model=BatchResourceResponse,
+    name="Batch get systems",
+)
+async def batch_get(
+    batch_request: BatchResourceRequest,
+    db: AsyncSession = Depends(get_async_db),
+) -> Dict:
+    """
+    Get many Systems by their fides_keys in a single request.
+
+    Systems are serialized the same way as by the single system GET. Keys that
+    do not exist are omitted from the response. Systems whose ETag matches the
+    one provided in `etags` are listed under `not_modified` instead of being
+    returned.
+    """
+    resource_dicts = await get_resources_with_custom_fields(
+        System, batch_request.fides_keys, db
+    )
+    return build_batch_resource_response(
+        SystemResponse, resource_dicts, batch_request.etags
+    )
+
+
 @SYSTEM_CONNECTION_INSTANTIATE_ROUTER.post(
     "/",
     dependencies=[
@@ -11,53 +11,100 @@ warnings.filterwarnings("ignore", category=UserWarning, module="snowflake")
 from rich_click import Context, echo, group, option, pass_context, secho, version_option
 
 import fides
-from fides.cli.utils import check_server
 from fides.config import get_config
 
 from . import cli_formatting
-from .commands.annotate import annotate
-from .commands.db import database
-from .commands.deploy import deploy
-from .commands.generate import generate
-from .commands.pbac import pbac
-from .commands.pull import pull
-from .commands.scan import scan
-from .commands.ungrouped import (
-    delete,
-    evaluate,
-    get_resource,
-    init,
-    list_resources,
-    parse,
-    push,
-    status,
-    webserver,
-    worker,
-)
-from .commands.user import user
-from .commands.view import view
 from .exceptions import LocalModeException
+from .lazy_group import LazyCommand, LazyGroup
 
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
-LOCAL_COMMANDS = [deploy, evaluate, generate, init, pbac, scan, parse, view, webserver]
-LOCAL_COMMAND_NAMES = {command.name for command in LOCAL_COMMANDS}
-API_COMMANDS = [
-    annotate,
-    database,
-    delete,
-    get_resource,
-    list_resources,
-    status,
-    pull,
-    push,
-    worker,
-    user,
-]
-ALL_COMMANDS = API_COMMANDS + LOCAL_COMMANDS
+# Commands are imported when they're invoked, see LazyGroup
+LOCAL_COMMANDS = {
+    "deploy": LazyCommand(
+        "fides.cli.commands.deploy:deploy",
+        "Deploy a sample project locally to try out Fides.",
+    ),
+    "evaluate": LazyCommand(
+        "fides.cli.commands.ungrouped:evaluate",
+        "Evaluate System-level Privacy Declarations against Organization-level "
+        "Policy Rules.",
+    ),
+    "generate": LazyCommand(
+        "fides.cli.commands.generate:generate",
+        "Programmatically generate Fides objects.",
+    ),
+    "init": LazyCommand(
+        "fides.cli.commands.ungrouped:init",
+        "Initializes a Fides instance by creating the default directory and "
+        "configuration file if not present.",
+    ),
+    "pbac": LazyCommand(
+        "fides.cli.commands.pbac:pbac",
+        "Policy-Based Access Control evaluation commands.",
+    ),
+    "scan": LazyCommand(
+        "fides.cli.commands.scan:scan",
+        "Scan and report on discrepancies between Fides resource files and real "
+        "infrastructure.",
+    ),
+    "parse": LazyCommand(
+        "fides.cli.commands.ungrouped:parse",
+        "Parse all Fides objects located in the supplied directory.",
+    ),
+    "view": LazyCommand(
+        "fides.cli.commands.view:view", "View various resources types."
+    ),
+    "webserver": LazyCommand(
+        "fides.cli.commands.ungrouped:webserver", "Start the Fides webserver."
+    ),
+}
+LOCAL_COMMAND_NAMES = set(LOCAL_COMMANDS)
+API_COMMANDS = {
+    "annotate": LazyCommand(
+        "fides.cli.commands.annotate:annotate",
+        "Interactively annotate Fides resources.",
+    ),
+    "db": LazyCommand(
+        "fides.cli.commands.db:database",
+        "Run actions against the application database.",
+    ),
+    "delete": LazyCommand(
+        "fides.cli.commands.ungrouped:delete", "Delete an object from the server."
+    ),
+    "get": LazyCommand(
+        "fides.cli.commands.ungrouped:get_resource", "View an object from the server."
+    ),
+    "ls": LazyCommand(
+        "fides.cli.commands.ungrouped:list_resources",
+        "View all objects of a single type from the server.",
+    ),
+    "status": LazyCommand(
+        "fides.cli.commands.ungrouped:status", "Check Fides server availability."
+    ),
+    "pull": LazyCommand(
+        "fides.cli.commands.pull:pull",
+        "Update local resource files based on the state of the objects on the server.",
+    ),
+    "push": LazyCommand(
+        "fides.cli.commands.ungrouped:push",
+        "Parse local manifest files and upload them to the server.",
+    ),
+    "worker": LazyCommand(
+        "fides.cli.commands.ungrouped:worker",
+        "Start a Celery worker for the Fides webserver.",
+    ),
+    "user": LazyCommand(
+        "fides.cli.commands.user:user",
+        "Click command group for interacting with user-related functionality.",
+    ),
+}
+ALL_COMMANDS = {**API_COMMANDS, **LOCAL_COMMANDS}
 VERSION = fides.__version__
 
 
 @group(  # type: ignore
+    cls=LazyGroup,
+    lazy_commands=ALL_COMMANDS,
     context_settings=CONTEXT_SETTINGS,
     invoke_without_command=True,
     name="fides",
@@ -103,8 +150,3 @@ def cli(ctx: Context, config_path: str, local: bool) -> None:
 
     # Setting the config context after all mutations
     ctx.obj["CONFIG"] = config
-
-
-# Add all commands here before dynamically checking them in the CLI
-for cli_command in ALL_COMMANDS:
-    cli.add_command(cli_command)
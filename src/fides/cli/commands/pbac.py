@@ -8,6 +8,7 @@ Python handles only:
 
 Commands:
   fides pbac evaluate          — Full pipeline: YAML fixtures + SQL + identity
+  fides pbac evaluate --batch  — Full pipeline over a JSONL query log
   fides pbac evaluate-purpose  — Purpose-overlap primitive (JSON in)
   fides pbac evaluate-policies — Access-policy primitive (JSON in)
 """
@@ -16,13 +17,15 @@ from __future__ import annotations
 
 import json
 import sys
+from itertools import islice
 from pathlib import Path
-from typing import TextIO
+from typing import Any, Iterator, TextIO
 
 import rich_click as click
 
 from fides.service.pbac.engine import (
     evaluate_pipeline,
+    evaluate_pipeline_batch,
     evaluate_policies,
     evaluate_purpose,
     load_fixtures,
@@ -34,6 +37,56 @@ def _qualified_name(catalog: str, schema: str, table: str) -> str:
     return ".".join(part for part in (catalog, schema, table) if part)
 
 
+def _table_refs(stmt: Any) -> list[dict[str, str]]:
+    """Extract the pipeline's table references from a parsed sqlglot statement."""
+    import sqlglot.expressions as exp
+
+    return [
+        {
+            "collection": t.name,
+            "qualified_name": _qualified_name(t.catalog, t.db, t.name),
+        }
+        for t in stmt.find_all(exp.Table)
+        if t.name
+    ]
+
+
+def _batch_queries(
+    input_file: TextIO, default_identity: str | None
+) -> Iterator[dict[str, Any]]:
+    """Yield pipeline inputs from a JSONL query log, one per SQL statement.
+
+    Each line is {"query_text": ..., "identity": ..., "query_id": ...};
+    identity falls back to --identity and query_id to the line number.
+    Lines that fail to parse are reported on stderr and skipped.
+    """
+    import sqlglot
+
+    for line_number, line in enumerate(input_file, start=1):
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+            statements = sqlglot.parse(entry["query_text"])
+        except Exception as e:  # noqa: BLE001
+            click.echo(f"Skipping line {line_number}: {e}", err=True)
+            continue
+        identity = entry.get("identity") or default_identity
+        if not identity:
+            click.echo(f"Skipping line {line_number}: no identity", err=True)
+            continue
+        query_id = str(entry.get("query_id") or f"q{line_number}")
+        for stmt in statements:
+            if stmt is None:
+                continue
+            yield {
+                "query_id": query_id,
+                "identity": identity,
+                "query_text": stmt.sql(),
+                "tables": _table_refs(stmt),
+            }
+
+
 @click.group(name="pbac")
 @click.pass_context
 def pbac(ctx: click.Context) -> None:
@@ -58,11 +111,37 @@ def pbac(ctx: click.Context) -> None:
 )
 @click.option(
     "--identity",
-    required=True,
-    help="Caller identity (typically email). Looked up against consumer members.",
+    required=False,
+    help=(
+        "Caller identity (typically email). Looked up against consumer members. "
+        "Required unless --batch is set, where it is the default for entries "
+        "without an identity."
+    ),
+)
+@click.option(
+    "--batch",
+    is_flag=True,
+    default=False,
+    help=(
+        "Read a JSONL query log (one {query_text, identity, query_id} object per "
+        "line) and write one JSON evaluation record per line."
+    ),
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=1000,
+    show_default=True,
+    help="Number of statements evaluated per engine call in --batch mode.",
 )
 @click.argument("input_file", type=click.File("r"), default="-", required=False)
-def evaluate_cmd(config_dir: Path, identity: str, input_file: TextIO) -> None:
+def evaluate_cmd(
+    config_dir: Path,
+    identity: str | None,
+    batch: bool,
+    chunk_size: int,
+    input_file: TextIO,
+) -> None:
     """Run the full PBAC pipeline over SQL with YAML fixtures.
 
     Reads SQL from INPUT_FILE (or stdin), parses each statement with
@@ -70,6 +149,10 @@ def evaluate_cmd(config_dir: Path, identity: str, input_file: TextIO) -> None:
     (identity resolution, dataset resolution, purpose evaluation, gap
     reclassification, policy filtering) via the Go evaluation library.
 
+    With --batch, INPUT_FILE is a JSONL query log. Statements are
+    evaluated in chunks with one engine call per chunk, and records are
+    streamed to stdout as JSONL.
+
     \b
     Example:
       fides pbac evaluate \\
@@ -78,9 +161,10 @@ def evaluate_cmd(config_dir: Path, identity: str, input_file: TextIO) -> None:
         pbac/entries/alice.txt
     """
     import sqlglot
-    import sqlglot.expressions as exp
 
-    sql_text = input_file.read()
+    if not batch and not identity:
+        click.echo("Error: --identity is required unless --batch is set", err=True)
+        sys.exit(1)
 
     try:
         fixtures = load_fixtures(config_dir)
@@ -88,6 +172,15 @@ def evaluate_cmd(config_dir: Path, identity: str, input_file: TextIO) -> None:
         click.echo(f"Error loading fixtures: {e}", err=True)
         sys.exit(1)
 
+    if batch:
+        queries = _batch_queries(input_file, identity)
+        while chunk := list(islice(queries, chunk_size)):
+            for record in evaluate_pipeline_batch(fixtures, chunk):
+                click.echo(json.dumps(record))
+        return
+
+    sql_text = input_file.read()
+
     try:
         statements = sqlglot.parse(sql_text)
     except Exception as e:  # noqa: BLE001
@@ -98,22 +191,13 @@ def evaluate_cmd(config_dir: Path, identity: str, input_file: TextIO) -> None:
     for idx, stmt in enumerate(statements):
         if stmt is None:
             continue
-        stmt_text = stmt.sql()
-        tables = [
-            {
-                "collection": t.name,
-                "qualified_name": _qualified_name(t.catalog, t.db, t.name),
-            }
-            for t in stmt.find_all(exp.Table)
-            if t.name
-        ]
         record = evaluate_pipeline(
             fixtures,
             query={
                 "query_id": f"q{idx + 1}",
                 "identity": identity,
-                "query_text": stmt_text,
-                "tables": tables,
+                "query_text": stmt.sql(),
+                "tables": _table_refs(stmt),
             },
         )
         records.append(record)
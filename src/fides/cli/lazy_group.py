@@ -0,0 +1,78 @@
+"""
+A Click group which only imports its commands when they're invoked.
+
+The command modules import the SQLAlchemy models, schemas and connectors they
+need, so importing all of them made every invocation of the CLI, even `fides
+--help`, pay for the imports of every command.
+"""
+
+from importlib import import_module
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from rich_click import (
+    Command,
+    Context,
+    RichCommand,
+    RichContext,
+    RichGroup,
+    RichHelpFormatter,
+)
+
+
+class LazyCommand(NamedTuple):
+    """Where to import a command from, as `module:attribute`, and its summary."""
+
+    import_path: str
+    summary: str
+
+
+class LazyGroup(RichGroup):
+    """
+    A group whose commands are registered by name and imported on first use.
+
+    While the group's help is formatted, commands which haven't been imported are
+    stood in for by placeholders with their summary, as rich-click lists the
+    group's commands rather than calling get_command.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_commands: Optional[Dict[str, LazyCommand]] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: Context) -> List[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(  # type: ignore[override]
+        self, ctx: RichContext, cmd_name: str
+    ) -> Optional[Command]:
+        if cmd_name in self.commands or cmd_name not in self.lazy_commands:
+            return super().get_command(ctx, cmd_name)
+        return self.load_command(cmd_name)
+
+    def load_command(self, cmd_name: str) -> Command:
+        """Imports a lazily registered command and adds it to the group."""
+        module_name, attribute = self.lazy_commands[cmd_name].import_path.split(":")
+        command = getattr(import_module(module_name), attribute)
+        self.add_command(command, cmd_name)
+        return command
+
+    def format_help(  # type: ignore[override]
+        self, ctx: RichContext, formatter: RichHelpFormatter
+    ) -> None:
+        placeholders = {
+            name: RichCommand(name=name, help=lazy_command.summary)
+            for name, lazy_command in self.lazy_commands.items()
+            if name not in self.commands
+        }
+        self.commands.update(placeholders)
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            for name, placeholder in placeholders.items():
+                if self.commands.get(name) is placeholder:
+                    del self.commands[name]
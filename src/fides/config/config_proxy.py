@@ -7,7 +7,7 @@ from pydantic import SerializeAsAny
 from sqlalchemy.orm import Session
 
 from fides.api.custom_types import AnyHttpUrlStringRemovesSlash, URLOriginString
-from fides.api.models.application_config import ApplicationConfig
+from fides.api.models.application_config import get_resolved_config_property
 from fides.api.schemas.storage.storage import StorageType
 from fides.api.util.cors_middleware_utils import update_cors_middleware
 from fides.config import CONFIG
@@ -65,7 +65,7 @@ class ConfigProxyBase:
     prefix: str
     merge_properties: Set[str] = set()
 
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: Optional[Session] = None) -> None:
         self._db = db
 
     def __getattribute__(self, __name: str) -> Any:
@@ -76,7 +76,7 @@ class ConfigProxyBase:
         """
         if __name in ("_db", "merge_properties", "prefix"):
             return object.__getattribute__(self, __name)
-        return ApplicationConfig.get_resolved_config_property(
+        return get_resolved_config_property(
             self._db,
             f"{self.prefix}.{__name}",
             merge_values=__name in self.merge_properties,
@@ -173,20 +173,17 @@ class ConfigProxy:
     as if they were a "normal" pydantic config object, i.e. with dot notation,
     e.g. `ConfigProxy(db).notifications.notification_service_type`
 
-    To instantiate a `ConfigProxy`, you must have an active db `Session`,
-    since the `ConfigProxy` will rely on the db for property resolution.
-
     Instantiating a `ConfigProxy` is itself a cheap operation,
     i.e. there is minimal resource overhead with instantiating a new `ConfigProxy`.
-    The `ConfigProxy` is a thin wrapper above the given db `Session` -
-    it relies on the given db `Session` and for all of its state.
 
-    Lookups (i.e. attribute access) with the `ConfigProxy` do leverage
-    the underlying ORM model, but any db calls that are needed should be straightforward -
-    it leverages only a fixed single-row table holding the config state.
+    Lookups (i.e. attribute access) with the `ConfigProxy` are resolved against
+    a process-wide snapshot of the single-row table holding the config state
+    (see `ApplicationConfigSnapshot`), so they don't query the db unless the
+    snapshot is out of date. The given db `Session`, if any, is used to reload it;
+    otherwise a session is opened only when needed.
     """
 
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: Optional[Session] = None) -> None:
         self.admin_ui = AdminUISettingsProxy(db)
         self.notifications = NotificationSettingsProxy(db)
         self.execution = ExecutionSettingsProxy(db)
@@ -49,6 +49,18 @@ class ExecutionSettings(FidesSettings):
         default=604800,
         description="The number of seconds a request task should live.",
     )
+    dsr_data_removal_batch_size: int = Field(
+        default=1000,
+        description="The number of request tasks or privacy requests cleaned up per transaction by the DSR data removal job",
+    )
+    dsr_data_removal_batch_delay: float = Field(
+        default=0.5,
+        description="Seconds to sleep between batches of the DSR data removal job, to limit its impact on other database work",
+    )
+    dsr_data_removal_storage_workers: int = Field(
+        default=8,
+        description="The number of external storage files the DSR data removal job deletes concurrently",
+    )
     state_polling_interval: int = Field(
         default=30,
         description="Seconds between polling for Privacy Requests that should change state",
@@ -57,6 +69,18 @@ class ExecutionSettings(FidesSettings):
         default=300,
         description="Seconds between polling for interrupted tasks to requeue",
     )
+    dsr_task_heartbeat_interval: int = Field(
+        default=30,
+        description="Seconds between heartbeats sent by workers for the DSR tasks they are running",
+    )
+    dsr_task_heartbeat_timeout: int = Field(
+        default=300,
+        description="Seconds without a heartbeat after which a running DSR task is considered interrupted",
+    )
+    dsr_task_queued_timeout: int = Field(
+        default=1800,
+        description="Seconds after being published for which a queued DSR task is assumed to still be in the queue. After that, a queued task is only assumed to be in the queue while the queue is long enough to still hold it; otherwise it is looked up in the workers, in case its message was lost or purged",
+    )
     privacy_request_requeue_retry_count: int = Field(
         default=3,
         description="The number of times a privacy request will be requeued when its tasks are interrupted before being marked as error",
@@ -69,6 +93,18 @@ class ExecutionSettings(FidesSettings):
         default=30,
         description="Maximum time in days to wait for an async polling request to complete before timing out",
     )
+    async_polling_dispatch_interval_seconds: int = Field(
+        default=60,
+        description="Seconds between runs of the async polling dispatcher, which checks the status of the sub-requests that are due and queues the tasks whose results are ready",
+    )
+    async_polling_min_check_interval_seconds: int = Field(
+        default=300,
+        description="Seconds to wait before the first status check of an async polling sub-request. The wait doubles after every check that isn't ready, up to async_polling_interval_hours, unless the vendor asks for a different delay",
+    )
+    async_polling_connector_concurrency: int = Field(
+        default=5,
+        description="The maximum number of concurrent status checks the async polling dispatcher sends to a single connection",
+    )
     erasure_request_finalization_required: bool = Field(
         default=False,
         description="Whether erasure requests require an additional finalization step after all collections have been executed.",
@@ -85,10 +121,30 @@ class ExecutionSettings(FidesSettings):
         default="US/Eastern",
         description="The timezone to send batch emails for DSR email integration.",
     )
+    email_send_batch_size: int = Field(
+        default=1000,
+        description="The number of privacy requests awaiting email send that the batch email send processes, and checkpoints, at a time. Each email connector sends one email per batch.",
+    )
+    mongodb_cursor_batch_size: int = Field(
+        default=1000,
+        description="The number of documents the MongoDB connector fetches per round trip while streaming the results of a query.",
+    )
     memory_watchdog_enabled: bool = Field(
         default=False,
         description="Whether the memory watchdog is enabled to monitor and gracefully terminate tasks that approach memory limits.",
     )
+    use_typed_payload_codec: bool = Field(
+        default=False,
+        description="When enabled, DSR payloads cached in Redis and stored encrypted in the database are written with the typed payload codec rather than as JSON with prefixed strings, which makes large access results faster to read back. Payloads in either format are always readable, but workers running an older version of fides can't read the typed payloads.",
+    )
+    coalesce_execution_logs: bool = Field(
+        default=False,
+        description="When enabled, the execution logs of a privacy request node's starting and retrying transitions are buffered and written in one batched insert along with its next transition, rather than each in their own commit. The node's request task status isn't written for those transitions either, as the worker's heartbeat tells that it's running. Buffered logs are stamped with the worker's clock. Terminal and pausing transitions are always written right away, but the buffered logs of a worker which crashes mid-node are lost.",
+    )
+    saas_connector_template_index_path: str = Field(
+        default="~/.fides/cache/saas_connector_template_index.json",
+        description="The path of the on-disk index of the bundled SaaS connector templates, which caches the header and version of each template so they aren't loaded at startup unless they changed. The index is signed with the app encryption key, and its directory is created readable by its owner only.",
+    )
     use_legacy_traversal: bool = Field(
         default=False,
         description="When enabled, falls back to the legacy traversal algorithm. Intended as a temporary safety net in case of regressions with the optimized traversal.",
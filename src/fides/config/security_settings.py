@@ -95,6 +95,14 @@ class SecuritySettings(FidesSettings):
         default=11520,
         description="The time in minutes for which Fides API tokens will be valid. Default value is equal to 8 days.",
     )
+    oauth_verified_token_cache_size: int = Field(
+        default=10000,
+        description="The maximum number of verified API access tokens each server process caches, so that repeated requests with the same token don't decrypt it and load its client again. Set to 0 to disable the cache.",
+    )
+    oauth_verified_token_cache_ttl_seconds: int = Field(
+        default=60,
+        description="The number of seconds a verified API access token is served from the cache before it is verified again. This bounds how long a revoked token can remain usable on another server if its revocation can't be broadcast through Redis. Set to 0 to disable the cache.",
+    )
     oauth_client_id_length_bytes: int = Field(
         default=16,
         description="Sets desired length in bytes of generated client id used for oauth.",
@@ -172,6 +180,14 @@ class SecuritySettings(FidesSettings):
         default=False,
         description="Either enables the collection of audit log resource data or bypasses the middleware",
     )
+    audit_log_resource_queue_size: int = Field(
+        default=10000,
+        description="The maximum number of audit log resource records waiting to be written. Requests wait for room in the queue once it's full.",
+    )
+    audit_log_resource_batch_size: int = Field(
+        default=500,
+        description="The maximum number of queued audit log resource records written in a single insert.",
+    )
 
     password_reset_token_ttl_minutes: int = Field(
         default=30,
@@ -44,6 +44,27 @@ def get(
     return requests.get(resource_url, headers=headers)
 
 
+def batch_get(
+    url: str,
+    resource_type: str,
+    fides_keys: List[str],
+    headers: Dict[str, str],
+    etags: Optional[Dict[str, str]] = None,
+) -> requests.Response:
+    """
+    Get many resources by their ids in a single request.
+
+    Resources whose ETag matches the one provided in `etags` are
+    reported as not modified instead of being returned.
+    """
+    resource_url = generate_resource_url(url, resource_type) + "batch"
+    return requests.post(
+        resource_url,
+        headers=headers,
+        json={"fides_keys": fides_keys, "etags": etags or {}},
+    )
+
+
 def create(
     url: str, resource_type: str, json_resource: str, headers: Dict[str, str]
 ) -> requests.Response:
@@ -2,6 +2,7 @@
 Reusable utilities meant to make repetitive api-related tasks easier.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
 from fideslang.models import FidesModel
@@ -11,6 +12,11 @@ from requests import Response
 
 from fides.common.utils import check_response_auth
 from fides.core import api
+from fides.core.resource_cache import ResourceCache
+
+# The number of keys requested per batch call, and how many batch calls may be in flight at once
+BATCH_SIZE = 100
+MAX_BATCH_WORKERS = 8
 
 
 def get_server_resources(
@@ -23,30 +29,105 @@ def get_server_resources(
     Get a list of resources from the server that match the provided keys.
 
     If the resource does not exist on the server, an error will _not_ be thrown.
-    Instead, an empty object will be stored and then filtered out.
+    Instead, the resource is left out of the returned list.
     """
-    raw_server_resources = list(
-        filter(
-            None,
-            [
-                get_server_resource(
-                    url=url,
-                    resource_type=resource_type,
-                    resource_key=key,
-                    headers=headers,
-                )
-                for key in existing_keys
-            ],
-        )
+    raw_server_resources = get_server_resource_dicts(
+        url=url,
+        resource_type=resource_type,
+        resource_keys=existing_keys,
+        headers=headers,
     )
     server_resources: List[FidesModel] = [
         parse_dict(resource_type=resource_type, resource=resource, from_server=True)
-        for resource in raw_server_resources
+        for resource in raw_server_resources.values()
     ]
 
     return server_resources
 
 
+def get_server_resource_dicts(
+    url: str,
+    resource_type: str,
+    resource_keys: List[str],
+    headers: Dict[str, str],
+    use_cache: bool = True,
+) -> Dict[str, Dict]:
+    """
+    Get the raw resources from the server that match the provided keys, by fides_key.
+
+    Keys are requested in concurrent batches. Unless `use_cache` is False, the ETags of
+    previously fetched resources are sent along so that only resources that changed
+    since the last run are transferred; the rest are served from the local cache.
+
+    Falls back to one request per key against servers without batch support.
+    Keys that do not exist on the server are left out of the result.
+    """
+    unique_keys = list(dict.fromkeys(resource_keys))
+    if not unique_keys:
+        return {}
+
+    cache = (
+        ResourceCache(url, resource_type, credentials=headers.get("Authorization", ""))
+        if use_cache
+        else None
+    )
+    chunks = [
+        unique_keys[i : i + BATCH_SIZE] for i in range(0, len(unique_keys), BATCH_SIZE)
+    ]
+
+    def fetch_batch(chunk: List[str]) -> Optional[Dict]:
+        response: Response = check_response_auth(
+            api.batch_get(
+                url=url,
+                resource_type=resource_type,
+                fides_keys=chunk,
+                headers=headers,
+                etags=cache.etags(chunk) if cache else None,
+            )
+        )
+        if not 200 <= response.status_code <= 299 or not response.content:
+            return None
+        return response.json()
+
+    with ThreadPoolExecutor(max_workers=min(MAX_BATCH_WORKERS, len(chunks))) as pool:
+        batch_responses: List[Dict] = [
+            batch_response
+            for batch_response in pool.map(fetch_batch, chunks)
+            if batch_response
+        ]
+
+    # Servers without batch support, or returning no body, are queried key by key
+    if len(batch_responses) < len(chunks):
+        fetched = {
+            key: get_server_resource(
+                url=url, resource_type=resource_type, resource_key=key, headers=headers
+            )
+            for key in unique_keys
+        }
+        return {key: resource for key, resource in fetched.items() if resource}
+
+    resources: Dict[str, Dict] = {}
+    for chunk, batch_response in zip(chunks, batch_responses):
+        for resource in batch_response["resources"]:
+            fides_key = resource["fides_key"]
+            resources[fides_key] = resource
+            if cache:
+                cache.set(fides_key, batch_response["etags"][fides_key], resource)
+        for fides_key in batch_response["not_modified"]:
+            cached = cache.get(fides_key) if cache else None
+            if cached:
+                resources[fides_key] = cached
+        if cache:
+            for fides_key in chunk:
+                if fides_key not in batch_response["etags"]:
+                    cache.discard(fides_key)
+
+    if cache:
+        cache.save()
+
+    return {key: resources[key] for key in unique_keys if resources.get(key)}
+
+
 def get_server_resource(
     url: str,
     resource_type: str,
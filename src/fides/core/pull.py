@@ -7,7 +7,11 @@ from fideslang import model_list
 from fideslang.manifests import load_yaml_into_dict
 
 from fides.common.utils import echo_green, echo_red, print_divider
-from fides.core.api_helpers import get_server_resource, list_server_resources
+from fides.core.api_helpers import (
+    get_server_resource,
+    get_server_resource_dicts,
+    list_server_resources,
+)
 from fides.core.utils import get_manifest_list
 
 MODEL_LIST = model_list
@@ -68,14 +72,18 @@ def pull_existing_resources(
         for resource_type in manifest.keys():
             resource_list = manifest[resource_type]
             updated_resource_list = []
+            server_resources = get_server_resource_dicts(
+                url=url,
+                resource_type=resource_type,
+                resource_keys=[resource["fides_key"] for resource in resource_list],
+                headers=headers,
+            )
 
             for resource in resource_list:
                 fides_key = resource["fides_key"]
                 existing_keys.append(fides_key)
 
-                server_resource = get_server_resource(
-                    url, resource_type, fides_key, headers
-                )
+                server_resource = server_resources.get(fides_key)
 
                 if server_resource:
                     # Remove null values from the server resource
@@ -0,0 +1,92 @@
+"""
+A local, on-disk cache of server resources keyed by their ETags.
+
+The CLI sends the cached ETags along with batch requests so that the server
+only transfers resources that changed since the last run.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional
+
+DEFAULT_RESOURCE_CACHE_DIR = os.path.join(".fides", "cache", "resources")
+
+
+class ResourceCache:
+    """
+    Stores the last known version of each resource of a single type, as seen by a
+    single user of a single server.
+
+    Each (server, credentials, resource type) combination is kept in its own JSON
+    file of the form `{fides_key: {"etag": ..., "resource": ...}}`, readable only by
+    the current OS user. Resources are only shared by callers presenting the same
+    credentials, so logging in again starts from an empty cache. Any error reading
+    or writing the cache is swallowed, as the cache is only ever an optimization.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        resource_type: str,
+        credentials: str = "",
+        cache_dir: str = DEFAULT_RESOURCE_CACHE_DIR,
+    ) -> None:
+        scope_digest = hashlib.sha256(
+            f"{url}\n{credentials}".encode("utf-8")
+        ).hexdigest()[:32]
+        self.path = os.path.join(cache_dir, scope_digest, f"{resource_type}.json")
+        self._entries: Dict[str, Dict] = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as cache_file:
+                entries = json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def etags(self, fides_keys: List[str]) -> Dict[str, str]:
+        """Return the cached ETags of any of the given keys that are cached."""
+        return {
+            key: self._entries[key]["etag"]
+            for key in fides_keys
+            if key in self._entries
+        }
+
+    def get(self, fides_key: str) -> Optional[Dict]:
+        """Return the cached copy of a resource, if there is one."""
+        entry = self._entries.get(fides_key)
+        return entry["resource"] if entry else None
+
+    def set(self, fides_key: str, etag: str, resource: Dict) -> None:
+        """Cache the latest copy of a resource."""
+        self._entries[fides_key] = {"etag": etag, "resource": resource}
+        self._dirty = True
+
+    def discard(self, fides_key: str) -> None:
+        """Drop a resource that no longer exists on the server."""
+        if self._entries.pop(fides_key, None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache back out to disk if anything changed."""
+        if not self._dirty:
+            return
+        try:
+            cache_dir = os.path.dirname(self.path)
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            os.chmod(cache_dir, 0o700)
+            temp_path = f"{self.path}.tmp"
+            file_descriptor = os.open(
+                temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+            )
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as cache_file:
+                json.dump(self._entries, cache_file)
+            # In case the temporary file was left behind with other permissions
+            os.chmod(temp_path, 0o600)
+            os.replace(temp_path, self.path)
+        except OSError:
+            return
+        self._dirty = False
@@ -0,0 +1 @@
+"""Scheduled maintenance of discovery monitor data."""
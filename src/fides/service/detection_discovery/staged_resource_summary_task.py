@@ -0,0 +1,70 @@
+"""Celery task and scheduler wiring for reconciling staged resource summaries.
+
+The ``stagedresourcesummary`` rollup is kept up to date by triggers on
+``stagedresource``. The ``reconcile_staged_resource_summaries_task`` recounts it
+nightly and fixes any drift, e.g. after the triggers were disabled for a bulk
+load.
+"""
+
+from loguru import logger
+
+from fides.api.models.detection_discovery.staged_resource_summary import (
+    reconcile_staged_resource_summaries,
+)
+from fides.api.tasks import DatabaseTask, celery_app
+from fides.api.tasks.scheduled.scheduler import scheduler
+from fides.api.util.lock import redis_lock
+from fides.config import CONFIG
+
+STAGED_RESOURCE_SUMMARY_RECONCILIATION_JOB = "staged_resource_summary_reconciliation"
+STAGED_RESOURCE_SUMMARY_RECONCILIATION_LOCK = (
+    "staged_resource_summary_reconciliation_lock"
+)
+STAGED_RESOURCE_SUMMARY_RECONCILIATION_LOCK_TIMEOUT = 3600
+
+
+@celery_app.task(base=DatabaseTask, bind=True)
+def reconcile_staged_resource_summaries_task(self: DatabaseTask) -> None:
+    """Recount the staged resource summaries and fix any drift.
+
+    Acquires a Redis lock so that only one reconciliation runs at a time.
+    """
+    with redis_lock(
+        STAGED_RESOURCE_SUMMARY_RECONCILIATION_LOCK,
+        STAGED_RESOURCE_SUMMARY_RECONCILIATION_LOCK_TIMEOUT,
+    ) as lock:
+        if not lock:
+            logger.info("Staged resource summary reconciliation already running")
+            return
+
+        with self.get_new_session() as db:
+            reconcile_staged_resource_summaries(db)
+
+
+def initiate_staged_resource_summary_reconciliation() -> None:
+    """Add the staged resource summary reconciliation job to the APScheduler.
+
+    Called during application startup from ``main.py``.  Skipped in
+    test mode.
+    """
+    if CONFIG.test_mode:
+        return
+
+    assert scheduler.running, (
+        "Scheduler is not running! Cannot add staged resource summary "
+        "reconciliation job."
+    )
+
+    logger.info("Initiating scheduler for staged resource summary reconciliation")
+    scheduler.add_job(
+        func=reconcile_staged_resource_summaries_task,
+        kwargs={},
+        id=STAGED_RESOURCE_SUMMARY_RECONCILIATION_JOB,
+        coalesce=True,
+        replace_existing=True,
+        trigger="cron",
+        minute="30",
+        hour="3",
+        day="*",
+        timezone="US/Eastern",
+    )
@@ -128,12 +128,16 @@ class AWS_SES_Service:
         to: str,
         subject: str,
         body: str,
+        validate: bool = True,
     ) -> None:
         """
         Send an email using AWS SES.
         Either `email_from` or `domain` must be verified in SES.
+
+        Batch senders validate the identities once and then pass `validate=False`.
         """
-        self.validate_email_and_domain_status()
+        if validate:
+            self.validate_email_and_domain_status()
         ses_client = self.get_ses_client()
 
         from_address = self.messaging_config_details.email_from
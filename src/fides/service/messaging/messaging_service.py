@@ -1,5 +1,6 @@
 import secrets
-from typing import Optional, Set, Union
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Union
 
 from loguru import logger
 from pydantic import BaseModel, ValidationError
@@ -40,6 +41,7 @@ from fides.api.schemas.policy import ActionType
 from fides.api.schemas.redis_cache import Identity
 from fides.api.service.messaging.message_dispatch_service import (
     EMAIL_JOIN_STRING,
+    dispatch_message_batch_task,
     dispatch_message_task,
     get_email_messaging_config_service_type,
     message_send_enabled,
@@ -49,6 +51,9 @@ from fides.api.util.logger import Pii
 from fides.config import FidesConfig
 from fides.config.config_proxy import ConfigProxy
 
+# Messages per batch message dispatch task
+MESSAGE_BATCH_SIZE = 500
+
 
 class MessageDispatchParams(BaseModel):
     message_meta: Optional[FidesopsMessage]
@@ -137,76 +142,106 @@ class MessagingService:
         )
 
     def send_request_approved(self, privacy_request: PrivacyRequest) -> None:
-        if message_send_enabled(
-            self.db,
-            privacy_request.property_id,
-            MessagingActionType.PRIVACY_REQUEST_REVIEW_APPROVE,
-            self.config_proxy.notifications.send_request_review_notification,
-        ):
-            identity_data = privacy_request.get_cached_identity_data()
-            if not identity_data:
-                logger.error(
-                    IdentityNotFoundException(
-                        "Identity was not found, so request review message could not be sent."
-                    )
-                )
-                return
-
-            to_identity = Identity(
-                email=identity_data.get(ProvidedIdentityType.email.value),
-                phone_number=identity_data.get(ProvidedIdentityType.phone_number.value),
-            )
-
-            dispatch_message_task.apply_async(
-                queue=MESSAGING_QUEUE_NAME,
-                kwargs=MessageDispatchParams(
-                    message_meta=FidesopsMessage(
-                        action_type=MessagingActionType.PRIVACY_REQUEST_REVIEW_APPROVE,
-                        body_params=None,
-                    ),
-                    service_type=self.config_proxy.notifications.notification_service_type,
-                    to_identity=to_identity,
-                    property_id=privacy_request.property_id,
-                ).model_dump(mode="json"),
-            )
+        self.send_requests_approved([privacy_request])
 
     def send_request_denied(
         self, privacy_request: PrivacyRequest, deny_reason: Optional[str] = None
     ) -> None:
-        if message_send_enabled(
-            self.db,
-            privacy_request.property_id,
-            MessagingActionType.PRIVACY_REQUEST_REVIEW_DENY,
-            self.config_proxy.notifications.send_request_review_notification,
-        ):
-            identity_data = privacy_request.get_cached_identity_data()
-            if not identity_data:
-                logger.error(
-                    IdentityNotFoundException(
-                        "Identity was not found, so request review message could not be sent."
-                    )
-                )
-                return
+        self.send_requests_denied([privacy_request], deny_reason)
+
+    def send_requests_approved(self, privacy_requests: List[PrivacyRequest]) -> None:
+        self._send_request_review_messages(
+            privacy_requests,
+            FidesopsMessage(
+                action_type=MessagingActionType.PRIVACY_REQUEST_REVIEW_APPROVE,
+                body_params=None,
+            ),
+        )
 
-            to_identity = Identity(
-                email=identity_data.get(ProvidedIdentityType.email.value),
-                phone_number=identity_data.get(ProvidedIdentityType.phone_number.value),
-            )
+    def send_requests_denied(
+        self,
+        privacy_requests: List[PrivacyRequest],
+        deny_reason: Optional[str] = None,
+    ) -> None:
+        self._send_request_review_messages(
+            privacy_requests,
+            FidesopsMessage(
+                action_type=MessagingActionType.PRIVACY_REQUEST_REVIEW_DENY,
+                body_params=RequestReviewDenyBodyParams(rejection_reason=deny_reason),
+            ),
+        )
 
-            dispatch_message_task.apply_async(
-                queue=MESSAGING_QUEUE_NAME,
-                kwargs=MessageDispatchParams(
-                    message_meta=FidesopsMessage(
-                        action_type=MessagingActionType.PRIVACY_REQUEST_REVIEW_DENY,
-                        body_params=RequestReviewDenyBodyParams(
-                            rejection_reason=deny_reason
+    def _send_request_review_messages(
+        self, privacy_requests: List[PrivacyRequest], message: FidesopsMessage
+    ) -> None:
+        """
+        Queues the review message for each of the privacy requests.
+
+        Whether sending is enabled is checked once per property. A single message is
+        queued on its own, and more than one is queued in batches, which are sent
+        with the messaging provider's batch sending API.
+        """
+        by_property: Dict[Optional[str], List[PrivacyRequest]] = defaultdict(list)
+        for privacy_request in privacy_requests:
+            by_property[privacy_request.property_id].append(privacy_request)
+
+        service_type = self.config_proxy.notifications.notification_service_type
+        for property_id, property_requests in by_property.items():
+            if not message_send_enabled(
+                self.db,
+                property_id,
+                message.action_type,
+                self.config_proxy.notifications.send_request_review_notification,
+            ):
+                continue
+
+            to_identities: List[Identity] = []
+            for privacy_request in property_requests:
+                identity_data = privacy_request.get_cached_identity_data()
+                if not identity_data:
+                    logger.error(
+                        IdentityNotFoundException(
+                            "Identity was not found, so request review message could not be sent."
+                        )
+                    )
+                    continue
+                to_identities.append(
+                    Identity(
+                        email=identity_data.get(ProvidedIdentityType.email.value),
+                        phone_number=identity_data.get(
+                            ProvidedIdentityType.phone_number.value
                         ),
-                    ),
-                    service_type=self.config_proxy.notifications.notification_service_type,
-                    to_identity=to_identity,
-                    property_id=privacy_request.property_id,
-                ).model_dump(mode="json"),
-            )
+                    )
+                )
+
+            if len(to_identities) == 1:
+                dispatch_message_task.apply_async(
+                    queue=MESSAGING_QUEUE_NAME,
+                    kwargs=MessageDispatchParams(
+                        message_meta=message,
+                        service_type=service_type,
+                        to_identity=to_identities[0],
+                        property_id=property_id,
+                    ).model_dump(mode="json"),
+                )
+                continue
+
+            message_meta = message.model_dump(mode="json")
+            for i in range(0, len(to_identities), MESSAGE_BATCH_SIZE):
+                dispatch_message_batch_task.apply_async(
+                    queue=MESSAGING_QUEUE_NAME,
+                    kwargs={
+                        "messages": [
+                            {
+                                "message_meta": message_meta,
+                                "to_identity": to_identity.model_dump(mode="json"),
+                            }
+                            for to_identity in to_identities[i : i + MESSAGE_BATCH_SIZE]
+                        ],
+                        "service_type": service_type,
+                        "property_id": property_id,
+                    },
+                )
 
     def send_verification_code(
         self,
@@ -99,7 +99,9 @@ def _get_lib() -> ctypes.CDLL:  # pragma: no cover — requires built Go library
         # to pass to FreeString after copying the data.
         for fn_name in (
             "EvaluatePipelineJSON",
+            "EvaluatePipelineBatchJSON",
             "EvaluatePurposeJSON",
+            "EvaluatePurposeBatchJSON",
             "EvaluatePoliciesJSON",
             "LoadFixturesJSON",
         ):
@@ -173,6 +175,26 @@ def evaluate_pipeline(  # pragma: no cover
     )
 
 
+def evaluate_pipeline_batch(  # pragma: no cover
+    fixtures: dict[str, Any],
+    queries: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Run the full PBAC pipeline for many queries in a single Go call.
+
+    Equivalent to calling evaluate_pipeline() per query, but the fixtures
+    are serialized and decoded once per call instead of once per query.
+
+    Returns EvaluationRecord dicts in query order.
+    """
+    return _call(
+        "EvaluatePipelineBatchJSON",
+        {
+            "fixtures": fixtures,
+            "inputs": queries,
+        },
+    )["records"]
+
+
 def evaluate_purpose(  # pragma: no cover
     consumer: dict[str, Any],
     datasets: dict[str, dict[str, Any]],
@@ -193,6 +215,18 @@ def evaluate_purpose(  # pragma: no cover
     )
 
 
+def evaluate_purpose_batch(  # pragma: no cover
+    requests: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Evaluate purpose overlap for many requests in a single Go call.
+
+    Each request has the same shape as the evaluate_purpose() arguments:
+    {"consumer": ..., "datasets": ..., "collections": ...}.
+    Returns results in request order.
+    """
+    return _call("EvaluatePurposeBatchJSON", {"requests": requests})["results"]
+
+
 def evaluate_policies(  # pragma: no cover
     policies: list[dict[str, Any]],
     request: dict[str, Any],
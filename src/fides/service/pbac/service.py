@@ -9,7 +9,18 @@ purpose lookup, PBAC evaluation, and policy filtering.
 
 from __future__ import annotations
 
-from typing import Protocol, runtime_checkable
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import (
+    Any,
+    Generic,
+    Iterable,
+    Iterator,
+    Protocol,
+    TypeVar,
+    runtime_checkable,
+)
 
 from loguru import logger
 
@@ -18,6 +29,9 @@ from fides.service.pbac.consumers.entities import DataConsumerEntity
 from fides.service.pbac.consumers.repository import DataConsumerRedisRepository
 from fides.service.pbac.dataset.resolver import DatasetResolver
 from fides.service.pbac.engine import evaluate_purpose as _go_evaluate_purpose
+from fides.service.pbac.engine import (
+    evaluate_purpose_batch as _go_evaluate_purpose_batch,
+)
 from fides.service.pbac.identity.interface import IdentityResolver
 from fides.service.pbac.identity.resolver import RedisIdentityResolver
 from fides.service.pbac.policies import (
@@ -40,6 +54,16 @@ from fides.service.pbac.types import (
 
 PBAC_CONTROL_TYPE = "purpose_restriction"
 
+# Number of entries evaluated per Go call in evaluate_batch
+DEFAULT_BATCH_CHUNK_SIZE = 1000
+
+# Number of identities, tables and purposes each memo of an evaluate_batch call
+# holds on to, so streaming a large query log doesn't grow memory without bound
+RESOLUTION_MEMO_SIZE = 10_000
+
+K = TypeVar("K")
+V = TypeVar("V")
+
 
 @runtime_checkable
 class PBACEvaluationService(Protocol):
@@ -81,15 +105,74 @@ class InProcessPBACEvaluationService:
         dataset_purpose_overrides: dict[str, list[str]] | None = None,
     ) -> EvaluationRecord:
         """Evaluate a query log entry for PBAC compliance."""
+        memo = _ResolutionMemo()
+        prepared = self._prepare_entry(entry, dataset_purpose_overrides, memo)
+
+        # 4. Purpose evaluation via Go library
+        result = self._call_go_evaluate_purpose(
+            prepared.consumer_purposes,
+            prepared.dataset_purposes,
+            prepared.collections,
+        )
+
+        return self._build_record(prepared, result, memo)
+
+    def evaluate_batch(
+        self,
+        entries: Iterable[RawQueryLogEntry],
+        dataset_purpose_overrides: dict[str, list[str]] | None = None,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+    ) -> Iterator[EvaluationRecord]:
+        """Evaluate a stream of query log entries for PBAC compliance.
+
+        Produces the same records as calling ``evaluate`` on each entry, in
+        input order. Identity, dataset and data_use lookups are memoized for
+        the lifetime of the call, and the Go library is called once per
+        chunk of ``chunk_size`` entries instead of once per entry.
+
+        ``entries`` is consumed lazily, so arbitrarily large query logs can be
+        streamed through without being held in memory.
+        """
+        memo = _ResolutionMemo()
+        for chunk in _chunked(entries, chunk_size):
+            prepared = [
+                self._prepare_entry(entry, dataset_purpose_overrides, memo)
+                for entry in chunk
+            ]
+            results = self._call_go_evaluate_purpose_batch(
+                [
+                    (p.consumer_purposes, p.dataset_purposes, p.collections)
+                    for p in prepared
+                ]
+            )
+            for prepared_entry, result in zip(prepared, results):
+                yield self._build_record(prepared_entry, result, memo)
+
+    # ── Private helpers ────────────────────────────────────────────────
+
+    def _prepare_entry(
+        self,
+        entry: RawQueryLogEntry,
+        dataset_purpose_overrides: dict[str, list[str]] | None,
+        memo: _ResolutionMemo,
+    ) -> _PreparedEntry:
+        """Resolve the consumer and datasets for an entry and build the engine inputs."""
         # 1. Resolve consumer
-        consumer = self._identity_resolver.resolve(identity=entry.identity)
+        if entry.identity not in memo.consumers:
+            memo.consumers[entry.identity] = self._identity_resolver.resolve(
+                identity=entry.identity
+            )
+        consumer = memo.consumers[entry.identity]
 
         # 2. Resolve datasets + collect per-dataset collection names
         dataset_keys: list[str] = []
         collections: dict[str, list[str]] = {}
         unresolved_gaps: list[EvaluationGap] = []
         for table_ref in entry.referenced_tables:
-            fides_key = self._dataset_resolver.resolve(table_ref)
+            table_key = (table_ref.catalog, table_ref.schema, table_ref.table)
+            if table_key not in memo.dataset_keys:
+                memo.dataset_keys[table_key] = self._dataset_resolver.resolve(table_ref)
+            fides_key = memo.dataset_keys[table_key]
             if fides_key:
                 if fides_key not in collections:
                     dataset_keys.append(fides_key)
@@ -117,13 +200,28 @@ class InProcessPBACEvaluationService:
         else:
             ds_purposes_map = self._build_dataset_purposes(dataset_keys)
 
-        # 4. Purpose evaluation via Go library
-        result = self._call_go_evaluate_purpose(
-            consumer_purposes, ds_purposes_map, collections
+        return _PreparedEntry(
+            entry=entry,
+            consumer=consumer,
+            dataset_keys=dataset_keys,
+            collections=collections,
+            unresolved_gaps=unresolved_gaps,
+            consumer_purposes=consumer_purposes,
+            dataset_purposes=ds_purposes_map,
         )
 
+    def _build_record(
+        self,
+        prepared: _PreparedEntry,
+        result: PurposeEvaluationResult,
+        memo: _ResolutionMemo,
+    ) -> EvaluationRecord:
+        """Post-process the engine result for an entry into an EvaluationRecord."""
+        consumer = prepared.consumer
+        entry = prepared.entry
+
         # 5. Reclassify gaps if consumer was found but has no purposes
-        gaps = result.gaps + unresolved_gaps
+        gaps = result.gaps + prepared.unresolved_gaps
         if consumer is not None and not consumer.purpose_fides_keys:
             gaps = [
                 EvaluationGap(
@@ -138,7 +236,7 @@ class InProcessPBACEvaluationService:
             ]
 
         # 6. Resolve data_use on violations
-        enriched = self._resolve_data_uses(result.violations)
+        enriched = self._resolve_data_uses(result.violations, memo)
 
         # 7. Filter through Policy v2
         filtered = self._filter_violations_through_policies(enriched, consumer)
@@ -148,7 +246,7 @@ class InProcessPBACEvaluationService:
             query_id=entry.external_job_id,
             identity=entry.identity,
             consumer=consumer,
-            dataset_keys=tuple(dataset_keys),
+            dataset_keys=tuple(prepared.dataset_keys),
             is_compliant=len(filtered) == 0,
             violations=tuple(filtered),
             gaps=tuple(gaps),
@@ -157,8 +255,6 @@ class InProcessPBACEvaluationService:
             query_text=entry.query_text,
         )
 
-    # ── Private helpers ────────────────────────────────────────────────
-
     def _build_consumer_purposes(
         self,
         consumer: DataConsumerEntity | None,
@@ -210,15 +306,18 @@ class InProcessPBACEvaluationService:
     def _resolve_data_uses(
         self,
         violations: list[PurposeViolation],
+        memo: _ResolutionMemo,
     ) -> list[PurposeViolation]:
         """Populate data_use and control on violations."""
         result = []
         for v in violations:
             data_use = None
             for purpose_key in sorted(v.dataset_purposes):
-                purpose = self._purpose_repo.get(purpose_key)
-                if purpose and purpose.data_use:
-                    data_use = purpose.data_use
+                if purpose_key not in memo.data_uses:
+                    purpose = self._purpose_repo.get(purpose_key)
+                    memo.data_uses[purpose_key] = purpose.data_use if purpose else None
+                if memo.data_uses[purpose_key]:
+                    data_use = memo.data_uses[purpose_key]
                     break
             result.append(
                 PurposeViolation(
@@ -245,53 +344,29 @@ class InProcessPBACEvaluationService:
 
         Serializes the typed Python inputs to JSON dicts, calls Go,
         then deserializes the JSON response back to typed Python objects.
-        This is the only place where Python <-> Go marshalling happens
-        for purpose evaluation.
         """
-        consumer_dict = {
-            "consumer_id": consumer.consumer_id,
-            "consumer_name": consumer.consumer_name,
-            "purpose_keys": sorted(consumer.purpose_keys),
-        }
-        datasets_dict = {
-            key: {
-                "dataset_key": ds.dataset_key,
-                "purpose_keys": sorted(ds.purpose_keys),
-                "collection_purposes": {
-                    col: sorted(purposes)
-                    for col, purposes in ds.collection_purposes.items()
-                }
-                if ds.collection_purposes
-                else {},
-            }
-            for key, ds in datasets.items()
-        }
-        collections_dict = {k: list(v) for k, v in (collections or {}).items()}
-        raw = _go_evaluate_purpose(consumer_dict, datasets_dict, collections_dict)
-        return PurposeEvaluationResult(
-            violations=[
-                PurposeViolation(
-                    consumer_id=v["consumer_id"],
-                    consumer_name=v["consumer_name"],
-                    dataset_key=v["dataset_key"],
-                    collection=v.get("collection"),
-                    consumer_purposes=frozenset(v.get("consumer_purposes", [])),
-                    dataset_purposes=frozenset(v.get("dataset_purposes", [])),
-                    reason=v["reason"],
-                )
-                for v in raw.get("violations", [])
-            ],
-            gaps=[
-                EvaluationGap(
-                    gap_type=GapType(g["gap_type"]),
-                    identifier=g["identifier"],
-                    dataset_key=g.get("dataset_key"),
-                    reason=g["reason"],
-                )
-                for g in raw.get("gaps", [])
-            ],
-            total_accesses=raw.get("total_accesses", 0),
+        request = _purpose_request_to_dict(consumer, datasets, collections)
+        raw = _go_evaluate_purpose(
+            request["consumer"], request["datasets"], request["collections"]
         )
+        return _purpose_result_from_dict(raw)
+
+    @staticmethod
+    def _call_go_evaluate_purpose_batch(
+        requests: list[
+            tuple[ConsumerPurposes, dict[str, DatasetPurposes], dict[str, list[str]]]
+        ],
+    ) -> list[PurposeEvaluationResult]:
+        """Call Go EvaluatePurposeBatch once for many purpose evaluations."""
+        if not requests:
+            return []
+        raw_results = _go_evaluate_purpose_batch(
+            [
+                _purpose_request_to_dict(consumer, datasets, collections)
+                for consumer, datasets, collections in requests
+            ]
+        )
+        return [_purpose_result_from_dict(raw) for raw in raw_results]
 
     def _filter_violations_through_policies(
         self,
@@ -325,3 +400,121 @@ class InProcessPBACEvaluationService:
                 remaining.append(violation)
 
         return remaining
+
+
+# ── Module helpers ─────────────────────────────────────────────────────
+
+
+class _BoundedMemo(OrderedDict, Generic[K, V]):
+    """A dict which evicts its least recently used entries beyond ``maxsize``."""
+
+    def __init__(self, maxsize: int | None = None) -> None:
+        super().__init__()
+        self.maxsize = maxsize or RESOLUTION_MEMO_SIZE
+
+    def __getitem__(self, key: K) -> V:
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+@dataclass
+class _ResolutionMemo:
+    """Lookups memoized across the entries of a single evaluate/evaluate_batch call."""
+
+    consumers: _BoundedMemo[str, DataConsumerEntity | None] = field(
+        default_factory=_BoundedMemo
+    )
+    dataset_keys: _BoundedMemo[tuple[str, str, str], str] = field(
+        default_factory=_BoundedMemo
+    )
+    data_uses: _BoundedMemo[str, str | None] = field(default_factory=_BoundedMemo)
+
+
+@dataclass
+class _PreparedEntry:
+    """An entry with its consumer and datasets resolved, ready for the engine."""
+
+    entry: RawQueryLogEntry
+    consumer: DataConsumerEntity | None
+    dataset_keys: list[str]
+    collections: dict[str, list[str]]
+    unresolved_gaps: list[EvaluationGap]
+    consumer_purposes: ConsumerPurposes
+    dataset_purposes: dict[str, DatasetPurposes]
+
+
+def _chunked(
+    entries: Iterable[RawQueryLogEntry], size: int
+) -> Iterator[list[RawQueryLogEntry]]:
+    """Lazily split an iterable of entries into lists of at most ``size``."""
+    iterator = iter(entries)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _purpose_request_to_dict(
+    consumer: ConsumerPurposes,
+    datasets: dict[str, DatasetPurposes],
+    collections: dict[str, list[str]] | None = None,
+) -> dict[str, Any]:
+    """Serialize typed purpose-evaluation inputs to the Go request shape.
+
+    This and ``_purpose_result_from_dict`` are the only places where
+    Python <-> Go marshalling happens for purpose evaluation.
+    """
+    return {
+        "consumer": {
+            "consumer_id": consumer.consumer_id,
+            "consumer_name": consumer.consumer_name,
+            "purpose_keys": sorted(consumer.purpose_keys),
+        },
+        "datasets": {
+            key: {
+                "dataset_key": ds.dataset_key,
+                "purpose_keys": sorted(ds.purpose_keys),
+                "collection_purposes": {
+                    col: sorted(purposes)
+                    for col, purposes in ds.collection_purposes.items()
+                }
+                if ds.collection_purposes
+                else {},
+            }
+            for key, ds in datasets.items()
+        },
+        "collections": {k: list(v) for k, v in (collections or {}).items()},
+    }
+
+
+def _purpose_result_from_dict(raw: dict[str, Any]) -> PurposeEvaluationResult:
+    """Deserialize a Go purpose-evaluation response to typed Python objects."""
+    return PurposeEvaluationResult(
+        violations=[
+            PurposeViolation(
+                consumer_id=v["consumer_id"],
+                consumer_name=v["consumer_name"],
+                dataset_key=v["dataset_key"],
+                collection=v.get("collection"),
+                consumer_purposes=frozenset(v.get("consumer_purposes", [])),
+                dataset_purposes=frozenset(v.get("dataset_purposes", [])),
+                reason=v["reason"],
+            )
+            for v in raw.get("violations", [])
+        ],
+        gaps=[
+            EvaluationGap(
+                gap_type=GapType(g["gap_type"]),
+                identifier=g["identifier"],
+                dataset_key=g.get("dataset_key"),
+                reason=g["reason"],
+            )
+            for g in raw.get("gaps", [])
+        ],
+        total_accesses=raw.get("total_accesses", 0),
+    )
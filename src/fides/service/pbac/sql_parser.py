@@ -2,13 +2,24 @@
 
 Uses sqlglot for dialect-agnostic SQL parsing.  Produces a
 RawQueryLogEntry ready for the PBACEvaluationService.
+
+Warehouse query logs are dominated by the same dashboard and ETL
+statements run with different literals, so ``parse_query`` looks
+statements up in a ``SQLParseCache`` keyed by a literal-normalized
+fingerprint before falling back to sqlglot.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import Any
 from uuid import uuid4
 
 import sqlglot
@@ -18,27 +29,255 @@ from fides.service.pbac.types import RawQueryLogEntry, TableRef
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PARSE_CACHE_SIZE = 10_000
+PARSE_CACHE_REDIS_PREFIX = "pbac:sql_parse"
+DEFAULT_PARSE_CACHE_REDIS_TTL = 24 * 60 * 60
+
+# One alternation so that quotes inside comments (and comment markers
+# inside strings) are handled in a single left-to-right pass. Numbers
+# that are part of an identifier (``t1``, ``project-123.ds.t``) are kept.
+_FINGERPRINT_TOKEN_RE = re.compile(
+    r"""
+    (?P<string>'(?:[^']|'')*')
+    | (?P<identifier>"(?:[^"]|"")*"|`[^`]*`|\[[^\]]*\])
+    | (?P<comment>--[^\n]*|/\*.*?\*/)
+    | (?P<number>(?<![\w.$])(?<!\w-)\d+(?:\.\d+)?(?:[eE][+-]?\d+)?(?![\w.$])(?!-\w))
+    | (?P<space>\s+)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+
+# Statement forms known not to reference a table, for which sqlglot is
+# skipped: session and transaction control, SHOW, and SELECTs of literals or
+# expressions (e.g. ``SELECT 1``). Anything else, including dialects which
+# omit INTO or FROM (e.g. ``INSERT ds.t VALUES ...``), is parsed by sqlglot.
+_TABLELESS_STATEMENT_RE = re.compile(
+    r"^(?:SET|SHOW|BEGIN|START\s+TRANSACTION|COMMIT|ROLLBACK|END|SELECT)\b",
+    re.IGNORECASE,
+)
+# Clauses which may name a table even in one of the forms above, e.g.
+# ``SHOW COLUMNS FROM t`` or ``SELECT 1 INTO t``
+_TABLE_CLAUSE_RE = re.compile(
+    r"\b(?:FROM|JOIN|INTO|IN|TABLE|ON)\b|;",
+    re.IGNORECASE,
+)
+
+
+def _is_tableless_statement(normalized_query: str) -> bool:
+    """Whether a literal-normalized statement is a form which can't reference a table."""
+    statement = normalized_query.rstrip("; ")
+    return bool(
+        _TABLELESS_STATEMENT_RE.match(statement)
+        and not _TABLE_CLAUSE_RE.search(statement)
+    )
+
+
+def _normalize_token(match: re.Match[str]) -> str:
+    kind = match.lastgroup
+    if kind in ("string", "number"):
+        return "?"
+    if kind in ("comment", "space"):
+        return " "
+    return match.group(0)
+
+
+def normalize_query(query_text: str) -> str:
+    """Replace literals with ``?`` and drop comments and redundant whitespace.
+
+    Statements that differ only in literal values (including the length
+    of ``IN (...)`` lists) normalize to the same text. Identifiers,
+    quoted or not, are kept verbatim since they may be case-sensitive.
+    """
+    normalized = _FINGERPRINT_TOKEN_RE.sub(_normalize_token, query_text)
+    normalized = _IN_LIST_RE.sub("(?)", normalized)
+    return re.sub(r" {2,}", " ", normalized).strip()
+
+
+def query_fingerprint(query_text: str) -> str:
+    """Return a stable digest of the literal-normalized query text."""
+    return _digest(normalize_query(query_text))
+
+
+def _digest(normalized_query: str) -> str:
+    return hashlib.blake2b(normalized_query.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True)
+class ParsedStatementInfo:
+    """The parts of a parsed statement that PBAC evaluation needs."""
+
+    statement_type: str
+    tables: tuple[tuple[str, str, str], ...]  # (catalog, schema, table)
+
+    def table_refs(self) -> list[TableRef]:
+        """Build fresh TableRef objects, so callers can't mutate cached state."""
+        return [
+            TableRef(catalog=catalog, schema=schema, table=table)
+            for catalog, schema, table in self.tables
+        ]
+
+
+class SQLParseCache:
+    """Bounded LRU of fingerprint -> ParsedStatementInfo.
+
+    Optionally backed by Redis (any client exposing ``get`` and
+    ``set(key, value, ex=...)``, e.g. ``FidesopsRedis``) so that workers
+    share parse results. Redis errors are logged and otherwise ignored.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_PARSE_CACHE_SIZE,
+        redis: Any | None = None,
+        redis_ttl: int = DEFAULT_PARSE_CACHE_REDIS_TTL,
+    ) -> None:
+        self._maxsize = maxsize
+        self._redis = redis
+        self._redis_ttl = redis_ttl
+        self._entries: OrderedDict[str, ParsedStatementInfo] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+
+    def get(self, fingerprint: str) -> ParsedStatementInfo | None:
+        """Return the cached info for a fingerprint, checking Redis on a local miss."""
+        with self._lock:
+            info = self._entries.get(fingerprint)
+            if info is not None:
+                self._entries.move_to_end(fingerprint)
+                self.hits += 1
+                return info
+
+        info = self._get_from_redis(fingerprint)
+        with self._lock:
+            if info is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._store_locally(fingerprint, info)
+        return info
+
+    def put(self, fingerprint: str, info: ParsedStatementInfo) -> None:
+        """Cache the info for a fingerprint locally and, if configured, in Redis."""
+        with self._lock:
+            self._store_locally(fingerprint, info)
+        if self._redis is None:
+            return
+        try:
+            self._redis.set(
+                f"{PARSE_CACHE_REDIS_PREFIX}:{fingerprint}",
+                json.dumps(
+                    {
+                        "statement_type": info.statement_type,
+                        "tables": [list(t) for t in info.tables],
+                    }
+                ),
+                ex=self._redis_ttl,
+            )
+        except Exception:  # noqa: BLE001
+            logger.warning("Failed to write SQL parse cache entry to Redis")
+
+    def record_skip(self) -> None:
+        """Count a statement that skipped parsing because it has no table references."""
+        with self._lock:
+            self.skipped += 1
+
+    def clear(self) -> None:
+        """Clear the local entries and counters (Redis entries expire on their own)."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.skipped = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store_locally(self, fingerprint: str, info: ParsedStatementInfo) -> None:
+        self._entries[fingerprint] = info
+        self._entries.move_to_end(fingerprint)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def _get_from_redis(self, fingerprint: str) -> ParsedStatementInfo | None:
+        if self._redis is None:
+            return None
+        try:
+            raw = self._redis.get(f"{PARSE_CACHE_REDIS_PREFIX}:{fingerprint}")
+            if raw is None:
+                return None
+            data = json.loads(raw)
+            return ParsedStatementInfo(
+                statement_type=data["statement_type"],
+                tables=tuple(tuple(t) for t in data["tables"]),
+            )
+        except Exception:  # noqa: BLE001
+            logger.warning("Failed to read SQL parse cache entry from Redis")
+            return None
+
+
+_default_parse_cache = SQLParseCache()
+
+
+def get_default_parse_cache() -> SQLParseCache:
+    """Return the process-wide parse cache used when none is passed in."""
+    return _default_parse_cache
+
+
+def parse_statement_info(
+    query_text: str,
+    cache: SQLParseCache | None = None,
+) -> ParsedStatementInfo:
+    """Return the table references and statement type for a query.
+
+    Statements that cannot reference tables skip sqlglot entirely; others
+    are parsed once per fingerprint and served from ``cache`` afterwards.
+    """
+    if cache is None:
+        cache = _default_parse_cache
+    normalized = normalize_query(query_text)
+
+    if _is_tableless_statement(normalized):
+        cache.record_skip()
+        return ParsedStatementInfo(
+            statement_type=detect_statement_type(query_text), tables=()
+        )
+
+    fingerprint = _digest(normalized)
+    info = cache.get(fingerprint)
+    if info is None:
+        info = ParsedStatementInfo(
+            statement_type=detect_statement_type(query_text),
+            tables=tuple(
+                (ref.catalog, ref.schema, ref.table)
+                for ref in extract_table_refs(query_text)
+            ),
+        )
+        cache.put(fingerprint, info)
+    return info
+
 
 def parse_query(
     query_text: str,
     user_identity: str,
     timestamp: datetime | None = None,
     source_id: str = "sql_parser",
+    cache: SQLParseCache | None = None,
 ) -> RawQueryLogEntry:
     """Parse generic SQL into a RawQueryLogEntry.
 
     Extracts table references and statement type using sqlglot
-    (dialect-agnostic).  The resulting entry can be passed directly
-    to ``PBACEvaluationService.evaluate()``.
+    (dialect-agnostic), memoized by query fingerprint in ``cache``
+    (the process-wide cache by default).  The resulting entry can be
+    passed directly to ``PBACEvaluationService.evaluate()``.
     """
-    tables = extract_table_refs(query_text)
-    stmt_type = detect_statement_type(query_text)
+    info = parse_statement_info(query_text, cache)
     return RawQueryLogEntry(
         source_id=source_id,
         external_job_id=str(uuid4()),
         query_text=query_text,
-        statement_type=stmt_type,
-        referenced_tables=tables,
+        statement_type=info.statement_type,
+        referenced_tables=info.table_refs(),
         timestamp=timestamp or datetime.now(timezone.utc),
         identity=user_identity,
     )
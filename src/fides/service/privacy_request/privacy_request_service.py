@@ -625,6 +625,8 @@ class PrivacyRequestService:
             privacy_requests_dict = self._fetch_privacy_requests_for_bulk_operation(
                 batch
             )
+            # Review messages are queued together once the batch is processed
+            to_notify: List[PrivacyRequest] = []
 
             for request_id in batch:
                 privacy_request = privacy_requests_dict.get(request_id)
@@ -700,7 +702,7 @@ class PrivacyRequestService:
                     )
 
                     if not suppress_notification:
-                        self.messaging_service.send_request_approved(privacy_request)
+                        to_notify.append(privacy_request)
                     queue_privacy_request(privacy_request.id)
 
                     succeeded.append(privacy_request)
@@ -715,6 +717,12 @@ class PrivacyRequestService:
                         )
                     )
 
+            if to_notify:
+                try:
+                    self.messaging_service.send_requests_approved(to_notify)
+                except Exception as exc:
+                    logger.exception(exc)
+
         return BulkReviewResponse(succeeded=succeeded, failed=failed)
 
     def deny_privacy_requests(
@@ -737,6 +745,8 @@ class PrivacyRequestService:
             privacy_requests_dict = self._fetch_privacy_requests_for_bulk_operation(
                 batch
             )
+            # Review messages are queued together once the batch is processed
+            to_notify: List[PrivacyRequest] = []
 
             for request_id in batch:
                 privacy_request = privacy_requests_dict.get(request_id)
@@ -780,10 +790,7 @@ class PrivacyRequestService:
                         },
                     )
 
-                    self.messaging_service.send_request_denied(
-                        privacy_request, deny_reason
-                    )
-
+                    to_notify.append(privacy_request)
                     succeeded.append(privacy_request)
                 except Exception:
                     failed.append(
@@ -795,6 +802,12 @@ class PrivacyRequestService:
                         )
                     )
 
+            if to_notify:
+                try:
+                    self.messaging_service.send_requests_denied(to_notify, deny_reason)
+                except Exception as exc:
+                    logger.exception(exc)
+
         return BulkReviewResponse(succeeded=succeeded, failed=failed)
 
     def cancel_privacy_requests(
@@ -2,6 +2,7 @@
 import json
 from datetime import datetime
 from typing import Any, Awaitable, Callable, Dict, Generator, List, MutableMapping
+from unittest import mock
 
 import pytest
 from fastapi_pagination import Params
@@ -21,6 +22,7 @@ from fides.api.cryptography.schemas.jwt import (
 )
 from fides.api.models.client import ClientDetail
 from fides.api.models.fides_user import FidesUser
+from fides.api.models.sql_models import AuditLogResource  # type: ignore[attr-defined]
 from fides.api.oauth.jwt import generate_jwe
 from fides.common.scope_registry import USER_CREATE
 from fides.config import CONFIG
@@ -57,11 +59,7 @@ def test_bad_audit_log_resource_data() -> Generator:
     yield audit_log_resource_data
 
 
-def test_record_written_to_db(db, test_audit_log_resource_data: Dict[str, Any]) -> None:
-    assert _middleware.write_audit_log_resource_record(db, test_audit_log_resource_data)
-
-
-async def test_extracted_token(db) -> None:
+def test_extracted_token(db) -> None:
     # This was taken from test_user_endpoints.py
     user = FidesUser.create(
         db=db,
@@ -86,7 +84,7 @@ async def test_extracted_token(db) -> None:
 
     jwe = generate_jwe(json.dumps(payload), CONFIG.security.app_encryption_key)
     auth_header = {"Authorization": "Bearer " + jwe}
-    assert client.user_id == await _middleware.get_client_user_id(
+    assert client.user_id == _middleware.get_client_user_id(
         db, auth_header["Authorization"]
     )
 
@@ -113,3 +111,55 @@ async def test_extract_data_from_body(
 ) -> None:
     fides_keys = await _middleware.extract_data_from_body(request_body)
     assert fides_keys == expected_fides_keys
+
+
+def get_audit_log_resources(db, request_path: str) -> List[AuditLogResource]:
+    db.expire_all()
+    return db.query(AuditLogResource).filter_by(request_path=request_path).all()
+
+
+async def test_audit_log_resource_writer_batches_records(
+    db, test_audit_log_resource_data: Dict[str, Any]
+) -> None:
+    writer = _middleware.AuditLogResourceWriter(max_queue_size=5, batch_size=4)
+    writer.start()
+    with mock.patch.object(
+        _middleware.AuditLogResourceWriter,
+        "write_records",
+        wraps=_middleware.AuditLogResourceWriter.write_records,
+    ) as write_records:
+        for i in range(10):
+            await writer.put(
+                {**test_audit_log_resource_data, "request_path": "batched/path"},
+                None,
+            )
+        await writer.stop()
+
+    assert len(get_audit_log_resources(db, "batched/path")) == 10
+    assert write_records.call_count < 10
+    assert all(len(call.args[0]) <= 4 for call in write_records.call_args_list)
+
+
+async def test_audit_log_resource_writer_without_start(
+    db, test_audit_log_resource_data: Dict[str, Any]
+) -> None:
+    writer = _middleware.AuditLogResourceWriter(max_queue_size=5, batch_size=4)
+
+    await writer.put(
+        {**test_audit_log_resource_data, "request_path": "unqueued/path"}, None
+    )
+
+    assert len(get_audit_log_resources(db, "unqueued/path")) == 1
+
+
+def test_write_audit_log_resource_records_skips_invalid_tokens(
+    db, test_audit_log_resource_data: Dict[str, Any]
+) -> None:
+    data = {**test_audit_log_resource_data, "request_path": "token/path"}
+
+    written = _middleware.AuditLogResourceWriter.write_records(
+        [(data, None), (data, "Bearer not-a-token")]
+    )
+
+    assert written == 1
+    assert len(get_audit_log_resources(db, "token/path")) == 1
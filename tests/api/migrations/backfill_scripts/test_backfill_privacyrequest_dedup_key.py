@@ -0,0 +1,107 @@
+"""Tests for backfill_privacyrequest_dedup_key module."""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.orm import Session
+
+from fides.api.migrations.backfill_scripts.backfill_privacyrequest_dedup_key import (
+    backfill_privacyrequest_dedup_key,
+    get_pending_dedup_key_count,
+)
+from fides.api.models.policy import Policy
+from fides.api.models.privacy_request import PrivacyRequest
+from fides.api.models.privacy_request.duplicate_group import (
+    generate_dedup_key_version,
+)
+from fides.api.schemas.privacy_request import PrivacyRequestStatus
+from fides.api.schemas.redis_cache import Identity
+
+
+@pytest.fixture
+def privacy_requests_needing_backfill(db: Session, policy: Policy):
+    """Requests created before the dedup_key column was added."""
+    privacy_requests = []
+    for identity in [
+        Identity(email="customer-1@example.com"),
+        Identity(email="customer-2@example.com", phone_number="+15555555555"),
+        Identity(phone_number="+15555555555"),
+    ]:
+        privacy_request = PrivacyRequest.create(
+            db=db,
+            data={
+                "external_id": "test_external_id",
+                "status": PrivacyRequestStatus.pending,
+                "policy_id": policy.id,
+            },
+        )
+        privacy_request.persist_identity(db=db, identity=identity)
+        privacy_requests.append(privacy_request)
+
+    expected_keys = [privacy_request.dedup_key for privacy_request in privacy_requests]
+    for privacy_request in privacy_requests:
+        privacy_request.update(
+            db=db, data={"dedup_key": None, "dedup_key_version": None}
+        )
+
+    yield privacy_requests, expected_keys
+
+    for privacy_request in privacy_requests:
+        privacy_request.delete(db)
+
+
+class TestBackfillPrivacyRequestDedupKey:
+    def test_pending_count_only_includes_requests_with_the_matched_identities(
+        self, db: Session, privacy_requests_needing_backfill
+    ):
+        # The request with only a phone number never gets a key
+        assert get_pending_dedup_key_count(db) == 2
+
+    @patch("fides.api.migrations.backfill_scripts.utils.mark_backfill_completed")
+    @patch(
+        "fides.api.migrations.backfill_scripts.utils.is_backfill_completed",
+        return_value=False,
+    )
+    def test_backfill_matches_persisted_dedup_keys(
+        self,
+        mock_is_completed,
+        mock_mark_completed,
+        db: Session,
+        privacy_requests_needing_backfill,
+    ):
+        privacy_requests, expected_keys = privacy_requests_needing_backfill
+        assert expected_keys[0] is not None
+        assert expected_keys[2] is None
+
+        with patch("fides.api.migrations.backfill_scripts.utils.refresh_backfill_lock"):
+            result = backfill_privacyrequest_dedup_key(
+                db, batch_size=1, batch_delay_seconds=0
+            )
+
+        assert result.name == "privacyrequest-dedup_key"
+        assert result.success is True
+        assert result.total_updated == 2
+        for privacy_request in privacy_requests:
+            db.refresh(privacy_request)
+        assert [
+            privacy_request.dedup_key for privacy_request in privacy_requests
+        ] == expected_keys
+        assert get_pending_dedup_key_count(db) == 0
+
+    def test_requests_keyed_under_other_identity_fields_are_pending(
+        self, db: Session, privacy_requests_needing_backfill
+    ):
+        privacy_requests, expected_keys = privacy_requests_needing_backfill
+        privacy_requests[0].update(
+            db=db,
+            data={"dedup_key": "stale", "dedup_key_version": "previous"},
+        )
+        privacy_requests[1].update(
+            db=db,
+            data={
+                "dedup_key": expected_keys[1],
+                "dedup_key_version": generate_dedup_key_version(["email"]),
+            },
+        )
+
+        assert get_pending_dedup_key_count(db) == 1
@@ -1,3 +1,5 @@
+import random
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
@@ -8,6 +10,7 @@ from fides.api.graph.config import FieldPath
 from fides.api.task.conditional_dependencies.evaluator import (
     ConditionEvaluationError,
     ConditionEvaluator,
+    compile_condition,
 )
 from fides.api.task.conditional_dependencies.schemas import (
     ConditionGroup,
@@ -1392,3 +1395,104 @@ class TestErrorHandling(TestConditionEvaluator):
         # This should raise the specific exception from the Fides reference structure
         with pytest.raises(exception_class, match=exception_message):
             evaluator._get_nested_value_from_fides_reference_structure(data, keys)
+
+
+class FieldValueStructure:
+    """A Fides reference structure which looks up field paths in a dict"""
+
+    def __init__(self, data: dict):
+        self.data = data
+
+    def get_field_value(self, field_path: FieldPath) -> Any:
+        current: Any = self.data
+        for level in field_path.levels:
+            if not isinstance(current, dict):
+                raise ValueError(f"No field {field_path}")
+            current = current.get(level)
+        return current
+
+
+class TestCompiledConditions(TestConditionEvaluator):
+    """Compiled conditions must return the same result as the interpretive evaluator"""
+
+    FIELDS = ["user.name", "user.age", "user.tags", "order.total", "missing", "a:b:c"]
+    SCALARS = ["john", "jo", "premium", "", 0, 1, 25, 99.5, -3, True, False, None]
+    NUMERIC_OPERATORS = {Operator.lt, Operator.lte, Operator.gt, Operator.gte}
+
+    def random_value(self, rng: random.Random) -> Any:
+        if rng.random() < 0.3:
+            return [
+                rng.choice([v for v in self.SCALARS if v is not None])
+                for _ in range(rng.randint(0, 3))
+            ]
+        return rng.choice(self.SCALARS)
+
+    def random_condition(self, rng: random.Random, depth: int = 0):
+        if depth < 3 and rng.random() < 0.4:
+            return ConditionGroup(
+                logical_operator=rng.choice(list(GroupOperator)),
+                conditions=[
+                    self.random_condition(rng, depth + 1)
+                    for _ in range(rng.randint(1, 4))
+                ],
+            )
+        operator = rng.choice(list(Operator))
+        value = (
+            rng.choice([0, 1, 25, 99.5, -3])
+            if operator in self.NUMERIC_OPERATORS
+            else self.random_value(rng)
+        )
+        return ConditionLeaf(
+            field_address=rng.choice(self.FIELDS), operator=operator, value=value
+        )
+
+    def random_data(self, rng: random.Random) -> dict:
+        data: dict = {
+            "user": {
+                "name": self.random_value(rng),
+                "age": self.random_value(rng),
+                "tags": self.random_value(rng),
+            },
+            "order": rng.choice([{"total": self.random_value(rng)}, None, "flat"]),
+            "a": {"b": {"c": self.random_value(rng)}},
+        }
+        if rng.random() < 0.2:
+            data["missing"] = self.random_value(rng)
+        return data
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_compiled_matches_evaluator(self, evaluator, seed):
+        rng = random.Random(seed)
+        for _ in range(50):
+            condition = self.random_condition(rng)
+            compiled = compile_condition(condition)
+            for _ in range(10):
+                data = self.random_data(rng)
+                if rng.random() < 0.3:
+                    data = FieldValueStructure(data)
+                try:
+                    expected = evaluator.evaluate_rule(condition, data).result
+                except ConditionEvaluationError:
+                    # Short-circuiting may skip the condition which raises
+                    continue
+                assert compiled(data) == expected, (condition, data)
+
+    def test_groups_short_circuit(self):
+        condition = ConditionGroup(
+            logical_operator=GroupOperator.or_,
+            conditions=[
+                ConditionLeaf(field_address="user.name", operator=Operator.exists),
+                ConditionLeaf(field_address="user.age", operator=Operator.lt, value=1),
+            ],
+        )
+
+        # Only the first condition's operator can be applied
+        with patch(
+            "fides.api.task.conditional_dependencies.evaluator.OPERATOR_METHODS",
+            {Operator.exists: lambda a, _: a is not None},
+        ):
+            compiled = compile_condition(condition)
+
+        assert compiled({"user": {"name": "john", "age": 25}}) is True
+        with pytest.raises(ConditionEvaluationError, match="Unknown operator"):
+            compiled({"user": {"name": None, "age": 25}})
@@ -15,6 +15,7 @@ from fides.api.schemas.policy import ActionType
 from fides.api.task.conditional_dependencies.policy_evaluation import (
     PolicyEvaluationError,
     PolicyEvaluator,
+    get_compiled_policy_condition,
 )
 from fides.api.task.conditional_dependencies.privacy_request.schemas import (
     PrivacyRequestConvenienceFields,
@@ -438,3 +439,48 @@ class TestCustomDefaultPolicy:
 
         consent_result = evaluator.evaluate_policy_conditions(pr, ActionType.consent)
         assert consent_result.policy.key == DEFAULT_CONSENT_POLICY  # System default
+
+
+class TestCompiledPolicyConditions:
+    def test_conditions_are_compiled_once_per_version(self):
+        condition_tree = {
+            "logical_operator": "and",
+            "conditions": [
+                {"field_address": LOCATION_FIELD, "operator": "eq", "value": "fr"},
+                {"field_address": SOURCE_FIELD, "operator": "exists"},
+            ],
+        }
+        reordered = {
+            "conditions": [
+                {"value": "fr", "operator": "eq", "field_address": LOCATION_FIELD},
+                {"operator": "exists", "field_address": SOURCE_FIELD},
+            ],
+            "logical_operator": "and",
+        }
+        changed = {**condition_tree, "logical_operator": "or"}
+
+        compiled = get_compiled_policy_condition(condition_tree)
+
+        assert get_compiled_policy_condition(reordered) is compiled
+        assert get_compiled_policy_condition(changed) is not compiled
+        assert compiled.field_addresses == {LOCATION_FIELD, SOURCE_FIELD}
+        assert compiled.specificity.condition_count == 2
+        assert compiled.evaluate(
+            {"privacy_request": {"location": "fr", "source": "Privacy Center"}}
+        )
+        assert not compiled.evaluate(
+            {"privacy_request": {"location": "us_ca", "source": "Privacy Center"}}
+        )
+
+    def test_matching_policies_include_the_evaluation_report(
+        self, db: Session, evaluator: PolicyEvaluator
+    ):
+        _create_policy_with_condition(db, "policy_a", _leaf(LOCATION_FIELD, "fr"))
+
+        result = evaluator.evaluate_policy_conditions(
+            _create_request("fr"), ActionType.access
+        )
+
+        assert result.policy.key == "policy_a"
+        assert result.evaluation_result.result is True
+        assert result.evaluation_result.field_address == LOCATION_FIELD
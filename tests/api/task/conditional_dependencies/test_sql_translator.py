@@ -3,6 +3,7 @@ Tests for the enhanced SQLAlchemy-based SQLConditionTranslator
 """
 
 import operator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from unittest.mock import Mock, create_autospec, patch
 
@@ -982,6 +983,86 @@ class TestSQLTranslatorRelationshipHandling:
         )
 
 
+class TestJoinPlans:
+    """Test that join plans are shared by conditions on the same tables"""
+
+    @pytest.fixture(autouse=True)
+    def join_plans(self, monkeypatch):
+        join_plans = {}
+        monkeypatch.setattr(SQLConditionTranslator, "_join_plans", join_plans)
+        return join_plans
+
+    @staticmethod
+    def _condition(*field_addresses: str) -> ConditionGroup:
+        return ConditionGroup(
+            logical_operator=GroupOperator.and_,
+            conditions=[
+                ConditionLeaf(field_address=field_address, operator=Operator.exists)
+                for field_address in field_addresses
+            ],
+        )
+
+    def test_join_plan_is_reused_across_translators(self, db, join_plans):
+        condition = self._condition("fidesuser.disabled", "fidesuserpermissions.roles")
+        query = SQLConditionTranslator(db).build_sqlalchemy_query(condition)
+        assert len(join_plans) == 1
+        join_plan = next(iter(join_plans.values()))
+        assert join_plan.primary_model is FidesUser
+        assert len(join_plan.join_steps) == 1
+        assert join_plan.join_steps[0].relationship_attr is FidesUser.permissions
+        assert not join_plan.join_steps[0].reverse
+
+        with patch.object(
+            SQLConditionTranslator, "_build_join_plan"
+        ) as mock_build_join_plan:
+            other_query = SQLConditionTranslator(db).build_sqlalchemy_query(
+                self._condition("fidesuser.email_address", "fidesuserpermissions.id")
+            )
+
+        mock_build_join_plan.assert_not_called()
+        assert "JOIN fidesuserpermissions" in str(query)
+        assert "JOIN fidesuserpermissions" in str(other_query)
+        assert "fidesuser.email_address IS NOT NULL" in str(other_query)
+
+    def test_join_plan_depends_on_the_models(self, translator, join_plans):
+        condition = self._condition("fidesuser.disabled")
+        translator.get_join_plan(translator.map_tables_to_fields(condition))
+
+        translator._model_cache = {"fidesuser": FidesUserPermissions}
+        join_plan = translator.get_join_plan(translator.map_tables_to_fields(condition))
+
+        assert join_plan.primary_model is FidesUserPermissions
+        assert len(join_plans) == 2
+
+    def test_oldest_join_plan_is_evicted(self, translator, join_plans, monkeypatch):
+        monkeypatch.setattr(SQLConditionTranslator, "MAX_JOIN_PLANS", 1)
+
+        translator.build_sqlalchemy_query(self._condition("fidesuser.disabled"))
+        translator.build_sqlalchemy_query(self._condition("privacyrequest.status"))
+
+        assert [model for ((_, model),) in join_plans] == [PrivacyRequest]
+
+    def test_join_plans_are_shared_across_threads(
+        self, translator, join_plans, monkeypatch
+    ):
+        monkeypatch.setattr(SQLConditionTranslator, "MAX_JOIN_PLANS", 1)
+        tables_to_fields = [
+            translator.map_tables_to_fields(self._condition(field_address))
+            for field_address in ("fidesuser.disabled", "privacyrequest.status")
+        ]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            join_plans_built = list(
+                executor.map(translator.get_join_plan, tables_to_fields * 50)
+            )
+
+        assert {join_plan.primary_model for join_plan in join_plans_built} == {
+            FidesUser,
+            PrivacyRequest,
+        }
+        assert len(join_plans) == 1
+
+
 class TestFindRelationshipPath:
     """Test finding relationship paths in SQLConditionTranslator"""
 
@@ -0,0 +1,99 @@
+# pylint: disable=missing-docstring
+import subprocess
+import sys
+from importlib import import_module
+from typing import Dict, List
+
+import pytest
+from click.testing import CliRunner
+
+from fides.cli import ALL_COMMANDS, cli
+
+HEAVY_MODULES = ["sqlalchemy", "fides.api.models", "fides.api.db"]
+
+
+def import_times(args: List[str]) -> Dict[str, int]:
+    """
+    Runs the CLI with `python -X importtime` and returns the cumulative import time
+    of each imported module, in microseconds.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"from fides.cli import cli; cli({args!r})",
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+def command_modules(times: Dict[str, int]) -> List[str]:
+    return sorted(
+        module for module in times if module.startswith("fides.cli.commands.")
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("name", sorted(ALL_COMMANDS))
+def test_lazy_command_summaries_match_commands(name: str) -> None:
+    module_name, attribute = ALL_COMMANDS[name].import_path.split(":")
+    command = getattr(import_module(module_name), attribute)
+
+    assert command.name == name
+    summary = (command.help or "").split("\n\n")[0]
+    assert ALL_COMMANDS[name].summary == " ".join(summary.split())
+
+
+@pytest.mark.unit
+def test_help_lists_lazy_commands() -> None:
+    commands = dict(cli.commands)
+    result = CliRunner().invoke(cli, ["--help"])
+
+    assert result.exit_code == 0
+    for name in ALL_COMMANDS:
+        assert name in result.output
+    # Placeholders are only added while the help is formatted
+    assert cli.commands == commands
+
+
+@pytest.mark.unit
+def test_help_imports_no_commands() -> None:
+    times = import_times(["--help"])
+
+    assert command_modules(times) == []
+    for module in HEAVY_MODULES:
+        assert module not in times, f"`fides --help` imported {module}"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "args, expected_modules",
+    [
+        (["view", "--help"], ["fides.cli.commands.view"]),
+        (["evaluate", "--help"], ["fides.cli.commands.ungrouped"]),
+        (["pbac", "--help"], ["fides.cli.commands.pbac"]),
+    ],
+)
+def test_subcommands_only_import_their_module(
+    args: List[str], expected_modules: List[str]
+) -> None:
+    times = import_times(args)
+
+    import_time = sum(times[module] for module in command_modules(times))
+    assert command_modules(times) == expected_modules, (
+        f"`fides {' '.join(args)}` spent {import_time / 1e6:.2f}s importing commands"
+    )
@@ -5,10 +5,12 @@ from typing import Dict, Generator, List
 import pytest
 from fideslang import model_list
 from fideslang.models import FidesModel
+from requests import Response
 
 from fides.config import FidesConfig
 from fides.core import api as _api
 from fides.core import api_helpers as _api_helpers
+from fides.core.resource_cache import ResourceCache
 from tests.ctl.types import FixtureRequest
 
 RESOURCE_CREATION_COUNT = 5
@@ -157,6 +159,103 @@ class TestGetServerResources:
         assert result == []
 
 
+@pytest.mark.integration
+class TestGetServerResourceDicts:
+    @pytest.mark.parametrize(
+        "created_resources", PARAM_MODEL_LIST, indirect=["created_resources"]
+    )
+    @pytest.mark.usefixtures("monkeypatch_requests", "fideslang_resources")
+    def test_get_server_resource_dicts_batches_and_skips_missing(
+        self, test_config: FidesConfig, created_resources: List, tmp_path, monkeypatch
+    ) -> None:
+        """
+        Tests that existing resources are returned in a batch and missing keys are left out
+        """
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(_api_helpers, "BATCH_SIZE", 2)
+        resource_type = created_resources[0]
+        resource_keys = created_resources[1]
+        result = _api_helpers.get_server_resource_dicts(
+            url=test_config.cli.server_url,
+            resource_type=resource_type,
+            resource_keys=resource_keys + [str(uuid.uuid4())],
+            headers=test_config.user.auth_header,
+        )
+        assert list(result.keys()) == resource_keys
+
+    @pytest.mark.parametrize(
+        "created_resources", ["organization"], indirect=["created_resources"]
+    )
+    @pytest.mark.usefixtures("monkeypatch_requests", "fideslang_resources")
+    def test_get_server_resource_dicts_uses_etag_cache(
+        self, test_config: FidesConfig, created_resources: List, tmp_path, monkeypatch
+    ) -> None:
+        """
+        Tests that unchanged resources are served from the local cache on repeated calls
+        """
+        monkeypatch.chdir(tmp_path)
+        resource_type = created_resources[0]
+        resource_keys = created_resources[1]
+        first_result = _api_helpers.get_server_resource_dicts(
+            url=test_config.cli.server_url,
+            resource_type=resource_type,
+            resource_keys=resource_keys,
+            headers=test_config.user.auth_header,
+        )
+
+        response = _api.batch_get(
+            url=test_config.cli.server_url,
+            resource_type=resource_type,
+            fides_keys=resource_keys,
+            headers=test_config.user.auth_header,
+            etags=ResourceCache(
+                test_config.cli.server_url,
+                resource_type,
+                credentials=test_config.user.auth_header["Authorization"],
+            ).etags(resource_keys),
+        ).json()
+        assert response["resources"] == []
+        assert set(response["not_modified"]) == set(resource_keys)
+
+        second_result = _api_helpers.get_server_resource_dicts(
+            url=test_config.cli.server_url,
+            resource_type=resource_type,
+            resource_keys=resource_keys,
+            headers=test_config.user.auth_header,
+        )
+        assert second_result == first_result
+
+
+@pytest.mark.unit
+class TestGetServerResourceDictsFallback:
+    def test_get_server_resource_dicts_falls_back_on_empty_batch_body(
+        self, monkeypatch
+    ) -> None:
+        """
+        Tests that a batch response without a body falls back to per-key retrieval
+        """
+        empty_response = Response()
+        empty_response.status_code = 200
+        empty_response._content = b""
+        monkeypatch.setattr(_api, "batch_get", lambda **kwargs: empty_response)
+        monkeypatch.setattr(
+            _api_helpers,
+            "get_server_resource",
+            lambda resource_key, **kwargs: (
+                {"fides_key": resource_key} if resource_key == "found" else {}
+            ),
+        )
+
+        result = _api_helpers.get_server_resource_dicts(
+            url="http://localhost",
+            resource_type="system",
+            resource_keys=["found", "missing"],
+            headers={},
+            use_cache=False,
+        )
+        assert result == {"found": {"fides_key": "found"}}
+
+
 @pytest.mark.integration
 class TestListServerResources:
     @pytest.mark.usefixtures("monkeypatch_requests", "fideslang_resources")
@@ -0,0 +1,85 @@
+# pylint: disable=missing-docstring
+import os
+import stat
+
+import pytest
+
+from fides.core.resource_cache import ResourceCache
+
+SERVER_URL = "http://localhost:8080"
+
+
+@pytest.mark.unit
+class TestResourceCache:
+    def test_round_trip(self, tmp_path) -> None:
+        cache = ResourceCache(SERVER_URL, "system", cache_dir=str(tmp_path))
+        cache.set("system_a", '"etag-a"', {"fides_key": "system_a"})
+        cache.save()
+
+        reloaded = ResourceCache(SERVER_URL, "system", cache_dir=str(tmp_path))
+        assert reloaded.etags(["system_a", "system_b"]) == {"system_a": '"etag-a"'}
+        assert reloaded.get("system_a") == {"fides_key": "system_a"}
+        assert reloaded.get("system_b") is None
+
+    def test_discard(self, tmp_path) -> None:
+        cache = ResourceCache(SERVER_URL, "system", cache_dir=str(tmp_path))
+        cache.set("system_a", '"etag-a"', {"fides_key": "system_a"})
+        cache.save()
+        cache.discard("system_a")
+        cache.save()
+
+        reloaded = ResourceCache(SERVER_URL, "system", cache_dir=str(tmp_path))
+        assert reloaded.etags(["system_a"]) == {}
+
+    def test_caches_are_scoped_by_server_and_type(self, tmp_path) -> None:
+        cache = ResourceCache(SERVER_URL, "system", cache_dir=str(tmp_path))
+        cache.set("system_a", '"etag-a"', {"fides_key": "system_a"})
+        cache.save()
+
+        assert (
+            ResourceCache(SERVER_URL, "dataset", cache_dir=str(tmp_path)).etags(
+                ["system_a"]
+            )
+            == {}
+        )
+        assert (
+            ResourceCache("http://other:8080", "system", cache_dir=str(tmp_path)).etags(
+                ["system_a"]
+            )
+            == {}
+        )
+
+    def test_caches_are_scoped_by_credentials(self, tmp_path) -> None:
+        cache = ResourceCache(
+            SERVER_URL, "system", credentials="Bearer a", cache_dir=str(tmp_path)
+        )
+        cache.set("system_a", '"etag-a"', {"fides_key": "system_a"})
+        cache.save()
+
+        other_user = ResourceCache(
+            SERVER_URL, "system", credentials="Bearer b", cache_dir=str(tmp_path)
+        )
+        assert other_user.etags(["system_a"]) == {}
+        assert other_user.get("system_a") is None
+
+    def test_cache_is_only_readable_by_owner(self, tmp_path) -> None:
+        cache = ResourceCache(SERVER_URL, "system", cache_dir=str(tmp_path))
+        cache.set("system_a", '"etag-a"', {"fides_key": "system_a"})
+        cache.save()
+
+        assert stat.S_IMODE(os.stat(cache.path).st_mode) == 0o600
+        assert stat.S_IMODE(os.stat(os.path.dirname(cache.path)).st_mode) == 0o700
+
+    def test_corrupt_cache_file_is_ignored(self, tmp_path) -> None:
+        cache = ResourceCache(SERVER_URL, "system", cache_dir=str(tmp_path))
+        cache.set("system_a", '"etag-a"', {"fides_key": "system_a"})
+        cache.save()
+        with open(cache.path, "w", encoding="utf-8") as cache_file:
+            cache_file.write("{not json")
+
+        assert (
+            ResourceCache(SERVER_URL, "system", cache_dir=str(tmp_path)).etags(
+                ["system_a"]
+            )
+            == {}
+        )
@@ -15,6 +15,7 @@ from fides.api.models.detection_discovery.core import (
     SharedMonitorConfig,
     StagedResource,
     StagedResourceAncestor,
+    StagedResourceAncestorLinkDiff,
     fetch_staged_resources_by_type_query,
 )
 from fides.api.models.detection_discovery.monitor_task import (
@@ -1546,3 +1547,143 @@ class TestStagedResourceAncestorModel:
         assert {desc.urn for desc in staged_resource_2.descendants(db)} == {
             descendant_urn
         }
+
+    def test_bulk_load_staged_resource_ancestor_links(
+        self,
+        db: Session,
+        staged_resource_1: StagedResource,
+        staged_resource_2: StagedResource,
+        staged_resource_3: StagedResource,
+    ):
+        """Test loading ancestor links through COPY, which is idempotent."""
+        ancestor_links = {
+            staged_resource_2.urn: {(staged_resource_1.urn, 1)},
+            staged_resource_3.urn: {
+                (staged_resource_1.urn, 2),
+                (staged_resource_2.urn, 1),
+            },
+        }
+
+        inserted = StagedResourceAncestor.bulk_load_staged_resource_ancestor_links(
+            db=db, ancestor_links=ancestor_links
+        )
+        assert inserted == 3
+
+        links = {
+            (link.ancestor_urn, link.descendant_urn, link.distance)
+            for link in db.query(StagedResourceAncestor).all()
+        }
+        assert links == {
+            (staged_resource_1.urn, staged_resource_2.urn, 1),
+            (staged_resource_1.urn, staged_resource_3.urn, 2),
+            (staged_resource_2.urn, staged_resource_3.urn, 1),
+        }
+        assert all(
+            link.id.startswith("srl_")
+            for link in db.query(StagedResourceAncestor).all()
+        )
+
+        # Loading the same links again doesn't insert anything
+        inserted = StagedResourceAncestor.bulk_load_staged_resource_ancestor_links(
+            db=db, ancestor_links=ancestor_links
+        )
+        assert inserted == 0
+        assert db.query(StagedResourceAncestor).count() == 3
+
+    def test_bulk_load_staged_resource_ancestor_links_empty(self, db: Session):
+        """Test that loading no links is a no-op."""
+        assert (
+            StagedResourceAncestor.bulk_load_staged_resource_ancestor_links(
+                db=db, ancestor_links={"urn": set()}
+            )
+            == 0
+        )
+        assert db.query(StagedResourceAncestor).count() == 0
+
+    def test_sync_staged_resource_ancestor_links(
+        self,
+        db: Session,
+        staged_resource_1: StagedResource,
+        staged_resource_2: StagedResource,
+        staged_resource_3: StagedResource,
+    ):
+        """Test that syncing a subtree's links only applies what changed."""
+        StagedResourceAncestor.create_all_staged_resource_ancestor_links(
+            db=db,
+            ancestor_links={
+                staged_resource_2.urn: {(staged_resource_1.urn, 1)},
+                staged_resource_3.urn: {
+                    (staged_resource_1.urn, 2),
+                    (staged_resource_2.urn, 1),
+                },
+            },
+        )
+        unchanged_link_id = (
+            db.query(StagedResourceAncestor)
+            .filter_by(
+                ancestor_urn=staged_resource_2.urn,
+                descendant_urn=staged_resource_3.urn,
+            )
+            .one()
+            .id
+        )
+
+        # Only the distance of one of staged_resource_3's links changed, and
+        # staged_resource_2's links aren't part of the sync
+        diff = StagedResourceAncestor.sync_staged_resource_ancestor_links(
+            db=db,
+            ancestor_links={
+                staged_resource_3.urn: {
+                    (staged_resource_1.urn, 1),
+                    (staged_resource_2.urn, 1),
+                },
+            },
+        )
+        assert diff == StagedResourceAncestorLinkDiff(inserted=0, updated=1, deleted=0)
+        db.expire_all()
+
+        links = {
+            (link.ancestor_urn, link.descendant_urn, link.distance)
+            for link in db.query(StagedResourceAncestor).all()
+        }
+        assert links == {
+            (staged_resource_1.urn, staged_resource_2.urn, 1),
+            (staged_resource_1.urn, staged_resource_3.urn, 1),
+            (staged_resource_2.urn, staged_resource_3.urn, 1),
+        }
+        # Links that didn't change are kept as they are
+        assert (
+            db.query(StagedResourceAncestor)
+            .filter_by(
+                ancestor_urn=staged_resource_2.urn,
+                descendant_urn=staged_resource_3.urn,
+            )
+            .one()
+            .id
+            == unchanged_link_id
+        )
+
+        diff = StagedResourceAncestor.sync_staged_resource_ancestor_links(
+            db=db,
+            ancestor_links={
+                staged_resource_2.urn: set(),
+                staged_resource_3.urn: {(staged_resource_1.urn, 1)},
+            },
+        )
+        assert diff == StagedResourceAncestorLinkDiff(inserted=0, updated=0, deleted=2)
+
+        diff = StagedResourceAncestor.sync_staged_resource_ancestor_links(
+            db=db,
+            ancestor_links={staged_resource_2.urn: {(staged_resource_1.urn, 1)}},
+        )
+        assert diff == StagedResourceAncestorLinkDiff(inserted=1, updated=0, deleted=0)
+        db.expire_all()
+
+        links = {
+            (link.ancestor_urn, link.descendant_urn, link.distance)
+            for link in db.query(StagedResourceAncestor).all()
+        }
+        assert links == {
+            (staged_resource_1.urn, staged_resource_2.urn, 1),
+            (staged_resource_1.urn, staged_resource_3.urn, 1),
+        }
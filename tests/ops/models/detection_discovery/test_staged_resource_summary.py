@@ -0,0 +1,160 @@
+import pytest
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from fides.api.models.detection_discovery.core import DiffStatus, StagedResource
+from fides.api.models.detection_discovery.staged_resource_summary import (
+    StagedResourceSummary,
+    StagedResourceSummaryReconciliation,
+    reconcile_staged_resource_summaries,
+)
+
+MONITOR_CONFIG_ID = "summary_test_monitor"
+
+
+@pytest.fixture(autouse=True)
+def clear_staged_resource_summaries(db: Session):
+    """Start from an empty rollup, regardless of the table cleanup order"""
+    db.query(StagedResourceSummary).delete()
+    db.commit()
+    yield
+
+
+def create_staged_resource(db: Session, urn: str, **data) -> StagedResource:
+    return StagedResource.create(
+        db=db,
+        data={
+            "urn": urn,
+            "name": urn,
+            "resource_type": "Table",
+            "monitor_config_id": MONITOR_CONFIG_ID,
+            "diff_status": DiffStatus.ADDITION.value,
+            **data,
+        },
+    )
+
+
+def get_monitor_counts(db: Session, **filters) -> int:
+    return sum(
+        StagedResourceSummary.get_counts(
+            db, monitor_config_id=MONITOR_CONFIG_ID, **filters
+        ).values()
+    )
+
+
+class TestStagedResourceSummary:
+    def test_counts_follow_inserts_updates_and_deletes(self, db: Session):
+        resources = [create_staged_resource(db, f"summary_urn_{i}") for i in range(3)]
+        create_staged_resource(
+            db,
+            "summary_urn_classified",
+            classifications=[{"label": "user.contact.email", "score": 1}],
+        )
+
+        assert get_monitor_counts(db) == 4
+        assert get_monitor_counts(db, is_classified=True) == 1
+        assert get_monitor_counts(db, diff_status=DiffStatus.ADDITION.value) == 4
+
+        resources[0].diff_status = DiffStatus.MONITORED.value
+        resources[0].save(db)
+        assert get_monitor_counts(db, diff_status=DiffStatus.ADDITION.value) == 3
+        assert get_monitor_counts(db, diff_status=DiffStatus.MONITORED.value) == 1
+
+        # Updates that don't change the summary dimensions leave the counts as is
+        resources[1].description = "A table"
+        resources[1].save(db)
+        assert get_monitor_counts(db) == 4
+
+        resources[2].delete(db)
+        assert get_monitor_counts(db) == 3
+        assert get_monitor_counts(db, diff_status=DiffStatus.ADDITION.value) == 2
+
+    def test_counts_follow_bulk_updates(self, db: Session):
+        for i in range(5):
+            create_staged_resource(db, f"summary_urn_{i}")
+
+        db.execute(
+            update(StagedResource)
+            .where(StagedResource.monitor_config_id == MONITOR_CONFIG_ID)
+            .values(diff_status=DiffStatus.MUTED.value)
+        )
+        db.commit()
+
+        assert StagedResourceSummary.get_counts(
+            db, monitor_config_id=MONITOR_CONFIG_ID
+        ) == {
+            (
+                MONITOR_CONFIG_ID,
+                None,
+                None,
+                "Table",
+                DiffStatus.MUTED.value,
+                False,
+                None,
+            ): 5
+        }
+
+    def test_system_summaries(self, db: Session, system):
+        create_staged_resource(
+            db,
+            "summary_urn_table",
+            system_id=system.id,
+            vendor_id="vendor_1",
+            meta={"consent_aggregated": "without_consent"},
+        )
+        create_staged_resource(
+            db,
+            "summary_urn_cookie",
+            system_id=system.id,
+            vendor_id="vendor_1",
+            resource_type="Cookie",
+            meta={"consent_aggregated": "without_consent"},
+        )
+
+        assert StagedResourceSummary.get_system_summaries(
+            db, system_ids=[system.id]
+        ) == [(system.id, "vendor_1", "without_consent", 2)]
+
+    def test_empty_strings_are_counted_as_null(self, db: Session):
+        create_staged_resource(db, "summary_urn_1", vendor_id="")
+        create_staged_resource(db, "summary_urn_2", vendor_id=None)
+
+        assert get_monitor_counts(db, vendor_id=None) == 2
+
+    def test_unknown_dimension(self, db: Session):
+        with pytest.raises(ValueError):
+            StagedResourceSummary.get_counts(db, name="summary_urn")
+
+    def test_reconcile_fixes_drift(self, db: Session):
+        for i in range(3):
+            create_staged_resource(db, f"summary_urn_{i}")
+        assert (
+            reconcile_staged_resource_summaries(db)
+            == StagedResourceSummaryReconciliation()
+        )
+
+        # Corrupt the rollup: a wrong count, a stale row and a missing row
+        db.query(StagedResourceSummary).update({"resource_count": 10})
+        db.add(
+            StagedResourceSummary(
+                monitor_config_id="deleted_monitor",
+                is_classified=False,
+                resource_count=2,
+            )
+        )
+        db.commit()
+        create_staged_resource(db, "summary_urn_muted", diff_status="muted")
+        db.query(StagedResourceSummary).filter_by(diff_status="muted").delete()
+        db.commit()
+
+        result = reconcile_staged_resource_summaries(db)
+
+        assert result == StagedResourceSummaryReconciliation(
+            inserted=1, updated=1, deleted=1
+        )
+        assert get_monitor_counts(db, diff_status=DiffStatus.ADDITION.value) == 3
+        assert get_monitor_counts(db, diff_status=DiffStatus.MUTED.value) == 1
+        assert (
+            StagedResourceSummary.get_counts(db, monitor_config_id="deleted_monitor")
+            == {}
+        )
@@ -1,10 +1,20 @@
+import time
 from json import dumps
 from typing import Any, Dict, Iterable
+from unittest import mock
 
 import pytest
 from sqlalchemy.orm import Session
 
-from fides.api.models.application_config import ApplicationConfig
+from fides.api.models.application_config import (
+    APPLICATION_CONFIG_SNAPSHOT_TTL_SECONDS,
+    APPLICATION_CONFIG_VERSION_CHECK_INTERVAL_SECONDS,
+    APPLICATION_CONFIG_VERSION_KEY,
+    ApplicationConfig,
+    ApplicationConfigSnapshot,
+    get_resolved_config_property,
+)
+from fides.api.util.cache import get_cache
 from fides.config import get_config
 from fides.config.config_proxy import ConfigProxy
 
@@ -571,3 +581,98 @@ class TestConfigProxy:
                 or resolve_origin in cors_origin_api_set
             )
         assert isinstance(proxy_resolved_cors_origins, set)
+
+
+class TestApplicationConfigSnapshot:
+    @pytest.fixture
+    def insert_example_config_record(self, db) -> None:
+        ApplicationConfig.create_or_update(
+            db,
+            data={
+                "api_set": {"notifications": {"notification_service_type": "twilio"}},
+                "config_set": {"security": {"cors_origins": ["http://a.com"]}},
+            },
+        )
+
+    @pytest.fixture
+    def load_spy(self):
+        with mock.patch.object(
+            ApplicationConfigSnapshot,
+            "load",
+            side_effect=ApplicationConfigSnapshot.load,
+        ) as load_spy:
+            yield load_spy
+
+    @pytest.mark.usefixtures("insert_example_config_record")
+    def test_reads_are_served_from_snapshot(self, db, load_spy):
+        for _ in range(3):
+            config_proxy = ConfigProxy(db)
+            assert config_proxy.notifications.notification_service_type == "twilio"
+            assert config_proxy.security.cors_origins == {"http://a.com"}
+
+        assert load_spy.call_count == 1
+
+    @pytest.mark.usefixtures("insert_example_config_record")
+    def test_commit_invalidates_snapshot(self, db, load_spy):
+        version = get_cache().get(APPLICATION_CONFIG_VERSION_KEY)
+        assert ConfigProxy(db).notifications.notification_service_type == "twilio"
+
+        ApplicationConfig.update_api_set(
+            db, {"notifications": {"notification_service_type": "mailgun"}}
+        )
+
+        assert ConfigProxy(db).notifications.notification_service_type == "mailgun"
+        assert load_spy.call_count == 2
+        assert get_cache().get(APPLICATION_CONFIG_VERSION_KEY) != version
+
+    @pytest.mark.usefixtures("insert_example_config_record")
+    def test_uncommitted_changes_are_visible_to_their_session(self, db):
+        assert ConfigProxy(db).notifications.notification_service_type == "twilio"
+
+        config_record = db.query(ApplicationConfig).first()
+        config_record.api_set = {"notifications": {"notification_service_type": "x"}}
+        db.flush()
+        assert ConfigProxy(db).notifications.notification_service_type == "x"
+
+        db.rollback()
+        assert ConfigProxy(db).notifications.notification_service_type == "twilio"
+
+    @pytest.mark.usefixtures("insert_example_config_record")
+    def test_version_change_from_other_process_reloads_snapshot(self, db, load_spy):
+        ConfigProxy(db).notifications.notification_service_type
+        get_cache().incr(APPLICATION_CONFIG_VERSION_KEY)
+
+        ConfigProxy(db).notifications.notification_service_type
+        assert load_spy.call_count == 1
+
+        later = time.monotonic() + APPLICATION_CONFIG_VERSION_CHECK_INTERVAL_SECONDS
+        with mock.patch("time.monotonic", return_value=later):
+            ConfigProxy(db).notifications.notification_service_type
+        assert load_spy.call_count == 2
+
+    @pytest.mark.usefixtures("insert_example_config_record")
+    def test_snapshot_expires_without_redis(self, db, load_spy):
+        with mock.patch(
+            "fides.api.models.application_config._get_application_config_version",
+            return_value=None,
+        ):
+            ConfigProxy(db).notifications.notification_service_type
+
+            later = time.monotonic() + APPLICATION_CONFIG_VERSION_CHECK_INTERVAL_SECONDS
+            with mock.patch("time.monotonic", return_value=later):
+                ConfigProxy(db).notifications.notification_service_type
+            assert load_spy.call_count == 1
+
+            later = time.monotonic() + APPLICATION_CONFIG_SNAPSHOT_TTL_SECONDS
+            with mock.patch("time.monotonic", return_value=later):
+                ConfigProxy(db).notifications.notification_service_type
+            assert load_spy.call_count == 2
+
+    @pytest.mark.usefixtures("insert_example_config_record")
+    def test_mutable_values_are_copied(self, db):
+        cors_origins = get_resolved_config_property(db, "security.cors_origins")
+        cors_origins.append("http://b.com")
+
+        assert get_resolved_config_property(db, "security.cors_origins") == [
+            "http://a.com"
+        ]
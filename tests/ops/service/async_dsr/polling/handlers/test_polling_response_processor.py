@@ -472,3 +472,18 @@ class TestPollingResponseProcessor:
         assert result.metadata["content_type"] == "image/svg+xml"
         assert result.metadata["preserved_as_attachment"] is True
         assert result.metadata["filename"] == "icon.svg"
+
+    @pytest.mark.parametrize(
+        "headers, expected",
+        [
+            ({}, None),
+            ({"Retry-After": "120"}, 120.0),
+            ({"Retry-After": "-5"}, 0.0),
+            ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0.0),
+            ({"Retry-After": "soon"}, None),
+        ],
+    )
+    def test_get_retry_after(self, headers, expected):
+        response = Mock(autospec=Response)
+        response.headers = headers
+        assert PollingResponseProcessor.get_retry_after(response) == expected
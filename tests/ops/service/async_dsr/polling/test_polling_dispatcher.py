@@ -0,0 +1,212 @@
+import time
+from unittest import mock
+
+import pytest
+
+from fides.api.models.privacy_request.request_task import (
+    AsyncTaskType,
+    RequestTask,
+    RequestTaskSubRequest,
+)
+from fides.api.models.worker_task import ExecutionLogStatus
+from fides.api.schemas.policy import ActionType
+from fides.api.schemas.saas.shared_schemas import PollingStatusResult
+from fides.api.service.async_dsr.polling_dispatcher import AsyncPollingDispatcher
+from fides.api.service.async_dsr.polling_schedule import (
+    ASYNC_POLLING_ATTEMPTS_KEY,
+    ASYNC_POLLING_NEXT_CHECK_KEY,
+    get_backoff_delay,
+    get_ready_key,
+    pop_ready_status,
+)
+from fides.api.util.cache import get_cache
+from fides.config import CONFIG
+
+CHECK_STATUS = (
+    "fides.api.service.async_dsr.strategies.async_dsr_strategy_polling."
+    "AsyncPollingStrategy.check_sub_request_status"
+)
+QUEUE_REQUEST_TASK = "fides.api.task.execute_request_tasks.queue_request_task"
+
+
+@pytest.fixture
+def redis_conn():
+    redis_conn = get_cache()
+    redis_conn.delete(ASYNC_POLLING_NEXT_CHECK_KEY, ASYNC_POLLING_ATTEMPTS_KEY)
+    yield redis_conn
+    redis_conn.delete(ASYNC_POLLING_NEXT_CHECK_KEY, ASYNC_POLLING_ATTEMPTS_KEY)
+
+
+@pytest.fixture
+def polling_task(
+    db, in_processing_privacy_request, saas_async_polling_example_connection_config
+):
+    connection_key = saas_async_polling_example_connection_config.key
+    request_task = RequestTask.create(
+        db,
+        data={
+            "action_type": ActionType.access,
+            "status": ExecutionLogStatus.polling,
+            "privacy_request_id": in_processing_privacy_request.id,
+            "collection_address": "saas_async_polling_config:user",
+            "dataset_name": "saas_async_polling_config",
+            "collection_name": "user",
+            "upstream_tasks": [],
+            "downstream_tasks": [],
+            "async_type": AsyncTaskType.polling,
+            "traversal_details": {
+                "dataset_connection_key": connection_key,
+                "incoming_edges": [],
+                "outgoing_edges": [],
+                "input_keys": [],
+            },
+        },
+    )
+    yield request_task
+    request_task.delete(db)
+
+
+@pytest.fixture
+def sub_request(db, redis_conn, polling_task):
+    sub_request = RequestTaskSubRequest.create(
+        db,
+        data={
+            "request_task_id": polling_task.id,
+            "param_values": {"correlation_id": "abc"},
+            "status": ExecutionLogStatus.pending.value,
+        },
+    )
+    yield sub_request
+    redis_conn.delete(get_ready_key(sub_request.id))
+
+
+@pytest.mark.async_dsr
+class TestAsyncPollingDispatcher:
+    def test_not_ready_sub_request_backs_off(self, db, redis_conn, sub_request):
+        now = time.time()
+        with (
+            mock.patch(
+                CHECK_STATUS, return_value=PollingStatusResult(is_complete=False)
+            ) as mock_check,
+            mock.patch(QUEUE_REQUEST_TASK) as mock_queue,
+        ):
+            AsyncPollingDispatcher(db, redis_conn).run(now)
+            # Not due again until the backoff has passed
+            result = AsyncPollingDispatcher(db, redis_conn).run(now + 1)
+
+        assert mock_check.call_count == 1
+        assert result.checked == 0
+        mock_queue.assert_not_called()
+        min_interval = CONFIG.execution.async_polling_min_check_interval_seconds
+        assert redis_conn.zscore(
+            ASYNC_POLLING_NEXT_CHECK_KEY, sub_request.id
+        ) == pytest.approx(now + min_interval)
+
+    def test_vendor_retry_after_is_respected(self, db, redis_conn, sub_request):
+        now = time.time()
+        with (
+            mock.patch(
+                CHECK_STATUS,
+                return_value=PollingStatusResult(
+                    is_complete=False, retry_after_seconds=30
+                ),
+            ),
+            mock.patch(QUEUE_REQUEST_TASK),
+        ):
+            AsyncPollingDispatcher(db, redis_conn).run(now)
+
+        assert redis_conn.zscore(
+            ASYNC_POLLING_NEXT_CHECK_KEY, sub_request.id
+        ) == pytest.approx(now + 30)
+
+    def test_ready_task_is_queued_with_its_status(
+        self, db, redis_conn, polling_task, sub_request
+    ):
+        with (
+            mock.patch(
+                CHECK_STATUS, return_value=PollingStatusResult(is_complete=True)
+            ),
+            mock.patch(QUEUE_REQUEST_TASK) as mock_queue,
+        ):
+            result = AsyncPollingDispatcher(db, redis_conn).run()
+
+        assert result.ready == 1
+        assert result.queued_task_ids == [polling_task.id]
+        mock_queue.assert_called_once_with(mock.ANY, privacy_request_proceed=True)
+        assert pop_ready_status(sub_request.id) == PollingStatusResult(is_complete=True)
+        assert pop_ready_status(sub_request.id) is None
+
+    def test_status_check_error_queues_task(
+        self, db, redis_conn, polling_task, sub_request
+    ):
+        with (
+            mock.patch(CHECK_STATUS, side_effect=Exception("Vendor unavailable")),
+            mock.patch(QUEUE_REQUEST_TASK) as mock_queue,
+        ):
+            result = AsyncPollingDispatcher(db, redis_conn).run()
+
+        assert result.queued_task_ids == [polling_task.id]
+        mock_queue.assert_called_once()
+
+    def test_concurrent_checks_use_their_own_client(
+        self, db, redis_conn, polling_task, sub_request
+    ):
+        other_sub_request = RequestTaskSubRequest.create(
+            db,
+            data={
+                "request_task_id": polling_task.id,
+                "param_values": {"correlation_id": "def"},
+                "status": ExecutionLogStatus.pending.value,
+            },
+        )
+        with (
+            mock.patch.object(
+                CONFIG.execution, "async_polling_connector_concurrency", 2
+            ),
+            mock.patch(
+                CHECK_STATUS,
+                autospec=True,
+                return_value=PollingStatusResult(is_complete=False),
+            ) as mock_check,
+            mock.patch(QUEUE_REQUEST_TASK),
+        ):
+            AsyncPollingDispatcher(db, redis_conn).run()
+
+        clients = [call.args[1] for call in mock_check.call_args_list]
+        assert len(clients) == 2
+        assert clients[0] is not clients[1]
+        assert clients[0].configuration is not clients[1].configuration
+        redis_conn.delete(get_ready_key(other_sub_request.id))
+
+    def test_task_without_polling_config_is_queued_at_legacy_interval(
+        self, db, redis_conn, polling_task, sub_request
+    ):
+        polling_task.traversal_details = None
+        polling_task.save(db)
+        now = time.time()
+
+        with (
+            mock.patch(CHECK_STATUS) as mock_check,
+            mock.patch(QUEUE_REQUEST_TASK) as mock_queue,
+        ):
+            AsyncPollingDispatcher(db, redis_conn).run(now)
+            AsyncPollingDispatcher(db, redis_conn).run(now + 60)
+
+        mock_check.assert_not_called()
+        mock_queue.assert_called_once()
+
+
+class TestBackoffDelay:
+    def test_delay_doubles_up_to_polling_interval(self):
+        min_interval = CONFIG.execution.async_polling_min_check_interval_seconds
+        assert get_backoff_delay(1) == min_interval
+        assert get_backoff_delay(2) == min_interval * 2
+        assert get_backoff_delay(100) == (
+            CONFIG.execution.async_polling_interval_hours * 3600
+        )
+
+    def test_vendor_delay_takes_precedence(self):
+        assert get_backoff_delay(5, retry_after=10) == 10
+        assert get_backoff_delay(1, retry_after=10**9) == (
+            CONFIG.execution.async_polling_interval_hours * 3600
+        )
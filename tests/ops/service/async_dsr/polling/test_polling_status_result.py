@@ -23,4 +23,5 @@ class TestPollingStatusResult:
         assert status_result.dict() == {
             "is_complete": True,
             "skip_result_request": True,
+            "retry_after_seconds": None,
         }
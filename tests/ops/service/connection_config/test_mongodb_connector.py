@@ -1,15 +1,19 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from urllib.parse import parse_qs, urlparse
 
 import pytest
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 from sqlalchemy.orm import Session
 
 from fides.api.common_exceptions import ConnectionException
+from fides.api.graph.config import CollectionAddress
 from fides.api.models.connectionconfig import ConnectionConfig
 from fides.api.schemas.connection_configuration.connection_secrets_mongodb import (
     MongoDBSchema,
 )
 from fides.api.service.connectors.mongodb_connector import MongoDBConnector
+from fides.config import CONFIG
 
 
 @pytest.mark.unit
@@ -263,3 +267,89 @@ class TestMongoDBConnector:
         assert query_params.get("ssl") == [
             "false"
         ]  # Should be added to override SRV default
+
+
+@pytest.mark.unit
+class TestMongoDBConnectorBulkOperations:
+    """Unit tests for the MongoDBConnector cursor streaming and bulk masking"""
+
+    @pytest.fixture
+    def node(self):
+        node = MagicMock()
+        node.address = CollectionAddress("mongo_test", "customer_details")
+        return node
+
+    @pytest.fixture
+    def query_config(self):
+        query_config = MagicMock()
+        query_config.generate_update_stmt.side_effect = lambda row, *_: (
+            ({"_id": row["_id"]}, {"$set": {"email": None}})
+            if row.get("email")
+            else None
+        )
+        return query_config
+
+    @pytest.fixture
+    def connector(self, mongo_connection_config, query_config):
+        connector = MongoDBConnector(configuration=mongo_connection_config)
+        connector.db_client = MagicMock()
+        with patch.object(connector, "query_config", return_value=query_config):
+            yield connector
+
+    def collection(self, connector) -> MagicMock:
+        return connector.db_client["mongo_test"]["customer_details"]
+
+    def test_retrieve_data_streams_cursor_in_batches(self, connector, node):
+        connector.query_config.return_value.generate_query.return_value = (
+            {"customer_id": {"$in": [1, 2]}},
+            {"_id": 1},
+        )
+        cursor = self.collection(connector).find.return_value
+        batched_cursor = cursor.batch_size.return_value
+        batched_cursor.__enter__.return_value = iter([{"_id": 1}, {"_id": 2}])
+
+        rows = connector.retrieve_data(node, None, None, None, {"customer_id": [1, 2]})
+
+        assert rows == [{"_id": 1}, {"_id": 2}]
+        self.collection(connector).find.assert_called_once_with(
+            {"customer_id": {"$in": [1, 2]}}, {"_id": 1}
+        )
+        cursor.batch_size.assert_called_once_with(
+            CONFIG.execution.mongodb_cursor_batch_size
+        )
+        batched_cursor.__exit__.assert_called_once()
+
+    def test_mask_data_bulk_writes_unordered(self, connector, node):
+        self.collection(connector).bulk_write.return_value.modified_count = 2
+        rows = [
+            {"_id": 1, "email": "customer-1@example.com"},
+            {"_id": 2, "email": "customer-2@example.com"},
+            {"_id": 3, "email": None},
+        ]
+
+        assert connector.mask_data(node, None, None, None, rows) == 2
+
+        self.collection(connector).bulk_write.assert_called_once_with(
+            [
+                UpdateOne({"_id": 1}, {"$set": {"email": None}}, upsert=False),
+                UpdateOne({"_id": 2}, {"$set": {"email": None}}, upsert=False),
+            ],
+            ordered=False,
+        )
+        self.collection(connector).update_one.assert_not_called()
+
+    def test_mask_data_without_updates(self, connector, node):
+        assert connector.mask_data(node, None, None, None, [{"_id": 1}]) == 0
+        self.collection(connector).bulk_write.assert_not_called()
+
+    def test_mask_data_bulk_write_error(self, connector, node):
+        self.collection(connector).bulk_write.side_effect = BulkWriteError(
+            {"nModified": 1, "writeErrors": [{"index": 1, "errmsg": "failed"}]}
+        )
+        rows = [
+            {"_id": 1, "email": "customer-1@example.com"},
+            {"_id": 2, "email": "customer-2@example.com"},
+        ]
+
+        with pytest.raises(BulkWriteError):
+            connector.mask_data(node, None, None, None, rows)
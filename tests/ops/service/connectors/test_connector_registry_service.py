@@ -233,8 +233,16 @@ def update_config(
         replace_dataset_placeholders_mock_function
     )
 
+    # the indexed versions of the "updated" templates are bumped as well
+    template_versions = ConnectorRegistry.get_template_versions()
+    template_versions["mailchimp"] = increment_ver(mailchimp_version)
+    template_versions["hubspot"] = increment_ver(hubspot_version)
+
     # run update "script"
-    update_saas_configs(db)
+    with mock.patch.object(
+        ConnectorRegistry, "get_template_versions", return_value=template_versions
+    ):
+        update_saas_configs(db)
 
     # confirm SaasTemplateDataset records were created during update
     assert (
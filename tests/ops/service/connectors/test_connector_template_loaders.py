@@ -1,3 +1,5 @@
+import json
+import os
 from io import BytesIO
 from unittest import mock
 from unittest.mock import MagicMock
@@ -12,10 +14,12 @@ from fides.api.schemas.saas.connector_template import ConnectorTemplate
 from fides.api.service.authentication.authentication_strategy import (
     AuthenticationStrategy,
 )
+from fides.api.service.connectors.saas import connector_registry_service
 from fides.api.service.connectors.saas.connector_registry_service import (
     ConnectorRegistry,
     CustomConnectorTemplateLoader,
     FileConnectorTemplateLoader,
+    FileConnectorTemplates,
 )
 from fides.api.service.saas_request.saas_request_override_factory import (
     SaaSRequestOverrideFactory,
@@ -57,6 +61,177 @@ class TestFileConnectorTemplateLoader:
         assert connector_templates.get("not_found") is None
 
 
+class TestFileConnectorTemplates:
+    @pytest.fixture(autouse=True)
+    def template_index_path(self, tmp_path, monkeypatch):
+        """Index the file templates from an empty on-disk index"""
+        index_path = str(tmp_path / "index.json")
+        monkeypatch.setattr(
+            connector_registry_service.CONFIG.execution,
+            "saas_connector_template_index_path",
+            index_path,
+        )
+        yield index_path
+        FileConnectorTemplateLoader._instance = None
+
+    @staticmethod
+    def index_mailchimp() -> None:
+        templates = FileConnectorTemplates.load()
+        templates["mailchimp"]
+        templates.save_index()
+
+    def test_templates_are_loaded_on_access(self):
+        templates = FileConnectorTemplates.load()
+
+        assert "mailchimp" in templates
+        assert templates._templates == {}
+
+        mailchimp_connector = templates["mailchimp"]
+
+        assert list(templates._templates) == ["mailchimp"]
+        assert mailchimp_connector.config == load_yaml_as_string(
+            "data/saas/config/mailchimp_config.yml"
+        )
+        assert mailchimp_connector.icon == encode_file_contents(
+            "data/saas/icon/mailchimp.svg"
+        )
+
+    def test_indexed_headers_are_not_parsed_again(self, template_index_path):
+        self.index_mailchimp()
+
+        with mock.patch.object(
+            connector_registry_service,
+            "SaaSConfig",
+            side_effect=AssertionError("The config was parsed"),
+        ):
+            templates = FileConnectorTemplates.load()
+            assert templates.get_header("mailchimp").human_readable == "Mailchimp"
+        assert os.stat(template_index_path).st_mode & 0o077 == 0
+
+    def test_indexed_versions_are_not_parsed_again(self):
+        self.index_mailchimp()
+        mailchimp_config = load_config_from_string(
+            load_yaml_as_string("data/saas/config/mailchimp_config.yml")
+        )
+
+        with mock.patch.object(
+            connector_registry_service,
+            "SaaSConfig",
+            side_effect=AssertionError("The config was parsed"),
+        ):
+            templates = FileConnectorTemplates.load()
+            assert templates.get_version("mailchimp") == mailchimp_config["version"]
+
+    def test_index_is_written_once_per_pass(self, template_index_path):
+        templates = FileConnectorTemplates.load()
+        templates["mailchimp"]
+        templates["stripe"]
+        assert not os.path.exists(template_index_path)
+
+        with mock.patch.object(
+            connector_registry_service.tempfile,
+            "NamedTemporaryFile",
+            wraps=connector_registry_service.tempfile.NamedTemporaryFile,
+        ) as named_temporary_file:
+            templates.save_index()
+            templates.save_index()
+            FileConnectorTemplates.load()["mailchimp"]
+
+        assert named_temporary_file.call_count == 1
+        with open(template_index_path, "r", encoding="utf-8") as file:
+            signed_index = json.load(file)
+        indexed_types = {
+            entry["connector_type"]
+            for entry in signed_index["index"]["templates"].values()
+        }
+        assert {"mailchimp", "stripe"} <= indexed_types
+
+    def test_indexed_templates_are_still_validated(self):
+        self.index_mailchimp()
+
+        with mock.patch.object(
+            connector_registry_service,
+            "SaaSConfig",
+            side_effect=ValueError("Invalid config"),
+        ):
+            templates = FileConnectorTemplates.load()
+            assert templates.get("mailchimp") is None
+        assert "mailchimp" not in templates
+
+    def test_tampered_index_is_ignored(self, template_index_path):
+        self.index_mailchimp()
+        with open(template_index_path, "r", encoding="utf-8") as file:
+            signed_index = json.load(file)
+        for entry in signed_index["index"]["templates"].values():
+            entry["header"]["human_readable"] = "Tampered"
+            entry["header"]["authorization_required"] = False
+        with open(template_index_path, "w", encoding="utf-8") as file:
+            json.dump(signed_index, file)
+
+        templates = FileConnectorTemplates.load()
+
+        assert templates.get_header("mailchimp").human_readable == "Mailchimp"
+
+    def test_templates_which_fail_to_load_are_skipped(self):
+        templates = FileConnectorTemplates.load()
+        load_template = templates._load_template
+
+        def fail_mailchimp(connector_type, entry):
+            if connector_type == "mailchimp":
+                raise ValueError("Invalid config")
+            return load_template(connector_type, entry)
+
+        with mock.patch.object(templates, "_load_template", fail_mailchimp):
+            loaded = dict(templates.items())
+            combined = connector_registry_service.CombinedConnectorTemplates(
+                {}, templates
+            )
+            assert combined.get("mailchimp") is None
+
+        assert "mailchimp" not in loaded
+        assert len(loaded) == len(templates)
+        assert list(templates.values()) == list(loaded.values())
+
+    def test_index_of_another_version_is_ignored(self, template_index_path):
+        self.index_mailchimp()
+        with open(template_index_path, "r", encoding="utf-8") as file:
+            index = json.load(file)
+        stale_index = {**index["index"], "version": "0.0.0"}
+        for entry in stale_index["templates"].values():
+            entry["header"]["human_readable"] = "Stale"
+        with open(template_index_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "index": stale_index,
+                    "signature": connector_registry_service._sign_index(stale_index),
+                },
+                file,
+            )
+
+        templates = FileConnectorTemplates.load()
+
+        assert templates["mailchimp"].human_readable == "Mailchimp"
+
+    def test_summary_matches_templates(self):
+        FileConnectorTemplateLoader._instance = None
+        CustomConnectorTemplateLoader.get_connector_templates.cache_clear()  # type: ignore[attr-defined]
+        summaries = {
+            summary.type: summary
+            for summary in ConnectorRegistry.get_all_connector_templates_summary()
+        }
+
+        for (
+            connector_type,
+            template,
+        ) in FileConnectorTemplateLoader.get_connector_templates().items():
+            assert summaries[connector_type].name == template.human_readable
+            assert (
+                summaries[connector_type].supported_actions
+                == template.supported_actions
+            )
+            assert summaries[connector_type].category == template.category
+
+
 class TestCustomConnectorTemplateLoader:
     @pytest.fixture(scope="function", autouse=True)
     def reset_connector_template_loaders(self):
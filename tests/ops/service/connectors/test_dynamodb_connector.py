@@ -0,0 +1,298 @@
+import json
+from typing import Any, Dict, List, Optional
+
+import pytest
+from boto3.dynamodb.types import TypeSerializer
+from fideslang.models import Dataset
+
+from fides.api.graph.config import CollectionAddress
+from fides.api.graph.graph import DatasetGraph
+from fides.api.graph.traversal import Traversal
+from fides.api.models.datasetconfig import convert_dataset_to_graph
+from fides.api.models.privacy_request import PrivacyRequest
+from fides.api.service.connectors import dynamodb_connector
+from fides.api.service.connectors.dynamodb_connector import DynamoDBConnector
+from fides.connectors.models import ConnectorFailureException
+
+privacy_request = PrivacyRequest(id="234544")
+serializer = TypeSerializer()
+
+
+class FakeDynamoDBClient:
+    """
+    An in-memory stand-in for a DynamoDB client. Queries return a page of at most
+    `page_size` items, and the first batch request of each kind leaves part of its
+    keys or items unprocessed, like DynamoDB does when throttled.
+    """
+
+    def __init__(
+        self,
+        tables: Dict[str, List[Dict[str, Any]]],
+        key_schemas: Dict[str, List[Dict[str, str]]],
+        page_size: int = 2,
+        unprocessed: int = 1,
+    ):
+        self.tables = {
+            name: [
+                {key: serializer.serialize(value) for key, value in item.items()}
+                for item in items
+            ]
+            for name, items in tables.items()
+        }
+        self.key_schemas = key_schemas
+        self.page_size = page_size
+        self.unprocessed = {"get": unprocessed, "write": unprocessed}
+        self.calls: Dict[str, int] = {}
+
+    def _record(self, method: str) -> None:
+        self.calls[method] = self.calls.get(method, 0) + 1
+
+    def _key(self, table: str, item: Dict[str, Any]) -> str:
+        return json.dumps(
+            [item[key["AttributeName"]] for key in self.key_schemas[table]],
+            sort_keys=True,
+        )
+
+    def describe_table(self, TableName: str) -> Dict[str, Any]:
+        self._record("describe_table")
+        return {
+            "Table": {
+                "KeySchema": self.key_schemas[TableName],
+                "AttributeDefinitions": [
+                    {"AttributeName": key["AttributeName"], "AttributeType": "S"}
+                    for key in self.key_schemas[TableName]
+                ],
+            }
+        }
+
+    def batch_get_item(self, RequestItems: Dict[str, Any]) -> Dict[str, Any]:
+        self._record("batch_get_item")
+        ((table, request),) = RequestItems.items()
+        assert len(request["Keys"]) <= 100
+        keys = request["Keys"]
+        processed, unprocessed = (
+            keys[self.unprocessed["get"] :],
+            keys[: self.unprocessed["get"]],
+        )
+        self.unprocessed["get"] = 0
+        wanted = {self._key(table, key) for key in processed}
+        response: Dict[str, Any] = {
+            "Responses": {
+                table: [
+                    item
+                    for item in self.tables[table]
+                    if self._key(table, item) in wanted
+                ]
+            }
+        }
+        if unprocessed:
+            response["UnprocessedKeys"] = {table: {"Keys": unprocessed}}
+        return response
+
+    def query(
+        self,
+        TableName: str,
+        ExpressionAttributeValues: Dict[str, Any],
+        KeyConditionExpression: str,
+        ExclusiveStartKey: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        self._record("query")
+        attribute_name = KeyConditionExpression.split(" = ")[0]
+        matches = [
+            item
+            for item in self.tables[TableName]
+            if item[attribute_name] == ExpressionAttributeValues[":value"]
+        ]
+        start = int(ExclusiveStartKey["offset"]["N"]) if ExclusiveStartKey else 0
+        response: Dict[str, Any] = {"Items": matches[start : start + self.page_size]}
+        if start + self.page_size < len(matches):
+            response["LastEvaluatedKey"] = {
+                "offset": {"N": str(start + self.page_size)}
+            }
+        return response
+
+    def batch_write_item(self, RequestItems: Dict[str, Any]) -> Dict[str, Any]:
+        self._record("batch_write_item")
+        ((table, requests),) = RequestItems.items()
+        assert len(requests) <= 25
+        items = [request["PutRequest"]["Item"] for request in requests]
+        assert len({self._key(table, item) for item in items}) == len(items)
+        processed, unprocessed = (
+            requests[self.unprocessed["write"] :],
+            requests[: self.unprocessed["write"]],
+        )
+        self.unprocessed["write"] = 0
+        for request in processed:
+            item = request["PutRequest"]["Item"]
+            self.tables[table] = [
+                existing
+                for existing in self.tables[table]
+                if self._key(table, existing) != self._key(table, item)
+            ] + [item]
+        if unprocessed:
+            return {"UnprocessedItems": {table: unprocessed}}
+        return {}
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(dynamodb_connector, "BATCH_RETRY_BASE_DELAY_SECONDS", 0)
+
+
+class TestDynamoDBConnector:
+    @pytest.fixture(scope="function")
+    def traversal(self, integration_dynamodb_config, example_datasets):
+        dataset = Dataset(**example_datasets[11])
+        dataset_graph = convert_dataset_to_graph(
+            dataset, integration_dynamodb_config.key
+        )
+        return Traversal(
+            DatasetGraph(dataset_graph), {"email": "customer-1@example.com"}
+        )
+
+    @pytest.fixture(scope="function")
+    def customer_node(self, traversal):
+        return traversal.traversal_node_dict[
+            CollectionAddress("dynamodb_example_test_dataset", "customer")
+        ].to_mock_execution_node()
+
+    @pytest.fixture(scope="function")
+    def login_node(self, traversal):
+        return traversal.traversal_node_dict[
+            CollectionAddress("dynamodb_example_test_dataset", "login")
+        ].to_mock_execution_node()
+
+    @pytest.fixture(scope="function")
+    def client(self):
+        return FakeDynamoDBClient(
+            tables={
+                "customer": [
+                    {
+                        "id": str(i),
+                        "customer_email": f"customer-{i}@example.com",
+                        "name": f"Customer {i}",
+                    }
+                    for i in range(250)
+                ],
+                "login": [
+                    {
+                        "customer_id": str(i % 3),
+                        "login_date": f"2024-01-{i:02d}",
+                        "name": f"Customer {i % 3}",
+                    }
+                    for i in range(1, 10)
+                ],
+            },
+            key_schemas={
+                "customer": [{"AttributeName": "id", "KeyType": "HASH"}],
+                "login": [
+                    {"AttributeName": "customer_id", "KeyType": "HASH"},
+                    {"AttributeName": "login_date", "KeyType": "RANGE"},
+                ],
+            },
+        )
+
+    @pytest.fixture(scope="function")
+    def connector(self, integration_dynamodb_config, client):
+        connector = DynamoDBConnector(integration_dynamodb_config)
+        connector.db_client = client
+        return connector
+
+    def test_retrieve_data_batch_gets_partition_keys(
+        self, connector, client, customer_node, policy
+    ):
+        ids = [str(i) for i in range(250)]
+        input_data = {"id": ids + ids[:10]}
+
+        rows = connector.retrieve_data(
+            customer_node, policy, privacy_request, None, input_data
+        )
+
+        assert sorted(row["id"] for row in rows) == sorted(ids)
+        # Three requests of at most 100 keys, and a retry of the unprocessed key
+        assert client.calls["batch_get_item"] == 4
+        assert "query" not in client.calls
+        # The input data isn't modified
+        assert len(input_data["id"]) == 260
+
+    def test_retrieve_data_queries_every_page(
+        self, connector, client, login_node, policy
+    ):
+        rows = connector.retrieve_data(
+            login_node, policy, privacy_request, None, {"customer_id": ["0", "1"]}
+        )
+
+        assert sorted(row["login_date"] for row in rows) == [
+            "2024-01-01",
+            "2024-01-03",
+            "2024-01-04",
+            "2024-01-06",
+            "2024-01-07",
+            "2024-01-09",
+        ]
+        # Two pages of each customer's three logins
+        assert client.calls["query"] == 4
+        assert "batch_get_item" not in client.calls
+
+    def test_retrieve_data_without_input(
+        self, connector, client, customer_node, policy
+    ):
+        assert (
+            connector.retrieve_data(customer_node, policy, privacy_request, None, {})
+            == []
+        )
+        assert "batch_get_item" not in client.calls
+
+    def test_table_is_described_once(
+        self, connector, client, customer_node, policy, erasure_policy
+    ):
+        rows = connector.retrieve_data(
+            customer_node, policy, privacy_request, None, {"id": ["1"]}
+        )
+        connector.mask_data(customer_node, erasure_policy, privacy_request, None, rows)
+
+        assert client.calls["describe_table"] == 1
+
+    def test_mask_data_batch_writes(
+        self, connector, client, customer_node, policy, erasure_policy
+    ):
+        rows = connector.retrieve_data(
+            customer_node,
+            policy,
+            privacy_request,
+            None,
+            {"id": [str(i) for i in range(60)]},
+        )
+
+        # A duplicated row can't be written in the same request
+        update_ct = connector.mask_data(
+            customer_node,
+            erasure_policy,
+            privacy_request,
+            None,
+            rows + [dict(rows[-1])],
+        )
+
+        assert update_ct == 61
+        # 25, 25 and 10 rows, the duplicated row, and the unprocessed row's retry
+        assert client.calls["batch_write_item"] == 5
+        masked = [
+            item for item in client.tables["customer"] if int(item["id"]["S"]) < 60
+        ]
+        assert len(masked) == 60
+        assert all(item["name"] == {"NULL": True} for item in masked)
+
+    def test_mask_data_raises_when_items_stay_unprocessed(
+        self, connector, client, customer_node, policy, erasure_policy
+    ):
+        rows = connector.retrieve_data(
+            customer_node, policy, privacy_request, None, {"id": ["1"]}
+        )
+        client.batch_write_item = lambda RequestItems: {
+            "UnprocessedItems": RequestItems
+        }
+
+        with pytest.raises(ConnectorFailureException):
+            connector.mask_data(
+                customer_node, erasure_policy, privacy_request, None, rows
+            )
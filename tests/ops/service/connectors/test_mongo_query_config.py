@@ -130,6 +130,14 @@ class TestMongoQueryConfig:
             CollectionAddress("mongo_test", "customer_details")
         ].to_mock_execution_node()
         config = MongoQueryConfig(customer_details)
+        # Duplicate input values are only matched once
+        assert config.generate_query({"customer_id": [1, 2, 1]}, policy)[0] == {
+            "customer_id": {"$in": [1, 2]}
+        }
+        # ...but values of different types are kept, even if Python deems them equal
+        assert config.generate_query({"customer_id": [1, True, 1.0, 1]}, policy)[0] == {
+            "customer_id": {"$in": [1, True, 1.0]}
+        }
         input_data = {"customer_id": [1]}
         # Tuple of query, projection - Projection is specifying fields at the top-level. Nested data will
         # be filtered later.
@@ -634,6 +634,90 @@ class TestSQLQueryConfig:
             text_clause._bindparams["masked_email"].value == "*****"
         )  # String rewrite masking strategy
 
+    def test_update_value_maps_masks_each_column_once(
+        self, erasure_policy, example_datasets, connection_config
+    ):
+        dataset = Dataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset, connection_config.key)
+        dataset_graph = DatasetGraph(*[graph])
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+
+        customer_node = traversal.traversal_node_dict[
+            CollectionAddress("postgres_example_test_dataset", "customer")
+        ].to_mock_execution_node()
+
+        config = SQLQueryConfig(customer_node)
+        rows = [
+            {"email": "customer-1@example.com", "name": "John", "id": 1},
+            {"email": "customer-2@example.com", "name": "John", "id": 2},
+            {"email": "customer-1@example.com", "name": "Jane", "id": 3},
+        ]
+
+        rule = erasure_policy.rules[0]
+        rule.targets[0].data_category = DataCategory("user").value
+        rule.masking_strategy = {
+            "strategy": "hash",
+            "configuration": {"algorithm": "SHA-512"},
+        }
+        secret = MaskingSecretCache[str](
+            secret="adobo",
+            masking_strategy=HashMaskingStrategy.name,
+            secret_type=SecretType.salt,
+        )
+        cache_secret(secret, privacy_request.id)
+
+        with mock.patch.object(
+            HashMaskingStrategy,
+            "mask",
+            autospec=True,
+            side_effect=HashMaskingStrategy.mask,
+        ) as mock_mask:
+            value_maps = config.update_value_maps(rows, erasure_policy, privacy_request)
+
+        # One call per masked column (id has no data type, so hash can't mask it),
+        # each with the column's distinct values only
+        assert [call.args[1] for call in mock_mask.call_args_list] == [
+            ["customer-1@example.com", "customer-2@example.com"],
+            ["John", "Jane"],
+        ]
+        assert value_maps == [
+            config.update_value_map(row, erasure_policy, privacy_request)
+            for row in rows
+        ]
+        assert value_maps[0]["email"] == value_maps[2]["email"]
+        assert value_maps[0]["name"] != value_maps[2]["name"]
+        clear_cache_secrets(privacy_request.id)
+
+    def test_generate_update_stmt_uses_given_value_maps(
+        self, erasure_policy, example_datasets, connection_config
+    ):
+        dataset = Dataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset, connection_config.key)
+        dataset_graph = DatasetGraph(*[graph])
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+
+        customer_node = traversal.traversal_node_dict[
+            CollectionAddress("postgres_example_test_dataset", "customer")
+        ].to_mock_execution_node()
+
+        config = SQLQueryConfig(customer_node)
+        rows = [{"name": "John Customer", "id": i} for i in range(3)]
+
+        value_maps = config.update_value_maps(rows, erasure_policy, privacy_request)
+        with mock.patch.object(config, "update_value_maps") as mock_update_value_maps:
+            text_clauses = [
+                config.generate_update_stmt(
+                    row, erasure_policy, privacy_request, value_map=value_map
+                )
+                for row, value_map in zip(rows, value_maps)
+            ]
+
+        mock_update_value_maps.assert_not_called()
+        assert [clause._bindparams["id"].value for clause in text_clauses] == [0, 1, 2]
+        assert all(
+            clause._bindparams["masked_name"].value is None for clause in text_clauses
+        )
+
     def test_generate_update_stmt_one_field_without_primary_keys(
         self, erasure_policy, example_datasets, connection_config
     ):
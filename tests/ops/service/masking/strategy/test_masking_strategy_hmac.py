@@ -1,4 +1,5 @@
 from datetime import datetime
+from unittest import mock
 
 from fides.api.schemas.masking.masking_configuration import HmacMaskingConfiguration
 from fides.api.schemas.masking.masking_secrets import MaskingSecretCache, SecretType
@@ -170,3 +171,27 @@ def test_mask_arguments_date():
     masked = masker.mask([datetime(2000, 1, 1)], request_id)
     assert expected == masked
     clear_cache_secrets(request_id)
+
+
+def test_mask_batch_masks_each_distinct_value_once():
+    masker = HmacMaskingStrategy(HmacMaskingConfiguration())
+    secret_key = MaskingSecretCache[str](
+        secret="test_key",
+        masking_strategy=HmacMaskingStrategy.name,
+        secret_type=SecretType.key,
+    )
+    cache_secret(secret_key, request_id)
+    secret_salt = MaskingSecretCache[str](
+        secret="test_salt",
+        masking_strategy=HmacMaskingStrategy.name,
+        secret_type=SecretType.salt,
+    )
+    cache_secret(secret_salt, request_id)
+
+    values = ["my_data", "other_data", None, "my_data", "my_data"]
+    with mock.patch.object(masker, "mask", wraps=masker.mask) as mock_mask:
+        masked = masker.mask_batch(values, request_id)
+
+    mock_mask.assert_called_once_with(["my_data", "other_data", None], request_id)
+    assert masked == masker.mask(values, request_id)
+    clear_cache_secrets(request_id)
@@ -31,3 +31,12 @@ def test_mask_no_value():
     config = RandomStringMaskingConfiguration(length=6)
     masker = RandomStringRewriteMaskingStrategy(configuration=config)
     assert None is masker.mask(None, request_id)
+
+
+def test_mask_batch_does_not_reuse_random_values():
+    request_id = "123432"
+    config = RandomStringMaskingConfiguration(length=25)
+    masker = RandomStringRewriteMaskingStrategy(configuration=config)
+    masked = masker.mask_batch(["string to mask", "string to mask"], request_id)
+    assert len(masked) == 2
+    assert masked[0] != masked[1]
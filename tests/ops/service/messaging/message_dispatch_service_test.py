@@ -34,12 +34,18 @@ from fides.api.schemas.privacy_request import Consent
 from fides.api.schemas.redis_cache import Identity
 from fides.api.service.messaging.message_dispatch_service import (
     EMAIL_TEMPLATE_NAME,
+    BatchMessage,
     _compose_twilio_mail,
     _get_dispatcher_from_config_type,
     _get_template_id_if_exists,
     _twilio_email_dispatcher,
     _twilio_sms_dispatcher,
     dispatch_message,
+    dispatch_message_batch,
+)
+from fides.api.service.messaging.messaging_throughput import (
+    get_messaging_throughput,
+    reset_messaging_throughput,
 )
 from fides.config import CONFIG
 
@@ -1177,3 +1183,101 @@ class TestTwilioSmsDispatcher:
             + "This code will expire in 10 minutes",
             "+12312341231",
         )
+
+
+@pytest.mark.unit
+class TestDispatchMessageBatch:
+    @pytest.fixture
+    def mailgun_url(self, messaging_config):
+        details = messaging_config.details
+        api_version = details[MessagingServiceDetails.API_VERSION.value]
+        domain = details[MessagingServiceDetails.DOMAIN.value]
+        return f"https://api.mailgun.net/{api_version}/{domain}"
+
+    def test_mailgun_batch_sends_identical_emails_together(
+        self, db: Session, messaging_config, mailgun_url
+    ) -> None:
+        reset_messaging_throughput()
+        messages = [
+            BatchMessage(to_identity=Identity(email="customer-1@example.com")),
+            BatchMessage(to_identity=Identity(phone_number="+12312341231")),
+            BatchMessage(to_identity=Identity(email="customer-2@example.com")),
+        ]
+        with requests_mock.Mocker() as mock_response:
+            mock_response.get(f"{mailgun_url}/templates/fides", status_code=404)
+            mock_messages = mock_response.post(f"{mailgun_url}/messages", json={})
+            result = dispatch_message_batch(
+                db=db,
+                action_type=MessagingActionType.PRIVACY_REQUEST_REVIEW_APPROVE,
+                messages=messages,
+                service_type=MessagingServiceType.mailgun.value,
+            )
+
+        assert result.sent == 2
+        assert result.failed == {1: "No email identity supplied."}
+        assert mock_messages.call_count == 1
+        body = mock_messages.last_request.text
+        assert "customer-1%40example.com" in body
+        assert "customer-2%40example.com" in body
+        assert "recipient-variables" in body
+
+        throughput = get_messaging_throughput()[MessagingServiceType.mailgun.value]
+        assert throughput.sent == 2
+        assert throughput.failed == 1
+        assert throughput.batches == 1
+
+    def test_mailgun_batch_failed_request(
+        self, db: Session, messaging_config, mailgun_url
+    ) -> None:
+        with requests_mock.Mocker() as mock_response:
+            mock_response.get(f"{mailgun_url}/templates/fides", status_code=404)
+            mock_response.post(f"{mailgun_url}/messages", status_code=500)
+            result = dispatch_message_batch(
+                db=db,
+                action_type=MessagingActionType.PRIVACY_REQUEST_REVIEW_DENY,
+                messages=[
+                    BatchMessage(
+                        to_identity=Identity(email=f"customer-{i}@example.com"),
+                        body_params=RequestReviewDenyBodyParams(
+                            rejection_reason="Unpaid balance"
+                        ),
+                    )
+                    for i in range(2)
+                ],
+                service_type=MessagingServiceType.mailgun.value,
+            )
+
+        assert result.sent == 0
+        assert result.failed == {
+            0: "Email failed to send with status code 500",
+            1: "Email failed to send with status code 500",
+        }
+
+    def test_batch_no_service_type(self, db: Session) -> None:
+        with pytest.raises(MessageDispatchException):
+            dispatch_message_batch(
+                db=db,
+                action_type=MessagingActionType.PRIVACY_REQUEST_REVIEW_APPROVE,
+                messages=[BatchMessage(to_identity=Identity(email="a@example.com"))],
+                service_type=None,
+            )
+
+    def test_sms_batch_reuses_client(
+        self, db: Session, messaging_config_twilio_sms
+    ) -> None:
+        with mock.patch(
+            "fides.api.service.messaging.message_dispatch_service.Client"
+        ) as mock_client:
+            result = dispatch_message_batch(
+                db=db,
+                action_type=MessagingActionType.PRIVACY_REQUEST_REVIEW_APPROVE,
+                messages=[
+                    BatchMessage(to_identity=Identity(phone_number="+12312341231")),
+                    BatchMessage(to_identity=Identity(phone_number="+12312341232")),
+                ],
+                service_type=MessagingServiceType.twilio_text.value,
+            )
+
+        assert result.sent == 2
+        mock_client.assert_called_once()
+        assert mock_client.return_value.messages.create.call_count == 2
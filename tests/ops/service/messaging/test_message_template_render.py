@@ -61,3 +61,26 @@ class TestMessageTemplateRender:
 
         rendered_template = _render(template_str, variables)
         assert rendered_template == template_str
+
+    def test_template_render_values_are_not_rendered(self):
+        """
+        Test that a value containing a placeholder is inserted as-is, rather than
+        rendered as part of the template.
+        """
+        rendered_template = _render(
+            "__NAME__ from __ORGANIZATION__",
+            {"name": "__ORGANIZATION__", "organization": "Ethyca"},
+        )
+        assert rendered_template == "__ORGANIZATION__ from Ethyca"
+
+    def test_edited_template_is_rendered(self):
+        """
+        Test that a cached template is not used once the template is edited.
+        """
+        variables = {"denial_reason": "Unpaid balance"}
+        assert _render("Denied: __DENIAL_REASON__", variables) == (
+            "Denied: Unpaid balance"
+        )
+        assert _render("Request denied. __DENIAL_REASON__.", variables) == (
+            "Request denied. Unpaid balance."
+        )
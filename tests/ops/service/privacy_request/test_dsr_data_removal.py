@@ -0,0 +1,174 @@
+import os
+from datetime import datetime, timedelta
+from unittest import mock
+
+import pytest
+
+from fides.api.models.privacy_request import RequestTask
+from fides.api.schemas.policy import ActionType
+from fides.api.schemas.privacy_request import PrivacyRequestStatus
+from fides.api.service.external_data_storage import ExternalDataStorageService
+from fides.api.service.privacy_request.dsr_data_removal import (
+    DSR_DATA_REMOVAL_PROGRESS,
+    DSRDataRemovalProgress,
+    run_dsr_data_removal,
+    save_progress,
+)
+from fides.api.service.storage.util import get_local_filename
+from fides.api.util.cache import get_cache
+from fides.config import CONFIG
+
+
+@pytest.fixture
+def redis_conn():
+    redis_conn = get_cache()
+    redis_conn.delete(DSR_DATA_REMOVAL_PROGRESS)
+    yield redis_conn
+    redis_conn.delete(DSR_DATA_REMOVAL_PROGRESS)
+
+
+@pytest.fixture
+def removal_settings():
+    original = (
+        CONFIG.execution.dsr_data_removal_batch_size,
+        CONFIG.execution.dsr_data_removal_batch_delay,
+    )
+    CONFIG.execution.dsr_data_removal_batch_size = 2
+    CONFIG.execution.dsr_data_removal_batch_delay = 0
+    yield CONFIG
+    (
+        CONFIG.execution.dsr_data_removal_batch_size,
+        CONFIG.execution.dsr_data_removal_batch_delay,
+    ) = original
+
+
+@pytest.fixture
+def expired_progress():
+    """A run whose cutoffs include everything created up until now."""
+    now = datetime.now() + timedelta(seconds=1)
+    return DSRDataRemovalProgress(
+        started_at=now, request_task_cutoff=now, privacy_request_cutoff=now
+    )
+
+
+@pytest.fixture
+def completed_privacy_request(db, privacy_request):
+    privacy_request.status = PrivacyRequestStatus.complete
+    privacy_request.access_result_urls = {"access_result_urls": ["www.example.com"]}
+    privacy_request.save(db)
+    return privacy_request
+
+
+def _create_request_tasks(db, privacy_request, count):
+    return [
+        RequestTask.create(
+            db,
+            data={
+                "action_type": ActionType.access,
+                "status": "complete",
+                "privacy_request_id": privacy_request.id,
+                "collection_address": f"test_dataset:collection_{i}",
+                "dataset_name": "test_dataset",
+                "collection_name": f"collection_{i}",
+                "upstream_tasks": [],
+                "downstream_tasks": [],
+            },
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.usefixtures("removal_settings")
+class TestRunDSRDataRemoval:
+    def test_removes_data_in_batches(
+        self, db, redis_conn, completed_privacy_request, expired_progress
+    ):
+        _create_request_tasks(db, completed_privacy_request, 5)
+        save_progress(redis_conn, expired_progress)
+        CONFIG.execution.dsr_data_removal_batch_delay = 0.1
+
+        with mock.patch(
+            "fides.api.service.privacy_request.dsr_data_removal.time.sleep"
+        ) as mock_sleep:
+            progress = run_dsr_data_removal(db, redis_conn)
+
+        assert progress.request_tasks_deleted == 5
+        assert progress.privacy_requests_cleared == 1
+        # 3 batches of request tasks (2, 2, 1) and 1 of privacy requests
+        assert progress.batches == 4
+        assert mock_sleep.call_count == 2
+        assert progress.completed_at is not None
+
+        db.refresh(completed_privacy_request)
+        assert not completed_privacy_request.request_tasks.count()
+        assert completed_privacy_request.access_result_urls is None
+
+    def test_resumes_interrupted_run(
+        self, db, redis_conn, completed_privacy_request, expired_progress
+    ):
+        _create_request_tasks(db, completed_privacy_request, 5)
+        save_progress(redis_conn, expired_progress)
+
+        with mock.patch.object(
+            db, "commit", side_effect=[None, Exception("Interrupted")]
+        ):
+            with pytest.raises(Exception, match="Interrupted"):
+                run_dsr_data_removal(db, redis_conn)
+        db.rollback()
+
+        checkpoint = DSRDataRemovalProgress.from_json(
+            redis_conn.get(DSR_DATA_REMOVAL_PROGRESS)
+        )
+        assert checkpoint.completed_at is None
+        assert checkpoint.request_tasks_deleted == 2
+        assert checkpoint.request_task_cutoff == expired_progress.request_task_cutoff
+
+        progress = run_dsr_data_removal(db, redis_conn)
+        assert progress.started_at == expired_progress.started_at
+        assert progress.request_tasks_deleted == 5
+        assert not completed_privacy_request.request_tasks.count()
+
+    def test_completed_run_is_not_resumed(self, db, redis_conn, expired_progress):
+        expired_progress.completed_at = datetime.now()
+        save_progress(redis_conn, expired_progress)
+
+        progress = run_dsr_data_removal(db, redis_conn)
+
+        assert progress.started_at != expired_progress.started_at
+
+    def test_incomplete_privacy_requests_are_kept(
+        self, db, redis_conn, privacy_request, expired_progress
+    ):
+        _create_request_tasks(db, privacy_request, 2)
+        save_progress(redis_conn, expired_progress)
+
+        progress = run_dsr_data_removal(db, redis_conn)
+
+        assert progress.request_tasks_deleted == 0
+        assert privacy_request.request_tasks.count() == 2
+
+    def test_external_storage_files_are_deleted(
+        self,
+        db,
+        redis_conn,
+        completed_privacy_request,
+        expired_progress,
+        storage_config_local,
+    ):
+        (request_task,) = _create_request_tasks(db, completed_privacy_request, 1)
+        metadata = ExternalDataStorageService.store_data(
+            db=db,
+            storage_path=f"RequestTask/{request_task.id}/access_data/test.txt",
+            data=[{"email": "customer-1@example.com"}],
+            storage_key=storage_config_local.key,
+        )
+        request_task._access_data = metadata.model_dump()
+        request_task.save(db)
+        assert os.path.exists(get_local_filename(metadata.file_key))
+        save_progress(redis_conn, expired_progress)
+
+        progress = run_dsr_data_removal(db, redis_conn)
+
+        assert progress.external_files_deleted == 1
+        assert not os.path.exists(get_local_filename(metadata.file_key))
+        assert not db.query(RequestTask).filter_by(id=request_task.id).count()
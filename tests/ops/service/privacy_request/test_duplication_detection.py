@@ -7,13 +7,15 @@ from sqlalchemy.orm import Session
 
 from fides.api.models.policy import Policy
 from fides.api.models.privacy_request import PrivacyRequest
+from fides.api.models.privacy_request.duplicate_group import (
+    generate_dedup_key_version,
+)
 from fides.api.models.worker_task import ExecutionLogStatus
 from fides.api.schemas.privacy_request import PrivacyRequestCreate, PrivacyRequestStatus
 from fides.api.schemas.redis_cache import Identity
 from fides.api.service.privacy_request.duplication_detection import (
     DuplicateDetectionService,
 )
-from fides.api.task.conditional_dependencies.schemas import ConditionGroup
 from fides.config.duplicate_detection_settings import DuplicateDetectionSettings
 from fides.service.messaging.messaging_service import MessagingService
 from fides.service.privacy_request.privacy_request_service import PrivacyRequestService
@@ -114,65 +116,6 @@ def create_duplicate_requests(
     return duplicate_requests
 
 
-class TestCreateDuplicateDetectionConditions:
-    """Tests for create_duplicate_detection_conditions function."""
-
-    def test_create_conditions_single_identity_field(
-        self, duplicate_detection_service, privacy_request_with_email_identity
-    ):
-        """Test creating conditions with single identity field returns expected structure."""
-        conditions = duplicate_detection_service.create_duplicate_detection_conditions(
-            privacy_request_with_email_identity
-        )
-
-        assert conditions is not None
-        assert isinstance(conditions, ConditionGroup)
-        assert (
-            len(conditions.conditions) == 3
-        )  # identity condition, policy condition & time window condition
-
-    def test_create_conditions_multiple_identity_fields(
-        self, duplicate_detection_service, privacy_request_with_multiple_identities
-    ):
-        """Test creating conditions with multiple identity fields returns expected structure."""
-        duplicate_detection_service._config = get_detection_config(
-            match_identity_fields=["email", "phone_number"]
-        )
-        conditions = duplicate_detection_service.create_duplicate_detection_conditions(
-            privacy_request_with_multiple_identities
-        )
-        assert conditions is not None
-        assert isinstance(conditions, ConditionGroup)
-        assert (
-            len(conditions.conditions) == 4
-        )  # identity conditions, policy condition & time window condition
-
-    @pytest.mark.parametrize(
-        "match_identity_fields",
-        [
-            pytest.param(["phone_number"], id="no_matching_identity_field"),
-            pytest.param([], id="empty_match_identity_fields"),
-            pytest.param(
-                ["email", "phone_number"], id="multiple_identity_fields_no_match"
-            ),
-        ],
-    )
-    def test_create_conditions_no_matching_identities(
-        self,
-        duplicate_detection_service,
-        privacy_request_with_email_identity,
-        match_identity_fields,
-    ):
-        """Test returns None when request has no identities matching configured fields."""
-        duplicate_detection_service._config = get_detection_config(
-            match_identity_fields=match_identity_fields
-        )
-        conditions = duplicate_detection_service.create_duplicate_detection_conditions(
-            privacy_request_with_email_identity
-        )
-        assert conditions is None
-
-
 class TestFindDuplicatePrivacyRequests:
     """Tests for find_duplicate_privacy_requests function."""
 
@@ -307,6 +250,7 @@ class TestFindDuplicatePrivacyRequests:
                 email="customer-1@example.com", phone_number="+15555555555"
             ),
         )
+        duplicate_detection_service.update_dedup_key(duplicate_request)
 
         duplicates = duplicate_detection_service.find_duplicate_privacy_requests(
             privacy_request_with_multiple_identities
@@ -315,6 +259,64 @@ class TestFindDuplicatePrivacyRequests:
         assert len(duplicates) == 1
         assert duplicates[0].id == duplicate_request.id
 
+    def test_find_duplicates_keyed_under_other_identity_fields(
+        self,
+        db,
+        duplicate_detection_service,
+        privacy_request_with_multiple_identities,
+        policy,
+    ):
+        """Test that requests without a key under the current settings are matched on their identities."""
+        stale_request, unkeyed_request, partial_match_request = [
+            PrivacyRequest.create(
+                db=db,
+                data={
+                    "external_id": f"test_external_id_{name}",
+                    "started_processing_at": datetime.now(timezone.utc),
+                    "requested_at": datetime.now(timezone.utc),
+                    "status": PrivacyRequestStatus.in_processing,
+                    "policy_id": policy.id,
+                },
+            )
+            for name in ("stale", "unkeyed", "partial")
+        ]
+        for privacy_request, phone_number in [
+            (stale_request, "+15555555555"),
+            (unkeyed_request, "+15555555555"),
+            (partial_match_request, "+19999999999"),
+        ]:
+            # Keyed under the email only settings
+            privacy_request.persist_identity(
+                db=db,
+                identity=Identity(
+                    email="customer-1@example.com", phone_number=phone_number
+                ),
+            )
+        unkeyed_request.update(
+            db=db, data={"dedup_key": None, "dedup_key_version": None}
+        )
+
+        duplicate_detection_service._config = get_detection_config(
+            time_window_days=365, match_identity_fields=["email", "phone_number"]
+        )
+        duplicates = duplicate_detection_service.find_duplicate_privacy_requests(
+            privacy_request_with_multiple_identities
+        )
+
+        assert {duplicate.id for duplicate in duplicates} == {
+            stale_request.id,
+            unkeyed_request.id,
+        }
+        # The matched requests are given the key under the current settings
+        expected_key = duplicate_detection_service.generate_dedup_key(
+            privacy_request_with_multiple_identities
+        )
+        for duplicate in duplicates:
+            assert duplicate.dedup_key == expected_key
+            assert duplicate.dedup_key_version == generate_dedup_key_version(
+                ["email", "phone_number"]
+            )
+
     def test_partial_identity_match_not_returned(
         self,
         db,
@@ -343,6 +345,7 @@ class TestFindDuplicatePrivacyRequests:
                 email="customer-1@example.com", phone_number="+19999999999"
             ),
         )
+        duplicate_detection_service.update_dedup_key(partial_match_request)
 
         duplicates = duplicate_detection_service.find_duplicate_privacy_requests(
             privacy_request_with_multiple_identities
@@ -378,6 +381,86 @@ class TestFindDuplicatePrivacyRequests:
         )
         assert len(duplicates) == 0
 
+    def test_deleted_requests_not_returned(
+        self,
+        db,
+        duplicate_detection_service,
+        privacy_request_with_email_identity,
+        policy,
+    ):
+        """Test that soft deleted requests are not returned as duplicates."""
+        duplicate_request = create_duplicate_requests(
+            db, policy, 1, PrivacyRequestStatus.in_processing
+        )[0]
+        duplicate_request.update(db=db, data={"deleted_at": datetime.now(timezone.utc)})
+
+        duplicates = duplicate_detection_service.find_duplicate_privacy_requests(
+            privacy_request_with_email_identity
+        )
+        assert len(duplicates) == 0
+
+    def test_no_duplicates_with_empty_match_identity_fields(
+        self, db, duplicate_detection_service, privacy_request_with_email_identity
+    ):
+        """Test that requests without a dedup key are never matched."""
+        duplicate_detection_service._config = get_detection_config(
+            match_identity_fields=[]
+        )
+        duplicate_detection_service.update_dedup_key(
+            privacy_request_with_email_identity
+        )
+        assert privacy_request_with_email_identity.dedup_key is None
+
+        duplicates = duplicate_detection_service.find_duplicate_privacy_requests(
+            privacy_request_with_email_identity
+        )
+        assert len(duplicates) == 0
+
+
+class TestDedupKey:
+    """Tests for the dedup key duplicate requests are found by."""
+
+    def test_dedup_key_persisted_with_identities(
+        self, db, duplicate_detection_service, privacy_request_with_email_identity
+    ):
+        """Test that the dedup key is stored when identities are persisted."""
+        assert (
+            privacy_request_with_email_identity.dedup_key
+            == duplicate_detection_service.generate_dedup_key(
+                privacy_request_with_email_identity
+            )
+        )
+
+        privacy_request_with_email_identity.persist_identity(
+            db=db, identity=Identity(email="customer-2@example.com")
+        )
+        db.refresh(privacy_request_with_email_identity)
+        assert (
+            privacy_request_with_email_identity.dedup_key
+            == duplicate_detection_service.generate_dedup_key(
+                privacy_request_with_email_identity
+            )
+        )
+
+    def test_dedup_key_updated_for_new_settings(
+        self, db, duplicate_detection_service, privacy_request_with_multiple_identities
+    ):
+        """Test that checking a request stores its key under the current settings."""
+        email_key = privacy_request_with_multiple_identities.dedup_key
+        duplicate_detection_service._config = get_detection_config(
+            match_identity_fields=["email", "phone_number"]
+        )
+
+        duplicate_detection_service.is_duplicate_request(
+            privacy_request_with_multiple_identities
+        )
+        db.refresh(privacy_request_with_multiple_identities)
+
+        assert privacy_request_with_multiple_identities.dedup_key != email_key
+        assert privacy_request_with_multiple_identities.dedup_key.startswith(
+            f"{email_key}|"
+        )
+
 
 class TestDuplicateRequestFunctionality:
     """Tests for is_canonical_request function."""
@@ -614,6 +697,7 @@ class TestDuplicateRequestFunctionality:
                     email="customer-1@example.com", phone_number="+15555555555"
                 ),
             )
+            duplicate_detection_service.update_dedup_key(duplicate)
         is_duplicate = duplicate_detection_service.is_duplicate_request(
             privacy_request_with_multiple_identities
         )
@@ -20,7 +20,10 @@ from fides.api.schemas.redis_cache import Identity
 from fides.api.service.privacy_request.email_batch_service import (
     BATCH_EMAIL_SEND_LOCK,
     BATCH_EMAIL_SEND_LOCK_TIMEOUT,
+    BATCH_EMAIL_SEND_PROGRESS,
+    BatchEmailSendProgress,
     EmailExitState,
+    save_progress,
     send_email_batch,
 )
 from fides.api.util.cache import get_all_cache_keys_for_privacy_request, get_cache
@@ -1273,3 +1276,87 @@ class TestEmailBatchSendLocking:
                 in loguru_caplog.text
             )
             assert "Starting batch email send" not in loguru_caplog.text
+
+
+@pytest.fixture
+def batch_email_send_progress():
+    redis_conn = get_cache()
+    redis_conn.delete(BATCH_EMAIL_SEND_PROGRESS)
+    yield redis_conn
+    redis_conn.delete(BATCH_EMAIL_SEND_PROGRESS)
+
+
+@pytest.fixture
+def email_send_batch_size():
+    original = CONFIG.execution.email_send_batch_size
+    CONFIG.execution.email_send_batch_size = 1
+    yield CONFIG
+    CONFIG.execution.email_send_batch_size = original
+
+
+@pytest.mark.usefixtures("attentive_email_connection_config")
+class TestEmailBatchSendChunks:
+    @mock.patch(
+        "fides.api.service.connectors.erasure_email_connector.send_single_erasure_email",
+    )
+    @mock.patch(
+        "fides.api.service.privacy_request.email_batch_service.requeue_privacy_requests_after_email_send",
+    )
+    @pytest.mark.usefixtures(
+        "email_send_batch_size",
+        "privacy_request_awaiting_erasure_email_send",
+        "second_privacy_request_awaiting_erasure_email_send",
+    )
+    def test_send_email_batch_in_chunks(
+        self,
+        requeue_privacy_requests,
+        send_single_erasure_email,
+        batch_email_send_progress,
+    ) -> None:
+        exit_state = send_email_batch.delay().get()
+        assert exit_state == EmailExitState.complete
+
+        # One email and one requeue per chunk of a single privacy request
+        assert send_single_erasure_email.call_count == 2
+        assert requeue_privacy_requests.call_count == 2
+
+        progress = BatchEmailSendProgress.from_json(
+            batch_email_send_progress.get(BATCH_EMAIL_SEND_PROGRESS)
+        )
+        assert progress.completed_at is not None
+        assert progress.chunks == 2
+        assert progress.privacy_requests_requeued == 2
+        # Requeued privacy requests are no longer tracked for resuming
+        assert all(not ids for ids in progress.sent.values())
+
+    @mock.patch(
+        "fides.api.service.connectors.erasure_email_connector.send_single_erasure_email",
+    )
+    @mock.patch(
+        "fides.api.service.privacy_request.email_batch_service.requeue_privacy_requests_after_email_send",
+    )
+    def test_resumed_send_skips_emails_already_sent(
+        self,
+        requeue_privacy_requests,
+        send_single_erasure_email,
+        batch_email_send_progress,
+        attentive_email_connection_config,
+        privacy_request_awaiting_erasure_email_send,
+    ) -> None:
+        failed_run = BatchEmailSendProgress.start()
+        failed_run.mark_sent(
+            attentive_email_connection_config.key,
+            [privacy_request_awaiting_erasure_email_send.id],
+        )
+        save_progress(batch_email_send_progress, failed_run)
+
+        exit_state = send_email_batch.delay().get()
+        assert exit_state == EmailExitState.complete
+
+        assert not send_single_erasure_email.called
+        assert requeue_privacy_requests.called
+        progress = BatchEmailSendProgress.from_json(
+            batch_email_send_progress.get(BATCH_EMAIL_SEND_PROGRESS)
+        )
+        assert progress.batch_id == failed_run.batch_id
+        assert progress.completed_at is not None
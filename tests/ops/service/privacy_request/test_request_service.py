@@ -785,9 +785,11 @@ class TestRequeueInterruptedTasksAdditionalCoverage:
         self, mock_logger, mock_get_queue_tasks, mock_redis_lock, db, privacy_request
     ):
         """Test that queue exceptions are handled gracefully."""
-        # Set up privacy request as in-progress
+        # Set up privacy request as in-progress, with a task unknown to the
+        # liveness registry so the watchdog falls back to scanning the queue
         privacy_request.status = PrivacyRequestStatus.in_processing
         privacy_request.save(db)
+        cache_task_tracking_key(privacy_request.id, "unregistered_task_id")
 
         # Mock successful lock acquisition
         mock_redis_lock.return_value.__enter__.return_value = True
@@ -0,0 +1,127 @@
+from unittest import mock
+
+import pydash
+import pytest
+
+from fides.api.common_exceptions import PostProcessingException
+from fides.api.schemas.saas.saas_config import SaaSRequest, Strategy
+from fides.api.service.processors.post_processor_strategy.post_processor_pipeline import (
+    PostProcessorPipeline,
+)
+from fides.api.service.processors.post_processor_strategy.post_processor_strategy import (
+    PostProcessorStrategy,
+)
+
+RESPONSE = {
+    "data": {
+        "contacts": [
+            {"id": 1, "email": "Customer-1@Example.com", "tags": ["VIP", "new"]},
+            {"id": 2, "email": "customer-2@example.com", "tags": ["new"]},
+            {"id": 3, "email": "customer-1@example.com", "tags": []},
+            {"id": 4, "email": None, "tags": ["vip"]},
+        ]
+    }
+}
+
+
+def get_postprocessors():
+    return [
+        Strategy(strategy="unwrap", configuration={"data_path": "data.contacts"}),
+        Strategy(
+            strategy="filter",
+            configuration={
+                "field": "email",
+                "value": {"identity": "email"},
+                "case_sensitive": False,
+            },
+        ),
+    ]
+
+
+def process_strategy_by_strategy(postprocessors, data, identity_data):
+    for postprocessor in postprocessors:
+        data = PostProcessorStrategy.get_strategy(
+            postprocessor.strategy, postprocessor.configuration
+        ).process(data, identity_data)
+    return data
+
+
+class TestPostProcessorPipeline:
+    @pytest.mark.parametrize(
+        "identity_data",
+        [
+            {"email": "customer-1@example.com"},
+            {"email": "CUSTOMER-2@EXAMPLE.COM"},
+            {"email": "nobody@example.com"},
+        ],
+    )
+    def test_matches_strategy_by_strategy(self, identity_data):
+        postprocessors = get_postprocessors()
+        pipeline = PostProcessorPipeline(postprocessors)
+
+        assert pipeline.process(
+            RESPONSE, "contacts", identity_data
+        ) == process_strategy_by_strategy(postprocessors, RESPONSE, identity_data)
+
+    def test_strategies_are_built_once(self):
+        pipeline = PostProcessorPipeline(get_postprocessors())
+
+        with mock.patch.object(
+            PostProcessorStrategy,
+            "get_strategy",
+            wraps=PostProcessorStrategy.get_strategy,
+        ) as get_strategy:
+            for _ in range(3):
+                pipeline.process(
+                    RESPONSE, "contacts", {"email": "customer-1@example.com"}
+                )
+
+        assert get_strategy.call_count == 2
+
+    def test_saas_request_reuses_its_pipeline(self):
+        request = SaaSRequest(
+            method="GET", path="/contacts", postprocessors=get_postprocessors()
+        )
+
+        pipeline = request.get_postprocessor_pipeline()
+
+        assert len(pipeline) == 2
+        assert request.get_postprocessor_pipeline() is pipeline
+
+    def test_exceptions_name_the_failing_strategy(self):
+        pipeline = PostProcessorPipeline(
+            [
+                Strategy(
+                    strategy="filter",
+                    configuration={"field": "email", "value": {"identity": "email"}},
+                )
+            ]
+        )
+
+        with pytest.raises(PostProcessingException) as exc:
+            pipeline.process([{"id": 1, "email": {"nested": True}}], "contacts", {})
+
+        assert "during the 'filter' postprocessor on the 'contacts' collection" in str(
+            exc.value
+        )
+
+
+@pytest.mark.parametrize(
+    "data_path",
+    ["data.contacts", "data.missing", "data.contacts.0", "data.contacts[0]", "data"],
+)
+@pytest.mark.parametrize(
+    "data",
+    [
+        RESPONSE,
+        [RESPONSE, {"data": {"contacts": []}}, {"data": "flat"}],
+        {"data": None},
+    ],
+)
+def test_unwrap_matches_pydash(data_path, data):
+    strategy = PostProcessorStrategy.get_strategy("unwrap", {"data_path": data_path})
+    items = data if isinstance(data, list) else [data]
+
+    for item in items:
+        # pylint: disable=protected-access
+        assert strategy._unwrap(item) == pydash.get(item, data_path)
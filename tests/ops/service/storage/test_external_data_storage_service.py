@@ -264,3 +264,29 @@ class TestExternalDataStorageService:
         assert metadata.filesize == actual_file_size
 
         ExternalDataStorageService.delete_data(db=db, metadata=metadata)
+
+    def test_delete_data_batch(self, db, storage_config_local):
+        """Test deleting several files at once, including an unknown storage key"""
+        metadata_list = [
+            ExternalDataStorageService.store_data(
+                db=db,
+                storage_path=f"test/data/batch_file_{i}",
+                data={"index": i},
+                storage_key=storage_config_local.key,
+            )
+            for i in range(3)
+        ]
+        missing_config = ExternalStorageMetadata(
+            storage_type="local",
+            file_key="test/data/batch_file_missing",
+            filesize=1,
+            storage_key="nonexistent_storage_key",
+        )
+
+        deleted = ExternalDataStorageService.delete_data_batch(
+            db, metadata_list + [missing_config], max_workers=2
+        )
+
+        assert deleted == 3
+        for metadata in metadata_list:
+            assert not os.path.exists(get_local_filename(metadata.file_key))
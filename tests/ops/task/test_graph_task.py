@@ -1,4 +1,5 @@
 import uuid
+from datetime import datetime, timezone
 from typing import Any, Dict
 from unittest import mock
 from uuid import uuid4
@@ -40,11 +41,13 @@ from fides.api.task.graph_task import (
     build_affected_field_logs,
     collect_queries,
     filter_by_enabled_actions,
+    retry,
 )
 from fides.api.task.task_resources import Connections
 from fides.api.util.consent_util import (
     cache_initial_status_and_identities_for_consent_reporting,
 )
+from fides.config import CONFIG
 from fides.system_integration_link.repository import SystemIntegrationLinkRepository
 
 from ..graph.graph_test_util import (
@@ -1256,6 +1259,81 @@ class TestGraphTaskLogging:
         assert execution_log is not None
         assert execution_log.saas_version == expected_version
 
+    @pytest.fixture
+    def coalesce_execution_logs(self, monkeypatch):
+        monkeypatch.setattr(CONFIG.execution, "coalesce_execution_logs", True)
+
+    @staticmethod
+    def get_execution_logs(db, privacy_request):
+        return (
+            db.query(ExecutionLog)
+            .filter(
+                ExecutionLog.privacy_request_id == privacy_request.id,
+                ExecutionLog.collection_name == "b",
+                ExecutionLog.dataset_name == "a",
+            )
+            .order_by(ExecutionLog.created_at)
+            .all()
+        )
+
+    @pytest.mark.usefixtures("coalesce_execution_logs")
+    def test_coalesced_logs_written_with_next_terminal_transition(
+        self, graph_task, db, privacy_request
+    ):
+        status_before = graph_task.request_task.status
+        with mock.patch(
+            "fides.api.task.graph_task.get_db",
+            side_effect=AssertionError("A session was opened"),
+        ):
+            graph_task.log_start(action_type=ActionType.access)
+            graph_task.log_retry(action_type=ActionType.access)
+
+        # The request task status isn't written for buffered transitions either
+        assert graph_task.request_task.status == status_before
+        assert self.get_execution_logs(db, privacy_request) == []
+
+        graph_task.log_end(action_type=ActionType.access)
+
+        assert graph_task.request_task.status == ExecutionLogStatus.complete
+        assert graph_task.pending_execution_logs == []
+        assert [
+            execution_log.status
+            for execution_log in self.get_execution_logs(db, privacy_request)
+        ] == [
+            ExecutionLogStatus.in_processing,
+            ExecutionLogStatus.retrying,
+            ExecutionLogStatus.complete,
+        ]
+
+    @pytest.mark.usefixtures("coalesce_execution_logs")
+    def test_coalesced_logs_stamped_in_order(self, graph_task):
+        stamped_at = datetime.now(timezone.utc)
+        with mock.patch("fides.api.task.graph_task.datetime") as mock_datetime:
+            mock_datetime.now.return_value = stamped_at
+            graph_task.log_start(action_type=ActionType.access)
+            graph_task.log_retry(action_type=ActionType.access)
+
+        first, second = graph_task.pending_execution_logs
+        assert first["created_at"] == stamped_at
+        assert second["created_at"] > first["created_at"]
+
+    @pytest.mark.usefixtures("coalesce_execution_logs")
+    def test_coalesced_logs_flushed_when_node_stops_running(
+        self, graph_task, db, privacy_request
+    ):
+        @retry(action_type=ActionType.access, default_return=[])
+        def run_without_logging_end(task: GraphTask):
+            assert len(task.pending_execution_logs) == 1
+            return []
+
+        run_without_logging_end(graph_task)
+
+        assert graph_task.pending_execution_logs == []
+        execution_logs = self.get_execution_logs(db, privacy_request)
+        assert len(execution_logs) == 1
+        assert execution_logs[0].status == ExecutionLogStatus.in_processing
+        assert execution_logs[0].message == "starting"
+
 
 class TestTraversalOnlyBehavior:
     """Tests for TRAVERSAL_ONLY bridge node behavior in access and erasure requests."""
@@ -1,5 +1,6 @@
 import json
 from typing import Dict, List
+from unittest import mock
 
 from fides.api.db.session import get_db_session
 from fides.api.models.masking_secret import MaskingSecret
@@ -14,7 +15,10 @@ from fides.api.service.masking.strategy.masking_strategy_aes_encrypt import (
 )
 from fides.api.service.masking.strategy.masking_strategy_hmac import HmacMaskingStrategy
 from fides.api.util.cache import get_cache, get_masking_secret_cache_key
-from fides.api.util.encryption.secrets_util import SecretsUtil
+from fides.api.util.encryption.secrets_util import (
+    SecretsUtil,
+    masking_secret_vault,
+)
 from fides.config import CONFIG
 
 from ...test_helpers.cache_secrets_helper import cache_secret, clear_cache_secrets
@@ -224,3 +228,71 @@ def test_get_masking_secret_error_handling() -> None:
 
     # Should return None, not throw an exception
     assert result is None
+
+
+class TestMaskingSecretVault:
+    def test_secrets_are_loaded_once(self, db, privacy_request: PrivacyRequest):
+        privacy_request.persist_masking_secrets(
+            SecretsUtil.build_masking_secrets_for_cache(
+                AesEncryptionMaskingStrategy._build_masking_secret_meta()
+            )
+        )
+        expected = SecretsUtil.get_masking_secret(
+            privacy_request.id, AesEncryptionMaskingStrategy.name, SecretType.key
+        )
+
+        with masking_secret_vault(db, privacy_request.id):
+            with mock.patch.object(SecretsUtil, "lookup_masking_secret") as mock_lookup:
+                for _ in range(3):
+                    for secret_type in (
+                        SecretType.key,
+                        SecretType.key_hmac,
+                        SecretType.salt_hmac,
+                    ):
+                        assert SecretsUtil.get_masking_secret(
+                            privacy_request.id,
+                            AesEncryptionMaskingStrategy.name,
+                            secret_type,
+                        )
+                assert (
+                    SecretsUtil.get_masking_secret(
+                        privacy_request.id,
+                        AesEncryptionMaskingStrategy.name,
+                        SecretType.key,
+                    )
+                    == expected
+                )
+            mock_lookup.assert_not_called()
+
+    def test_missing_secrets_are_looked_up_once(
+        self, db, privacy_request: PrivacyRequest
+    ):
+        with masking_secret_vault(db, privacy_request.id):
+            with mock.patch.object(
+                SecretsUtil, "lookup_masking_secret", return_value="cached-secret"
+            ) as mock_lookup:
+                for _ in range(3):
+                    assert (
+                        SecretsUtil.get_masking_secret(
+                            privacy_request.id,
+                            HmacMaskingStrategy.name,
+                            SecretType.key,
+                        )
+                        == "cached-secret"
+                    )
+            mock_lookup.assert_called_once()
+
+    def test_vault_is_scoped_to_its_privacy_request(
+        self, db, privacy_request: PrivacyRequest
+    ):
+        with masking_secret_vault(db, privacy_request.id):
+            with mock.patch.object(
+                SecretsUtil, "lookup_masking_secret", return_value=None
+            ) as mock_lookup:
+                SecretsUtil.get_masking_secret(
+                    "other_privacy_request", HmacMaskingStrategy.name, SecretType.key
+                )
+                SecretsUtil.get_masking_secret(
+                    "other_privacy_request", HmacMaskingStrategy.name, SecretType.key
+                )
+            assert mock_lookup.call_count == 2
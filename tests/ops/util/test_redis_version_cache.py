@@ -427,6 +427,51 @@ class TestRedisUnavailable:
         assert call_count == 2
 
 
+class TestServeStaleDisabled:
+    """With serve_stale=False a value is only served while its version can be
+    read from Redis."""
+
+    def test_redis_unavailable_bypasses_cache(self, mock_get_redis_version):
+        call_count = 0
+
+        def counting_fn():
+            nonlocal call_count
+            call_count += 1
+            return call_count
+
+        decorated = redis_version_cached(
+            redis_key=REDIS_KEY, cache_key=CACHE_KEY, serve_stale=False
+        )(counting_fn)
+
+        mock_get_redis_version.return_value = "1"
+        assert decorated() == 1
+
+        # Redis goes down - every call gets a fresh value, none is cached
+        mock_get_redis_version.side_effect = Exception("Redis down")
+        assert decorated() == 2
+        assert decorated() == 3
+        assert CACHE_KEY not in _cache_store
+
+        # Redis recovers with the same version - the old value isn't served
+        mock_get_redis_version.side_effect = None
+        assert decorated() == 4
+        assert decorated() == 4
+
+    def test_bump_version_failure_raises(
+        self, mock_get_redis_version, mock_bump_redis_version
+    ):
+        mock_get_redis_version.return_value = "1"
+        mock_bump_redis_version.side_effect = Exception("Redis down")
+        decorated = redis_version_cached(
+            redis_key=REDIS_KEY, cache_key=CACHE_KEY, serve_stale=False
+        )(lambda: object())
+        decorated()
+
+        with pytest.raises(Exception, match="Redis down"):
+            decorated.bump_version()
+        assert CACHE_KEY not in _cache_store
+
+
 class TestCircuitBreaker:
     """The circuit breaker in _get_redis_version should prevent repeated
     slow timeouts when Redis is down."""
@@ -0,0 +1,120 @@
+"""Tests for fides.api.util.task_heartbeat."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fides.api.tasks import DSR_QUEUE_NAME
+from fides.api.util import task_heartbeat
+from fides.api.util.cache import get_cache
+from fides.api.util.task_heartbeat import (
+    QUEUED_TASKS_KEY,
+    TASK_HEARTBEATS_KEY,
+    TaskLiveness,
+    TaskLivenessSnapshot,
+    mark_task_finished,
+    mark_task_queued,
+    mark_task_started,
+    send_heartbeats,
+)
+from fides.config import CONFIG
+
+
+@pytest.fixture
+def redis_conn():
+    redis_conn = get_cache()
+    redis_conn.delete(TASK_HEARTBEATS_KEY, QUEUED_TASKS_KEY)
+    yield redis_conn
+    redis_conn.delete(TASK_HEARTBEATS_KEY, QUEUED_TASKS_KEY)
+    task_heartbeat._running_task_ids.clear()
+
+
+@pytest.fixture(autouse=True)
+def no_heartbeat_thread():
+    with patch("fides.api.util.task_heartbeat._ensure_heartbeat_thread"):
+        yield
+
+
+class TestTaskHeartbeat:
+    def test_task_lifecycle(self, redis_conn):
+        mark_task_queued("task_a")
+        assert TaskLivenessSnapshot(redis_conn).get_liveness("task_a") == (
+            TaskLiveness.queued
+        )
+
+        mark_task_started("task_a")
+        assert redis_conn.zscore(QUEUED_TASKS_KEY, "task_a") is None
+        assert TaskLivenessSnapshot(redis_conn).get_liveness("task_a") == (
+            TaskLiveness.running
+        )
+
+        mark_task_finished("task_a")
+        assert TaskLivenessSnapshot(redis_conn).get_liveness("task_a") == (
+            TaskLiveness.unknown
+        )
+
+    def test_missed_heartbeats_are_stale(self, redis_conn):
+        mark_task_started("task_a")
+        later = time.time() + CONFIG.execution.dsr_task_heartbeat_timeout + 1
+
+        snapshot = TaskLivenessSnapshot(redis_conn, now=later)
+        assert snapshot.get_liveness("task_a") == TaskLiveness.stale
+        assert snapshot.stale == {"task_a"}
+
+    def test_long_queued_tasks_are_stale(self, redis_conn):
+        mark_task_queued("task_a")
+        later = time.time() + CONFIG.execution.dsr_task_queued_timeout + 1
+
+        # The task's message may have been lost, so it's confirmed with the workers
+        snapshot = TaskLivenessSnapshot(redis_conn, now=later)
+        assert snapshot.get_liveness("task_a") == TaskLiveness.stale
+
+    def test_long_queued_tasks_within_a_backed_up_queue_are_queued(self, redis_conn):
+        now = time.time()
+        redis_conn.zadd(
+            QUEUED_TASKS_KEY, {"task_a": now - 3, "task_b": now - 2, "task_c": now - 1}
+        )
+        redis_conn.rpush(DSR_QUEUE_NAME, "message_b", "message_c")
+        later = now + CONFIG.execution.dsr_task_queued_timeout + 1
+
+        try:
+            snapshot = TaskLivenessSnapshot(redis_conn, now=later)
+            assert snapshot.queue_length == 2
+            # Only the two most recently published tasks can still be in the queue
+            assert snapshot.get_liveness("task_c") == TaskLiveness.queued
+            assert snapshot.get_liveness("task_b") == TaskLiveness.queued
+            assert snapshot.get_liveness("task_a") == TaskLiveness.stale
+        finally:
+            redis_conn.delete(DSR_QUEUE_NAME)
+
+    def test_send_heartbeats_refreshes_running_tasks(self, redis_conn):
+        mark_task_started("task_a")
+        redis_conn.zadd(TASK_HEARTBEATS_KEY, {"task_a": 0})
+
+        send_heartbeats()
+
+        assert redis_conn.zscore(TASK_HEARTBEATS_KEY, "task_a") > time.time() - 5
+
+    def test_expired_entries_are_pruned(self, redis_conn):
+        expired = time.time() - CONFIG.execution.request_task_ttl - 1
+        redis_conn.zadd(TASK_HEARTBEATS_KEY, {"old_running": expired})
+        redis_conn.zadd(QUEUED_TASKS_KEY, {"old_queued": expired})
+
+        TaskLivenessSnapshot(redis_conn)
+
+        assert redis_conn.zcard(TASK_HEARTBEATS_KEY) == 0
+        assert redis_conn.zcard(QUEUED_TASKS_KEY) == 0
+
+    def test_redis_errors_do_not_fail_the_task(self):
+        broken_redis = MagicMock()
+        broken_redis.zadd.side_effect = Exception("Redis down")
+        broken_redis.zrem.side_effect = Exception("Redis down")
+        broken_redis.pipeline.side_effect = Exception("Redis down")
+        with patch(
+            "fides.api.util.task_heartbeat._get_redis", return_value=broken_redis
+        ):
+            mark_task_queued("task_a")
+            mark_task_started("task_a")
+            send_heartbeats()
+            mark_task_finished("task_a")
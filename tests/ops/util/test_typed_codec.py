@@ -0,0 +1,166 @@
+import io
+import json
+from datetime import date, datetime, timezone
+from enum import Enum
+
+import pytest
+from bson.objectid import ObjectId
+
+from fides.api.util import typed_codec
+from fides.api.util.cache import FidesopsRedis
+from fides.api.util.custom_json_encoder import (
+    ENCODED_BYTES_PREFIX,
+    ENCODED_DATE_PREFIX,
+    ENCODED_MONGO_OBJECT_ID_PREFIX,
+    CustomJSONEncoder,
+    _custom_decoder,
+)
+from fides.api.util.encryption.aes_gcm_encryption_util import (
+    decrypt_with_cryptography,
+    encrypt_with_cryptography,
+)
+from fides.config import CONFIG
+
+
+class Color(Enum):
+    RED = "red"
+
+
+ROWS = [
+    {
+        "_id": ObjectId("5f2b2b2b2b2b2b2b2b2b2b2b"),
+        "email": "customer-1@example.com",
+        "created": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "birthday": date(1990, 5, 6),
+        "avatar": b"\x00\xffavatar",
+        "color": Color.RED,
+        "address": {"street": "123 Main St", "moved": [date(2020, 1, 1), None]},
+        "orders": [{"id": 1, "placed": datetime(2024, 2, 3)}, {"id": 2}],
+        "aliases": [b"alias", ObjectId("7f2b2b2b2b2b2b2b2b2b2b2b")],
+        10: "an integer key",
+    },
+    {"_id": ObjectId("6f2b2b2b2b2b2b2b2b2b2b2b"), "email": None, "orders": ()},
+]
+
+# Dates are decoded as datetimes, and typed list items as prefixed strings, as
+# the CustomJSONEncoder output is decoded
+DECODED_ROWS = [
+    {
+        "_id": ObjectId("5f2b2b2b2b2b2b2b2b2b2b2b"),
+        "email": "customer-1@example.com",
+        "created": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "birthday": datetime(1990, 5, 6),
+        "avatar": b"\x00\xffavatar",
+        "color": "red",
+        "address": {
+            "street": "123 Main St",
+            "moved": [f"{ENCODED_DATE_PREFIX}2020-01-01", None],
+        },
+        "orders": [{"id": 1, "placed": datetime(2024, 2, 3)}, {"id": 2}],
+        "aliases": [
+            f"{ENCODED_BYTES_PREFIX}alias",
+            f"{ENCODED_MONGO_OBJECT_ID_PREFIX}7f2b2b2b2b2b2b2b2b2b2b2b",
+        ],
+        "10": "an integer key",
+    },
+    {"_id": ObjectId("6f2b2b2b2b2b2b2b2b2b2b2b"), "email": None, "orders": []},
+]
+
+
+def assert_same_types(first, second):
+    assert type(first) is type(second)
+    if isinstance(first, dict):
+        assert first.keys() == second.keys()
+        for key in first:
+            assert_same_types(first[key], second[key])
+    elif isinstance(first, list):
+        assert len(first) == len(second)
+        for first_item, second_item in zip(first, second):
+            assert_same_types(first_item, second_item)
+
+
+class TestTypedCodec:
+    def test_round_trip(self):
+        frame = typed_codec.dumps(ROWS)
+
+        assert typed_codec.is_typed_frame(frame)
+        assert typed_codec.loads(frame) == DECODED_ROWS
+        assert typed_codec.loads(frame.encode("utf-8")) == DECODED_ROWS
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            b"secret",
+            date(2024, 1, 1),
+            datetime(2024, 1, 1),
+            ObjectId("5f2b2b2b2b2b2b2b2b2b2b2b"),
+            None,
+        ],
+    )
+    def test_top_level_values_decode_as_custom_json_encoder_output(self, value):
+        legacy = json.loads(
+            json.dumps(value, cls=CustomJSONEncoder), object_hook=_custom_decoder
+        )
+
+        assert typed_codec.loads(typed_codec.dumps(value)) == legacy
+
+    def test_decodes_same_types_as_custom_json_encoder_output(self):
+        typed = typed_codec.loads(typed_codec.dumps(ROWS))
+        legacy = typed_codec.loads(json.dumps(ROWS, cls=CustomJSONEncoder))
+
+        assert typed == legacy == DECODED_ROWS
+        assert_same_types(typed, legacy)
+
+    def test_prefixed_strings_are_left_alone(self):
+        data = {"note": f"{ENCODED_DATE_PREFIX}not a date"}
+
+        assert typed_codec.loads(typed_codec.dumps(data)) == data
+
+    def test_reads_custom_json_encoder_output(self):
+        encoded = json.dumps(
+            {"created": datetime(2024, 1, 2), "_id": ROWS[0]["_id"]},
+            cls=CustomJSONEncoder,
+        )
+
+        assert typed_codec.loads(encoded) == {
+            "created": datetime(2024, 1, 2),
+            "_id": ROWS[0]["_id"],
+        }
+
+    def test_streaming(self):
+        assert "".join(typed_codec.iter_dumps(ROWS)) == typed_codec.dumps(ROWS)
+
+        buffer = io.StringIO()
+        typed_codec.dump(ROWS, buffer)
+        buffer.seek(0)
+        assert typed_codec.load(buffer) == DECODED_ROWS
+
+    def test_newer_versions_are_rejected(self):
+        frame = typed_codec.dumps(ROWS).replace(
+            f"{typed_codec.FRAME_PREFIX}{typed_codec.VERSION}",
+            f"{typed_codec.FRAME_PREFIX}{typed_codec.VERSION + 1}",
+            1,
+        )
+
+        with pytest.raises(ValueError, match="Unsupported typed codec version"):
+            typed_codec.loads(frame)
+
+
+class TestTypedCodecProducers:
+    def test_cache_decodes_both_formats(self):
+        typed = FidesopsRedis.encode_obj(ROWS[1], typed=True)
+        legacy = FidesopsRedis.encode_obj(ROWS[1])
+
+        assert FidesopsRedis.decode_obj(typed) == DECODED_ROWS[1]
+        assert FidesopsRedis.decode_obj(legacy) == DECODED_ROWS[1]
+
+    def test_encrypted_payloads_in_both_formats(self, monkeypatch):
+        legacy = encrypt_with_cryptography(ROWS)
+        monkeypatch.setattr(CONFIG.execution, "use_typed_payload_codec", True)
+        typed = encrypt_with_cryptography(ROWS)
+
+        assert decrypt_with_cryptography(typed) == DECODED_ROWS
+        assert decrypt_with_cryptography(legacy) == DECODED_ROWS
+        assert_same_types(
+            decrypt_with_cryptography(typed), decrypt_with_cryptography(legacy)
+        )
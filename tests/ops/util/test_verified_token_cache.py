@@ -0,0 +1,182 @@
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from fides.api.common_exceptions import AuthorizationError
+from fides.api.cryptography.schemas.jwt import (
+    JWE_ISSUED_AT,
+    JWE_PAYLOAD_CLIENT_ID,
+    JWE_PAYLOAD_SCOPES,
+)
+from fides.api.oauth import utils
+from fides.api.oauth.jwt import generate_jwe
+from fides.api.oauth.utils import extract_token_and_load_client
+from fides.api.oauth.verified_token_cache import (
+    VerifiedToken,
+    VerifiedTokenStore,
+    get_verified_token_store,
+)
+from fides.common.scope_registry import POLICY_READ
+from fides.config import CONFIG
+
+
+@pytest.fixture(autouse=True)
+def clear_verified_tokens():
+    get_verified_token_store.cache_clear()
+    yield
+    get_verified_token_store.cache_clear()
+
+
+def build_token(client_id: str) -> str:
+    payload = {
+        JWE_PAYLOAD_SCOPES: [POLICY_READ],
+        JWE_PAYLOAD_CLIENT_ID: client_id,
+        JWE_ISSUED_AT: datetime.now(timezone.utc).isoformat(),
+    }
+    return generate_jwe(json.dumps(payload), CONFIG.security.app_encryption_key)
+
+
+class TestVerifiedTokenCache:
+    def test_cached_token_is_not_decrypted_again(self, db, oauth_client):
+        token = build_token(oauth_client.id)
+
+        with patch.object(
+            utils, "extract_payload", wraps=utils.extract_payload
+        ) as extract_payload:
+            first_data, first_client = extract_token_and_load_client(token, db)
+            token_data, client = extract_token_and_load_client(token, db)
+
+        assert extract_payload.call_count == 1
+        assert token_data == first_data
+        assert client is first_client
+        assert client in db
+        assert client.scopes == oauth_client.scopes
+
+    def test_cached_client_is_attached_to_each_session(self, db, oauth_client):
+        token = build_token(oauth_client.id)
+        extract_token_and_load_client(token, db)
+        db.expunge_all()
+
+        _, client = extract_token_and_load_client(token, db)
+
+        assert client in db
+        assert client.id == oauth_client.id
+        assert client.user is None
+
+    def test_client_update_invalidates_token(self, db, oauth_client):
+        token = build_token(oauth_client.id)
+        extract_token_and_load_client(token, db)
+
+        oauth_client.update(db, data={"scopes": [POLICY_READ]})
+        db.expunge_all()
+
+        with patch.object(
+            utils, "extract_payload", wraps=utils.extract_payload
+        ) as extract_payload:
+            _, client = extract_token_and_load_client(token, db)
+
+        assert extract_payload.call_count == 1
+        assert client.scopes == [POLICY_READ]
+
+    def test_failed_invalidation_is_raised_from_commit(self, db, oauth_client):
+        token = build_token(oauth_client.id)
+        extract_token_and_load_client(token, db)
+
+        with patch(
+            "fides.api.util.redis_version_cache._bump_redis_version",
+            side_effect=ConnectionError("Redis down"),
+        ):
+            with pytest.raises(ConnectionError):
+                oauth_client.update(db, data={"scopes": [POLICY_READ]})
+
+        # This process's tokens are dropped even though other servers can't be told
+        assert len(get_verified_token_store()) == 0
+
+    def test_client_deletion_invalidates_token(self, db, oauth_client):
+        token = build_token(oauth_client.id)
+        extract_token_and_load_client(token, db)
+
+        oauth_client.delete(db)
+
+        with pytest.raises(AuthorizationError):
+            extract_token_and_load_client(token, db)
+
+    def test_password_reset_invalidates_token(self, db, application_user):
+        token = build_token(application_user.client.id)
+        extract_token_and_load_client(token, db)
+
+        application_user.update_password(db, "N3w_password!")
+
+        with pytest.raises(AuthorizationError):
+            extract_token_and_load_client(token, db)
+
+    def test_expired_token_is_rejected_from_cache(self, db, oauth_client):
+        token = build_token(oauth_client.id)
+        extract_token_and_load_client(token, db)
+
+        with pytest.raises(AuthorizationError):
+            extract_token_and_load_client(token, db, token_duration_override=-1)
+        assert len(get_verified_token_store()) == 0
+
+    def test_cache_is_bypassed_while_redis_is_unavailable(self, db, oauth_client):
+        token = build_token(oauth_client.id)
+        extract_token_and_load_client(token, db)
+
+        with (
+            patch(
+                "fides.api.util.redis_version_cache._get_redis_version",
+                side_effect=ConnectionError("Redis down"),
+            ),
+            patch.object(
+                utils, "extract_payload", wraps=utils.extract_payload
+            ) as extract_payload,
+        ):
+            extract_token_and_load_client(token, db)
+            extract_token_and_load_client(token, db)
+
+        assert extract_payload.call_count == 2
+
+    def test_cache_can_be_disabled(self, db, oauth_client, monkeypatch):
+        monkeypatch.setattr(CONFIG.security, "oauth_verified_token_cache_size", 0)
+        token = build_token(oauth_client.id)
+
+        with patch.object(
+            utils, "extract_payload", wraps=utils.extract_payload
+        ) as extract_payload:
+            extract_token_and_load_client(token, db)
+            extract_token_and_load_client(token, db)
+
+        assert extract_payload.call_count == 2
+
+
+class TestVerifiedTokenStore:
+    def test_least_recently_used_tokens_are_evicted(self):
+        store = VerifiedTokenStore(max_size=2, ttl_seconds=60)
+        tokens = {
+            digest: VerifiedToken(token_data={}, client_id=digest, client_state=None)
+            for digest in ("a", "b", "c")
+        }
+
+        store.put("a", tokens["a"])
+        store.put("b", tokens["b"])
+        store.get("a")
+        store.put("c", tokens["c"])
+
+        assert store.get("a") is tokens["a"]
+        assert store.get("b") is None
+        assert store.get("c") is tokens["c"]
+
+    def test_tokens_expire_after_ttl(self):
+        store = VerifiedTokenStore(max_size=2, ttl_seconds=60)
+        token = VerifiedToken(token_data={}, client_id="a", client_state=None)
+
+        with patch("fides.api.oauth.verified_token_cache.time.monotonic") as now:
+            now.return_value = 1000.0
+            store.put("a", token)
+            now.return_value = 1059.0
+            assert store.get("a") is token
+            now.return_value = 1060.0
+            assert store.get("a") is None
+        assert len(store) == 0
@@ -11,10 +11,11 @@ from datetime import datetime, timezone
 
 import pytest
 
+from fides.service.pbac import service as service_module
 from fides.service.pbac.consumers.entities import DataConsumerEntity
 from fides.service.pbac.consumers.repository import DataConsumerRedisRepository
 from fides.service.pbac.purposes.repository import DataPurposeRedisRepository
-from fides.service.pbac.service import InProcessPBACEvaluationService
+from fides.service.pbac.service import InProcessPBACEvaluationService, _BoundedMemo
 from fides.service.pbac.types import (
     DatasetPurposes,
     GapType,
@@ -247,3 +248,98 @@ class TestNoDatasetPurposes:
         output = service.evaluate(entry)
 
         assert output.is_compliant
+
+
+# --- Batch evaluation ---
+
+
+@pytest.mark.integration
+class TestEvaluateBatch:
+    def test_batch_matches_single_evaluation(
+        self, cache, registered_consumer, dataset_purposes_map
+    ):
+        service = InProcessPBACEvaluationService(
+            cache=cache,
+            dataset_purposes=dataset_purposes_map,
+        )
+        entries = [
+            _make_entry(
+                "billing@example.com",
+                [TableRef(catalog="", schema="billing_db", table="invoices")],
+            ),
+            _make_entry(
+                "billing@example.com",
+                [TableRef(catalog="", schema="marketing_db", table="campaigns")],
+            ),
+            _make_entry(
+                "stranger@example.com",
+                [TableRef(catalog="", schema="analytics_db", table="events")],
+            ),
+            _make_entry(
+                "billing@example.com",
+                [TableRef(catalog="", schema="", table="orphan")],
+            ),
+        ]
+
+        # chunk_size=3 forces a partial second chunk
+        batch_outputs = list(service.evaluate_batch(iter(entries), chunk_size=3))
+
+        assert batch_outputs == [service.evaluate(entry) for entry in entries]
+
+    def test_batch_applies_overrides(self, cache, registered_consumer):
+        service = InProcessPBACEvaluationService(cache=cache)
+        entry = _make_entry(
+            "billing@example.com",
+            [TableRef(catalog="", schema="marketing_db", table="campaigns")],
+        )
+
+        outputs = list(
+            service.evaluate_batch(
+                [entry, entry],
+                dataset_purpose_overrides={"marketing_db": ["billing"]},
+            )
+        )
+
+        assert [output.is_compliant for output in outputs] == [True, True]
+
+    def test_batch_with_evicted_resolutions(
+        self, cache, registered_consumer, dataset_purposes_map, monkeypatch
+    ):
+        monkeypatch.setattr(service_module, "RESOLUTION_MEMO_SIZE", 1)
+        service = InProcessPBACEvaluationService(
+            cache=cache,
+            dataset_purposes=dataset_purposes_map,
+        )
+        entries = [
+            _make_entry(
+                identity,
+                [TableRef(catalog="", schema=schema, table=table)],
+            )
+            for identity, schema, table in [
+                ("billing@example.com", "billing_db", "invoices"),
+                ("stranger@example.com", "marketing_db", "campaigns"),
+                ("billing@example.com", "billing_db", "invoices"),
+                ("billing@example.com", "marketing_db", "campaigns"),
+            ]
+        ]
+
+        batch_outputs = list(service.evaluate_batch(entries))
+
+        assert batch_outputs == [service.evaluate(entry) for entry in entries]
+
+    def test_empty_batch(self, cache):
+        service = InProcessPBACEvaluationService(cache=cache)
+
+        assert list(service.evaluate_batch([])) == []
+
+
+@pytest.mark.unit
+class TestBoundedMemo:
+    def test_evicts_least_recently_used(self):
+        memo = _BoundedMemo(maxsize=2)
+        memo["a"] = 1
+        memo["b"] = 2
+        assert memo["a"] == 1
+        memo["c"] = 3
+
+        assert list(memo) == ["a", "c"]
@@ -0,0 +1,183 @@
+"""Unit tests for the SQL parser's fingerprinting and parse cache."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from fides.service.pbac.sql_parser import (
+    PARSE_CACHE_REDIS_PREFIX,
+    ParsedStatementInfo,
+    SQLParseCache,
+    normalize_query,
+    parse_query,
+    parse_statement_info,
+    query_fingerprint,
+)
+from fides.service.pbac.types import TableRef
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store: dict[str, str] = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+
+
+class TestNormalizeQuery:
+    @pytest.mark.parametrize(
+        "first,second",
+        [
+            (
+                "SELECT * FROM orders WHERE id = 1",
+                "SELECT * FROM orders WHERE id = 2",
+            ),
+            (
+                "SELECT * FROM orders WHERE name = 'alice'",
+                "SELECT * FROM orders WHERE name = 'o''brien'",
+            ),
+            (
+                "SELECT * FROM orders WHERE id IN (1, 2, 3)",
+                "SELECT * FROM orders WHERE id IN (4)",
+            ),
+            (
+                "SELECT *\n  FROM orders -- dashboard A\n WHERE x = 1.5",
+                "SELECT * FROM orders /* dashboard B */ WHERE x = 2e10",
+            ),
+        ],
+    )
+    def test_literal_variants_share_fingerprint(self, first, second):
+        assert query_fingerprint(first) == query_fingerprint(second)
+
+    @pytest.mark.parametrize(
+        "first,second",
+        [
+            ("SELECT * FROM orders", "SELECT * FROM invoices"),
+            ("SELECT * FROM t1", "SELECT * FROM t2"),
+            (
+                "SELECT * FROM project-123.sales.orders",
+                "SELECT * FROM project-456.sales.orders",
+            ),
+            ('SELECT * FROM "Orders"', 'SELECT * FROM "orders"'),
+        ],
+    )
+    def test_identifiers_are_preserved(self, first, second):
+        assert query_fingerprint(first) != query_fingerprint(second)
+
+    def test_comment_markers_inside_strings_are_literals(self):
+        assert (
+            normalize_query("SELECT * FROM t WHERE note = '-- not a comment'")
+            == "SELECT * FROM t WHERE note = ?"
+        )
+
+
+class TestParseStatementInfo:
+    def test_repeated_statement_is_parsed_once(self):
+        cache = SQLParseCache()
+        with patch(
+            "fides.service.pbac.sql_parser.extract_table_refs",
+            return_value=[TableRef(catalog="", schema="sales", table="orders")],
+        ) as extract:
+            for i in range(5):
+                info = parse_statement_info(
+                    f"SELECT * FROM sales.orders WHERE id = {i}", cache
+                )
+
+        assert extract.call_count == 1
+        assert info == ParsedStatementInfo(
+            statement_type="SELECT", tables=(("", "sales", "orders"),)
+        )
+        assert (cache.hits, cache.misses) == (4, 1)
+
+    @pytest.mark.parametrize(
+        "query",
+        ["SELECT 1", "SET search_path TO public", "COMMIT", "SELECT 'FROM orders'"],
+    )
+    def test_statements_without_tables_skip_sqlglot(self, query):
+        cache = SQLParseCache()
+        with patch("fides.service.pbac.sql_parser.extract_table_refs") as extract:
+            info = parse_statement_info(query, cache)
+
+        extract.assert_not_called()
+        assert info.tables == ()
+        assert cache.skipped == 1
+        assert len(cache) == 0
+
+    @pytest.mark.parametrize(
+        "query, tables",
+        [
+            ("INSERT ds.t VALUES (1)", (("", "ds", "t"),)),
+            ("DELETE ds.t WHERE id = 1", (("", "ds", "t"),)),
+            ("CREATE INDEX idx ON s.t (c)", (("", "s", "t"),)),
+            ("GRANT SELECT ON s.t TO bob", (("", "s", "t"),)),
+            ("SET x = 1; DELETE ds.t", (("", "ds", "t"),)),
+        ],
+    )
+    def test_statements_with_tables_are_parsed(self, query, tables):
+        cache = SQLParseCache()
+        info = parse_statement_info(query, cache)
+
+        assert info.tables == tables
+        assert cache.skipped == 0
+        assert cache.misses == 1
+
+    def test_parse_query_returns_fresh_table_refs(self):
+        cache = SQLParseCache()
+        first = parse_query(
+            "SELECT * FROM sales.orders", "alice@example.com", cache=cache
+        )
+        first.referenced_tables[0].table = "mutated"
+        second = parse_query(
+            "SELECT * FROM sales.orders", "alice@example.com", cache=cache
+        )
+
+        assert second.referenced_tables == [
+            TableRef(catalog="", schema="sales", table="orders")
+        ]
+        assert second.statement_type == "SELECT"
+
+
+class TestSQLParseCache:
+    def test_lru_eviction(self):
+        cache = SQLParseCache(maxsize=2)
+        info = ParsedStatementInfo(statement_type="SELECT", tables=())
+        cache.put("a", info)
+        cache.put("b", info)
+        cache.get("a")
+        cache.put("c", info)
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_entries_are_shared_through_redis(self):
+        redis = FakeRedis()
+        info = ParsedStatementInfo(statement_type="SELECT", tables=(("", "s", "t"),))
+        SQLParseCache(redis=redis).put("fp", info)
+
+        assert json.loads(redis.store[f"{PARSE_CACHE_REDIS_PREFIX}:fp"]) == {
+            "statement_type": "SELECT",
+            "tables": [["", "s", "t"]],
+        }
+        assert SQLParseCache(redis=redis).get("fp") == info
+
+    def test_redis_errors_are_ignored(self):
+        class BrokenRedis:
+            def get(self, key):
+                raise ConnectionError("down")
+
+            def set(self, key, value, ex=None):
+                raise ConnectionError("down")
+
+        cache = SQLParseCache(redis=BrokenRedis())
+        info = ParsedStatementInfo(statement_type="SELECT", tables=())
+        cache.put("fp", info)
+
+        assert cache.get("fp") == info
+        assert cache.get("other") is None
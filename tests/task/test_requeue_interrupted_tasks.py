@@ -1,3 +1,4 @@
+import time
 import uuid
 from datetime import datetime, timedelta
 from unittest import mock
@@ -13,6 +14,7 @@ from fides.api.service.privacy_request.request_service import (
     REQUEUE_INTERRUPTED_TASKS_LOCK,
     requeue_interrupted_tasks,
 )
+from fides.api.tasks import DSR_QUEUE_NAME
 from fides.api.util.cache import (
     cache_task_tracking_key,
     get_cache,
@@ -20,6 +22,10 @@ from fides.api.util.cache import (
     increment_privacy_request_retry_count,
     reset_privacy_request_retry_count,
 )
+from fides.api.util.task_heartbeat import (
+    QUEUED_TASKS_KEY,
+    TASK_HEARTBEATS_KEY,
+)
 from fides.config import CONFIG
 
 # Mock target paths — centralised to avoid string duplication
@@ -157,6 +163,14 @@ def in_progress_request_task(db, in_progress_privacy_request):
     task.delete(db)
 
 
+@pytest.fixture
+def task_registry():
+    """Direct access to the task liveness registry, cleared after each test."""
+    redis_conn = get_cache()
+    yield redis_conn
+    redis_conn.delete(TASK_HEARTBEATS_KEY, QUEUED_TASKS_KEY)
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -529,3 +543,109 @@ class TestRequeueInterruptedTasks:
 
         reset_privacy_request_retry_count(pr.id)
         assert get_privacy_request_retry_count(pr.id) == 0
+
+
+class TestRequeueInterruptedTasksHeartbeats:
+    @pytest.mark.usefixtures("in_progress_privacy_request", "in_progress_request_task")
+    @mock.patch(_REQUEUE)
+    @mock.patch(_QUEUE)
+    @mock.patch(_IN_FLIGHT)
+    def test_tasks_with_live_heartbeats_skip_queue_scan(
+        self, mock_in_flight, mock_queue, mock_requeue, task_registry
+    ):
+        """Running tasks are resolved from the registry without scanning the queue."""
+        task_registry.zadd(
+            TASK_HEARTBEATS_KEY,
+            {"privacy_request_task_id": time.time(), "request_task_id": time.time()},
+        )
+        requeue_interrupted_tasks.apply().get()
+        mock_queue.assert_not_called()
+        mock_in_flight.assert_not_called()
+        mock_requeue.assert_not_called()
+
+    @pytest.mark.usefixtures("in_progress_privacy_request", "in_progress_request_task")
+    @mock.patch(_REQUEUE)
+    @mock.patch(_QUEUE)
+    @mock.patch(_IN_FLIGHT)
+    def test_queued_tasks_skip_queue_scan(
+        self, mock_in_flight, mock_queue, mock_requeue, task_registry
+    ):
+        """Tasks registered as queued are not requeued, and the queue isn't scanned."""
+        task_registry.zadd(
+            QUEUED_TASKS_KEY,
+            {"privacy_request_task_id": time.time(), "request_task_id": time.time()},
+        )
+        requeue_interrupted_tasks.apply().get()
+        mock_queue.assert_not_called()
+        mock_requeue.assert_not_called()
+
+    @pytest.mark.usefixtures("in_progress_privacy_request", "in_progress_request_task")
+    @mock.patch(_REQUEUE)
+    @mock.patch(_QUEUE)
+    @mock.patch(_IN_FLIGHT, return_value=False)
+    def test_stale_heartbeat_is_requeued(
+        self, mock_in_flight, mock_queue, mock_requeue, task_registry
+    ):
+        """A task whose heartbeat stopped, and isn't in flight, is interrupted."""
+        stale = time.time() - CONFIG.execution.dsr_task_heartbeat_timeout - 60
+        task_registry.zadd(
+            TASK_HEARTBEATS_KEY,
+            {"privacy_request_task_id": stale, "request_task_id": stale},
+        )
+        requeue_interrupted_tasks.apply().get()
+        mock_queue.assert_not_called()
+        mock_in_flight.assert_called()
+        mock_requeue.assert_called_once()
+
+    @pytest.mark.usefixtures("in_progress_privacy_request", "in_progress_request_task")
+    @mock.patch(_REQUEUE)
+    @mock.patch(_QUEUE)
+    @mock.patch(_IN_FLIGHT, return_value=True)
+    def test_stale_heartbeat_still_in_flight_is_not_requeued(
+        self, mock_in_flight, mock_queue, mock_requeue, task_registry
+    ):
+        """A stale heartbeat is confirmed with the workers before requeueing."""
+        stale = time.time() - CONFIG.execution.dsr_task_heartbeat_timeout - 60
+        task_registry.zadd(TASK_HEARTBEATS_KEY, {"privacy_request_task_id": stale})
+        requeue_interrupted_tasks.apply().get()
+        mock_requeue.assert_not_called()
+
+    @pytest.mark.usefixtures("in_progress_privacy_request", "in_progress_request_task")
+    @mock.patch(_REQUEUE)
+    @mock.patch(_QUEUE)
+    @mock.patch(_IN_FLIGHT)
+    def test_long_queued_tasks_in_a_backed_up_queue_skip_queue_scan(
+        self, mock_in_flight, mock_queue, mock_requeue, task_registry
+    ):
+        """Tasks queued past the timeout are trusted while the queue still holds them."""
+        queued_at = time.time() - CONFIG.execution.dsr_task_queued_timeout - 60
+        task_registry.zadd(
+            QUEUED_TASKS_KEY,
+            {"privacy_request_task_id": queued_at, "request_task_id": queued_at},
+        )
+        task_registry.rpush(DSR_QUEUE_NAME, "message_1", "message_2")
+        try:
+            requeue_interrupted_tasks.apply().get()
+        finally:
+            task_registry.delete(DSR_QUEUE_NAME)
+        mock_queue.assert_not_called()
+        mock_in_flight.assert_not_called()
+        mock_requeue.assert_not_called()
+
+    @pytest.mark.usefixtures("in_progress_privacy_request", "in_progress_request_task")
+    @mock.patch(_REQUEUE)
+    @mock.patch(_QUEUE)
+    @mock.patch(_IN_FLIGHT, return_value=False)
+    def test_stale_queued_tasks_are_confirmed_with_workers_only(
+        self, mock_in_flight, mock_queue, mock_requeue, task_registry
+    ):
+        """A queued entry the queue can no longer hold is checked with the workers, not the queue."""
+        queued_at = time.time() - CONFIG.execution.dsr_task_queued_timeout - 60
+        task_registry.zadd(
+            QUEUED_TASKS_KEY,
+            {"privacy_request_task_id": queued_at, "request_task_id": queued_at},
+        )
+        requeue_interrupted_tasks.apply().get()
+        mock_queue.assert_not_called()
+        mock_in_flight.assert_called()
+        mock_requeue.assert_called_once()